@@ -1,30 +1,69 @@
-"""Shared AsyncAnthropic client with rate-limit semaphore (#1111).
+"""Shared AsyncAnthropic client pool with priority-lane admission (#1111).
 
 Every call site across ``bridge/``, ``tools/``, and ``agent/`` goes through
 this module instead of constructing its own ``anthropic.AsyncAnthropic``.
-A process-wide ``asyncio.Semaphore`` gates concurrent API calls so fan-out
-never breaches Anthropic's per-minute request limits.
+A process-wide slot budget gates concurrent API calls so fan-out never
+breaches Anthropic's per-minute request limits.
 
 Two entry points:
 
-* ``anthropic_slot()`` — the ergonomic context manager. Acquires a slot,
-  constructs a fresh ``AsyncAnthropic`` client, yields it, then releases
-  the slot on exit. Use for the common case::
+* ``anthropic_slot(lane)`` — the ergonomic context manager. Acquires a slot
+  in ``lane``, yields this event loop's pooled ``AsyncAnthropic`` client,
+  then releases the slot on exit. Use for the common case::
 
-      async with anthropic_slot() as client:
+      async with anthropic_slot("interactive") as client:
           msg = await client.messages.create(...)
 
-* ``semaphore_slot()`` — semaphore-only variant. Acquires a slot but does
-  NOT construct a client. Use at sites with site-specific client
-  invariants (e.g. ``agent/memory_extraction.py`` needs
-  ``async with anthropic.AsyncAnthropic(timeout=...) as client:`` for
-  hotfix #1055 httpx cleanup)::
+* ``semaphore_slot(lane)`` — slot-only variant. Acquires a slot but does
+  NOT hand out a client. Use at sites with site-specific client
+  invariants (e.g. ``bridge/read_the_room.py`` builds its own
+  ``async with anthropic.AsyncAnthropic(timeout=...) as client:``), or pair
+  it with ``pooled_client()`` as ``agent/llm/wrapper.py`` does::
 
-      async with semaphore_slot():
-          async with anthropic.AsyncAnthropic(timeout=...) as client:
+      async with semaphore_slot("background"):
+          async with pooled_client(timeout=30.0) as client:
               await client.messages.create(...)
 
-Both acquire the same module-level semaphore, so mixing them is fine.
+Both draw on the same module-level scheduler, so mixing them is fine.
+
+Lanes:
+    ``interactive`` (inbound-message classifiers and pre-send gates),
+    ``pipeline`` (the default: session-driven work) and ``background``
+    (reflection, memory extraction, health judging, catch-up). Waiters are
+    admitted by smooth weighted round robin (``LANE_WEIGHTS``, 6:3:1), so a
+    burst in one lane slows the others down without starving them. One slot
+    is held back for ``interactive`` whenever the budget is larger than one,
+    so a backlog of background calls never makes an inbound message wait for
+    a whole call to finish.
+
+Pooled client:
+    One long-lived ``AsyncAnthropic`` per running event loop, so calls reuse
+    warm keep-alive connections instead of paying client construction (CA
+    bundle load) plus a TCP/TLS handshake each time. The pool is keyed by
+    loop because an httpx connection is bound to the loop that opened it.
+    The hotfix #1055 guarantees carry over:
+
+    * A call that ends in a timeout or transport error retires
+      the pooled client — a half-open socket is never handed to the next
+      caller — and the retired client is closed once its last in-flight call
+      leaves. The next call builds a fresh one.
+    * The double timeout is unchanged: ``pooled_client(timeout=...)`` applies
+      the per-call SDK timeout via ``with_options``; callers keep their outer
+      ``asyncio.wait_for``.
+    * ``aclose_pooled_clients()`` closes the loop's client at shutdown (the
+      worker and bridge call it before their loops end).
+    * Short-lived loops (``asyncio.run`` in CLI tools, hooks and catch-up)
+      close their client too. The first lease on a loop parks a closer
+      task, and ``asyncio.run`` cancels every pending task before it closes
+      the loop. The closer then closes the client, as an ``async with``
+      client would have, rather than letting a garbage-collected loop drop
+      an open connection pool.
+
+Metrics:
+    ``lane_metrics()`` reports, per lane, calls served, current waiters,
+    queue wait p50/p95, p95 call latency (slot hold time) and the
+    connection reuse rate of pooled-client requests (from httpcore's
+    connection trace events).
 
 Configuration:
     ``settings.features.anthropic_concurrency`` (default 5, range 1-50).
@@ -34,102 +73,446 @@ Design notes:
     * Slot count is read once at module import time. Changing the setting
       at runtime requires a process restart (this matches the rest of
       ``FeatureSettings``, which is startup-config).
-    * ``_semaphore`` is a module-level private for test monkeypatching.
+    * ``_scheduler`` is a module-level private for test monkeypatching.
 """
 
 from __future__ import annotations
 
 import asyncio
-
-import anthropic
-
+import logging
+import time
+import weakref
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from analytics.metrics import gauge, histogram
 from config.settings import settings
 from utils.api_keys import get_anthropic_api_key
 
-# Module-level semaphore — slot count read once at import time from
+if TYPE_CHECKING:
+    import anthropic
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+LANES = ("interactive", "pipeline", "background")
+LANE_WEIGHTS = {"interactive": 6, "pipeline": 3, "background": 1}
+DEFAULT_LANE = "pipeline"
+
+# Samples kept per lane for the percentile metrics.
+_METRIC_WINDOW = 512
+
+# Cross-process views of the same waits and latencies (GET /metrics).
+_QUEUE_WAIT_SECONDS = histogram(
+    "valor_llm_queue_wait_seconds", "Time queued for an Anthropic call slot.", ("lane",)
+)
+_CALL_SECONDS = histogram(
+    "valor_llm_call_seconds", "LLM call latency (slot held).", ("provider", "lane")
+)
+_SLOTS_IN_USE = gauge("valor_llm_slots_in_use", "Anthropic call slots currently held.")
+_lane_wait = {lane: _QUEUE_WAIT_SECONDS.labels(lane) for lane in LANES}
+_lane_call = {lane: _CALL_SECONDS.labels("anthropic", lane) for lane in LANES}
+
+# Lane of the slot the current task holds; read by the connection tracer so
+# pooled-client requests are attributed to the lane that made them.
+_current_lane: ContextVar[str | None] = ContextVar("anthropic_lane", default=None)
+
+
+def _check_lane(lane: str) -> str:
+    if lane not in LANE_WEIGHTS:
+        raise ValueError(f"unknown anthropic lane {lane!r}; expected one of {LANES}")
+    return lane
+
+
+def _percentile(samples: deque[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class _LaneStats:
+    calls: int = 0
+    requests: int = 0
+    new_connections: int = 0
+    waits: deque[float] = field(default_factory=lambda: deque(maxlen=_METRIC_WINDOW))
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_METRIC_WINDOW))
+
+
+class LaneScheduler:
+    """Weighted-fair admission over a fixed number of concurrent call slots.
+
+    ``acquire(lane)`` takes a slot immediately when one is free for that lane
+    and nobody is queued ahead; otherwise it queues. Each ``release()`` hands
+    freed slots to queued lanes by smooth weighted round robin, so with all
+    three lanes backed up, ten grants go 6 interactive / 3 pipeline / 1
+    background, interleaved. ``interactive_reserve`` slots are only ever
+    granted to the interactive lane.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        weights: dict[str, int] | None = None,
+        interactive_reserve: int | None = None,
+    ) -> None:
+        self.capacity = capacity
+        self.weights = dict(weights or LANE_WEIGHTS)
+        if interactive_reserve is None:
+            interactive_reserve = 1 if capacity > 1 else 0
+        self.interactive_reserve = interactive_reserve
+        self.in_use = 0
+        self.stats = {lane: _LaneStats() for lane in LANES}
+        self._waiters: dict[str, deque[asyncio.Future]] = {lane: deque() for lane in LANES}
+        self._credit = dict.fromkeys(LANES, 0)
+
+    def _has_room(self, lane: str) -> bool:
+        limit = self.capacity
+        if lane != "interactive":
+            limit -= self.interactive_reserve
+        return self.in_use < limit
+
+    def _dispatch(self) -> None:
+        while True:
+            eligible = [lane for lane in LANES if self._waiters[lane] and self._has_room(lane)]
+            if not eligible:
+                return
+            total = sum(self.weights[lane] for lane in eligible)
+            for lane in eligible:
+                self._credit[lane] += self.weights[lane]
+            # max() keeps the first of equal credits, and LANES is in priority order.
+            pick = max(eligible, key=self._credit.__getitem__)
+            self._credit[pick] -= total
+            waiter = self._waiters[pick].popleft()
+            if waiter.done():  # cancelled while queued
+                continue
+            self.in_use += 1
+            _SLOTS_IN_USE.set(self.in_use)
+            waiter.set_result(None)
+
+    async def acquire(self, lane: str = DEFAULT_LANE) -> float:
+        """Wait for a slot in ``lane``; return the seconds spent queued."""
+        _check_lane(lane)
+        start = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted, then cancelled before the task resumed: hand it back.
+                self.release()
+            else:
+                try:
+                    self._waiters[lane].remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        wait_s = time.perf_counter() - start
+        stats = self.stats[lane]
+        stats.calls += 1
+        stats.waits.append(wait_s)
+        _lane_wait[lane].observe(wait_s)
+        return wait_s
+
+    def release(self, lane: str | None = None, held_s: float | None = None) -> None:
+        """Free a slot; ``held_s`` (when given) is recorded as ``lane``'s call latency."""
+        self.in_use -= 1
+        _SLOTS_IN_USE.set(self.in_use)
+        if lane is not None and held_s is not None:
+            self.stats[lane].latencies.append(held_s)
+            _lane_call[lane].observe(held_s)
+        self._dispatch()
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        out: dict[str, dict[str, float | int]] = {}
+        for lane in LANES:
+            stats = self.stats[lane]
+            reused = stats.requests - stats.new_connections
+            out[lane] = {
+                "calls": stats.calls,
+                "waiting": len(self._waiters[lane]),
+                "queue_wait_p50_s": round(_percentile(stats.waits, 0.50), 4),
+                "queue_wait_p95_s": round(_percentile(stats.waits, 0.95), 4),
+                "call_p95_s": round(_percentile(stats.latencies, 0.95), 4),
+                "requests": stats.requests,
+                "connection_reuse_rate": round(reused / stats.requests, 3)
+                if stats.requests
+                else 0.0,
+            }
+        return out
+
+
+# Module-level scheduler — slot count read once at import time from
 # ``settings.features.anthropic_concurrency``. Tests monkeypatch this attr
 # directly to simulate tight/loose limits.
-_semaphore: asyncio.Semaphore = asyncio.Semaphore(settings.features.anthropic_concurrency)
+_scheduler: LaneScheduler = LaneScheduler(settings.features.anthropic_concurrency)
 
 
-class _AnthropicGuard:
-    """Async context manager that acquires a semaphore slot then yields a client.
+def lane_metrics() -> dict[str, dict[str, float | int]]:
+    """Per-lane queue wait, call latency and connection reuse; see module docstring."""
+    return _scheduler.snapshot()
 
-    On ``__aenter__``: acquire the shared semaphore, then construct and
-    return a fresh ``anthropic.AsyncAnthropic`` client keyed with the
-    resolved API key. On ``__aexit__``: release the slot (always, even
-    on exception).
 
-    The returned client is ephemeral — each ``anthropic_slot()`` call
-    creates a new ``AsyncAnthropic`` instance so httpx connection pools
-    are not shared across call sites. This matches the prior per-site
-    behaviour; the only new thing is the gating semaphore.
-    """
+# ── Pooled client ─────────────────────────────────────────────────────────
+
+
+@dataclass
+class _PoolEntry:
+    client: anthropic.AsyncAnthropic
+    in_flight: int = 0
+    retired: bool = False
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _PoolEntry] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Loops with a parked _close_at_loop_end task, and strong refs to those tasks.
+_closer_loops: weakref.WeakSet[asyncio.AbstractEventLoop] = weakref.WeakSet()
+_closers: set[asyncio.Task] = set()
+
+
+async def _on_request(request: httpx.Request) -> None:
+    # httpcore reports a fresh TCP connect through the ``trace`` extension;
+    # a request that never sees one went out on a kept-alive connection.
+    outer = request.extensions.get("trace")
+    lane = _current_lane.get() or DEFAULT_LANE
+
+    async def trace(event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.started":
+            request.extensions["valor_new_connection"] = True
+        if outer is not None:
+            await outer(event_name, info)
+
+    request.extensions["trace"] = trace
+    request.extensions["valor_lane"] = lane
 
-    def __init__(self) -> None:
-        self._client: anthropic.AsyncAnthropic | None = None
-        self._acquired = False
+
+async def _on_response(response: httpx.Response) -> None:
+    lane = response.request.extensions.get("valor_lane")
+    if lane is None:
+        return
+    stats = _scheduler.stats[lane]
+    stats.requests += 1
+    if response.request.extensions.get("valor_new_connection"):
+        stats.new_connections += 1
+
+
+def _new_client() -> anthropic.AsyncAnthropic:
+    # Imported here, not at module level: the SDK is ~1s of import time and
+    # semaphore_slot() callers never need it.
+    import anthropic
+
+    http_client = anthropic.DefaultAsyncHttpxClient(
+        event_hooks={"request": [_on_request], "response": [_on_response]}
+    )
+    return anthropic.AsyncAnthropic(api_key=get_anthropic_api_key(), http_client=http_client)
+
+
+def _poisons_pool(exc: BaseException | None) -> bool:
+    """True when ``exc`` (or anything it chains from) may leave a bad socket behind.
+
+    Plain cancellation is not on the list: httpcore closes the connection of a
+    request cancelled mid-flight itself, and ``bridge.inbound_classification``
+    cancels speculative calls routinely, which must not cycle the pool.
+    """
+    import anthropic
+    import httpx
+
+    seen = 0
+    while exc is not None and seen < 8:
+        if isinstance(
+            exc,
+            (
+                TimeoutError,
+                anthropic.APIConnectionError,
+                httpx.TransportError,
+            ),
+        ):
+            return True
+        exc = exc.__cause__ or exc.__context__
+        seen += 1
+    return False
+
+
+async def _close_at_loop_end(loop: asyncio.AbstractEventLoop) -> None:
+    """Wait until the loop cancels its tasks at shutdown, then close its pooled client."""
+    try:
+        await loop.create_future()
+    finally:
+        _closer_loops.discard(loop)
+        entry = _pools.get(loop)
+        if entry is not None:
+            del _pools[loop]
+            entry.retired = True
+            if entry.in_flight == 0:
+                try:
+                    await entry.client.close()
+                except Exception:  # noqa: S110 -- shutdown close is best-effort
+                    pass
+
+
+def _watch_loop_end(loop: asyncio.AbstractEventLoop) -> None:
+    if loop in _closer_loops:
+        return
+    _closer_loops.add(loop)
+    task = loop.create_task(_close_at_loop_end(loop), name="anthropic-pool-closer")
+    _closers.add(task)
+    task.add_done_callback(_closers.discard)
+
+
+class _PooledClientLease:
+    """Async context manager that lends out the running loop's pooled client."""
+
+    def __init__(self, timeout: float | None) -> None:
+        self._timeout = timeout
+        self._entry: _PoolEntry | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def __aenter__(self) -> anthropic.AsyncAnthropic:
-        await _semaphore.acquire()
-        self._acquired = True
-        self._client = anthropic.AsyncAnthropic(api_key=get_anthropic_api_key())
-        return self._client
+        loop = asyncio.get_running_loop()
+        entry = _pools.get(loop)
+        if entry is None:
+            entry = _PoolEntry(client=_new_client())
+            _pools[loop] = entry
+            _watch_loop_end(loop)
+        entry.in_flight += 1
+        self._entry, self._loop = entry, loop
+        if self._timeout is None:
+            return entry.client
+        return entry.client.with_options(timeout=self._timeout)
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._acquired:
-            _semaphore.release()
-            self._acquired = False
+        entry, self._entry = self._entry, None
+        if entry is None:
+            return None
+        entry.in_flight -= 1
+        if exc_val is not None and not entry.retired and _poisons_pool(exc_val):
+            logger.info("[anthropic] retiring pooled client after %s", type(exc_val).__name__)
+            entry.retired = True
+            if _pools.get(self._loop) is entry:
+                del _pools[self._loop]
+        if entry.retired and entry.in_flight == 0:
+            try:
+                await entry.client.close()
+            except Exception:  # noqa: S110 -- closing a broken pool is best-effort
+                pass
         # Do not swallow exceptions.
         return None
 
 
+def pooled_client(timeout: float | None = None) -> _PooledClientLease:
+    """Return a context manager yielding this loop's long-lived client.
+
+    ``timeout`` is the per-call SDK timeout (the inner timer of the hotfix
+    #1055 double timeout). This does not take a concurrency slot; hold one
+    from ``semaphore_slot()`` around it.
+    """
+    return _PooledClientLease(timeout)
+
+
+async def aclose_pooled_clients() -> None:
+    """Close the running loop's pooled client; call once at process shutdown."""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _pools if k is loop or k.is_closed()]:
+        entry = _pools.pop(key)
+        entry.retired = True
+        if key is loop and entry.in_flight == 0:
+            await entry.client.close()
+    logger.info("[anthropic] lane metrics at shutdown: %s", lane_metrics())
+
+
+# ── Slot guards ───────────────────────────────────────────────────────────
+
+
 class _SemaphoreOnlyGuard:
-    """Async context manager that only acquires/releases the semaphore slot.
+    """Async context manager that only acquires/releases a lane slot.
 
     Used at call sites with bespoke client invariants (e.g.
-    ``agent/memory_extraction.py`` which needs ``async with
-    anthropic.AsyncAnthropic(timeout=...) as client:`` for hotfix #1055
-    httpx cleanup). The caller constructs the client; this guard just
-    gates concurrency.
+    ``bridge/read_the_room.py`` which builds ``async with
+    anthropic.AsyncAnthropic(timeout=...) as client:`` itself). The caller
+    provides the client; this guard just gates concurrency.
     """
 
-    def __init__(self) -> None:
-        self._acquired = False
+    def __init__(self, lane: str = DEFAULT_LANE) -> None:
+        self._lane = _check_lane(lane)
+        self._scheduler: LaneScheduler | None = None
+        self._acquired_at: float | None = None
+        self._token = None
 
     async def __aenter__(self) -> None:
-        await _semaphore.acquire()
-        self._acquired = True
+        # Bind the scheduler at entry so release() goes back to the same one.
+        self._scheduler = _scheduler
+        await self._scheduler.acquire(self._lane)
+        self._acquired_at = time.perf_counter()
+        self._token = _current_lane.set(self._lane)
         return None
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._acquired:
-            _semaphore.release()
-            self._acquired = False
+        if self._acquired_at is not None:
+            _current_lane.reset(self._token)
+            self._scheduler.release(self._lane, time.perf_counter() - self._acquired_at)
+            self._acquired_at = None
+        return None
+
+
+class _AnthropicGuard(_SemaphoreOnlyGuard):
+    """Async context manager that acquires a lane slot then yields the pooled client.
+
+    On ``__aenter__``: acquire a slot in the lane, then lease this loop's
+    pooled ``anthropic.AsyncAnthropic``. On ``__aexit__``: return the lease
+    (retiring the client if the call died on a transport error) and release
+    the slot — always, even on exception.
+    """
+
+    def __init__(self, lane: str = DEFAULT_LANE, timeout: float | None = None) -> None:
+        super().__init__(lane)
+        self._lease = _PooledClientLease(timeout)
+
+    async def __aenter__(self) -> anthropic.AsyncAnthropic:
+        await super().__aenter__()
+        try:
+            return await self._lease.__aenter__()
+        except BaseException:
+            await super().__aexit__(None, None, None)
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            await self._lease.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+        # Do not swallow exceptions.
         return None
 
 
-def anthropic_slot() -> _AnthropicGuard:
-    """Return a fresh context manager that gates on the shared semaphore.
+def anthropic_slot(lane: str = DEFAULT_LANE, *, timeout: float | None = None) -> _AnthropicGuard:
+    """Return a fresh context manager that gates on the shared scheduler.
 
     Use as::
 
-        async with anthropic_slot() as client:
+        async with anthropic_slot("interactive") as client:
             msg = await client.messages.create(...)
     """
-    return _AnthropicGuard()
+    return _AnthropicGuard(lane, timeout)
 
 
-def semaphore_slot() -> _SemaphoreOnlyGuard:
-    """Return a fresh context manager that acquires the slot without a client.
+def semaphore_slot(lane: str = DEFAULT_LANE) -> _SemaphoreOnlyGuard:
+    """Return a fresh context manager that acquires a lane slot without a client.
 
-    Use when a call site needs its own ``AsyncAnthropic`` construction
-    (e.g. with ``timeout=``, inside its own ``async with`` for httpx
-    cleanup). The slot is released on exit so the caller can still
-    create the client inside the slot's lifetime::
+    Use when a call site supplies its own client -- ``pooled_client()``, or
+    its own ``AsyncAnthropic`` construction inside its own ``async with``.
+    The slot is released on exit so the caller can still use the client
+    inside the slot's lifetime::
 
-        async with semaphore_slot():
+        async with semaphore_slot("interactive"):
             async with anthropic.AsyncAnthropic(timeout=30.0) as client:
                 msg = await client.messages.create(...)
     """
-    return _SemaphoreOnlyGuard()
+    return _SemaphoreOnlyGuard(lane)
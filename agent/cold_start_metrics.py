@@ -46,6 +46,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -54,6 +55,9 @@ logger = logging.getLogger(__name__)
 # Path to the JSONL metrics file.  Relative to CWD (normally the repo root).
 _METRICS_FILE = Path("logs/cold_start_metrics.jsonl")
 
+# Process boot times (process start -> first loop tick), one line per boot.
+_BOOT_METRICS_FILE = Path("logs/boot_metrics.jsonl")
+
 
 def record_ttft(
     *,
@@ -115,3 +119,48 @@ def record_ttft(
     except Exception as exc:  # noqa: BLE001
         # Instrumentation MUST NOT crash the caller.
         logger.warning("[TTFT] metric write failed (non-fatal): %s", exc)
+
+
+def seconds_since_process_start() -> float | None:
+    """Wall-clock seconds since this OS process was created, or ``None``.
+
+    Measured from the kernel's process start time, so it covers interpreter
+    startup and every import before the caller's own code ran.
+    """
+    try:
+        import psutil  # noqa: PLC0415
+
+        return max(0.0, time.time() - psutil.Process().create_time())
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def record_boot(*, process: str, boot_seconds: float | None = None) -> None:
+    """Append one boot measurement to ``logs/boot_metrics.jsonl``.
+
+    Called once per process at its first loop tick (``worker``) or when it
+    is ready to serve (``bridge``). ``boot_seconds`` defaults to
+    :func:`seconds_since_process_start`; nothing is written when that is
+    unavailable. Failures are swallowed like :func:`record_ttft`.
+
+    Schema: ``{"timestamp": ..., "process": "worker", "pid": 123,
+    "boot_seconds": 1.234}``. ``scripts/profile_startup.py`` attributes the
+    import share of this number per package.
+    """
+    try:
+        if boot_seconds is None:
+            boot_seconds = seconds_since_process_start()
+        if boot_seconds is None:
+            return
+        entry = {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "process": process,
+            "pid": os.getpid(),
+            "boot_seconds": round(boot_seconds, 3),
+        }
+        _BOOT_METRICS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with _BOOT_METRICS_FILE.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry) + "\n")
+        logger.info("[boot] %s ready %.2fs after process start", process, boot_seconds)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("[boot] metric write failed (non-fatal): %s", exc)
@@ -32,6 +32,7 @@ All resolved emojis are confirmed in VALIDATED_REACTIONS.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import NamedTuple
@@ -163,10 +164,16 @@ def _resolve_terminal_emoji(name: str, config: _TerminalEmojiConfig) -> object:
     """Resolve a terminal reaction emoji, caching the result.
 
     Pinned constants (config.pinned) resolve directly to their fixed emoji,
-    caching an EmojiResult without any semantic draw. Semantic constants call
-    find_best_emoji(config.feeling) and fall back to config.emoji when it raises
-    or returns the bare DEFAULT_EMOJI (OPENROUTER_API_KEY absent, embeddings
-    unavailable), keeping the constants distinct in degraded environments.
+    caching an EmojiResult without any semantic draw. Semantic constants resolve
+    config.feeling through the async embedding path and fall back to config.emoji
+    when it raises or returns the bare DEFAULT_EMOJI (OPENROUTER_API_KEY absent,
+    embeddings unavailable), keeping the constants distinct in degraded
+    environments.
+
+    The usual first access is a module-level import, with no event loop
+    running: find_best_emoji_offloop() embeds a miss on a private loop. An
+    access from inside a running loop must not block it on the network, so it
+    only consults the loaded query cache and otherwise takes the fallback.
 
     Args:
         name: Constant name (e.g. "REACTION_SUCCESS") — used as cache key.
@@ -187,9 +194,16 @@ def _resolve_terminal_emoji(name: str, config: _TerminalEmojiConfig) -> object:
         return pinned
 
     try:
-        from tools.emoji_embedding import find_best_emoji
-
-        result = find_best_emoji(config.feeling)
+        from tools.emoji_embedding import find_best_emoji_cached, find_best_emoji_offloop
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            result = find_best_emoji_offloop(config.feeling)
+        else:
+            result = find_best_emoji_cached(config.feeling)
+            if result is None:
+                raise ValueError(f"{name!r} not cached; not embedding on the running loop")
         # If find_best_emoji returned the DEFAULT_EMOJI, the API was unavailable.
         # Use our own fallback so the constants remain distinct.
         if result.emoji == DEFAULT_EMOJI and not result.is_custom:
@@ -447,7 +447,7 @@ async def _judge_health(activity: str, session_context: str = "") -> dict[str, A
     )
 
     # Shared semaphore-gated client (#1111)
-    async with anthropic_slot() as client:
+    async with anthropic_slot("background") as client:
         response = await client.messages.create(
             model=MODEL_FAST,
             max_tokens=150,
@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import Any
 
-from claude_agent_sdk import HookMatcher
-
 from agent.hooks.post_tool_use import post_tool_use_hook
 from agent.hooks.pre_compact import pre_compact_hook
 from agent.hooks.pre_tool_use import pre_tool_use_hook
@@ -28,6 +26,10 @@ def build_hooks_config() -> dict[str, Any]:
         Stop: Fires when the main agent session ends.
         PreCompact: Fires before context compaction.
     """
+    # Deferred: claude_agent_sdk drags in mcp/starlette/uvicorn (~1.3s), and
+    # this package is on the worker's boot path via the liveness writers.
+    from claude_agent_sdk import HookMatcher
+
     return {
         "PreToolUse": [HookMatcher(matcher="", hooks=[pre_tool_use_hook])],
         "PostToolUse": [HookMatcher(matcher="", hooks=[post_tool_use_hook])],
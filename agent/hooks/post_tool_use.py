@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from claude_agent_sdk import HookContext, PostToolUseHookInput
+if TYPE_CHECKING:
+    from claude_agent_sdk import HookContext, PostToolUseHookInput
 
 logger = logging.getLogger(__name__)
 
@@ -57,9 +57,10 @@ import os
 import shutil
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from claude_agent_sdk import HookContext, PreCompactHookInput
+if TYPE_CHECKING:
+    from claude_agent_sdk import HookContext, PreCompactHookInput
 
 logger = logging.getLogger(__name__)
 
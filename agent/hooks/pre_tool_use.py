@@ -40,9 +40,10 @@ from __future__ import annotations
 import logging
 import os
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from claude_agent_sdk import HookContext, PreToolUseHookInput
+if TYPE_CHECKING:
+    from claude_agent_sdk import HookContext, PreToolUseHookInput
 
 from config.enums import SessionType
 
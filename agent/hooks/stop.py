@@ -25,9 +25,10 @@ import logging
 import os
 import re
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from claude_agent_sdk import HookContext, StopHookInput
+if TYPE_CHECKING:
+    from claude_agent_sdk import HookContext, StopHookInput
 
 logger = logging.getLogger(__name__)
 
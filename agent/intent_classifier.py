@@ -210,7 +210,9 @@ async def classify_intent(
         prompt = f"{CLASSIFIER_PROMPT}\n\n{user_content}"
 
         async def _call_and_serialize() -> dict:
-            parsed = await run_typed(prompt, IntentClassification, model=MODEL_FAST)
+            parsed = await run_typed(
+                prompt, IntentClassification, model=MODEL_FAST, lane="interactive"
+            )
             # #1925: parsed is a pydantic BaseModel (IntentClassification), not
             # the old IntentResult dataclass -- dataclasses.asdict would raise
             # TypeError on it. model_dump() is the pydantic equivalent and
@@ -8,17 +8,17 @@ built-in single auto-retry on schema mismatch.
 
 Event-loop safety invariant (hotfix #1055 / #1111), reconciled with
 PydanticAI (see ``docs/plans/pydantic-ai-nonharness-llm-standardization.md``
-Spike Results spike-1): ``agent/anthropic_client.py`` holds no long-lived
-shared client -- ``semaphore_slot()`` only gates concurrency, the caller
-constructs its own client. ``run_typed`` follows that pattern **per call**:
-
-1. ``async with semaphore_slot():`` -- hold the shared semaphore for the
-   *entire* ``Agent.run()`` call (not just client construction), matching
-   how ``agent/memory_extraction.py::_llm_call`` uses the slot today.
-2. Inside the slot, construct a **fresh**
-   ``async with anthropic.AsyncAnthropic(api_key=..., timeout=sdk_timeout)``
-   -- per-call, per-site timeout; ``async with`` preserves hotfix #1055's
-   httpx cleanup.
+Spike Results spike-1). ``run_typed`` does this **per call**:
+
+1. ``async with semaphore_slot(lane):`` -- hold a slot in the caller's
+   priority lane for the *entire* ``Agent.run()`` call (not just client
+   setup).
+2. Inside the slot, lease the event loop's pooled client with
+   ``async with pooled_client(timeout=sdk_timeout)`` -- a per-call, per-site
+   SDK timeout on a long-lived keep-alive connection pool. If the call dies
+   on a timeout or transport error, the lease retires the pooled client so
+   the next call gets a fresh one (the hotfix #1055 cleanup guarantee, see
+   ``agent/anthropic_client.py``).
 3. Inject that client into PydanticAI:
    ``AnthropicProvider(anthropic_client=client)`` ->
    ``AnthropicModel(model, provider=...)`` ->
@@ -38,24 +38,74 @@ conservative default (respond / escalate / send / skip) on failure -- see
 from __future__ import annotations
 
 import asyncio
+import importlib
 import logging
 import os
+from typing import TYPE_CHECKING
 
-import anthropic
 from pydantic import BaseModel
-from pydantic_ai import Agent
-from pydantic_ai.models.anthropic import AnthropicModel
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.anthropic import AnthropicProvider
-from pydantic_ai.providers.ollama import OllamaProvider
 
-from agent.anthropic_client import semaphore_slot
+from agent.anthropic_client import DEFAULT_LANE, pooled_client, semaphore_slot
+from analytics.metrics import histogram
 from config.models import MODEL_FAST, OLLAMA_CLASSIFIER_MODEL
 from config.settings import settings
-from utils.api_keys import get_anthropic_api_key
+
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+    from pydantic_ai.models.anthropic import AnthropicModel
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.anthropic import AnthropicProvider
+    from pydantic_ai.providers.ollama import OllamaProvider
 
 logger = logging.getLogger(__name__)
 
+# Provider SDKs are imported on first call, not at import time: pydantic_ai's
+# Anthropic and OpenAI-compatible models (and the SDKs under them) cost ~2s,
+# and every bridge/worker module that classifies a message imports this wrapper at boot.
+# Module ``__getattr__`` resolves the names, so ``wrapper_mod.AnthropicModel``
+# stays patchable; a patched global wins over the lazy import.
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "Agent": ("pydantic_ai", "Agent"),
+    "AnthropicModel": ("pydantic_ai.models.anthropic", "AnthropicModel"),
+    "OpenAIChatModel": ("pydantic_ai.models.openai", "OpenAIChatModel"),
+    "AnthropicProvider": ("pydantic_ai.providers.anthropic", "AnthropicProvider"),
+    "OllamaProvider": ("pydantic_ai.providers.ollama", "OllamaProvider"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module_name)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def _load_providers() -> None:
+    """Bind every lazily imported provider name as a real module global."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
+
+async def _load_providers_off_loop() -> None:
+    """:func:`_load_providers` in a worker thread; the first import costs ~2s."""
+    if any(name not in globals() for name in _LAZY_IMPORTS):
+        await asyncio.to_thread(_load_providers)
+
+
+async def warm_providers() -> None:
+    """Import the provider SDKs off the loop after boot, before the first call. Never raises."""
+    try:
+        await _load_providers_off_loop()
+    except Exception as e:
+        logger.debug("[agent.llm] provider warm-up failed (first call will retry): %s", e)
+
+
 # Mirrors agent/memory_extraction.py's double-timeout constants (hotfix #1055):
 # the SDK-level timeout lets httpx/anthropic raise a typed error first for
 # cleaner logs; the outer hard timeout fires even on half-open sockets where
@@ -88,6 +138,7 @@ async def run_typed(
     model: str = MODEL_FAST,
     sdk_timeout: float = DEFAULT_SDK_TIMEOUT,
     hard_timeout: float | None = DEFAULT_HARD_TIMEOUT,
+    lane: str = DEFAULT_LANE,
 ) -> BaseModel:
     """Run a schema-validated LLM call through PydanticAI.
 
@@ -103,14 +154,18 @@ async def run_typed(
             (Haiku) so a single config edit swaps every non-harness call's
             model. Per-call overrides are supported (e.g. a cheaper/local
             model for a high-frequency hot path).
-        sdk_timeout: per-call SDK-level timeout (seconds), passed to
-            ``anthropic.AsyncAnthropic(timeout=...)``. This is the inner
-            timer of the hotfix #1055 double-timeout pattern.
+        sdk_timeout: per-call SDK-level timeout (seconds), applied to the
+            pooled client via ``with_options(timeout=...)``. This is the
+            inner timer of the hotfix #1055 double-timeout pattern.
         hard_timeout: outer wall-clock cap (seconds) via
             ``asyncio.wait_for``. Fires even when the SDK timer doesn't
             (e.g. half-open TCP sockets with no socket event). Pass
             ``None`` to disable the outer cap and rely on ``sdk_timeout``
             alone.
+        lane: the ``agent.anthropic_client`` priority lane the call waits
+            in -- ``"interactive"`` for inbound-message paths,
+            ``"pipeline"`` (default) for session work, ``"background"``
+            for reflection and extraction.
 
     Returns:
         A validated instance of ``output_type``.
@@ -124,10 +179,9 @@ async def run_typed(
     if not prompt or not prompt.strip():
         raise ValueError("run_typed requires a non-empty, non-whitespace prompt")
 
-    async with semaphore_slot():
-        async with anthropic.AsyncAnthropic(
-            api_key=get_anthropic_api_key(), timeout=sdk_timeout
-        ) as client:
+    await _load_providers_off_loop()
+    async with semaphore_slot(lane):
+        async with pooled_client(timeout=sdk_timeout) as client:
             provider = AnthropicProvider(anthropic_client=client)
             pydantic_model = AnthropicModel(model, provider=provider)
             agent = Agent(pydantic_model, output_type=output_type)
@@ -166,6 +220,11 @@ async def run_typed(
 # costs a conservative default, never a lost message.
 LOCAL_TYPED_HARD_TIMEOUT = float(os.environ.get("LOCAL_TYPED_HARD_TIMEOUT", "20.0"))
 
+# Local calls join the Anthropic lanes in the LLM latency family (GET /metrics).
+_LOCAL_CALL_SECONDS = histogram(
+    "valor_llm_call_seconds", "LLM call latency (slot held).", ("provider", "lane")
+).labels("ollama", "local")
+
 
 async def run_typed_local(
     prompt: str,
@@ -208,13 +267,15 @@ async def run_typed_local(
     if hard_timeout is None:
         hard_timeout = LOCAL_TYPED_HARD_TIMEOUT
 
+    await _load_providers_off_loop()
     base_url = f"{settings.models.ollama_host.rstrip('/')}/v1"
     provider = OllamaProvider(base_url=base_url)
     pydantic_model = OpenAIChatModel(model, provider=provider)
     agent = Agent(pydantic_model, output_type=output_type)
 
     try:
-        result = await asyncio.wait_for(agent.run(prompt), timeout=hard_timeout)
+        with _LOCAL_CALL_SECONDS.time():
+            result = await asyncio.wait_for(agent.run(prompt), timeout=hard_timeout)
     except TimeoutError as e:
         logger.error(
             "[agent.llm] local hard timeout (%.1fs) exceeded for model=%s: %s",
@@ -374,6 +374,7 @@ async def _llm_call(
             model=model,
             sdk_timeout=_EXTRACTION_SDK_TIMEOUT,
             hard_timeout=_EXTRACTION_HARD_TIMEOUT,
+            lane="background",
         )
     except LLMCallError as e:
         if isinstance(e.__cause__, TimeoutError):
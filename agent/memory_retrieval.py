@@ -375,6 +375,7 @@ def _retrieve_memories_rrf(
         from popoto import BM25Field
 
         from config.memory_defaults import RRF_K
+        from models.bulk_read import bulk_get_by_key
         from models.memory import Memory
 
         if rrf_k is None:
@@ -441,17 +442,18 @@ def _retrieve_memories_rrf(
                 pass
             return []
 
-        # Hydrate Memory instances from fused keys
+        # Hydrate Memory instances from fused keys in pipelined batches
+        try:
+            found = bulk_get_by_key(Memory, [redis_key for redis_key, _ in fused])
+        except Exception:  # noqa: BLE001 -- memory ops silent by design
+            found = {}
         records = []
         for redis_key, rrf_score in fused:
-            try:
-                record = Memory.query.get(redis_key)
-                if record is not None:
-                    # Attach RRF score for downstream use (_apply_category_weights)
-                    record.score = rrf_score
-                    records.append(record)
-            except Exception:  # noqa: S112 -- memory ops silent by design
-                continue
+            record = found.get(redis_key)
+            if record is not None:
+                # Attach RRF score for downstream use (_apply_category_weights)
+                record.score = rrf_score
+                records.append(record)
 
         # Filter out superseded records — archived memories remain in Redis for audit
         # but must not surface in recall. Handles both "" and None safely.
@@ -273,6 +273,7 @@ def build_telegram_outbox_payload(
     reply_to: int | None,
     session_id: str,
     file_paths: list[str] | None = None,
+    trace_id: str | None = None,
 ) -> dict[str, Any]:
     """Build the telegram outbox payload dict for ``telegram:outbox:{session_id}``.
 
@@ -288,6 +289,7 @@ def build_telegram_outbox_payload(
     ``file_paths``.  The ``file_paths`` key is OMITTED entirely when
     ``file_paths`` is falsy (empty list or ``None``), preserving the original
     conditional-key behaviour of the inline dict this helper replaces.
+    ``trace_id`` is likewise omitted unless it is a non-empty string.
 
     Args:
         chat_id: Target Telegram chat identifier.
@@ -295,6 +297,8 @@ def build_telegram_outbox_payload(
         reply_to: Message ID to reply to, or ``None``.
         session_id: Session identifier used for the outbox key.
         file_paths: Optional list of attachment paths.
+        trace_id: The session's ``correlation_id``; the relay records its
+            send span under it (``analytics/tracing.py``).
 
     Returns:
         A dict payload ready to be JSON-serialised and pushed onto
@@ -309,6 +313,8 @@ def build_telegram_outbox_payload(
     }
     if file_paths:
         payload["file_paths"] = file_paths
+    if isinstance(trace_id, str) and trace_id:
+        payload["trace_id"] = trace_id
     return payload
 
 
@@ -1127,7 +1133,12 @@ class TelegramRelayOutputHandler:
             return DeliveryOutcome.sent
 
         payload = build_telegram_outbox_payload(
-            chat_id, delivery_text, reply_to, session_id, effective_file_paths
+            chat_id,
+            delivery_text,
+            reply_to,
+            session_id,
+            effective_file_paths,
+            trace_id=getattr(session, "correlation_id", None),
         )
 
         queue_key = f"telegram:outbox:{session_id}"
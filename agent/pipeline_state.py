@@ -1560,7 +1560,24 @@ def _durable_gh_pr_for_branch(branch: str) -> dict | None:
     Reads open PRs first; if no open PR exists, falls back to any state so
     that closed/merged PRs still signal BUILD completion (they demonstrate
     the artifact was produced).
+
+    Reads through the shared GitHub broker (``utils.github_api``) when it is
+    configured, otherwise through ``gh``.
     """
+    from utils import github_api
+
+    repo = github_api.resolve_repo() if github_api.enabled() else None
+    if repo:
+        for state in ("open", "all"):
+            try:
+                pulls = github_api.pulls_for_branch(branch, repo, state=state)
+            except github_api.GitHubAPIError as exc:
+                logger.warning("derive_from_durable_signals: PR lookup for %s: %s", branch, exc)
+                continue
+            if pulls:
+                return pulls[0]
+        return None
+
     for state in ("open", "all"):
         out = _durable_run(
             [
@@ -1588,18 +1605,35 @@ def _durable_gh_pr_for_branch(branch: str) -> dict | None:
     return None
 
 
-def _durable_pr_checks_verdict(pr_number) -> str:
-    """Return ``"success"``/``"failure"``/``"pending"``/``"unknown"``."""
-    if pr_number is None:
-        return "unknown"
+def _durable_pr_checks(pr_number) -> list[dict] | None:
+    """Return the PR's ``statusCheckRollup`` entries, or None when unreadable."""
+    from utils import github_api
+
+    repo = github_api.resolve_repo() if github_api.enabled() else None
+    if repo:
+        try:
+            return github_api.pull_check_rollup(int(pr_number), repo)
+        except github_api.GitHubAPIError as exc:
+            logger.warning("derive_from_durable_signals: checks for PR #%s: %s", pr_number, exc)
+            return None
+
     out = _durable_run(["gh", "pr", "view", str(pr_number), "--json", "statusCheckRollup"])
     if out is None:
-        return "unknown"
+        return None
     try:
         parsed = json.loads(out)
     except json.JSONDecodeError:
+        return None
+    return parsed.get("statusCheckRollup") or []
+
+
+def _durable_pr_checks_verdict(pr_number) -> str:
+    """Return ``"success"``/``"failure"``/``"pending"``/``"unknown"``."""
+    if pr_number is None:
+        return "unknown"
+    checks = _durable_pr_checks(pr_number)
+    if checks is None:
         return "unknown"
-    checks = parsed.get("statusCheckRollup") or []
     if not checks:
         # PRs without CI configured default to success (no checks to fail).
         return "success"
@@ -21,6 +21,8 @@ from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 
+from analytics.metrics import histogram
+
 logger = logging.getLogger(__name__)
 
 # --- Configuration (env-tunable; all defaults are provisional, tune after
@@ -80,6 +82,12 @@ _redis_io_pool = ThreadPoolExecutor(
 # `get_redis_latency_max()` reflect only recent behavior, never a
 # never-resetting lifetime high-water mark.
 _samples: deque = deque()
+# The same samples as a cross-process histogram (GET /metrics); the deque
+# above keeps the exact windowed values the dashboard shows.
+_OFFLOAD_SECONDS = histogram(
+    "valor_redis_offload_seconds",
+    "Off-loop Redis call latency, including thread-pool queueing.",
+)
 _samples_lock = Lock()
 _last_latency: float = 0.0
 
@@ -161,6 +169,7 @@ async def offload_redis(fn, *args, **kwargs):
     finally:
         dt = time.monotonic() - t0
         _record(dt)
+        _OFFLOAD_SECONDS.observe(dt)
         if dt > REDIS_OFFLOAD_SLOW_THRESHOLD:
             logger.warning(
                 "[redis-offload] slow Redis call: %.2fs (threshold %.2fs)",
@@ -5,6 +5,7 @@ import asyncio
 import logging
 import os  # noqa: F401
 import re
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -26,6 +27,7 @@ from agent.worktree_manager import (
     WORKTREES_DIR,
     validate_workspace,
 )
+from analytics import tracing
 from config.enums import ClassificationType, SessionType
 from config.settings import settings
 from models.agent_session import AgentSession
@@ -1072,6 +1074,8 @@ async def _execute_agent_session(session: AgentSession) -> None:
     """
     from agent import BackgroundTask, BossMessenger
 
+    _exec_started_at = time.time()  # End of the reply trace's queue_wait span
+
     # === Two-tier no-progress detector registration (#1036) ===
     # Register an empty handle BEFORE any raise site so observability is
     # consistent even if setup/enrichment/hydration fails.
@@ -1452,7 +1456,21 @@ async def _execute_agent_session(session: AgentSession) -> None:
                 agent_session.branch_name = branch_name
                 # Persist task_list_id so hooks can resolve this session
                 agent_session.task_list_id = task_list_id
-                agent_session.save(update_fields=["updated_at", "branch_name", "task_list_id"])
+                _update_fields = ["updated_at", "branch_name", "task_list_id"]
+                # The bridge enqueues before its work-type classification lands;
+                # pick up the fused verdict it cached for the trigger message
+                # instead of leaving the session unclassified.
+                if not agent_session.classification_type:
+                    from bridge.inbound_classification import cached_work_type
+
+                    _cached_type = cached_work_type(
+                        agent_session.chat_id, agent_session.telegram_message_id
+                    )
+                    if _cached_type:
+                        agent_session.classification_type = _cached_type
+                        session.classification_type = _cached_type
+                        _update_fields.append("extra_context")
+                agent_session.save(update_fields=_update_fields)
                 agent_session.append_history("user", (session.message_text or "")[:200])
         except Exception as e:
             logger.debug(f"AgentSession update failed (non-fatal): {e}")
@@ -1835,12 +1853,22 @@ async def _execute_agent_session(session: AgentSession) -> None:
                 )
                 enrich_reply_to_msg_id = None
 
+        # Reply trace (analytics/tracing.py): enqueue → pickup, then enrichment.
+        _queued_at = session.created_at
+        _trace_spans = [
+            tracing.make_span(
+                "queue_wait",
+                _queued_at.timestamp() if isinstance(_queued_at, datetime) else _exec_started_at,
+                _exec_started_at,
+            )
+        ]
         if (
             enrich_has_media
             or enrich_youtube_urls
             or enrich_non_youtube_urls
             or enrich_reply_to_msg_id
         ):
+            _enrich_started_at = time.time()
             try:
                 from bridge.enrichment import enrich_message
 
@@ -1855,9 +1883,20 @@ async def _execute_agent_session(session: AgentSession) -> None:
                     sender_name=session.sender_name,
                     chat_id=session.chat_id,
                     message_id=session.telegram_message_id,
+                    message_key=session.telegram_message_key,
                 )
             except Exception as e:
                 logger.warning(f"[{session.project_key}] Enrichment failed, using raw text: {e}")
+            _trace_spans.append(
+                tracing.make_span(
+                    "enrichment",
+                    _enrich_started_at,
+                    time.time(),
+                    media=enrich_media_type,
+                    links=bool(enrich_youtube_urls or enrich_non_youtube_urls),
+                )
+            )
+        await asyncio.to_thread(tracing.record_spans, session.correlation_id, _trace_spans)
 
         # #1630: prepend the injection-screen banner if the bridge flagged this
         # inbound message at intake. The banner is stashed on the persisted
@@ -2159,6 +2198,10 @@ async def _execute_agent_session(session: AgentSession) -> None:
         _sdlc_env = _extract_sdlc_env_vars(session.session_id, _gh_repo)
         if _sdlc_env:
             _harness_env.update(_sdlc_env)
+        # The reply trace id, so the harness records its spans (spawn, first
+        # output, tool calls) under the same trace as intake and the relay.
+        if isinstance(session.correlation_id, str) and session.correlation_id:
+            _harness_env[tracing.TRACE_ENV] = session.correlation_id
 
         # D1 precedence cascade: session.model > settings > codebase default.
         # Applied to the runner's PM subprocess; the Dev role runs as a
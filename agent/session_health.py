@@ -46,6 +46,7 @@ from models.session_lifecycle import (
     get_authoritative_session,
 )
 from models.session_lifecycle import TERMINAL_STATUSES as _TERMINAL_STATUSES
+from models.session_projection import hydrate, only
 
 
 def _is_ledger(entry) -> bool:
@@ -2811,7 +2812,12 @@ def flush_deferred_self_draft_sync(session: "AgentSession", status: str | None =
 
             reply_to = int(getattr(source, "telegram_message_id", None) or 0) or None
             payload = build_telegram_outbox_payload(
-                chat_id, message, reply_to, session_id, file_paths=attached
+                chat_id,
+                message,
+                reply_to,
+                session_id,
+                file_paths=attached,
+                trace_id=getattr(source, "correlation_id", None),
             )
             queue_key = f"telegram:outbox:{session_id}"
             _R.rpush(queue_key, json.dumps(payload))
@@ -4301,7 +4307,11 @@ async def _agent_session_health_check() -> None:
     # which would slip past `actual_status in _TERMINAL_STATUSES` (descriptors
     # are not in the terminal-status set) and reach the destructive recovery
     # path.
-    running_sessions = _filter_hydrated_sessions(AgentSession.query.filter(status="running"))
+    #
+    # Projected scan: one HMGET of the health fields per row instead of an
+    # HGETALL of every event log and context dict. Mutation sites below take
+    # hydrate(entry), which loads the full record only for the rows acted on.
+    running_sessions = _filter_hydrated_sessions(only(AgentSession.query.filter(status="running")))
     for entry in running_sessions:
         checked += 1
 
@@ -4348,8 +4358,11 @@ async def _agent_session_health_check() -> None:
                     entry.agent_session_id,
                     entry.response_delivered_at,
                 )
+                record = hydrate(entry)
+                if record is None:
+                    continue
                 finalize_session(
-                    entry, "completed", reason="health check: delivered but not finalized"
+                    record, "completed", reason="health check: delivered but not finalized"
                 )
                 recovered += 1
             except StatusConflictError as e:
@@ -4439,14 +4452,15 @@ async def _agent_session_health_check() -> None:
                     f"claude_session_uuid={entry.claude_session_uuid!r})"
                 )
 
-            if should_recover:
+            record = hydrate(entry) if should_recover else None
+            if record is not None:
                 # Delegate to shared recovery helper (issue #1270). Both this
                 # loop and `_agent_session_tool_timeout_loop` go through the
                 # same code path so MAX_RECOVERY_ATTEMPTS, the OOM defer, the
                 # response-delivered finalize-instead-of-recover guard, and
                 # the kill-switch all apply uniformly.
                 if await _apply_recovery_transition(
-                    entry,
+                    record,
                     reason=reason,
                     reason_kind=_reason_kind,
                     handle=in_scope_handle,
@@ -4476,7 +4490,7 @@ async def _agent_session_health_check() -> None:
             )
 
     # === Check PENDING sessions_list ===
-    pending_sessions = list(AgentSession.query.filter(status="pending"))
+    pending_sessions = only(AgentSession.query.filter(status="pending"))
     for entry in pending_sessions:
         checked += 1
         if _is_ledger(entry):
@@ -4527,8 +4541,11 @@ async def _agent_session_health_check() -> None:
                     )
 
                     try:
+                        record = hydrate(entry)
+                        if record is None:
+                            continue
                         finalize_session(
-                            entry,
+                            record,
                             "abandoned",
                             reason=(
                                 f"health check: orphaned local pending session (chat={worker_key})"
@@ -5279,7 +5296,7 @@ async def _agent_session_tool_timeout_check() -> None:
     if os.environ.get("TOOL_TIMEOUT_TIERS_DISABLED") == "1":
         return
 
-    running_sessions = _filter_hydrated_sessions(AgentSession.query.filter(status="running"))
+    running_sessions = _filter_hydrated_sessions(only(AgentSession.query.filter(status="running")))
     for entry in running_sessions:
         # Terminal-status guard (#1006) — IndexedField may show stale running entries.
         actual_status = getattr(entry, "status", None)
@@ -44,10 +44,23 @@ from agent.session_runner.harness.claude_diagnostics import (
     describe_harness_exit_for_sentry,
 )
 from agent.session_runner.hook_edge import HEADLESS_ENV_OVERRIDES
+from analytics import tracing
+from analytics.metrics import histogram
 from config.enums import ClassificationType
 
 logger = logging.getLogger(__name__)
 
+# Harness subprocess latency (GET /metrics): exec of the claude CLI, and
+# spawn to its first stdout event (cold start, recorded for every turn).
+_SPAWN_SECONDS = histogram(
+    "valor_harness_spawn_seconds", "Time to exec the harness subprocess.", ("harness",)
+).labels("claude")
+_FIRST_OUTPUT_SECONDS = histogram(
+    "valor_harness_first_output_seconds",
+    "Harness spawn to first stdout event.",
+    ("harness",),
+).labels("claude")
+
 # The three ANTHROPIC_* auth keys `stripped_harness_env` pops so a
 # subscription-auth (OAuth) claude child never inherits an API-key base URL or
 # auth token (issue #2100 AC7). Module constant so both spawn sites strip the
@@ -989,6 +1002,13 @@ async def _run_harness_subprocess(
     # TTFT baseline: record spawn timestamp before exec (issue #1227).
     _spawn_ts = time.monotonic()
 
+    # Reply trace (analytics/tracing.py), keyed by the $VALOR_TRACE_ID the
+    # executor put in the env. Spans are buffered and written once after exit.
+    _trace_id = proc_env.get(tracing.TRACE_ENV)
+    _trace_spans: list[dict] = []
+    _tool_starts: dict[str, tuple[str, float]] = {}
+    _spawn_wall = time.time()
+
     # Default asyncio StreamReader limit is 64KB. The claude CLI outputs its
     # full result as a single JSON line — long responses (e.g. multi-cycle
     # analyses) can exceed that, raising LimitExceededError: "Separator is
@@ -1012,6 +1032,7 @@ async def _run_harness_subprocess(
     except Exception as _diag_err:  # noqa: BLE001
         logger.warning("[harness] spawn diagnostic emit failed (non-fatal): %s", _diag_err)
 
+    _exec_t0 = time.perf_counter()
     try:
         proc = await asyncio.create_subprocess_exec(
             *cmd,
@@ -1037,6 +1058,9 @@ async def _run_harness_subprocess(
             except Exception as _cb_err:  # noqa: BLE001
                 logger.warning("on_early_exit_class callback raised: %s", _cb_err)
         return (f"Error: CLI harness not found — {e}", None, None, None, None, None, 0, 0, None)
+    _SPAWN_SECONDS.observe(time.perf_counter() - _exec_t0)
+    if _trace_id:
+        _trace_spans.append(tracing.make_span("harness_spawn", _spawn_wall, time.time()))
 
     # Fire SDK-started callback once the pid is known (#1036).
     if on_sdk_started is not None and proc.pid is not None:
@@ -1052,6 +1076,7 @@ async def _run_harness_subprocess(
     # `structured_output` key, present only on a schema-validated success.
     structured_output: dict | None = None
     _first_stdout_seen = False  # TTFT sentinel (issue #1227)
+    _first_output_observed = False
     # Token + cost fields extracted off the `result` event (issue #1128).
     # Mirrors the SDK path's `ResultMessage.usage` / `.total_cost_usd`
     # so `accumulate_session_tokens` can be fed from either path.
@@ -1081,6 +1106,12 @@ async def _run_harness_subprocess(
             if not line:
                 continue
 
+            if not _first_output_observed:
+                _first_output_observed = True
+                _FIRST_OUTPUT_SECONDS.observe(time.monotonic() - _spawn_ts)
+                if _trace_id:
+                    _trace_spans.append(tracing.make_span("first_output", _spawn_wall, time.time()))
+
             # TTFT measurement: log first-stdout-byte elapsed time (issue #1227).
             # Best-effort — any write failure is silently swallowed so that a
             # permissions error on logs/ never blocks PM session output.
@@ -1192,6 +1223,24 @@ async def _run_harness_subprocess(
                     b for b in content_blocks if isinstance(b, dict) and b.get("type") == "tool_use"
                 ]
                 tool_call_count += len(tool_use_blocks)
+                if _trace_id:
+                    _now = time.time()
+                    for block in tool_use_blocks:
+                        _tool_starts[block.get("id")] = (block.get("name") or "tool", _now)
+                continue
+
+            # Tool results come back on `user` events; close the matching
+            # tool spans opened above.
+            if event_type == "user" and _tool_starts:
+                content = (data.get("message") or {}).get("content")
+                _now = time.time()
+                for block in content if isinstance(content, list) else []:
+                    if isinstance(block, dict) and block.get("type") == "tool_result":
+                        started = _tool_starts.pop(block.get("tool_use_id"), None)
+                        if started:
+                            _trace_spans.append(
+                                tracing.make_span(f"tool:{started[0]}", started[1], _now)
+                            )
                 continue
 
             if event_type == "stream_event":
@@ -1224,6 +1273,17 @@ async def _run_harness_subprocess(
 
         _, stderr_data = await proc.communicate()
         returncode = proc.returncode if proc.returncode is not None else 0
+        if _trace_id:
+            _trace_spans.append(
+                tracing.make_span(
+                    "harness_turn",
+                    _spawn_wall,
+                    time.time(),
+                    returncode=returncode,
+                    tool_calls=tool_call_count,
+                )
+            )
+            await asyncio.to_thread(tracing.record_spans, _trace_id, _trace_spans)
     finally:
         # Kill the subprocess if it is still alive because the awaiting
         # coroutine is being torn down (e.g. CancelledError). SAFETY: only
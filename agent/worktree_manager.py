@@ -10,6 +10,7 @@ import os
 import re
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Literal
 
@@ -1273,6 +1274,11 @@ def create_worktree(repo_root: Path, slug: str, base_branch: str = "main") -> Pa
     detected, cleaned up, and creation proceeds. This makes the function
     resilient to crashed or abandoned sessions.
 
+    A new worktree is claimed from the pre-warmed pool
+    (``agent/worktree_pool.py``) when one is ready, which replaces the
+    ``git worktree add`` + full ``uv sync`` with a move, a branch checkout and
+    an incremental re-sync. On a miss it is created cold, as before.
+
     Recovery cases handled:
     - Worktree directory exists and is valid: returns existing path (no-op).
     - Worktree directory is gone but git still tracks it: prunes the stale
@@ -1297,6 +1303,7 @@ def create_worktree(repo_root: Path, slug: str, base_branch: str = "main") -> Pa
 
     worktree_dir = repo_root / WORKTREES_DIR / slug
     branch_name = f"session/{slug}"
+    started = time.monotonic()
 
     if worktree_dir.exists():
         logger.info(f"Worktree already exists: {worktree_dir}")
@@ -1330,8 +1337,18 @@ def create_worktree(repo_root: Path, slug: str, base_branch: str = "main") -> Pa
             )
             prune_worktrees(repo_root)
 
+    branch_exists = _branch_exists(repo_root, branch_name)
+
+    from agent import worktree_pool
+
+    if worktree_pool.claim(repo_root, slug, base_branch, branch_exists=branch_exists):
+        _copy_local_settings(repo_root, worktree_dir)
+        _record_lane_start(started, "pool")
+        logger.info(f"Claimed pooled worktree: {worktree_dir} (branch: {branch_name})")
+        return worktree_dir
+
     # If the branch already exists (e.g., from a previous session), reuse it
-    if _branch_exists(repo_root, branch_name):
+    if branch_exists:
         cmd = ["git", "worktree", "add", str(worktree_dir), branch_name]
     else:
         cmd = [
@@ -1353,12 +1370,7 @@ def create_worktree(repo_root: Path, slug: str, base_branch: str = "main") -> Pa
         timeout=settings.timeouts.git_subprocess_s,
     )
 
-    # Copy settings.local.json if it exists (not tracked by git)
-    local_settings = repo_root / ".claude" / "settings.local.json"
-    if local_settings.exists():
-        target_dir = worktree_dir / ".claude"
-        target_dir.mkdir(exist_ok=True)
-        shutil.copy2(local_settings, target_dir / "settings.local.json")
+    _copy_local_settings(repo_root, worktree_dir)
 
     # Per-worktree venv isolation (issue #2052): eagerly provision a complete
     # worktree-local environment so lane commands never depend on -- or
@@ -1366,10 +1378,30 @@ def create_worktree(repo_root: Path, slug: str, base_branch: str = "main") -> Pa
     # logs loudly but never fails worktree creation.
     provision_worktree_venv(worktree_dir)
 
+    _record_lane_start(started, "cold")
     logger.info(f"Created worktree: {worktree_dir} (branch: {branch_name})")
     return worktree_dir
 
 
+def _copy_local_settings(repo_root: Path, worktree_dir: Path) -> None:
+    """Copy settings.local.json into the worktree if it exists (not tracked by git)."""
+    local_settings = repo_root / ".claude" / "settings.local.json"
+    if local_settings.exists():
+        target_dir = worktree_dir / ".claude"
+        target_dir.mkdir(exist_ok=True)
+        shutil.copy2(local_settings, target_dir / "settings.local.json")
+
+
+def _record_lane_start(started: float, source: str) -> None:
+    """Emit ``worktree.lane_start_s`` for a new lane (``source``: pool / cold)."""
+    try:
+        from analytics.collector import record_metric
+
+        record_metric("worktree.lane_start_s", time.monotonic() - started, {"source": source})
+    except Exception:  # noqa: S110 -- optional analytics telemetry
+        pass
+
+
 def get_or_create_worktree(repo_root: Path, slug: str, base_branch: str = "main") -> Path:
     """Return an existing worktree path or create a new one.
 
@@ -1553,6 +1585,7 @@ def remove_worktree(
     slug: str,
     delete_branch: bool = True,
     force: bool = False,
+    recycle: bool = False,
 ) -> bool | tuple[Literal["blocked"], str]:
     """Remove a git worktree and optionally its branch.
 
@@ -1576,6 +1609,10 @@ def remove_worktree(
             references it. A WARNING is logged in that case. Use only
             when the session has already been verified dead but its row
             has not yet flipped to a terminal status.
+        recycle: If True, hand the worktree back to the pre-warmed pool
+            (``agent/worktree_pool.recycle``) instead of deleting it, when
+            the pool has room. It is reset and detached either way, so the
+            branch can still be deleted.
 
     Returns:
         True if successfully removed, False if the worktree was missing or
@@ -1659,19 +1696,24 @@ def remove_worktree(
     # Non-blocking: failure here degrades to loud logging and teardown proceeds.
     preserve_uncommitted_worktree_changes(repo_root, slug, worktree_dir)
 
-    try:
-        subprocess.run(
-            ["git", "worktree", "remove", "--force", str(worktree_dir)],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=settings.timeouts.git_subprocess_s,
-        )
-        logger.info(f"Removed worktree: {worktree_dir}")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to remove worktree {worktree_dir}: {e.stderr}")
-        return False
+    from agent import worktree_pool
+
+    if recycle and worktree_pool.recycle(repo_root, worktree_dir):
+        logger.info(f"Recycled worktree into the pool: {worktree_dir}")
+    else:
+        try:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(worktree_dir)],
+                cwd=repo_root,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=settings.timeouts.git_subprocess_s,
+            )
+            logger.info(f"Removed worktree: {worktree_dir}")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to remove worktree {worktree_dir}: {e.stderr}")
+            return False
 
     if delete_branch:
         branch_result = safe_delete_branch(
@@ -1696,7 +1738,7 @@ def remove_worktree(
 
 
 def list_worktrees(repo_root: Path) -> list[dict]:
-    """List all worktrees under .worktrees/.
+    """List all lane worktrees under .worktrees/ (pool members are not lanes).
 
     Returns:
         List of dicts with 'slug', 'path', 'branch' keys
@@ -1713,11 +1755,17 @@ def list_worktrees(repo_root: Path) -> list[dict]:
         timeout=settings.timeouts.git_subprocess_s,
     )
 
+    from agent.worktree_pool import is_pool_path
+
+    def _is_lane(entry: dict) -> bool:
+        path = entry.get("path", "")
+        return WORKTREES_DIR in path and not is_pool_path(repo_root, path)
+
     worktrees = []
     current: dict = {}
     for line in result.stdout.strip().split("\n"):
         if line.startswith("worktree "):
-            if current and WORKTREES_DIR in current.get("path", ""):
+            if current and _is_lane(current):
                 worktrees.append(current)
             current = {"path": line.split(" ", 1)[1]}
         elif line.startswith("branch "):
@@ -1726,7 +1774,7 @@ def list_worktrees(repo_root: Path) -> list[dict]:
             path = Path(current["path"])
             current["slug"] = path.name
 
-    if current and WORKTREES_DIR in current.get("path", ""):
+    if current and _is_lane(current):
         worktrees.append(current)
 
     return worktrees
@@ -1959,7 +2007,8 @@ def cleanup_after_merge(repo_root: Path, slug: str) -> dict:
     This is the post-merge cleanup step for the SDLC pipeline. After
     `gh pr merge --squash --delete-branch` deletes the remote branch,
     this function removes the local worktree and branch that would
-    otherwise block deletion.
+    otherwise block deletion. The worktree is recycled into the pre-warmed
+    pool when it has room, and the pool is refilled in the background.
 
     The branch deletion is guarded by the unmerged-branch guard (issue #1646):
     safe_delete_branch verifies the merged precondition (via merged_via_tree) before
@@ -2007,7 +2056,7 @@ def cleanup_after_merge(repo_root: Path, slug: str) -> dict:
 
     # Step 1: Remove worktree if it exists
     if had_worktree:
-        removed = remove_worktree(repo_root, slug, delete_branch=False)
+        removed = remove_worktree(repo_root, slug, delete_branch=False, recycle=True)
         # Issue #1357: remove_worktree returns ("blocked", session_id) when a
         # live AgentSession references the worktree. Surface that into the
         # result dict so post_merge_cleanup.py can exit 2 and the operator
@@ -2065,6 +2114,11 @@ def cleanup_after_merge(repo_root: Path, slug: str) -> dict:
         result["already_clean"] = True
         logger.info(f"Post-merge: nothing to clean up for {slug}")
 
+    # Top the worktree pool back up on the new main tip, off the caller's path.
+    from agent import worktree_pool
+
+    worktree_pool.refill_in_background(repo_root)
+
     # Issue #2050: warn-only backstop for the SHARED repo-root .venv. Since
     # issue #2052, lanes get isolated per-worktree envs, but the main checkout
     # still runs on the shared env -- a `uv sync` that slipped past the
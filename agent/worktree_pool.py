@@ -0,0 +1,364 @@
+"""Pre-warmed worktree pool for SDLC lane start.
+
+``create_worktree`` used to run ``git worktree add`` and then a full
+``uv sync --all-extras`` on the critical path of every BUILD/PATCH lane, and
+``cleanup_after_merge`` threw both away again. This module keeps up to
+:func:`pool_size` detached, venv-provisioned worktrees on the main tip under
+``.worktrees/.pool/`` so a lane starts from one of them instead:
+
+- **Claim** (:func:`claim`): ``git worktree move`` a ready member to
+  ``.worktrees/{slug}``, check out ``session/{slug}`` (a diff against the
+  pool's main tip, not a full checkout), then re-run
+  ``provision_worktree_venv``. The venv was created ``--relocatable``, so the
+  move leaves its entry points working; the re-sync only reinstalls the
+  editable project at its new path and whatever the lockfile changed since.
+- **Recycle** (:func:`recycle`): ``cleanup_after_merge`` hands a merged lane
+  back instead of deleting it. It is hard-reset, cleaned (keeping
+  ``.venv``), detached onto main and moved back into the pool, if there is
+  room.
+- **Refill** (:func:`refill`, :func:`refill_in_background`): tops the pool up
+  to size after each merge and after a miss. Members are built under
+  ``.pool/.building-*`` and moved in only once provisioned, so a claim never
+  sees a half-built member.
+
+Every step is fail-open: a failed claim falls back to the cold path in
+``create_worktree``, and a failed recycle falls back to removal.
+
+Metrics (``analytics.collector.record_metric``): ``worktree.pool.claim``
+(``result`` = ``hit`` / ``miss``) and ``worktree.lane_start_s`` (``source`` =
+``pool`` / ``cold``, recorded by ``create_worktree``).
+"""
+
+from __future__ import annotations
+
+import fcntl
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+POOL_DIR = ".pool"
+_BUILDING_PREFIX = ".building-"
+_CLAIM_LOCK = ".claim.lock"
+_FILL_LOCK = ".fill.lock"
+
+_refill_threads: dict[str, threading.Thread] = {}
+_refill_guard = threading.Lock()
+
+
+def pool_size() -> int:
+    """Target number of ready members (``WORKTREE_POOL_SIZE``, default 2; 0 disables)."""
+    try:
+        return max(0, int(os.environ.get("WORKTREE_POOL_SIZE", "2")))
+    except ValueError:
+        return 0
+
+
+def pool_root(repo_root: Path) -> Path:
+    from agent.worktree_manager import WORKTREES_DIR
+
+    return Path(repo_root) / WORKTREES_DIR / POOL_DIR
+
+
+def is_pool_path(repo_root: Path, path: str | Path) -> bool:
+    """True when ``path`` is a pool member (ready or building), not a lane."""
+    return Path(path).resolve().is_relative_to(pool_root(repo_root).resolve())
+
+
+def ready_members(repo_root: Path) -> list[Path]:
+    """Ready members, oldest first: provisioned and not being built."""
+    from agent.worktree_manager import PROVISIONED_MARKER
+
+    root = pool_root(repo_root)
+    if not root.is_dir():
+        return []
+    members = [
+        p
+        for p in root.iterdir()
+        if p.is_dir()
+        and not p.name.startswith(".")
+        and (p / ".git").is_file()
+        and (p / ".venv" / PROVISIONED_MARKER).exists()
+    ]
+    return sorted(members, key=lambda p: p.stat().st_mtime)
+
+
+def _git(cwd: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=settings.timeouts.git_subprocess_s,
+    )
+
+
+@contextmanager
+def _locked(repo_root: Path, name: str, *, blocking: bool = True):
+    """Hold an ``flock`` on ``.pool/{name}``; yields False if non-blocking and busy."""
+    root = pool_root(repo_root)
+    root.mkdir(parents=True, exist_ok=True)
+    fd = os.open(root / name, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _record_claim(result: str) -> None:
+    try:
+        from analytics.collector import record_metric
+
+        record_metric("worktree.pool.claim", 1.0, {"result": result})
+    except Exception:  # noqa: S110 -- optional analytics telemetry
+        pass
+
+
+def _force_remove(repo_root: Path, worktree_dir: Path) -> None:
+    """Drop a pool-owned worktree (never a lane: callers pass pool or just-claimed paths)."""
+    try:
+        _git(repo_root, "worktree", "remove", "--force", str(worktree_dir))
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        logger.warning("[worktree-pool] could not remove %s: %s", worktree_dir, e)
+        if worktree_dir.exists() and is_pool_path(repo_root, worktree_dir):
+            shutil.rmtree(worktree_dir, ignore_errors=True)
+        _git_prune(repo_root)
+
+
+def _git_prune(repo_root: Path) -> None:
+    try:
+        _git(repo_root, "worktree", "prune")
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        pass
+
+
+def claim(
+    repo_root: Path, slug: str, base_branch: str = "main", *, branch_exists: bool = False
+) -> Path | None:
+    """Turn a ready member into the lane ``.worktrees/{slug}``; None on a miss.
+
+    ``branch_exists`` selects ``git checkout session/{slug}`` (resume) over
+    ``git checkout -b session/{slug} {base_branch}``. The caller has already
+    freed the branch from any stale worktree. A failed checkout or venv
+    re-sync removes the claimed member and counts as a miss, so the caller
+    falls back to the cold create.
+    """
+    from agent.worktree_manager import PROVISIONED_MARKER, WORKTREES_DIR, provision_worktree_venv
+
+    if pool_size() == 0:
+        return None
+    target = Path(repo_root) / WORKTREES_DIR / slug
+    branch_name = f"session/{slug}"
+
+    member = None
+    with _locked(repo_root, _CLAIM_LOCK):
+        for candidate in ready_members(repo_root):
+            try:
+                _git(repo_root, "worktree", "move", str(candidate), str(target))
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+                logger.warning("[worktree-pool] could not move %s: %s", candidate, e)
+                continue
+            member = candidate
+            break
+
+    if member is None:
+        _record_claim("miss")
+        refill_in_background(repo_root)
+        return None
+
+    try:
+        if branch_exists:
+            _git(target, "checkout", branch_name)
+        else:
+            _git(target, "checkout", "-b", branch_name, base_branch)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        stderr = getattr(e, "stderr", "") or ""
+        logger.warning(
+            "[worktree-pool] checkout of %s in claimed %s failed: %s",
+            branch_name,
+            target,
+            stderr.strip()[-300:] or e,
+        )
+        _force_remove(repo_root, target)
+        _record_claim("miss")
+        return None
+
+    # The venv moved with the worktree: re-sync so the editable install points
+    # here and the env matches this branch's lockfile. A failed re-sync leaves
+    # a venv pointing at the old member path, so hand back to the cold path.
+    (target / ".venv" / PROVISIONED_MARKER).unlink(missing_ok=True)
+    if not provision_worktree_venv(target):
+        logger.warning(
+            "[worktree-pool] venv re-sync failed in claimed %s; falling back to a cold create",
+            target,
+        )
+        _force_remove(repo_root, target)
+        if not branch_exists:
+            # The cold path creates the branch itself (``worktree add -b``).
+            try:
+                _git(repo_root, "branch", "-D", branch_name)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+                logger.warning("[worktree-pool] could not delete %s: %s", branch_name, e)
+        _record_claim("miss")
+        refill_in_background(repo_root)
+        return None
+
+    _record_claim("hit")
+    logger.info("[worktree-pool] claimed %s for %s", member.name, target)
+    refill_in_background(repo_root)
+    return target
+
+
+def recycle(repo_root: Path, worktree_dir: Path, base_branch: str = "main") -> bool:
+    """Reset a finished lane and move it back into the pool; False to remove instead.
+
+    The caller has already preserved uncommitted work and passed the busy
+    guards. The lane's branch is left alone (the worktree ends up detached).
+    """
+    from agent.worktree_manager import PROVISIONED_MARKER, _resolve_base
+
+    worktree_dir = Path(worktree_dir)
+    if pool_size() == 0 or not (worktree_dir / ".venv" / PROVISIONED_MARKER).exists():
+        return False
+    if not _venv_is_relocatable(worktree_dir / ".venv"):
+        return False
+    base = _resolve_base(str(repo_root), base_branch)
+    if base is None:
+        return False
+
+    with _locked(repo_root, _CLAIM_LOCK):
+        if len(ready_members(repo_root)) >= pool_size():
+            return False
+        member = pool_root(repo_root) / uuid.uuid4().hex[:12]
+        try:
+            _git(worktree_dir, "reset", "--hard", "-q")
+            _git(worktree_dir, "clean", "-ffdxq", "-e", ".venv")
+            _git(worktree_dir, "checkout", "-q", "--detach", base)
+            _git(repo_root, "worktree", "move", str(worktree_dir), str(member))
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.warning("[worktree-pool] recycle of %s failed: %s", worktree_dir, e)
+            return False
+    logger.info("[worktree-pool] recycled %s into the pool as %s", worktree_dir, member.name)
+    return True
+
+
+def _venv_is_relocatable(venv_dir: Path) -> bool:
+    try:
+        return "relocatable = true" in (venv_dir / "pyvenv.cfg").read_text()
+    except OSError:
+        return False
+
+
+def _build_member(repo_root: Path, base: str) -> bool:
+    """Create, provision and publish one member. Caller holds the fill lock."""
+    from agent.worktree_manager import provision_worktree_venv, worktree_interpreter_pin
+
+    building = pool_root(repo_root) / f"{_BUILDING_PREFIX}{uuid.uuid4().hex[:12]}"
+    try:
+        _git(repo_root, "worktree", "add", "--detach", str(building), base)
+        # Relocatable: entry-point shebangs are relative, so the venv survives
+        # the `git worktree move` that claims this member.
+        cmd = ["uv", "venv", "--relocatable", "--quiet", str(building / ".venv")]
+        pin = worktree_interpreter_pin(building)
+        if pin is not None:
+            cmd += ["--python", pin]
+        env = dict(os.environ)
+        env.pop("VIRTUAL_ENV", None)
+        subprocess.run(
+            cmd,
+            cwd=building,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=settings.timeouts.uv_sync_s,
+        )
+        if not provision_worktree_venv(building):
+            raise RuntimeError("provision_worktree_venv failed")
+        member = pool_root(repo_root) / building.name.removeprefix(_BUILDING_PREFIX)
+        with _locked(repo_root, _CLAIM_LOCK):
+            _git(repo_root, "worktree", "move", str(building), str(member))
+    except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        OSError,
+        RuntimeError,
+    ) as e:
+        stderr = getattr(e, "stderr", "") or ""
+        logger.warning(
+            "[worktree-pool] building a pool member failed: %s", stderr.strip()[-300:] or e
+        )
+        if building.exists():
+            _force_remove(repo_root, building)
+        return False
+    logger.info("[worktree-pool] added %s on %s", member.name, base)
+    return True
+
+
+def refill(repo_root: Path, size: int | None = None, base_branch: str = "main") -> int:
+    """Build members until ``size`` are ready; returns how many were added.
+
+    Only one filler runs per repo (non-blocking ``flock``); a second caller
+    returns 0 at once. Leftover ``.building-*`` dirs from a crashed filler are
+    removed first.
+    """
+    from agent.worktree_manager import _resolve_base
+
+    repo_root = Path(repo_root)
+    size = pool_size() if size is None else size
+    if size == 0:
+        return 0
+    base = _resolve_base(str(repo_root), base_branch)
+    if base is None:
+        return 0
+
+    added = 0
+    with _locked(repo_root, _FILL_LOCK, blocking=False) as acquired:
+        if not acquired:
+            return 0
+        for leftover in pool_root(repo_root).glob(f"{_BUILDING_PREFIX}*"):
+            _force_remove(repo_root, leftover)
+        while len(ready_members(repo_root)) < size:
+            if not _build_member(repo_root, base):
+                break
+            added += 1
+    return added
+
+
+def refill_in_background(repo_root: Path) -> None:
+    """Start :func:`refill` on a daemon thread unless one is already running."""
+    repo_root = Path(repo_root)
+    if pool_size() == 0 or not repo_root.is_dir():
+        return
+    key = str(repo_root.resolve())
+    with _refill_guard:
+        running = _refill_threads.get(key)
+        if running is not None and running.is_alive():
+            return
+
+        def _run() -> None:
+            try:
+                refill(repo_root)
+            except Exception as e:  # never let a background fill surface
+                logger.warning("[worktree-pool] background refill failed: %s", e)
+
+        thread = threading.Thread(target=_run, name="worktree-pool-refill", daemon=True)
+        _refill_threads[key] = thread
+        thread.start()
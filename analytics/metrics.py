@@ -0,0 +1,459 @@
+"""In-process latency histograms, counters and gauges for hot paths.
+
+``analytics.record_metric`` writes one SQLite row per observation, which is
+fine for per-session facts (cost, turns) and far too expensive for per-call
+timing. This module is the cheap side: every metric is a preallocated list
+of integers in process memory, and an observation is a ``bisect`` plus a few
+in-place increments. No locks are taken on the hot path; under free
+threading a concurrent increment may rarely be lost, which a latency
+distribution tolerates.
+
+Shape (modelled on ``prometheus_client`` so the names read the same):
+
+- :func:`histogram`, :func:`counter` and :func:`gauge` register a *family*
+  (name, help, label names) once, at module import. Registering the same
+  name again returns the existing family, so module reloads are safe.
+- ``family.labels(*values)`` returns the child handle for one label set.
+  Handles are cached; hot paths resolve them once and keep them.
+- :class:`Histogram` has fixed bucket bounds (:data:`LATENCY_BOUNDS`, 1 /
+  2.5 / 5 per decade from 10µs to 500s), lifetime bucket counts, and a ring
+  of :data:`WINDOW_SLOTS` per-slot bucket arrays for windowed percentiles
+  (:meth:`Histogram.quantile`). The exporter rotates the ring once per
+  interval, so the window is ``WINDOW_SLOTS * METRICS_EXPORT_INTERVAL_S``.
+- :func:`timed` (or ``histogram.time()``) times a block or a sync/async
+  function with ``time.perf_counter``.
+
+Multi-process view: each long-running process (bridge, worker, reflection
+worker, UI) calls :func:`start_exporter` with its name. A daemon thread
+writes :func:`snapshot` as JSON to ``metrics:snapshot:{process}:{pid}``
+every :data:`METRICS_EXPORT_INTERVAL_S` seconds with a TTL of three
+intervals, so a dead process drops out on its own. ``ui/app.py``'s
+``/metrics`` route merges those snapshots (:func:`collect`) and renders the
+Prometheus text format (:func:`render_prometheus`).
+
+Usage::
+
+    from analytics.metrics import histogram
+
+    SEND_SECONDS = histogram("valor_send_seconds", "Send latency.", ("type",))
+    _TEXT = SEND_SECONDS.labels("text")
+
+    with _TEXT.time():
+        await send()
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency buckets; a final +Inf bucket is implied.
+LATENCY_BOUNDS: tuple[float, ...] = tuple(
+    float(f"{m}e{e}") for e in range(-5, 3) for m in ("1", "2.5", "5")
+)
+
+# Snapshot cadence and ring-slot width, in seconds.
+METRICS_EXPORT_INTERVAL_S = float(os.environ.get("METRICS_EXPORT_INTERVAL_S", "15"))
+
+# Ring slots per histogram: the quantile window is this many intervals
+# (20 x 15s = 5 minutes by default).
+WINDOW_SLOTS = max(1, int(os.environ.get("METRICS_WINDOW_SLOTS", "20")))
+
+SNAPSHOT_KEY_PREFIX = "metrics:snapshot"
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Gauge:
+    """A value that goes up and down (in-flight work, pool sizes)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class Histogram:
+    """Fixed-bucket histogram with a ring of per-interval bucket counts."""
+
+    __slots__ = ("bounds", "counts", "sum", "_ring", "_pos", "_cur")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BOUNDS) -> None:
+        self.bounds = tuple(bounds)
+        size = len(self.bounds) + 1
+        self.counts = [0] * size
+        self.sum = 0.0
+        self._ring = [[0] * size for _ in range(WINDOW_SLOTS)]
+        self._pos = 0
+        self._cur = self._ring[0]
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self.bounds, value)
+        self.counts[i] += 1
+        self._cur[i] += 1
+        self.sum += value
+
+    def time(self) -> timed:
+        return timed(self)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def rotate(self) -> None:
+        """Start a new ring slot, dropping the oldest from the window."""
+        pos = (self._pos + 1) % len(self._ring)
+        slot = self._ring[pos]
+        slot[:] = [0] * len(slot)
+        self._pos = pos
+        self._cur = slot
+
+    def window_counts(self) -> list[int]:
+        return [sum(col) for col in zip(*self._ring, strict=True)]
+
+    def quantile(self, q: float, *, window: bool = True) -> float:
+        """Estimate the ``q`` quantile, interpolating inside its bucket; 0.0 when empty.
+
+        Values past the last bound report that bound.
+        """
+        counts = self.window_counts() if window else list(self.counts)
+        total = sum(counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for i, n in enumerate(counts):
+            if n and seen + n >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+
+_KINDS = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+
+class MetricFamily:
+    """A named metric and its children, one per label-value tuple."""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        labelnames: Sequence[str],
+        bounds: Sequence[float] = LATENCY_BOUNDS,
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.bounds = tuple(bounds)
+        self.children: dict[tuple[str, ...], Counter | Gauge | Histogram] = {}
+
+    def labels(self, *values: object):
+        key = tuple(str(v) for v in values)
+        child = self.children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            child = Histogram(self.bounds) if self.kind == "histogram" else _KINDS[self.kind]()
+            child = self.children.setdefault(key, child)
+        return child
+
+    # Label-less families act as their single child.
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def time(self) -> timed:
+        return timed(self.labels())
+
+
+_registry: dict[str, MetricFamily] = {}
+_registry_lock = threading.Lock()
+
+
+def _register(name, kind, help_text, labelnames, bounds=LATENCY_BOUNDS) -> MetricFamily:
+    with _registry_lock:
+        family = _registry.get(name)
+        if family is None:
+            family = _registry[name] = MetricFamily(name, kind, help_text, labelnames, bounds)
+        elif family.kind != kind or family.labelnames != tuple(labelnames):
+            raise ValueError(f"metric {name} already registered as {family.kind}")
+        return family
+
+
+def histogram(
+    name: str,
+    help_text: str,
+    labelnames: Sequence[str] = (),
+    bounds: Sequence[float] = LATENCY_BOUNDS,
+) -> MetricFamily:
+    return _register(name, "histogram", help_text, labelnames, bounds)
+
+
+def counter(name: str, help_text: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+    return _register(name, "counter", help_text, labelnames)
+
+
+def gauge(name: str, help_text: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+    return _register(name, "gauge", help_text, labelnames)
+
+
+class timed:  # noqa: N801 - used like a function: ``with timed(h):`` / ``@timed(h)``
+    """Observe elapsed seconds into a histogram, as a context manager or decorator."""
+
+    __slots__ = ("_hist", "_t0")
+
+    def __init__(self, hist: Histogram | MetricFamily) -> None:
+        self._hist = hist.labels() if isinstance(hist, MetricFamily) else hist
+
+    def __enter__(self) -> timed:
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._hist.observe(time.perf_counter() - self._t0)
+
+    def __call__(self, fn):
+        hist = self._hist
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                t0 = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    hist.observe(time.perf_counter() - t0)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.observe(time.perf_counter() - t0)
+
+        return wrapper
+
+
+# ── Snapshot / export ──────────────────────────────────────────────────────
+
+_process_name = "local"
+_exporter: threading.Thread | None = None
+
+
+def rotate_windows() -> None:
+    """Advance every histogram's ring by one slot."""
+    for family in list(_registry.values()):
+        if family.kind == "histogram":
+            for child in list(family.children.values()):
+                child.rotate()
+
+
+def snapshot(process: str | None = None) -> dict:
+    """This process's metrics as a JSON-serializable dict."""
+    families = []
+    for family in list(_registry.values()):
+        samples = []
+        for labels, child in list(family.children.items()):
+            if family.kind == "histogram":
+                samples.append(
+                    {"labels": list(labels), "counts": list(child.counts), "sum": child.sum}
+                )
+            else:
+                samples.append({"labels": list(labels), "value": child.value})
+        entry = {
+            "name": family.name,
+            "type": family.kind,
+            "help": family.help,
+            "labelnames": list(family.labelnames),
+            "samples": samples,
+        }
+        if family.kind == "histogram":
+            entry["bounds"] = list(family.bounds)
+        families.append(entry)
+    return {
+        "process": process or _process_name,
+        "pid": os.getpid(),
+        "ts": time.time(),
+        "families": families,
+    }
+
+
+def export_snapshot(process: str | None = None) -> bool:
+    """Write this process's snapshot to Redis. Never raises."""
+    data = snapshot(process)
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        POPOTO_REDIS_DB.set(
+            f"{SNAPSHOT_KEY_PREFIX}:{data['process']}:{data['pid']}",
+            json.dumps(data, separators=(",", ":")),
+            ex=max(1, int(METRICS_EXPORT_INTERVAL_S * 3)),
+        )
+        return True
+    except Exception as e:
+        logger.debug("[metrics] snapshot export failed (non-fatal): %s", e)
+        return False
+
+
+def _export_loop(stop: threading.Event) -> None:
+    while not stop.wait(METRICS_EXPORT_INTERVAL_S):
+        rotate_windows()
+        export_snapshot()
+
+
+def start_exporter(process: str) -> bool:
+    """Name this process and start the snapshot thread (once per process).
+
+    A no-op under pytest, like ``config.redis_bootstrap``: tests call
+    :func:`export_snapshot` directly. Returns whether a thread was started.
+    """
+    global _process_name, _exporter
+    _process_name = process
+    if os.environ.get("PYTEST_CURRENT_TEST") or _exporter is not None:
+        return False
+    _exporter = threading.Thread(
+        target=_export_loop, args=(threading.Event(),), name="metrics-export", daemon=True
+    )
+    _exporter.start()
+    export_snapshot()
+    logger.info("[metrics] exporting %s snapshots every %ss", process, METRICS_EXPORT_INTERVAL_S)
+    return True
+
+
+def load_snapshots() -> list[dict]:
+    """Every live process snapshot in Redis."""
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    keys = list(POPOTO_REDIS_DB.scan_iter(match=f"{SNAPSHOT_KEY_PREFIX}:*", count=100))
+    snapshots = []
+    for raw in POPOTO_REDIS_DB.mget(keys) if keys else []:
+        try:
+            snapshots.append(json.loads(raw))
+        except (TypeError, ValueError):
+            continue
+    return snapshots
+
+
+def collect(process: str | None = None) -> list[dict]:
+    """Redis snapshots, with this process's entry replaced by a live one."""
+    try:
+        stored = [s for s in load_snapshots() if s.get("pid") != os.getpid()]
+    except Exception as e:
+        logger.warning("[metrics] could not load snapshots: %s", e)
+        stored = []
+    return [*stored, snapshot(process)]
+
+
+# ── Prometheus text format ────────────────────────────────────────────────
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(pairs: Iterable[tuple[str, str]]) -> str:
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(snapshots: Iterable[dict]) -> str:
+    """Merge process snapshots into Prometheus text exposition format.
+
+    Samples gain a ``process`` label; processes of the same name (a restart
+    overlapping its predecessor's TTL, several workers) are summed.
+    Histograms whose bounds differ from the first seen are skipped.
+    """
+    merged: dict[str, dict] = {}
+    for snap in snapshots:
+        process = str(snap.get("process", "unknown"))
+        for fam in snap.get("families", []):
+            out = merged.setdefault(
+                fam["name"],
+                {
+                    "type": fam["type"],
+                    "help": fam.get("help", ""),
+                    "labelnames": ["process", *fam.get("labelnames", [])],
+                    "bounds": fam.get("bounds"),
+                    "samples": {},
+                },
+            )
+            if out["type"] != fam["type"] or out["bounds"] != fam.get("bounds"):
+                continue
+            for sample in fam.get("samples", []):
+                key = (process, *sample["labels"])
+                if fam["type"] == "histogram":
+                    acc = out["samples"].setdefault(key, [[0] * len(sample["counts"]), 0.0])
+                    acc[0] = [a + b for a, b in zip(acc[0], sample["counts"], strict=True)]
+                    acc[1] += sample["sum"]
+                else:
+                    out["samples"][key] = out["samples"].get(key, 0.0) + sample["value"]
+
+    lines: list[str] = []
+    for name in sorted(merged):
+        fam = merged[name]
+        lines.append(f"# HELP {name} {fam['help']}")
+        lines.append(f"# TYPE {name} {fam['type']}")
+        for key in sorted(fam["samples"]):
+            pairs = list(zip(fam["labelnames"], key, strict=True))
+            value = fam["samples"][key]
+            if fam["type"] != "histogram":
+                lines.append(f"{name}{_label_str(pairs)} {_fmt(value)}")
+                continue
+            counts, total = value
+            cumulative = 0
+            for bound, n in zip([*fam["bounds"], float("inf")], counts, strict=True):
+                cumulative += n
+                le = _label_str([*pairs, ("le", _fmt(bound))])
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            lines.append(f"{name}_sum{_label_str(pairs)} {_fmt(total)}")
+            lines.append(f"{name}_count{_label_str(pairs)} {cumulative}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,224 @@
+"""Reply traces: where the time went between a Telegram message and its reply.
+
+A message crosses several processes before Valor answers: bridge intake, the
+session queue, the worker's executor (enrichment), the ``claude -p`` harness
+subprocess (spawn, first output, tool calls) and the bridge relay's send.
+Each step records a *span* against one trace id, so the dashboard can draw
+the waterfall for a slow reply.
+
+The trace id is the session's existing ``correlation_id`` (minted at intake
+in ``bridge/telegram_bridge.py`` and stored on ``AgentSession``). It reaches
+the harness subprocess as ``$VALOR_TRACE_ID`` (:data:`TRACE_ENV`) and the
+relay as ``trace_id`` on the outbox payload.
+
+Storage, in ``POPOTO_REDIS_DB``, all expiring after :data:`TRACE_RETENTION_S`:
+
+- ``trace:{trace_id}:meta``: hash with ``started_at`` (epoch seconds of
+  intake) and intake attributes (session, chat, sender).
+- ``trace:{trace_id}:spans``: list of JSON spans, ``{"name", "start",
+  "end", "attrs"}``, in epoch seconds.
+- ``trace:replies:{YYYY-MM-DD}``: sorted set of trace ids scored by seconds
+  from intake to the first reply sent that UTC day, which backs the "slowest
+  replies" report (:func:`slowest_replies`).
+
+Writers never raise: tracing is diagnostics and must not fail a turn. A
+falsy trace id makes every writer a no-op, so call sites need no guard.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+# Env var carrying the trace id into the harness subprocess (and its hooks).
+TRACE_ENV = "VALOR_TRACE_ID"
+
+TRACE_RETENTION_S = int(float(os.environ.get("TRACE_RETENTION_DAYS", "7")) * 86400)
+
+KEY_PREFIX = "trace"
+
+
+def _meta_key(trace_id: str) -> str:
+    return f"{KEY_PREFIX}:{trace_id}:meta"
+
+
+def _spans_key(trace_id: str) -> str:
+    return f"{KEY_PREFIX}:{trace_id}:spans"
+
+
+def _replies_key(day: str) -> str:
+    return f"{KEY_PREFIX}:replies:{day}"
+
+
+def _today() -> str:
+    return datetime.now(tz=UTC).strftime("%Y-%m-%d")
+
+
+def make_span(name: str, start: float, end: float, **attrs) -> dict:
+    """A span dict for :func:`record_spans`; ``None`` attributes are dropped."""
+    return {
+        "name": name,
+        "start": start,
+        "end": end,
+        "attrs": {k: v for k, v in attrs.items() if v is not None},
+    }
+
+
+def start_trace(
+    trace_id: str | None, started_at: float, spans: Iterable[dict] = (), **attrs
+) -> None:
+    """Record the trace root (intake time and attributes). Never raises.
+
+    ``spans`` (from :func:`make_span`) are appended in the same round trip,
+    so intake writes its root and its own span at once.
+    """
+    if not trace_id:
+        return
+    spans = [json.dumps(span, separators=(",", ":")) for span in spans]
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        mapping = {"started_at": repr(started_at)}
+        mapping.update({k: str(v) for k, v in attrs.items() if v is not None})
+        pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+        pipe.hset(_meta_key(trace_id), mapping=mapping)
+        pipe.expire(_meta_key(trace_id), TRACE_RETENTION_S)
+        if spans:
+            pipe.rpush(_spans_key(trace_id), *spans)
+            pipe.expire(_spans_key(trace_id), TRACE_RETENTION_S)
+        pipe.execute()
+    except Exception as e:
+        logger.debug("[tracing] start_trace failed (non-fatal): %s", e)
+
+
+def record_spans(trace_id: str | None, spans: Iterable[dict]) -> None:
+    """Append spans built with :func:`make_span` in one round trip. Never raises."""
+    if not trace_id:
+        return
+    spans = [json.dumps(span, separators=(",", ":")) for span in spans]
+    if not spans:
+        return
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+        pipe.rpush(_spans_key(trace_id), *spans)
+        pipe.expire(_spans_key(trace_id), TRACE_RETENTION_S)
+        pipe.execute()
+    except Exception as e:
+        logger.debug("[tracing] record_spans failed (non-fatal): %s", e)
+
+
+def record_span(trace_id: str | None, name: str, start: float, end: float, **attrs) -> None:
+    """Append one span. Never raises."""
+    record_spans(trace_id, [make_span(name, start, end, **attrs)])
+
+
+def trace_started_at(trace_id: str | None) -> float | None:
+    """Intake time of ``trace_id``, or None when unknown (or Redis fails)."""
+    if not trace_id:
+        return None
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        raw = POPOTO_REDIS_DB.hget(_meta_key(trace_id), "started_at")
+        return float(raw) if raw is not None else None
+    except Exception as e:
+        logger.debug("[tracing] trace_started_at failed (non-fatal): %s", e)
+        return None
+
+
+def record_reply(trace_id: str | None, start: float, end: float, **attrs) -> None:
+    """Record a relay send span and enter the trace in today's reply ranking.
+
+    Only the first reply of a trace is ranked (``ZADD NX``): its latency is
+    what the sender waited. Never raises.
+    """
+    if not trace_id:
+        return
+    record_span(trace_id, "relay_send", start, end, **attrs)
+    started_at = trace_started_at(trace_id)
+    if started_at is None:
+        return
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        key = _replies_key(_today())
+        pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+        pipe.zadd(key, {trace_id: round(end - started_at, 3)}, nx=True)
+        pipe.expire(key, TRACE_RETENTION_S + 86400)
+        pipe.execute()
+    except Exception as e:
+        logger.debug("[tracing] record_reply failed (non-fatal): %s", e)
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def load_trace(trace_id: str) -> dict | None:
+    """The trace's meta and spans (sorted by start), or None when nothing is stored.
+
+    ``started_at`` falls back to the earliest span start; ``duration`` runs
+    from there to the latest span end.
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+    pipe.hgetall(_meta_key(trace_id))
+    pipe.lrange(_spans_key(trace_id), 0, -1)
+    raw_meta, raw_spans = pipe.execute()
+    meta = {_decode(k): _decode(v) for k, v in (raw_meta or {}).items()}
+    spans = []
+    for raw in raw_spans or []:
+        try:
+            spans.append(json.loads(raw))
+        except (TypeError, ValueError):
+            continue
+    if not meta and not spans:
+        return None
+    spans.sort(key=lambda s: s["start"])
+    try:
+        started_at = float(meta["started_at"])
+    except (KeyError, ValueError):
+        started_at = spans[0]["start"] if spans else 0.0
+    ended_at = max((s["end"] for s in spans), default=started_at)
+    return {
+        "trace_id": trace_id,
+        "meta": meta,
+        "spans": spans,
+        "started_at": started_at,
+        "duration": max(0.0, ended_at - started_at),
+    }
+
+
+def slowest_replies(limit: int = 10, day: str | None = None) -> list[dict]:
+    """The ``limit`` slowest first replies of ``day`` (UTC ``YYYY-MM-DD``, default today).
+
+    Each entry has ``trace_id``, ``seconds`` (intake → first reply sent) and
+    the trace's ``meta``.
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    ranked = POPOTO_REDIS_DB.zrevrange(
+        _replies_key(day or _today()), 0, max(0, limit - 1), withscores=True
+    )
+    if not ranked:
+        return []
+    pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+    for member, _ in ranked:
+        pipe.hgetall(_meta_key(_decode(member)))
+    metas = pipe.execute()
+    return [
+        {
+            "trace_id": _decode(member),
+            "seconds": score,
+            "meta": {_decode(k): _decode(v) for k, v in (meta or {}).items()},
+        }
+        for (member, score), meta in zip(ranked, metas, strict=True)
+    ]
@@ -224,7 +224,7 @@ async def judge_message(transcript: str, inbound_text: str, inbound_id: int) ->
     prompt = _build_judge_prompt(transcript, inbound_text, inbound_id)
 
     try:
-        decision = await run_typed(prompt, CatchupJudgeVerdict, model=MODEL_FAST)
+        decision = await run_typed(prompt, CatchupJudgeVerdict, model=MODEL_FAST, lane="background")
         return decision.verdict
     except Exception as e:
         logger.debug("%s judge failed: %s", LOG_PREFIX, e)
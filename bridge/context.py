@@ -8,20 +8,14 @@ from pathlib import Path
 
 from telethon import TelegramClient
 
+from bridge.link_enrichment import enrich_links
+
 # Reuse the canonical tool-log filter from bridge.response (single source of truth).
 # See docs/features/bridge-response-improvements.md and issue #1359.
 from bridge.response import filter_tool_logs
 from config.settings import settings
-from tools.link_analysis import (
-    extract_urls,
-    get_metadata,
-    summarize_url_content,
-)
-from tools.telegram_history import (
-    get_link_by_url,
-    get_recent_messages,
-    store_link,
-)
+from tools.link_analysis import extract_urls
+from tools.telegram_history import get_recent_messages
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +42,6 @@ LINK_COLLECTORS = [
 
 # Link summarization settings
 MAX_LINKS_PER_MESSAGE = 5  # Don't summarize more than 5 links per message
-LINK_SUMMARY_CACHE_HOURS = 24  # Don't re-summarize URLs within 24 hours
 
 
 # =============================================================================
@@ -488,6 +481,10 @@ def format_reply_chain(chain: list[dict]) -> str:
     return "\n".join(lines)
 
 
+# Lifetime of a session_root:{chat_id}:{msg_id} entry.
+SESSION_ROOT_TTL_S = 7 * 24 * 3600
+
+
 async def _get_cached_root(chat_id: int, msg_id: int) -> int | None:
     """Read the authoritative root message ID from Redis for a given message.
 
@@ -514,8 +511,8 @@ async def _get_cached_root(chat_id: int, msg_id: int) -> int | None:
 async def _set_cached_root(chat_id: int, msg_id: int, root_id: int) -> None:
     """Persist the authoritative root message ID to Redis for a given message.
 
-    Uses SET NX EX 604800 (7-day TTL, first writer wins) so concurrent
-    callers cannot overwrite each other's resolved root.
+    Uses SET NX EX SESSION_ROOT_TTL_S (7 days, first writer wins) so
+    concurrent callers cannot overwrite each other's resolved root.
 
     Fails silently on any Redis error.
     """
@@ -526,13 +523,37 @@ async def _set_cached_root(chat_id: int, msg_id: int, root_id: int) -> None:
 
         key = f"session_root:{chat_id}:{msg_id}"
         # NX = only set if key does not already exist; EX = TTL in seconds (7 days)
-        _r.set(key, str(root_id), nx=True, ex=604800)
+        _r.set(key, str(root_id), nx=True, ex=SESSION_ROOT_TTL_S)
     except Exception as exc:
         logger.debug(
             f"[session-root] _set_cached_root({chat_id}, {msg_id}, {root_id}) error: {exc}"
         )
 
 
+def record_sent_message_root(chat_id, msg_id: int, session_id: str | None) -> None:
+    """Cache the session root for a message Valor just sent (sync, never raises).
+
+    Telegram session ids are ``tg_{project_key}_{chat_id}_{root_msg_id}``, so
+    the root of every message a session sends is known at send time. Writing
+    ``session_root:{chat_id}:{msg_id}`` then lets a reply to that message
+    resolve in step 0 of :func:`resolve_root_session_id`, one GET. Without it
+    the first reply walked the TelegramMessage cache, which misses on outbound
+    rows (stored before Telethon assigns their id), and fell back to the
+    Telegram API. Other session id shapes are skipped.
+    """
+    match = re.fullmatch(rf"tg_.+_{re.escape(str(chat_id))}_(\d+)", session_id or "")
+    if match is None or msg_id is None:
+        return
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        POPOTO_REDIS_DB.set(
+            f"session_root:{chat_id}:{msg_id}", match.group(1), nx=True, ex=SESSION_ROOT_TTL_S
+        )
+    except Exception as exc:
+        logger.debug(f"[session-root] record_sent_message_root({chat_id}, {msg_id}) error: {exc}")
+
+
 async def resolve_root_session_id(
     client: TelegramClient,
     chat_id: int,
@@ -693,7 +714,9 @@ async def get_link_summaries(
     Extract URLs from text and get summaries for each.
 
     Uses caching to avoid re-summarizing URLs we've seen recently.
-    Applies rate limiting (max 5 links per message).
+    Applies rate limiting (max 5 links per message). The links are enriched
+    concurrently; see ``bridge.link_enrichment.enrich_links`` for the
+    per-host limits and the deadline after which partial results return.
 
     Args:
         text: Message text containing URLs
@@ -720,69 +743,7 @@ async def get_link_summaries(
             f"of {len(urls_result.get('urls', []))} links"
         )
 
-    summaries = []
-
-    for url in urls:
-        try:
-            # Check cache: do we already have a summary for this URL?
-            existing = get_link_by_url(url, max_age_hours=LINK_SUMMARY_CACHE_HOURS)
-
-            if existing and existing.get("ai_summary"):
-                # Use cached summary
-                logger.debug(f"Using cached summary for: {url[:50]}...")
-                summaries.append(
-                    {
-                        "url": url,
-                        "summary": existing["ai_summary"],
-                        "title": existing.get("title"),
-                        "cached": True,
-                    }
-                )
-                continue
-
-            # Need to fetch new summary
-            logger.info(f"Fetching summary for: {url[:50]}...")
-
-            # Get metadata (title, description) synchronously
-            metadata = get_metadata(url)
-            title = metadata.get("title")
-            description = metadata.get("description")
-            final_url = metadata.get("final_url", url)
-
-            # Get AI summary via Perplexity
-            summary = await summarize_url_content(url)
-
-            # Store the link with summary
-            store_link(
-                url=url,
-                sender=sender,
-                chat_id=chat_id,
-                message_id=message_id,
-                timestamp=timestamp,
-                title=title,
-                description=description,
-                final_url=final_url,
-                ai_summary=summary,
-            )
-
-            if summary:
-                summaries.append(
-                    {
-                        "url": url,
-                        "summary": summary,
-                        "title": title,
-                        "cached": False,
-                    }
-                )
-                logger.info(f"Stored link with summary: {url[:50]}...")
-            else:
-                logger.warning(f"No summary generated for: {url[:50]}...")
-
-        except Exception as e:
-            logger.error(f"Error processing URL {url[:50]}...: {e}")
-            continue
-
-    return summaries
+    return await enrich_links(urls, sender, chat_id, message_id, timestamp)
 
 
 def format_link_summaries(summaries: list[dict]) -> str:
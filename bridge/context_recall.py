@@ -271,6 +271,7 @@ async def check_outbound_context_recall(text: str | None) -> ContextRecallVerdic
             OUTBOUND_CONTEXT_RECALL_PROMPT.format(text=text),
             ContextRecallVerdict,
             sdk_timeout=3.0,
+            lane="interactive",
         )
         return verdict
     except Exception as e:
@@ -31,6 +31,7 @@ import re
 import shutil
 import smtplib
 import time
+from concurrent.futures import ThreadPoolExecutor
 from email import encoders
 from pathlib import Path
 from typing import Any
@@ -53,6 +54,17 @@ IMAP_SOCKET_TIMEOUT = int(os.environ.get("IMAP_SOCKET_TIMEOUT", "30"))
 # Max messages to fetch per poll cycle (prevents hanging on inboxes with many unseen messages)
 IMAP_MAX_BATCH = int(os.environ.get("IMAP_MAX_BATCH", "20"))
 
+# Mailboxes (from IMAP_MAILBOXES, default INBOX) polled at once, one connection
+# each. Gmail allows an account 15 simultaneous IMAP connections in total.
+IMAP_POLL_CONCURRENCY = int(os.environ.get("IMAP_POLL_CONCURRENCY", "3"))
+
+# Threads that parse MIME and persist attachments for a fetched batch.
+EMAIL_INGEST_WORKERS = int(os.environ.get("EMAIL_INGEST_WORKERS", "4"))
+
+# Conversation groups processed at once. Messages within a group (same sender,
+# reply chain or subject) always run one at a time, in arrival order.
+EMAIL_INGEST_CONCURRENCY = int(os.environ.get("EMAIL_INGEST_CONCURRENCY", "4"))
+
 # Max retries for SMTP sends before dead-lettering
 SMTP_MAX_RETRIES = 3
 
@@ -109,18 +121,24 @@ EMAIL_ATTACHMENT_VAULT_SUBDIR = Path.home() / "work-vault" / "email-attachments"
 
 
 def _get_imap_config() -> dict | None:
-    """Return IMAP connection config from environment, or None if not configured."""
+    """Return IMAP connection config from environment, or None if not configured.
+
+    ``mailboxes`` comes from the comma-separated ``IMAP_MAILBOXES`` (default
+    ``INBOX``); the poll loop polls each one on its own connection.
+    """
     host = os.environ.get("IMAP_HOST")
     user = os.environ.get("IMAP_USER")
     password = os.environ.get("IMAP_PASSWORD")
     if not (host and user and password):
         return None
+    mailboxes = [m.strip() for m in os.environ.get("IMAP_MAILBOXES", "INBOX").split(",")]
     return {
         "host": host,
         "user": user,
         "password": password,
         "port": int(os.environ.get("IMAP_PORT", "993")),
         "ssl": os.environ.get("IMAP_SSL", "true").lower() != "false",
+        "mailboxes": [m for m in mailboxes if m] or ["INBOX"],
     }
 
 
@@ -673,59 +691,77 @@ HISTORY_MAX_ENTRIES = 500
 HISTORY_MSG_TTL = 7 * 24 * 3600
 
 
+def _history_blob(parsed: dict, ts: float) -> str:
+    return json.dumps(
+        {
+            "from_addr": parsed.get("from_addr", ""),
+            "from_raw": parsed.get("from_raw", ""),
+            "subject": parsed.get("subject", ""),
+            "body": parsed.get("body", ""),
+            "timestamp": ts,
+            "message_id": parsed.get("message_id") or "",
+            "in_reply_to": parsed.get("in_reply_to", ""),
+            # Metadata only — never bytes. Projected through _public_attachment
+            # so a stray transient _payload can never reach the blob. Old blobs
+            # written before this field hydrate as [] on read (back-compat).
+            "attachments": [_public_attachment(a) for a in (parsed.get("attachments") or [])],
+            "attachments_truncated": bool(parsed.get("attachments_truncated")),
+        }
+    )
+
+
 def _record_history(parsed: dict, mailbox: str = "INBOX") -> None:
     """Write a parsed inbound email to the Redis history cache.
 
-    The per-message JSON blob (``SET``) and the sorted-set membership (``ZADD``)
-    are queued into a single ``r.pipeline()``, which defaults to
-    ``transaction=True`` — redis-py emits ``MULTI``/``EXEC`` so both commands
-    are applied atomically server-side. Readers never observe one without the
-    other, so no ordering-on-the-wire framing is needed (see Race 1 in the
-    plan for the original write-order mitigation this supersedes).
+    Single-message form of :func:`_record_history_many`.
+    """
+    _record_history_many([parsed], mailbox)
+
+
+def _record_history_many(parsed_list: list[dict], mailbox: str = "INBOX") -> None:
+    """Write a batch of parsed inbound emails to the Redis history cache.
+
+    Every per-message JSON blob (``SET``) and sorted-set membership (``ZADD``)
+    is queued into a single ``r.pipeline()``, which defaults to
+    ``transaction=True`` — redis-py emits ``MULTI``/``EXEC`` so the whole batch
+    is applied atomically server-side. Readers never observe a blob without
+    its set entry or the reverse, so no ordering-on-the-wire framing is needed
+    (see Race 1 in the plan for the original write-order mitigation this
+    supersedes). The same transaction reads the set's size, so a batch costs
+    one round trip plus one trim.
 
     After the write, trims the sorted set to ``HISTORY_MAX_ENTRIES`` newest
     entries. Evicted Message-IDs are actively DELed from the per-msg namespace
     in the same pipeline to bound orphan-blob leaks (C6 in the critique table).
 
-    Failures are logged as warnings and do not propagate — the poll loop must
-    never break because of a cache write error.
+    Messages without a Message-ID are skipped (no stable key to hang the blob
+    on). Failures are logged as warnings and do not propagate — the poll loop
+    must never break because of a cache write error.
     """
     try:
-        message_id = parsed.get("message_id") or ""
-        if not message_id:
-            return  # no stable key to hang the blob on
-        ts = float(parsed.get("timestamp") or time.time())
-        blob = json.dumps(
-            {
-                "from_addr": parsed.get("from_addr", ""),
-                "from_raw": parsed.get("from_raw", ""),
-                "subject": parsed.get("subject", ""),
-                "body": parsed.get("body", ""),
-                "timestamp": ts,
-                "message_id": message_id,
-                "in_reply_to": parsed.get("in_reply_to", ""),
-                # Metadata only — never bytes. Projected through _public_attachment
-                # so a stray transient _payload can never reach the blob. Old blobs
-                # written before this field hydrate as [] on read (back-compat).
-                "attachments": [_public_attachment(a) for a in (parsed.get("attachments") or [])],
-                "attachments_truncated": bool(parsed.get("attachments_truncated")),
-            }
-        )
-
+        items = [p for p in parsed_list if p.get("message_id")]
+        if not items:
+            return
         set_key = HISTORY_SET_KEY.format(mailbox=mailbox)
-        msg_key = HISTORY_MSG_KEY.format(message_id=message_id)
 
         r = _get_redis()
-        # Phase 1: blob + ZADD queued inside a MULTI/EXEC pipeline (redis-py
-        # defaults to transaction=True), so both commands land atomically.
+        # Phase 1: blobs + ZADDs queued inside one MULTI/EXEC pipeline (redis-py
+        # defaults to transaction=True), so they land atomically.
         pipe = r.pipeline()
-        pipe.set(msg_key, blob, ex=HISTORY_MSG_TTL)
-        pipe.zadd(set_key, {message_id: ts})
-        pipe.execute()
+        for parsed in items:
+            message_id = parsed["message_id"]
+            ts = float(parsed.get("timestamp") or time.time())
+            pipe.set(
+                HISTORY_MSG_KEY.format(message_id=message_id),
+                _history_blob(parsed, ts),
+                ex=HISTORY_MSG_TTL,
+            )
+            pipe.zadd(set_key, {message_id: ts})
+        pipe.zcard(set_key)
+        size = pipe.execute()[-1]
 
         # Phase 2: if over the cap, capture victims then DEL blobs + trim the set
         # atomically. ZRANGE 0 -(HISTORY_MAX_ENTRIES+1) selects the oldest over the cap.
-        size = r.zcard(set_key)
         if size > HISTORY_MAX_ENTRIES:
             overflow = size - HISTORY_MAX_ENTRIES
             victims = r.zrange(set_key, 0, overflow - 1)
@@ -739,65 +775,103 @@ def _record_history(parsed: dict, mailbox: str = "INBOX") -> None:
         logger.warning(f"[email] _record_history failed: {e}")
 
 
+def _load_thread_entry(raw: str | None) -> dict | None:
+    if not raw:
+        return None
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
 def _record_thread(parsed: dict) -> None:
     """Update the ``email:threads`` hash for the CLI threads listing.
 
+    Single-message form of :func:`_record_threads`.
+    """
+    _record_threads([parsed])
+
+
+def _record_threads(parsed_list: list[dict]) -> None:
+    """Update the ``email:threads`` hash for a batch, in order.
+
     Thread root is approximated as the ``in_reply_to`` chain head; when a new
     message reveals an earlier root than we'd stored, we re-key the entry.
     Drift is accepted for v1 — the hash is a best-effort navigation aid.
 
+    Reads are two ``HMGET`` round trips for the whole batch (the parents, then
+    any roots they point at) and the write is one ``HSET``. Entries are folded
+    in input order over a local overlay, so a reply to a message earlier in
+    the same batch lands on that message's thread.
+
     Failures are logged as warnings.
     """
     try:
-        message_id = parsed.get("message_id") or ""
-        if not message_id:
+        items = [p for p in parsed_list if p.get("message_id")]
+        if not items:
             return
-        in_reply_to = (parsed.get("in_reply_to") or "").strip()
-        subject = parsed.get("subject", "") or ""
-        ts = float(parsed.get("timestamp") or time.time())
-        from_addr = parsed.get("from_addr", "") or ""
 
         # Single connection for this function — cheaper than re-resolving
-        # the pool twice and easier to reason about under monkeypatch.
+        # the pool per read and easier to reason about under monkeypatch.
         r = _get_redis()
 
         # The root is the message at the end of the chain. Without a full
         # server-side traversal, approximate: if we have an in_reply_to, that's
         # a better root candidate than the current message. Walk one link via
         # Redis when possible.
-        root = in_reply_to or message_id
-        if in_reply_to:
+        stored: dict[str, dict | None] = {}
+        parents = sorted({(p.get("in_reply_to") or "").strip() for p in items} - {""})
+        if parents:
             try:
-                existing = r.hget(HISTORY_THREADS_KEY, in_reply_to)
-                if existing:
-                    try:
-                        data = json.loads(existing)
-                        candidate = data.get("root") or in_reply_to
-                        root = candidate
-                    except (json.JSONDecodeError, TypeError):
-                        root = in_reply_to
-            except Exception:
-                root = in_reply_to
+                raws = r.hmget(HISTORY_THREADS_KEY, parents)
+                stored.update(zip(parents, map(_load_thread_entry, raws), strict=True))
+            except Exception:  # noqa: S110 -- an unreadable parent falls back to in_reply_to
+                pass
+        roots = set()
+        for p in items:
+            parent = (p.get("in_reply_to") or "").strip()
+            data = stored.get(parent) if parent else None
+            roots.add((data or {}).get("root") or parent or p["message_id"])
+        missing = sorted(roots - stored.keys())
+        if missing:
+            stored.update(
+                zip(
+                    missing,
+                    map(_load_thread_entry, r.hmget(HISTORY_THREADS_KEY, missing)),
+                    strict=True,
+                )
+            )
 
-        existing_raw = r.hget(HISTORY_THREADS_KEY, root)
-        if existing_raw:
-            try:
-                data = json.loads(existing_raw)
-            except (json.JSONDecodeError, TypeError):
-                data = {}
-        else:
-            data = {}
-
-        data["root"] = root
-        data["subject"] = data.get("subject") or subject
-        data["message_count"] = int(data.get("message_count") or 0) + 1
-        data["last_ts"] = max(float(data.get("last_ts") or 0.0), ts)
-        participants = set(data.get("participants") or [])
-        if from_addr:
-            participants.add(from_addr)
-        data["participants"] = sorted(participants)
-
-        r.hset(HISTORY_THREADS_KEY, root, json.dumps(data))
+        updates: dict[str, dict] = {}
+        for parsed in items:
+            message_id = parsed["message_id"]
+            in_reply_to = (parsed.get("in_reply_to") or "").strip()
+            subject = parsed.get("subject", "") or ""
+            ts = float(parsed.get("timestamp") or time.time())
+            from_addr = parsed.get("from_addr", "") or ""
+
+            root = in_reply_to or message_id
+            if in_reply_to:
+                parent = updates.get(in_reply_to) or stored.get(in_reply_to)
+                if parent:
+                    root = parent.get("root") or in_reply_to
+
+            data = dict(updates.get(root) or stored.get(root) or {})
+            data["root"] = root
+            data["subject"] = data.get("subject") or subject
+            data["message_count"] = int(data.get("message_count") or 0) + 1
+            data["last_ts"] = max(float(data.get("last_ts") or 0.0), ts)
+            participants = set(data.get("participants") or [])
+            if from_addr:
+                participants.add(from_addr)
+            data["participants"] = sorted(participants)
+            updates[root] = data
+
+        r.hset(
+            HISTORY_THREADS_KEY,
+            mapping={root: json.dumps(data) for root, data in updates.items()},
+        )
     except Exception as e:  # pragma: no cover - defensive
         logger.warning(f"[email] _record_thread failed: {e}")
 
@@ -1087,6 +1161,7 @@ def _query_non_terminal_sessions(project_key: str) -> list:
     # waiting for the daily redis-index-cleanup sweep. Rate-limited
     # internally; see models/ghost_reconcile.py.
     from models.ghost_reconcile import reconcile_ghost_members
+    from models.session_coalesce_index import created_ts
     from models.session_lifecycle import NON_TERMINAL_STATUSES
 
     reconcile_ghost_members(AgentSession)
@@ -1099,8 +1174,9 @@ def _query_non_terminal_sessions(project_key: str) -> list:
             sessions.extend(batch)
         except Exception as e:
             logger.debug("[email] coalesce query failed for status=%s: %s", status, e)
-    # Filter by age (Python-side, since Popoto may not support gte on float fields)
-    sessions = [s for s in sessions if (getattr(s, "created_at", 0) or 0) >= min_created_at]
+    # Filter by age (Python-side; created_at is a datetime SortedField partitioned
+    # by project_key, compared here as epoch seconds)
+    sessions = [s for s in sessions if created_ts(s) >= min_created_at]
     return sessions
 
 
@@ -1117,6 +1193,11 @@ def find_coalescing_session_id(
     Applies a 48-hour age bound to prevent stale sessions from resurrecting.
     Empty normalized_subject never coalesces.
 
+    Answered from ``models.session_coalesce_index`` once the project's index
+    is built. Otherwise (first lookup, lapsed marker, index unreadable) the
+    project's open sessions are scanned as before, and that scan rebuilds the
+    index.
+
     Args:
         project_key: The project key.
         customer_id: The customer ID (from resolver).
@@ -1128,6 +1209,19 @@ def find_coalescing_session_id(
     if not normalized_subject or not normalized_subject.strip():
         return None
 
+    from models import session_coalesce_index as coalesce_index
+
+    try:
+        if coalesce_index.is_built(project_key):
+            session_id = coalesce_index.find_email_session(
+                project_key, customer_id, normalized_subject, COALESCE_MAX_AGE_SECONDS
+            )
+            if session_id:
+                logger.info(f"[email] coalescing matched session={session_id} via index")
+            return session_id
+    except Exception as e:
+        logger.warning(f"[email] coalescing index lookup failed, scanning: {e}")
+
     try:
         sessions = _query_non_terminal_sessions(project_key)
     except Exception as e:
@@ -1136,24 +1230,33 @@ def find_coalescing_session_id(
 
     min_created_at = time.time() - COALESCE_MAX_AGE_SECONDS
     matching = []
+    entries = []
     for s in sessions:
         extra = getattr(s, "extra_context", None) or {}
+        stored_subject = normalize_subject(extra.get("email_subject", ""))
+        created = coalesce_index.created_ts(s)
+        entries.append((s.session_id, extra.get("customer_id"), stored_subject, created))
         if extra.get("customer_id") != customer_id:
             continue
-        stored_subject = normalize_subject(extra.get("email_subject", ""))
         if stored_subject != normalized_subject:
             continue
-        created = getattr(s, "created_at", 0) or 0
         if created < min_created_at:
             continue
         matching.append(s)
 
+    # The scan just read every open session of the project, so index them all:
+    # later lookups for this project skip the scan until the marker lapses.
+    try:
+        coalesce_index.rebuild_email(project_key, entries)
+    except Exception as e:
+        logger.warning(f"[email] coalescing index rebuild failed: {e}")
+
     if not matching:
         return None
 
     # Pick most recently created
-    best = max(matching, key=lambda s: getattr(s, "created_at", 0) or 0)
-    age_hrs = (time.time() - (getattr(best, "created_at", 0) or 0)) / 3600
+    best = max(matching, key=coalesce_index.created_ts)
+    age_hrs = (time.time() - coalesce_index.created_ts(best)) / 3600
     logger.info(
         f"[email] coalescing matched session={best.session_id} age={age_hrs:.1f}h limit=48h"
     )
@@ -1166,7 +1269,10 @@ def find_coalescing_session_id(
 
 
 def _unmark_seen_sync(imap_config: dict, uid: bytes) -> None:
-    """Remove the \\Seen flag for a single message (sync, runs in a thread).
+    """Remove the \\Seen flag for a message set (sync, runs in a thread).
+
+    ``uid`` is one UID or an IMAP UID set; the mailbox is
+    ``imap_config["mailbox"]`` (default ``INBOX``).
 
     The connection ``_fetch_unseen`` used to mark the message \\Seen is
     always closed (``conn.logout()``) before its caller returns, so a fresh
@@ -1186,7 +1292,7 @@ def _unmark_seen_sync(imap_config: dict, uid: bytes) -> None:
         conn = imaplib.IMAP4(host, port, timeout=IMAP_SOCKET_TIMEOUT)
     try:
         conn.login(user, password)
-        conn.select("INBOX")
+        conn.select(imap_config.get("mailbox", "INBOX"))
         conn.uid("store", uid, "-FLAGS", "\\Seen")
     finally:
         try:
@@ -1518,6 +1624,12 @@ async def _process_inbound_email(
             extra_context_overrides=extra_context,
         )
         logger.info(f"[email] Enqueued session {session_id} for {from_addr}")
+        if customer_id is not None:
+            from models.session_coalesce_index import index_email_session
+
+            index_email_session(
+                session_id, project_key, customer_id, normalize_subject(subject or "")
+            )
     except Exception as e:
         logger.error(f"[email] Failed to enqueue session for {from_addr}: {e}")
 
@@ -1544,6 +1656,46 @@ def _build_imap_sender_query(known_senders: list[str]) -> str:
     return result
 
 
+_FETCH_UID_RE = re.compile(rb"\bUID (\d+)")
+
+
+def _uid_set(uids: list[bytes]) -> bytes:
+    """Compress UIDs into an IMAP sequence set (``1:3,7``) for one command."""
+    nums = sorted({int(u) for u in uids})
+    ranges: list[str] = []
+    start = prev = nums[0]
+    for n in nums[1:]:
+        if n != prev + 1:
+            ranges.append(f"{start}:{prev}" if prev != start else str(start))
+            start = n
+        prev = n
+    ranges.append(f"{start}:{prev}" if prev != start else str(start))
+    return ",".join(ranges).encode()
+
+
+def _parse_fetch_response(msg_data: list) -> list[tuple[bytes, bytes]]:
+    """Pair each literal in a UID FETCH response with its UID, sorted by UID.
+
+    Servers put ``UID n`` before or after the literal (``(UID 5 RFC822 {n}``
+    or ``(RFC822 {n}`` followed by `` UID 5)``), so both the tuple header and
+    the trailing element are checked.
+    """
+    messages: list[tuple[bytes, bytes]] = []
+    parts = list(msg_data or [])
+    for i, part in enumerate(parts):
+        if not isinstance(part, tuple) or len(part) < 2:
+            continue
+        match = _FETCH_UID_RE.search(part[0] or b"")
+        if match is None and i + 1 < len(parts) and isinstance(parts[i + 1], bytes):
+            match = _FETCH_UID_RE.search(parts[i + 1])
+        if match is None:
+            logger.warning("[email] FETCH response part without a UID; skipping")
+            continue
+        messages.append((match.group(1), part[1]))
+    messages.sort(key=lambda m: int(m[0]))
+    return messages
+
+
 async def _poll_imap(imap_config: dict, known_senders: list[str]) -> list[tuple[bytes, bytes]]:
     """Connect to IMAP and fetch unseen messages from known senders only.
 
@@ -1551,13 +1703,17 @@ async def _poll_imap(imap_config: dict, known_senders: list[str]) -> list[tuple[
     known_senders so messages from unknown addresses are never fetched and
     remain UNSEEN for other machines polling the same inbox.
 
-    Marks fetched messages as SEEN immediately to prevent duplicate processing
-    across concurrent polls on this machine. The UID is returned alongside
+    Polls ``imap_config["mailbox"]`` (default ``INBOX``). The capped UID batch
+    is marked SEEN with one ``UID STORE`` and downloaded with one ``UID FETCH``
+    over a compressed UID set, instead of a STORE/FETCH round-trip pair per
+    message. Marking SEEN first prevents duplicate processing across
+    concurrent polls on this machine; a UID the server marked but did not
+    return is un-marked again so the next poll retries it. The UID is returned alongside
     each message's raw bytes so a downstream resolver-unavailable outcome
     (issue #1817 A2) can un-mark \\Seen and let the next poll retry it,
     instead of the message being silently and permanently dropped.
 
-    Returns a list of (uid, raw_message_bytes) tuples.
+    Returns a list of (uid, raw_message_bytes) tuples in ascending UID order.
     """
     if not known_senders:
         return []
@@ -1567,6 +1723,7 @@ async def _poll_imap(imap_config: dict, known_senders: list[str]) -> list[tuple[
     user = imap_config["user"]
     password = imap_config["password"]
     use_ssl = imap_config.get("ssl", True)
+    mailbox = imap_config.get("mailbox", "INBOX")
     sender_query = _build_imap_sender_query(known_senders)
 
     def _fetch_unseen() -> list[tuple[bytes, bytes]]:
@@ -1576,7 +1733,7 @@ async def _poll_imap(imap_config: dict, known_senders: list[str]) -> list[tuple[
             conn = imaplib.IMAP4(host, port, timeout=IMAP_SOCKET_TIMEOUT)
         try:
             conn.login(user, password)
-            conn.select("INBOX")
+            conn.select(mailbox)
 
             # Search only for unseen messages from known senders (UIDs are stable)
             status, data = conn.uid("search", None, f"UNSEEN {sender_query}")
@@ -1592,15 +1749,22 @@ async def _poll_imap(imap_config: dict, known_senders: list[str]) -> list[tuple[
             if len(uids) > IMAP_MAX_BATCH:
                 uids = uids[-IMAP_MAX_BATCH:]
 
-            messages: list[tuple[bytes, bytes]] = []
-            for uid in uids:
-                # Mark as SEEN before fetching to prevent re-processing on concurrent polls
-                conn.uid("store", uid, "+FLAGS", "\\Seen")
-                status, msg_data = conn.uid("fetch", uid, "(RFC822)")
-                if status == "OK" and msg_data:
-                    for response_part in msg_data:
-                        if isinstance(response_part, tuple):
-                            messages.append((uid, response_part[1]))
+            # Mark as SEEN before fetching to prevent re-processing on concurrent polls
+            uid_set = _uid_set(uids)
+            conn.uid("store", uid_set, "+FLAGS", "\\Seen")
+            status, msg_data = conn.uid("fetch", uid_set, "(UID RFC822)")
+            messages = _parse_fetch_response(msg_data) if status == "OK" else []
+            missing = {int(u) for u in uids} - {int(uid) for uid, _ in messages}
+            if missing:
+                logger.warning(
+                    f"[email] FETCH returned {len(uids) - len(missing)}/{len(uids)} "
+                    f"message(s) from {mailbox}; un-marking the rest"
+                )
+                try:
+                    missing_set = _uid_set([str(u).encode() for u in missing])
+                    conn.uid("store", missing_set, "-FLAGS", "\\Seen")
+                except Exception as e:
+                    logger.warning(f"[email] Failed to un-mark unfetched UIDs: {e}")
             return messages
         finally:
             try:
@@ -1639,10 +1803,178 @@ def _clear_auth_failed_alert() -> None:
         logger.warning(f"[email] Failed to clear {REDIS_AUTH_FAILED_KEY} alert: {e}")
 
 
+async def _poll_mailboxes(
+    imap_config: dict, known_senders: list[str]
+) -> tuple[list[tuple[dict, bytes, bytes]], list[BaseException]]:
+    """Poll every configured mailbox, up to ``IMAP_POLL_CONCURRENCY`` at once.
+
+    Each mailbox gets its own connection through :func:`_poll_imap` with
+    ``imap_config["mailbox"]`` set. Returns ``(messages, errors)``: messages
+    are ``(mailbox_config, uid, raw_bytes)`` in mailbox order then UID order,
+    and errors holds one exception per mailbox whose poll failed, so one bad
+    folder never hides the others' mail.
+    """
+    mailboxes = imap_config.get("mailboxes") or ["INBOX"]
+    semaphore = asyncio.Semaphore(max(1, IMAP_POLL_CONCURRENCY))
+
+    async def _poll_one(box_config: dict) -> list[tuple[bytes, bytes]]:
+        async with semaphore:
+            return await _poll_imap(box_config, known_senders)
+
+    box_configs = [{**imap_config, "mailbox": mailbox} for mailbox in mailboxes]
+    results = await asyncio.gather(
+        *(_poll_one(box_config) for box_config in box_configs), return_exceptions=True
+    )
+    messages: list[tuple[dict, bytes, bytes]] = []
+    errors: list[BaseException] = []
+    for box_config, result in zip(box_configs, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning(f"[email] Poll of {box_config['mailbox']} failed: {result}")
+            errors.append(result)
+            continue
+        messages.extend((box_config, uid, raw_bytes) for uid, raw_bytes in result)
+    return messages, errors
+
+
+_ingest_pool: ThreadPoolExecutor | None = None
+
+
+def _get_ingest_pool() -> ThreadPoolExecutor:
+    global _ingest_pool
+    if _ingest_pool is None:
+        _ingest_pool = ThreadPoolExecutor(
+            max_workers=max(1, EMAIL_INGEST_WORKERS), thread_name_prefix="email-ingest"
+        )
+    return _ingest_pool
+
+
+def _prepare_inbound(raw_bytes: bytes) -> dict | None:
+    """Parse one fetched message and persist its attachments (runs in the pool)."""
+    parsed = parse_email_message(raw_bytes)
+    if parsed is None:
+        return None
+    # Persist attachment bytes to disk + vault BEFORE recording history or
+    # enqueueing — this is the ONLY write side-effect path (the read-only CLI
+    # fallback never reaches here, so it never writes; critique C1). After
+    # this call each attachment dict has a real `path` and its transient
+    # `_payload` stripped.
+    if parsed.get("attachments"):
+        try:
+            _persist_attachments(parsed)
+        except Exception as e:
+            logger.warning(f"[email] Attachment persistence failed: {e}")
+    return parsed
+
+
+def _coalescing_groups(parsed_list: list[dict]) -> list[list[int]]:
+    """Partition a batch into groups that must be processed in order.
+
+    Two messages share a group when they have the same sender, one replies to
+    the other, or their normalized subjects match — anything that could make
+    ``find_coalescing_session_id`` or the session queue see them as one
+    conversation. Returns index lists in input order.
+    """
+    parent = list(range(len(parsed_list)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    first_seen: dict[tuple[str, str], int] = {}
+    for i, parsed in enumerate(parsed_list):
+        keys = [
+            ("from", (parsed.get("from_addr") or "").lower()),
+            ("subject", normalize_subject(parsed.get("subject") or "")),
+            ("msgid", (parsed.get("message_id") or "").strip()),
+            ("msgid", (parsed.get("in_reply_to") or "").strip()),
+        ]
+        for key in keys:
+            if not key[1]:
+                continue
+            j = first_seen.setdefault(key, i)
+            parent[find(i)] = find(j)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(parsed_list)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+async def _ingest_messages(messages: list[tuple[dict, bytes, bytes]], config: dict) -> None:
+    """Parse, record and route one poll's worth of messages.
+
+    MIME parsing and attachment persistence run on the ingest thread pool. A
+    message whose preparation raises is logged and un-marked \\Seen for the
+    next poll; the rest of the batch carries on. History and thread entries
+    are written with one batch per mailbox, BEFORE any AgentSession is
+    enqueued, so the CLI can observe a message even when routing skips
+    session creation. Routing then runs per
+    conversation group (:func:`_coalescing_groups`): up to
+    ``EMAIL_INGEST_CONCURRENCY`` groups at once, each group's messages one
+    at a time in arrival order, so replies still coalesce onto the session
+    their thread started.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_ingest_pool()
+    prepared = await asyncio.gather(
+        *(loop.run_in_executor(pool, _prepare_inbound, raw) for _, _, raw in messages),
+        return_exceptions=True,
+    )
+    # One message that fails to prepare must not drop the rest of the poll.
+    # Its UID is already \Seen (_fetch_unseen marks before fetching), so
+    # un-mark it and let the next poll retry it.
+    failed = [
+        (box_config, uid, error)
+        for (box_config, uid, _), error in zip(messages, prepared, strict=True)
+        if isinstance(error, BaseException)
+    ]
+    for _, uid, error in failed:
+        logger.error(f"[email] Failed to prepare uid={uid!r}, leaving it unseen: {error}")
+    if failed:
+        await asyncio.gather(*(_unmark_seen(box_config, uid) for box_config, uid, _ in failed))
+    batch = [
+        (box_config, uid, parsed)
+        for (box_config, uid, _), parsed in zip(messages, prepared, strict=True)
+        if parsed is not None and not isinstance(parsed, BaseException)
+    ]
+    if not batch:
+        return
+
+    by_mailbox: dict[str, list[dict]] = {}
+    for box_config, _, parsed in batch:
+        by_mailbox.setdefault(box_config.get("mailbox", "INBOX"), []).append(parsed)
+    for mailbox, parsed_list in by_mailbox.items():
+        _record_history_many(parsed_list, mailbox)
+    _record_threads([parsed for _, _, parsed in batch])
+
+    semaphore = asyncio.Semaphore(max(1, EMAIL_INGEST_CONCURRENCY))
+
+    async def _process_group(indexes: list[int]) -> None:
+        async with semaphore:
+            for i in indexes:
+                box_config, uid, parsed = batch[i]
+                try:
+                    await _process_inbound_email(
+                        parsed, config, imap_uid=uid, imap_config=box_config
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"[email] Error processing email from "
+                        f"{parsed.get('from_addr', 'unknown')}: {e}"
+                    )
+
+    groups = _coalescing_groups([parsed for _, _, parsed in batch])
+    await asyncio.gather(*(_process_group(group) for group in groups))
+
+
 async def _email_inbox_loop(imap_config: dict, config: dict) -> None:
     """Main IMAP polling loop.
 
-    Polls the IMAP inbox every IMAP_POLL_INTERVAL seconds. On each successful
+    Polls every configured mailbox (``IMAP_MAILBOXES``) every
+    IMAP_POLL_INTERVAL seconds and hands the batch to
+    :func:`_ingest_messages`. On each successful
     poll, updates email:last_poll_ts in Redis for health monitoring.
 
     Implements exponential backoff on connection failures (up to 5 minutes
@@ -1662,7 +1994,9 @@ async def _email_inbox_loop(imap_config: dict, config: dict) -> None:
         try:
             # Re-read known senders each iteration so config reloads are reflected
             known_senders = get_known_email_search_terms()
-            messages = await _poll_imap(imap_config, known_senders)
+            messages, errors = await _poll_mailboxes(imap_config, known_senders)
+            if errors and len(errors) == len(imap_config.get("mailboxes") or ["INBOX"]):
+                raise errors[0]
 
             # Update health timestamp
             try:
@@ -1673,34 +2007,12 @@ async def _email_inbox_loop(imap_config: dict, config: dict) -> None:
 
             if messages:
                 logger.info(f"[email] Fetched {len(messages)} unseen message(s)")
-                for uid, raw_bytes in messages:
-                    parsed = parse_email_message(raw_bytes)
-                    if parsed is None:
-                        continue
-                    # Persist attachment bytes to disk + vault BEFORE recording
-                    # history or enqueueing — this is the ONLY write side-effect
-                    # path (the read-only CLI fallback never reaches here, so it
-                    # never writes; critique C1). After this call each attachment
-                    # dict has a real `path` and its transient `_payload` stripped.
-                    if parsed.get("attachments"):
-                        try:
-                            _persist_attachments(parsed)
-                        except Exception as e:
-                            logger.warning(f"[email] Attachment persistence failed: {e}")
-                    # Write-through to the history cache BEFORE enqueueing the
-                    # AgentSession so the CLI can observe the message even when
-                    # routing skips session creation. Failures are logged only.
-                    _record_history(parsed)
-                    _record_thread(parsed)
-                    try:
-                        await _process_inbound_email(
-                            parsed, config, imap_uid=uid, imap_config=imap_config
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"[email] Error processing email from "
-                            f"{parsed.get('from_addr', 'unknown')}: {e}"
-                        )
+                await _ingest_messages(messages, config)
+
+            # A mailbox that failed alongside healthy ones still drives the
+            # alert/backoff handling below, after the healthy mail is in.
+            if errors:
+                raise errors[0]
 
             # Reset backoff on success — a successful poll also proves IMAP
             # auth is healthy again, so clear any armed auth_failed alert.
@@ -16,8 +16,14 @@ split is reflected here:
 The :func:`enrich_message` function is called from
 ``agent/session_executor.py`` in the worker process before invoking the agent,
 so the agent receives fully enriched text.
+
+The media, YouTube and link stages are independent, so they run
+concurrently. The bridge also runs them speculatively right after intake
+(``bridge/pre_enrichment.py``); ``enrich_message`` reads back stages that
+are already done and joins ones still in flight instead of starting over.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -28,43 +34,14 @@ from tools.video_watch.constants import VIDEO_WATCH_THIN_TRANSCRIPT_CHARS, WATCH
 logger = logging.getLogger(__name__)
 
 
-async def enrich_message(
-    message_text: str,
-    *,
-    telegram_message=None,
-    youtube_urls: str | None = None,
-    non_youtube_urls: str | None = None,
-    sender_name: str | None = None,
-    chat_id: str | None = None,
-    message_id: int | None = None,
-) -> str:
-    """Perform deferred enrichment on a message before agent invocation.
-
-    Each enrichment step is independent and guarded by a try/except so that
-    a failure in one step does not prevent the others from running.
+async def media_stage(telegram_message) -> dict:
+    """Run worker-side AI on the media file the bridge downloaded at intake.
 
-    Args:
-        message_text: The cleaned message text from the event handler.
-        telegram_message: The persisted ``TelegramMessage`` record for this
-            message, or ``None`` for non-Telegram / legacy / manual-test
-            sessions where no record was created. When ``None``, the media
-            and reply-chain branches are skipped without warning — this is a
-            normal path, not an error.
-        youtube_urls: JSON-encoded list of (url, video_id) tuples.
-        non_youtube_urls: JSON-encoded list of URL strings.
-        sender_name: Name of the message sender.
-        chat_id: Telegram chat ID (as string) for link-summary metadata.
-        message_id: Telegram message ID of the current message.
-
-    Returns:
-        The enriched message text string.
+    Returns ``{"summary", "description", "failed"}``; ``description`` is the
+    text to prepend to the message, or ``None``.
     """
-    enriched_text = message_text
-    failed_steps: list[str] = []
-    youtube_count = 0
-    link_count = 0
-
-    # --- 1. Media processing (worker-side AI on bridge-downloaded file) ---
+    description = None
+    failed = False
     media_summary = "no"
     has_media = bool(getattr(telegram_message, "has_media", False)) if telegram_message else False
     if telegram_message is None:
@@ -141,10 +118,7 @@ async def enrich_message(
                         path, media_type or "media"
                     )
                     if media_description:
-                        if enriched_text and not enriched_text.startswith("--"):
-                            enriched_text = f"{media_description}\n\n{enriched_text}"
-                        else:
-                            enriched_text = media_description
+                        description = media_description
                         logger.info(
                             f"Enrichment: processed media ({media_type}): "
                             f"{media_description[:100]}..."
@@ -154,74 +128,190 @@ async def enrich_message(
                         media_summary = "skipped:no_description"
                 except Exception as e:
                     logger.warning(f"Enrichment: media AI processing failed: {e}")
-                    failed_steps.append("media")
+                    failed = True
                     media_summary = "failed"
 
-    # --- 2. YouTube URL transcription ---
-    if youtube_urls:
-        try:
-            from tools.link_analysis import process_youtube_urls_in_text
-
-            parsed_urls = json.loads(youtube_urls)
-            youtube_count = len(parsed_urls)
-            if parsed_urls:
-                yt_enriched, youtube_results = await process_youtube_urls_in_text(enriched_text)
-                successful = sum(1 for r in youtube_results if r.get("success"))
-                # Always apply enriched text — failure context strings must reach the agent too
-                enriched_text = yt_enriched
-                if successful > 0:
-                    logger.info(
-                        f"Enrichment: transcribed {successful}/{len(parsed_urls)} YouTube video(s)"
-                    )
-                for r in youtube_results:
-                    if r.get("error"):
-                        logger.warning(
-                            f"Enrichment: YouTube processing failed for "
-                            f"{r.get('video_id')}: {r.get('error')}"
-                        )
-                    # Signpost thin transcripts (music-only/silent/on-screen-only).
-                    # Gate on `transcript` only — `context` is non-empty even on
-                    # failure, so it must never be used for this decision.
-                    transcript_text = (r.get("transcript") or "").strip()
-                    if len(transcript_text) < VIDEO_WATCH_THIN_TRANSCRIPT_CHARS:
-                        url = r.get("url") or r.get("video_id") or "the video"
-                        # WATCH_CLI_NAME is the valor-video-watch command (single
-                        # source of truth in tools/video_watch/constants.py).
-                        enriched_text += (
-                            f"\n\n[transcript thin for {url} — run {WATCH_CLI_NAME} {url} "
-                            f"for visual grounding]"
-                        )
-        except Exception as e:
-            logger.warning(f"Enrichment: YouTube processing failed: {e}")
-            failed_steps.append("youtube")
-
-    # --- 3. Link summaries ---
-    if non_youtube_urls:
-        try:
-            from bridge.context import format_link_summaries, get_link_summaries
-
-            parsed_urls = json.loads(non_youtube_urls)
-            link_count = len(parsed_urls)
-            if parsed_urls:
-                urls_text = " ".join(parsed_urls)
-                link_summaries = await get_link_summaries(
-                    text=urls_text,
-                    sender=sender_name or "Unknown",
-                    chat_id=chat_id or "",
-                    message_id=message_id or 0,
-                    timestamp=None,
+    return {"summary": media_summary, "description": description, "failed": failed}
+
+
+async def youtube_stage(message_text: str, youtube_urls: str) -> dict:
+    """Transcribe the message's YouTube links.
+
+    Returns ``{"count", "suffix", "failed"}``; ``suffix`` is the text
+    appended after the message (contexts and thin-transcript signposts).
+    """
+    count = 0
+    suffix = ""
+    failed = False
+    try:
+        from tools.link_analysis import process_youtube_urls_in_text
+
+        parsed_urls = json.loads(youtube_urls)
+        count = len(parsed_urls)
+        if parsed_urls:
+            yt_enriched, youtube_results = await process_youtube_urls_in_text(message_text)
+            successful = sum(1 for r in youtube_results if r.get("success"))
+            # Always apply enriched text — failure context strings must reach the agent too.
+            # The contexts are appended, so only the appended part is kept.
+            suffix = yt_enriched[len(message_text) :]
+            if successful > 0:
+                logger.info(
+                    f"Enrichment: transcribed {successful}/{len(parsed_urls)} YouTube video(s)"
                 )
-                link_summary_text = format_link_summaries(link_summaries)
-                if link_summary_text:
-                    enriched_text = (
-                        f"{enriched_text}\n\n--- LINK SUMMARIES ---\n{link_summary_text}"
+            for r in youtube_results:
+                if r.get("error"):
+                    logger.warning(
+                        f"Enrichment: YouTube processing failed for "
+                        f"{r.get('video_id')}: {r.get('error')}"
                     )
-                    logger.info(f"Enrichment: added {len(link_summaries)} link summaries")
-        except Exception as e:
-            logger.warning(f"Enrichment: link summary processing failed: {e}")
-            failed_steps.append("links")
+                # Signpost thin transcripts (music-only/silent/on-screen-only).
+                # Gate on `transcript` only — `context` is non-empty even on
+                # failure, so it must never be used for this decision.
+                transcript_text = (r.get("transcript") or "").strip()
+                if len(transcript_text) < VIDEO_WATCH_THIN_TRANSCRIPT_CHARS:
+                    url = r.get("url") or r.get("video_id") or "the video"
+                    # WATCH_CLI_NAME is the valor-video-watch command (single
+                    # source of truth in tools/video_watch/constants.py).
+                    suffix += (
+                        f"\n\n[transcript thin for {url} — run {WATCH_CLI_NAME} {url} "
+                        f"for visual grounding]"
+                    )
+    except Exception as e:
+        logger.warning(f"Enrichment: YouTube processing failed: {e}")
+        failed = True
+
+    return {"count": count, "suffix": suffix, "failed": failed}
+
+
+async def links_stage(
+    non_youtube_urls: str,
+    *,
+    sender_name: str | None = None,
+    chat_id: str | None = None,
+    message_id: int | None = None,
+) -> dict:
+    """Summarize the message's non-YouTube links.
+
+    Returns ``{"count", "section", "failed"}``; ``section`` is the formatted
+    summaries, or ``""``.
+    """
+    count = 0
+    section = ""
+    failed = False
+    try:
+        from bridge.context import format_link_summaries, get_link_summaries
+
+        parsed_urls = json.loads(non_youtube_urls)
+        count = len(parsed_urls)
+        if parsed_urls:
+            urls_text = " ".join(parsed_urls)
+            link_summaries = await get_link_summaries(
+                text=urls_text,
+                sender=sender_name or "Unknown",
+                chat_id=chat_id or "",
+                message_id=message_id or 0,
+                timestamp=None,
+            )
+            section = format_link_summaries(link_summaries)
+            if section:
+                logger.info(f"Enrichment: added {len(link_summaries)} link summaries")
+    except Exception as e:
+        logger.warning(f"Enrichment: link summary processing failed: {e}")
+        failed = True
+
+    return {"count": count, "section": section, "failed": failed}
+
+
+NO_YOUTUBE = {"count": 0, "suffix": "", "failed": False}
+NO_LINKS = {"count": 0, "section": "", "failed": False}
+
+
+async def _ready(result: dict) -> dict:
+    return dict(result)
+
+
+async def enrich_message(
+    message_text: str,
+    *,
+    telegram_message=None,
+    youtube_urls: str | None = None,
+    non_youtube_urls: str | None = None,
+    sender_name: str | None = None,
+    chat_id: str | None = None,
+    message_id: int | None = None,
+    message_key: str | None = None,
+) -> str:
+    """Perform deferred enrichment on a message before agent invocation.
+
+    The media, YouTube and link stages run concurrently. Each is guarded by
+    its own try/except, so a failure in one does not prevent the others.
+
+    Args:
+        message_text: The cleaned message text from the event handler.
+        telegram_message: The persisted ``TelegramMessage`` record for this
+            message, or ``None`` for non-Telegram / legacy / manual-test
+            sessions where no record was created. When ``None``, the media
+            and reply-chain branches are skipped without warning — this is a
+            normal path, not an error.
+        youtube_urls: JSON-encoded list of (url, video_id) tuples.
+        non_youtube_urls: JSON-encoded list of URL strings.
+        sender_name: Name of the message sender.
+        chat_id: Telegram chat ID (as string) for link-summary metadata.
+        message_id: Telegram message ID of the current message.
+        message_key: ``TelegramMessage.msg_id`` the bridge pre-enriched under
+            (the session's ``telegram_message_key``). When set, stage results
+            the bridge already has are reused; see ``bridge.pre_enrichment``.
+
+    Returns:
+        The enriched message text string.
+    """
+    from bridge import pre_enrichment
+
+    def staged(stage: str, compute):
+        if message_key:
+            return pre_enrichment.resolve(message_key, stage, compute)
+        return compute()
+
+    if getattr(telegram_message, "has_media", False):
+        media_job = staged("media", lambda: media_stage(telegram_message))
+    else:
+        media_job = media_stage(telegram_message)  # Nothing to compute or store
+    youtube_job = (
+        staged("youtube", lambda: youtube_stage(message_text, youtube_urls))
+        if youtube_urls
+        else _ready(NO_YOUTUBE)
+    )
+    links_job = (
+        staged(
+            "links",
+            lambda: links_stage(
+                non_youtube_urls,
+                sender_name=sender_name,
+                chat_id=chat_id,
+                message_id=message_id,
+            ),
+        )
+        if non_youtube_urls
+        else _ready(NO_LINKS)
+    )
+    media, youtube, links = await asyncio.gather(media_job, youtube_job, links_job)
+
+    enriched_text = message_text
+    if media["description"]:
+        if enriched_text and not enriched_text.startswith("--"):
+            enriched_text = f"{media['description']}\n\n{enriched_text}"
+        else:
+            enriched_text = media["description"]
+    enriched_text += youtube["suffix"]
+    if links["section"]:
+        enriched_text = f"{enriched_text}\n\n--- LINK SUMMARIES ---\n{links['section']}"
+    failed_steps = [
+        name
+        for name, result in (("media", media), ("youtube", youtube), ("links", links))
+        if result["failed"]
+    ]
 
-    # --- 4. Reply chain context ---
+    # --- Reply chain context ---
     # Telethon-dependent; the worker has no Telethon client. Tracked as a
     # companion follow-up to #1297. Skipped silently here so this branch does
     # not regress until the follow-up persists pre-fetched reply chains.
@@ -229,8 +319,8 @@ async def enrich_message(
 
     # Single enrichment summary line
     summary = (
-        f"[enrichment] Summary: media={media_summary}, "
-        f"youtube={youtube_count}, links={link_count}, "
+        f"[enrichment] Summary: media={media['summary']}, "
+        f"youtube={youtube['count']}, links={links['count']}, "
         f"reply_chain={reply_chain_summary}, "
         f"result_length={len(enriched_text)}"
     )
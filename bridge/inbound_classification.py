@@ -0,0 +1,270 @@
+"""Fused single-pass classification of an inbound Telegram message.
+
+The bridge used to make one LLM round trip per question it asked about a
+message, in sequence on the receive-to-ack path: the prompt-injection screen,
+then ``routing.classify_needs_response`` for unaddressed group messages, then
+(after the 👀 ack) ``tools.classifier.classify_request_async`` for the work
+type. This module collapses the two text-only questions into ONE
+``run_typed`` call and runs the stages that cannot be fused alongside it:
+
+* **Fused** (:class:`InboundVerdict`) -- ``needs_response`` plus the work
+  type (bug/feature/chore/sdlc) and its confidence. Both depend only on the
+  message text, so one forced-tool-call answers both.
+* **Not fused, run speculatively** -- the injection screen has a different
+  prompt contract and its own timeout (see ``bridge/injection_inspection.py``),
+  so :meth:`InboundClassification.speculate` runs it as a task next to the
+  fused call instead of ahead of it. The handler collects it after the 👀 ack,
+  where the banner is first needed. :meth:`InboundClassification.cancel`
+  drops everything still in flight when the response gate rejects the message.
+
+Two classifiers stay separate calls. ``routing.classify_conversation_terminus``
+needs the replied-to message, which only the response gate fetches. The intake
+intent classifier (local granite) needs the target session's summary and runs
+after the ack, off the receive-to-ack path.
+
+Cache:
+    The fused verdict is written to Redis under
+    ``inbound_classification:{chat_id}:{message_id}`` for
+    ``INBOUND_CLASSIFICATION_TTL_S``. A redelivered message reuses it instead
+    of calling the LLM again, and the worker reads it through
+    :func:`cached_work_type` when the bridge enqueued the session before the
+    verdict landed.
+
+Fail-safe posture matches the calls it replaces: an LLM failure yields
+``None`` from :meth:`InboundClassification.verdict`, the gate then responds
+(``needs_response`` defaults to ``True``) and the work type stays unset.
+
+See docs/features/fused-inbound-classification.md.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Coroutine
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from agent.llm import LLMCallError, run_typed
+from config.models import MODEL_FAST
+
+logger = logging.getLogger(__name__)
+
+# Per-message verdict lifetime in Redis. A day covers redelivery after a bridge
+# restart and the worker picking up a session that sat in the queue.
+INBOUND_CLASSIFICATION_TTL_S = int(os.environ.get("INBOUND_CLASSIFICATION_TTL_S", "86400"))
+
+# Message text sent to the fused call. The work type needs more of the
+# message than the old 200-char needs_response prompt did.
+_FUSED_MAX_CHARS = 1000
+
+FUSED_CLASSIFICATION_PROMPT = """Classify this incoming chat message. Answer every field.
+
+needs_response:
+- true: a question, request, instruction, bug report, or anything needing action.
+- false: an acknowledgment, thanks, greeting, side chat, or social message.
+
+work_type (what kind of work the message asks for, even if needs_response is false):
+- bug: something broken that previously worked
+- feature: new functionality or capability
+- chore: maintenance, refactoring, documentation, dependencies
+- sdlc: references the SDLC pipeline, mentions "/sdlc", "issue #N", "run the pipeline",
+  or asks for pipeline/build/plan execution
+
+work_type_confidence: 0.0-1.0. reason: one short sentence.
+
+Message: {message}"""
+
+
+class InboundVerdict(BaseModel):
+    """Typed output of the fused inbound classification call."""
+
+    needs_response: bool
+    work_type: Literal["bug", "feature", "chore", "sdlc"]
+    work_type_confidence: float = Field(ge=0.0, le=1.0)
+    reason: str = ""
+
+
+def _cache_key(chat_id: int | str, message_id: int | str) -> str:
+    return f"inbound_classification:{chat_id}:{message_id}"
+
+
+def get_cached_verdict(chat_id: int | str, message_id: int | str) -> InboundVerdict | None:
+    """Return the stored verdict for a message, or ``None``. Never raises."""
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        raw = POPOTO_REDIS_DB.get(_cache_key(chat_id, message_id))
+        return InboundVerdict.model_validate_json(raw) if raw else None
+    except Exception as e:
+        logger.debug("[inbound-classification] cache read failed: %s", e)
+        return None
+
+
+def _store_verdict(chat_id: int | str, message_id: int | str, verdict: InboundVerdict) -> None:
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        POPOTO_REDIS_DB.set(
+            _cache_key(chat_id, message_id),
+            verdict.model_dump_json(),
+            ex=INBOUND_CLASSIFICATION_TTL_S,
+        )
+    except Exception as e:
+        logger.warning("[inbound-classification] cache write failed: %s", e)
+
+
+def cached_work_type(chat_id: int | str | None, message_id: int | str | None) -> str | None:
+    """Work type the bridge stored for a message, for sessions enqueued before it landed."""
+    if chat_id is None or message_id is None:
+        return None
+    verdict = get_cached_verdict(chat_id, message_id)
+    return verdict.work_type if verdict else None
+
+
+async def classify_inbound(
+    text: str, *, chat_id: int | str, message_id: int | str
+) -> InboundVerdict:
+    """One fused ``run_typed`` call for a message, served from Redis when cached.
+
+    Raises:
+        LLMCallError: the call failed (see ``agent.llm.run_typed``).
+        ValueError: ``text`` is empty.
+    """
+    cached = get_cached_verdict(chat_id, message_id)
+    if cached is not None:
+        return cached
+    verdict = await run_typed(
+        FUSED_CLASSIFICATION_PROMPT.format(message=text[:_FUSED_MAX_CHARS]),
+        InboundVerdict,
+        model=MODEL_FAST,
+        lane="interactive",
+    )
+    _store_verdict(chat_id, message_id, verdict)
+    return verdict
+
+
+def worth_speculating(
+    text: str, *, is_dm: bool, chat_title: str | None, project: dict | None
+) -> bool:
+    """Cheap pre-gate check: will the fused verdict probably be consumed?
+
+    Mirrors the zero-cost branches of ``routing.should_respond_async``:
+    mention-only groups (Teammate persona, team chats) skip the fused call
+    unless the message mentions Valor, chats without a project never
+    classify, and acknowledgments the gate drops without an LLM call skip it.
+    A wrong ``True`` costs one cancelled Haiku call; a wrong ``False`` only
+    means the call starts after the gate instead of before it.
+    """
+    from bridge.routing import (
+        DEFAULT_MENTIONS,
+        is_team_chat,
+        needs_response_fast_path,
+        resolve_persona,
+    )
+    from config.enums import PersonaType
+
+    if project is None or needs_response_fast_path(text) is False:
+        return False
+    if is_dm:
+        return True
+    if resolve_persona(project, chat_title, is_dm=False) == PersonaType.TEAMMATE or is_team_chat(
+        chat_title
+    ):
+        mentions = project.get("telegram", {}).get("mention_triggers", DEFAULT_MENTIONS)
+        return any(mention.lower() in text.lower() for mention in mentions)
+    return True
+
+
+class InboundClassification:
+    """Classification stage for one inbound message.
+
+    ``start()`` launches the fused call; it is idempotent, so the handler can
+    start it speculatively early and again (a no-op) once the message has
+    passed the response gate. Every consumer awaits the same task.
+    ``timings`` records when each stage finished, in seconds from creation,
+    for the intake log line and the benchmark.
+    """
+
+    def __init__(self, text: str, *, chat_id: int | str, message_id: int | str) -> None:
+        self.text = text
+        self.chat_id = chat_id
+        self.message_id = message_id
+        self.timings: dict[str, float] = {}
+        self._created = time.perf_counter()
+        self._fused: asyncio.Task | None = None
+        self._side: dict[str, asyncio.Task] = {}
+
+    def _mark(self, name: str) -> None:
+        self.timings[name] = round(time.perf_counter() - self._created, 4)
+
+    async def _run_fused(self) -> InboundVerdict | None:
+        try:
+            verdict = await classify_inbound(
+                self.text, chat_id=self.chat_id, message_id=self.message_id
+            )
+        except (LLMCallError, ValueError) as e:
+            logger.warning("[inbound-classification] fused call failed: %s", e)
+            verdict = None
+        self._mark("fused")
+        return verdict
+
+    @property
+    def started(self) -> bool:
+        return self._fused is not None
+
+    def start(self) -> None:
+        """Launch the fused call if it is not already running."""
+        if self._fused is None:
+            self._fused = asyncio.create_task(
+                self._run_fused(), name=f"inbound_classification:{self.message_id}"
+            )
+
+    async def verdict(self) -> InboundVerdict | None:
+        """The fused verdict (starting the call if needed); ``None`` on failure."""
+        self.start()
+        return await asyncio.shield(self._fused)
+
+    async def needs_response(self) -> bool:
+        """``routing.classify_needs_response`` semantics, answered by the fused call."""
+        from bridge.routing import needs_response_fast_path
+
+        fast = needs_response_fast_path(self.text)
+        if fast is not None:
+            return fast
+        verdict = await self.verdict()
+        if verdict is None:
+            return True  # conservative, as classify_needs_response
+        logger.info("classify_needs_response (fused): needs_response=%s", verdict.needs_response)
+        return verdict.needs_response
+
+    def speculate(self, name: str, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run an independent stage now; collect it later with :meth:`side_result`."""
+        task = asyncio.create_task(coro, name=f"inbound_{name}:{self.message_id}")
+        task.add_done_callback(lambda _t: self._mark(name))
+        self._side[name] = task
+        return task
+
+    async def side_result(self, name: str, default: Any = None) -> Any:
+        """Await a speculative stage; ``default`` if it never ran, failed or was cancelled."""
+        task = self._side.get(name)
+        if task is None:
+            return default
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return default
+            raise
+        except Exception as e:
+            logger.warning("[inbound-classification] %s stage failed: %s", name, e)
+            return default
+
+    def cancel(self) -> None:
+        """Drop every stage still in flight (the message will not be answered)."""
+        for task in [self._fused, *self._side.values()]:
+            if task is not None and not task.done():
+                task.cancel()
@@ -172,6 +172,7 @@ async def inspect_untrusted_input(
             _InjectionJudgment,
             sdk_timeout=INJECTION_INSPECT_TIMEOUT_S,
             hard_timeout=INJECTION_INSPECT_TIMEOUT_S,
+            lane="interactive",
         )
 
         if str(getattr(judgment, "risk", "")).strip().lower() == "suspected":
@@ -0,0 +1,190 @@
+"""Concurrent link enrichment for inbound messages.
+
+``enrich_links`` summarizes every URL of a message at once instead of one after
+another:
+
+* each URL is fetched once (``fetch_page``) and its title, description and
+  summary all come from that one response; a page that cannot be read
+  directly falls back to the summarizer fetching the URL itself
+* all HTTP goes through one pooled ``httpx.AsyncClient`` per event loop, so
+  repeated hosts and the summarizer API reuse kept-alive connections
+* at most ``LINK_FETCH_PER_HOST`` fetches run against one host at a time
+* after ``LINK_ENRICHMENT_DEADLINE_S`` the summaries finished so far are
+  returned; the rest keep running in the background (up to
+  ``LINK_LATE_TASK_CAP_S``) and land in the link cache for the next mention
+
+Cache lookups and ``store_link`` are synchronous Redis calls and run in a
+thread so they never block the loop.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from urllib.parse import urlparse
+
+import httpx
+
+from tools.link_analysis import fetch_page, summarize_page_content, summarize_url_content
+from tools.telegram_history import get_link_by_url, store_link
+
+logger = logging.getLogger(__name__)
+
+LINK_SUMMARY_CACHE_HOURS = 24  # Don't re-summarize URLs within 24 hours
+LINK_FETCH_PER_HOST = 2  # Concurrent page fetches per host
+LINK_FETCH_TIMEOUT_S = 10.0
+LINK_SUMMARY_TIMEOUT_S = 30.0
+LINK_ENRICHMENT_DEADLINE_S = float(os.getenv("LINK_ENRICHMENT_DEADLINE_S", "20"))
+LINK_LATE_TASK_CAP_S = 60.0  # Hard stop for work continuing past the deadline
+
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# One client and one set of host limits per event loop: an httpx connection
+# and an asyncio.Semaphore both belong to the loop that created them.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_host_limits: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict] = (
+    weakref.WeakKeyDictionary()
+)
+# Strong references to tasks still running past the deadline.
+_late_tasks: set[asyncio.Task] = set()
+
+
+def _client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers={"User-Agent": _USER_AGENT},
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=LINK_FETCH_TIMEOUT_S,
+        )
+        _clients[loop] = client
+    return client
+
+
+def _host_slot(url: str) -> asyncio.Semaphore:
+    limits = _host_limits.setdefault(asyncio.get_running_loop(), {})
+    host = urlparse(url).netloc.lower()
+    if host not in limits:
+        limits[host] = asyncio.Semaphore(LINK_FETCH_PER_HOST)
+    return limits[host]
+
+
+async def aclose_link_clients() -> None:
+    """Close the running loop's pooled client; call once at process shutdown."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _enrich_one(
+    url: str, sender: str, chat_id: str, message_id: int, timestamp
+) -> dict | None:
+    existing = await asyncio.to_thread(get_link_by_url, url, max_age_hours=LINK_SUMMARY_CACHE_HOURS)
+    if existing and existing.get("ai_summary"):
+        logger.debug(f"Using cached summary for: {url[:50]}...")
+        return {
+            "url": url,
+            "summary": existing["ai_summary"],
+            "title": existing.get("title"),
+            "cached": True,
+        }
+
+    logger.info(f"Fetching summary for: {url[:50]}...")
+    client = _client()
+    async with _host_slot(url):
+        page = await fetch_page(url, client=client, timeout=LINK_FETCH_TIMEOUT_S)
+
+    if page.get("content"):
+        summary = await summarize_page_content(
+            url, page["content"], page.get("title"), timeout=LINK_SUMMARY_TIMEOUT_S, client=client
+        )
+    else:
+        # Unreadable here (JS-rendered, blocked, binary): let the summarizer fetch it.
+        summary = await summarize_url_content(url, timeout=LINK_SUMMARY_TIMEOUT_S, client=client)
+
+    await asyncio.to_thread(
+        store_link,
+        url=url,
+        sender=sender,
+        chat_id=chat_id,
+        message_id=message_id,
+        timestamp=timestamp,
+        title=page.get("title"),
+        description=page.get("description"),
+        final_url=page.get("final_url", url),
+        ai_summary=summary,
+    )
+
+    if not summary:
+        logger.warning(f"No summary generated for: {url[:50]}...")
+        return None
+    logger.info(f"Stored link with summary: {url[:50]}...")
+    return {"url": url, "summary": summary, "title": page.get("title"), "cached": False}
+
+
+async def _enrich_guarded(url: str, *args) -> dict | None:
+    try:
+        return await asyncio.wait_for(_enrich_one(url, *args), LINK_LATE_TASK_CAP_S)
+    except Exception as e:
+        logger.error(f"Error processing URL {url[:50]}...: {e}")
+        return None
+
+
+async def enrich_links(
+    urls: list[str],
+    sender: str,
+    chat_id: str,
+    message_id: int,
+    timestamp,
+    deadline_s: float | None = None,
+) -> list[dict]:
+    """
+    Summarize ``urls`` concurrently and return what finished by the deadline.
+
+    Args:
+        urls: URLs to enrich (already de-duplicated and capped by the caller)
+        sender: Who shared the links
+        chat_id: Telegram chat ID
+        message_id: Telegram message ID
+        timestamp: When the message was sent
+        deadline_s: Seconds to wait (default ``LINK_ENRICHMENT_DEADLINE_S``)
+
+    Returns:
+        Summary dicts (url, summary, title, cached) in the order of ``urls``,
+        for the URLs that finished in time with a summary
+    """
+    if not urls:
+        return []
+    deadline = LINK_ENRICHMENT_DEADLINE_S if deadline_s is None else deadline_s
+    started = time.monotonic()
+    tasks = [
+        asyncio.create_task(_enrich_guarded(url, sender, chat_id, message_id, timestamp))
+        for url in urls
+    ]
+    _, pending = await asyncio.wait(tasks, timeout=deadline)
+
+    for task in pending:
+        _late_tasks.add(task)
+        task.add_done_callback(_late_tasks.discard)
+    if pending:
+        logger.info(
+            f"Link enrichment deadline ({deadline:.0f}s): {len(tasks) - len(pending)}/"
+            f"{len(tasks)} links ready, {len(pending)} finishing in the background"
+        )
+
+    try:
+        from analytics.collector import record_metric
+
+        record_metric(
+            "bridge.link_enrichment_s",
+            time.monotonic() - started,
+            {"links": str(len(tasks)), "late": str(len(pending))},
+        )
+    except Exception:  # noqa: S110 -- optional analytics telemetry
+        pass
+
+    return [t.result() for t in tasks if t.done() and t.result()]
@@ -0,0 +1,243 @@
+"""Speculative message enrichment at bridge intake.
+
+``bridge.enrichment.enrich_message`` runs in the worker right before the
+agent is invoked. Its media (transcription / vision), YouTube and link stages
+used to start only then, even though the bridge had the message while the
+session sat in the queue. This module lets the bridge start them at intake:
+
+* :func:`schedule` (bridge) starts a background task per message once its
+  ``TelegramMessage`` carries the media path and URL metadata. At most
+  ``PRE_ENRICHMENT_CONCURRENCY`` messages are enriched at once.
+* :func:`resolve` (worker, from ``enrich_message``) returns a stage result the
+  bridge already stored, waits for one still in flight, or computes it.
+
+Results live in ``POPOTO_REDIS_DB`` under ``pre_enrichment:{msg_key}:{stage}``,
+where ``msg_key`` is ``TelegramMessage.msg_id`` (the session's
+``telegram_message_key``). Whoever computes a stage first claims the key with
+``SET NX``, so the bridge and the worker never run the same stage twice. A
+claim expires after ``CLAIM_TTL_S`` in case its owner dies. A failed stage is
+released rather than stored, so the next reader retries it.
+
+Every Redis failure degrades to computing the stage locally: enrichment
+never fails because the speculative path did. ``PRE_ENRICHMENT_DISABLED=1``
+turns both sides off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "pre_enrichment"
+
+# How long a finished stage stays readable. Covers a long queue wait.
+RESULT_TTL_S = int(os.environ.get("PRE_ENRICHMENT_RESULT_TTL_S", str(6 * 3600)))
+
+# Lifetime of a "running" claim; a crashed owner frees the stage after this.
+CLAIM_TTL_S = int(os.environ.get("PRE_ENRICHMENT_CLAIM_TTL_S", "600"))
+
+# Longest a worker waits on a stage the bridge is still running before it
+# computes the stage itself.
+JOIN_TIMEOUT_S = float(os.environ.get("PRE_ENRICHMENT_JOIN_TIMEOUT_S", "180"))
+
+POLL_INTERVAL_S = 0.25
+
+# Messages enriched at once by the bridge; media stages are CPU/API heavy.
+PRE_ENRICHMENT_CONCURRENCY = int(os.environ.get("PRE_ENRICHMENT_CONCURRENCY", "4"))
+
+_semaphore: asyncio.Semaphore | None = None
+_tasks: set[asyncio.Task] = set()
+
+Compute = Callable[[], Awaitable[dict]]
+
+
+def disabled() -> bool:
+    return os.environ.get("PRE_ENRICHMENT_DISABLED", "").lower() in ("1", "true", "yes")
+
+
+def _redis():
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    return POPOTO_REDIS_DB
+
+
+def _key(message_key: str, stage: str) -> str:
+    return f"{KEY_PREFIX}:{message_key}:{stage}"
+
+
+def _record(outcome: str, stage: str) -> None:
+    try:
+        from analytics.collector import record_metric
+
+        record_metric("pre_enrichment.stage", 1, {"stage": stage, "outcome": outcome})
+    except Exception:  # noqa: S110 -- optional analytics telemetry
+        pass
+
+
+def peek(message_key: str, stage: str) -> dict | None:
+    """The stored entry: ``{"state": "running"}`` or ``{"state": "done", "result": ...}``."""
+    try:
+        raw = _redis().get(_key(message_key, stage))
+    except Exception as e:
+        logger.debug(f"[pre-enrichment] read failed for {message_key}/{stage}: {e}")
+        return None
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _claim(message_key: str, stage: str) -> bool:
+    entry = json.dumps({"state": "running", "pid": os.getpid(), "ts": time.time()})
+    try:
+        return bool(_redis().set(_key(message_key, stage), entry, nx=True, ex=CLAIM_TTL_S))
+    except Exception as e:
+        logger.debug(f"[pre-enrichment] claim failed for {message_key}/{stage}: {e}")
+        return False
+
+
+def _finish(message_key: str, stage: str, result: dict | None) -> None:
+    """Store a successful result, or release the claim so the stage is retried."""
+    key = _key(message_key, stage)
+    try:
+        if result is None or result.get("failed"):
+            _redis().delete(key)
+        else:
+            _redis().set(key, json.dumps({"state": "done", "result": result}), ex=RESULT_TTL_S)
+    except Exception as e:
+        logger.debug(f"[pre-enrichment] store failed for {message_key}/{stage}: {e}")
+
+
+async def _run_claimed(message_key: str, stage: str, compute: Compute) -> dict:
+    result = None
+    try:
+        result = await compute()
+        return result
+    finally:
+        _finish(message_key, stage, result)
+
+
+async def resolve(message_key: str, stage: str, compute: Compute) -> dict:
+    """Return ``stage``'s result for the message, computing it at most once.
+
+    A stored result is returned as is. A stage claimed elsewhere is polled
+    until it is stored, its claim disappears, or ``JOIN_TIMEOUT_S`` passes;
+    then it is computed here. An unclaimed stage is claimed and computed.
+    """
+    if disabled():
+        return await compute()
+    deadline = time.monotonic() + JOIN_TIMEOUT_S
+    waited = False
+    while True:
+        entry = peek(message_key, stage)
+        if entry and entry.get("state") == "done":
+            _record("joined" if waited else "ready", stage)
+            return entry["result"]
+        if entry is None and _claim(message_key, stage):
+            _record("computed", stage)
+            return await _run_claimed(message_key, stage, compute)
+        if entry is None:
+            # Lost the claim race or Redis is failing: look once more, then
+            # compute without storing.
+            entry = peek(message_key, stage)
+            if entry is None:
+                _record("computed", stage)
+                return await compute()
+            continue
+        if time.monotonic() >= deadline:
+            logger.info(f"[pre-enrichment] {message_key}/{stage} still running; computing here")
+            _record("join_timeout", stage)
+            return await compute()
+        waited = True
+        await asyncio.sleep(POLL_INTERVAL_S)
+
+
+async def pre_enrich(
+    message_key: str,
+    *,
+    message_text: str,
+    sender_name: str | None = None,
+    chat_id: str | None = None,
+    message_id: int | None = None,
+) -> list[str]:
+    """Run every applicable stage for a stored message that nobody has claimed.
+
+    Reads the ``TelegramMessage`` the way the worker does, so both sides
+    compute identical stages. Returns the stages this call ran.
+    """
+    from bridge import enrichment
+    from models.telegram import TelegramMessage
+
+    records = list(TelegramMessage.query.filter(msg_id=message_key))
+    if not records:
+        return []
+    tm = records[0]
+    computes: dict[str, Compute] = {}
+    if tm.has_media:
+        computes["media"] = lambda: enrichment.media_stage(tm)
+    if tm.youtube_urls:
+        computes["youtube"] = lambda: enrichment.youtube_stage(message_text, tm.youtube_urls)
+    if tm.non_youtube_urls:
+        computes["links"] = lambda: enrichment.links_stage(
+            tm.non_youtube_urls,
+            sender_name=sender_name,
+            chat_id=chat_id,
+            message_id=message_id,
+        )
+    claimed = [stage for stage in computes if _claim(message_key, stage)]
+    await asyncio.gather(
+        *(_run_claimed(message_key, stage, computes[stage]) for stage in claimed),
+        return_exceptions=True,
+    )
+    if claimed:
+        logger.info(f"[pre-enrichment] {message_key}: ran {','.join(claimed)} at intake")
+    return claimed
+
+
+async def _pre_enrich_bounded(message_key: str, **kwargs) -> None:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(max(1, PRE_ENRICHMENT_CONCURRENCY))
+    async with _semaphore:
+        try:
+            await pre_enrich(message_key, **kwargs)
+        except Exception as e:
+            logger.warning(f"[pre-enrichment] {message_key} failed: {e}")
+
+
+def schedule(
+    message_key: str | None,
+    *,
+    message_text: str,
+    sender_name: str | None = None,
+    chat_id: str | None = None,
+    message_id: int | None = None,
+) -> asyncio.Task | None:
+    """Start pre-enrichment for a stored message in the background (bridge side).
+
+    Call once the ``TelegramMessage`` has its media path and URL metadata.
+    The task is held here until it finishes so it is not garbage-collected.
+    """
+    if not message_key or disabled():
+        return None
+    task = asyncio.create_task(
+        _pre_enrich_bounded(
+            message_key,
+            message_text=message_text,
+            sender_name=sender_name,
+            chat_id=chat_id,
+            message_id=message_id,
+        ),
+        name=f"pre_enrich:{message_key}",
+    )
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
@@ -612,7 +612,7 @@ async def _evaluate_promise_async(text: str) -> PromiseVerdict | None:
         return None
 
     try:
-        async with semaphore_slot():
+        async with semaphore_slot("interactive"):
             async with anthropic.AsyncAnthropic(
                 api_key=api_key,
                 timeout=RTR_SDK_TIMEOUT,
@@ -589,7 +589,7 @@ async def read_the_room(
     )
 
     try:
-        async with semaphore_slot():
+        async with semaphore_slot("interactive"):
             async with anthropic.AsyncAnthropic(
                 api_key=get_anthropic_api_key(),
                 timeout=RTR_SDK_TIMEOUT,
@@ -14,13 +14,17 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel
 
 from agent.llm import run_typed
 from config.enums import ClassificationType, PersonaType, SessionType
 from config.models import MODEL_FAST
+from utils.llm_cache import llm_cached
+
+if TYPE_CHECKING:
+    from bridge.inbound_classification import InboundClassification
 
 logger = logging.getLogger(__name__)
 
@@ -712,14 +716,11 @@ _ACKNOWLEDGMENT_TOKENS: set[str] = {
 }
 
 
-async def classify_needs_response(text: str) -> bool:
-    """Classify whether a message needs a full response.
+def needs_response_fast_path(text: str) -> bool | None:
+    """Answer ``classify_needs_response`` without an LLM call, or ``None``.
 
-    Returns ``True`` if the message warrants an agent session, ``False`` if
-    it is a simple acknowledgment, social banter, or emoji that can be ignored.
-
-    The function is intentionally conservative: if LLM classification
-    fails, it defaults to ``True`` so no genuine question is dropped.
+    Shared with ``bridge.inbound_classification`` so the fused classifier
+    skips the same messages.
     """
     # Fast path: very short messages are usually acknowledgments
     if len(text.strip()) < 3:
@@ -729,6 +730,21 @@ async def classify_needs_response(text: str) -> bool:
     text_lower = text.strip().lower().rstrip("!.,")
     if text_lower in _ACKNOWLEDGMENT_TOKENS:
         return False
+    return None
+
+
+async def classify_needs_response(text: str) -> bool:
+    """Classify whether a message needs a full response.
+
+    Returns ``True`` if the message warrants an agent session, ``False`` if
+    it is a simple acknowledgment, social banter, or emoji that can be ignored.
+
+    The function is intentionally conservative: if LLM classification
+    fails, it defaults to ``True`` so no genuine question is dropped.
+    """
+    fast = needs_response_fast_path(text)
+    if fast is not None:
+        return fast
 
     # #1925: run_typed holds agent.anthropic_client's shared semaphore slot
     # for the whole call internally, and enforces the boolean schema directly
@@ -742,7 +758,9 @@ async def classify_needs_response(text: str) -> bool:
         f"Message: {text[:200]}"
     )
     try:
-        decision = await run_typed(prompt, NeedsResponseDecision, model=MODEL_FAST)
+        decision = await run_typed(
+            prompt, NeedsResponseDecision, model=MODEL_FAST, lane="interactive"
+        )
         logger.info(
             "classify_needs_response: needs_response=%s",
             decision.needs_response,
@@ -963,7 +981,7 @@ async def classify_conversation_terminus(
     # verdict (with a single auto-retry on mismatch), so the old
     # ``if raw in (...)`` garbage-output guard is enforced structurally.
     try:
-        decision = await run_typed(prompt, TerminusDecision, model=MODEL_FAST)
+        decision = await run_typed(prompt, TerminusDecision, model=MODEL_FAST, lane="interactive")
         result = decision.verdict
         logger.info("classify_terminus: verdict=%s", result)
     except Exception as e:
@@ -1086,13 +1104,27 @@ async def _classify_work_request_llm(text: str) -> str:
     #1925: a single ``run_typed`` call (Haiku default) replaces the previous
     Ollama-first/Haiku-fallback pair and its first-token text parse -- the
     ``RoutingDecision`` schema enforces one of the four categories directly.
+    The call itself goes through the shared LLM result cache
+    (``utils/llm_cache``), near-duplicate messages included.
     """
     # Inject principal context for better classification of project-related messages
     principal = _get_principal_priorities_for_classification()
     principal_hint = ""
     if principal:
         principal_hint = f"\n\nContext — active projects and priorities:\n{principal[:500]}\n\n"
+    return await _classify_work_request_cached(text[:300], principal_hint)
+
 
+@llm_cached(
+    "work_request",
+    model=MODEL_FAST,
+    version="v1",
+    ttl=3600,
+    semantic=True,
+    decode=ClassificationType,
+)
+async def _classify_work_request_cached(text: str, principal_hint: str) -> str:
+    """The ``run_typed`` call of ``_classify_work_request_llm``, in the shared LLM cache."""
     prompt = (
         "Classify this message into one of: sdlc, collaboration, other, question.\n\n"
         '- "sdlc" = work request that could result in code changes or a PR:\n'
@@ -1106,10 +1138,10 @@ async def _classify_work_request_llm(text: str) -> str:
         "  how does X work, what is Y, conversational/social\n\n"
         "If in doubt, classify as collaboration.\n\n"
         f"{principal_hint}"
-        f"Message: {text[:300]}"
+        f"Message: {text}"
     )
 
-    decision = await run_typed(prompt, RoutingDecision, model=MODEL_FAST)
+    decision = await run_typed(prompt, RoutingDecision, model=MODEL_FAST, lane="interactive")
     if decision.category == "sdlc":
         return ClassificationType.SDLC
     if decision.category == "collaboration":
@@ -1273,11 +1305,17 @@ async def should_respond_async(
     sender_name: str | None = None,
     sender_username: str | None = None,
     sender_id: int | None = None,
+    classification: "InboundClassification | None" = None,
 ) -> tuple[bool, bool]:
     """Async response decision with full context.
 
     Returns (should_respond, is_reply_to_valor) tuple.
 
+    ``classification`` is the message's fused classification stage
+    (``bridge.inbound_classification``). When given, Case 1 reads
+    ``needs_response`` from the fused verdict instead of making its own
+    LLM call; the bridge has usually started it speculatively by then.
+
     Uses config-driven persona resolution (resolve_persona) as the first
     routing gate. When a group resolves to Teammate persona (via "teammate"
     persona in projects.json), the group becomes a passive listener: messages
@@ -1411,7 +1449,10 @@ async def should_respond_async(
 
     # Case 1: Unaddressed message → use Ollama to classify
     logger.debug("Case 1: Unaddressed message - classifying with Ollama")
-    should_respond = await classify_needs_response_async(text)
+    if classification is not None:
+        should_respond = await classification.needs_response()
+    else:
+        should_respond = await classify_needs_response_async(text)
     if not should_respond:
         logger.info(f"Classified as ignore: {text[:50]}...")
         return False, False
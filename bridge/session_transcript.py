@@ -110,7 +110,7 @@ def start_transcript(
                 pass
         else:
             # No existing session — create one (standalone transcript case)
-            AgentSession.create(
+            created = AgentSession.create(
                 session_id=session_id,
                 project_key=project_key,
                 status="active",
@@ -127,6 +127,10 @@ def start_transcript(
                 classification_type=classification_type,
                 correlation_id=correlation_id,
             )
+            # Created already active: index its started_at for date-range reads.
+            from models.session_time_index import index_session
+
+            index_session(created)
             # Log lifecycle transition
             try:
                 sessions = list(AgentSession.query.filter(session_id=session_id))
@@ -101,6 +101,7 @@ from bridge.dispatch import (  # noqa: E402
     dispatch_telegram_session,
     record_telegram_message_handled,
 )
+from bridge.inbound_classification import InboundClassification, worth_speculating  # noqa: E402
 from bridge.media import (  # noqa: E402
     MEDIA_DIR,  # noqa: F401
     VISION_EXTENSIONS,  # noqa: F401
@@ -1210,6 +1211,10 @@ async def main():
 
     configure_resilient_redis()
 
+    from analytics.metrics import start_exporter  # noqa: PLC0415
+
+    start_exporter("bridge")
+
     # Validate agent definition files are usable on disk. Missing, malformed,
     # or unreadable files are not fatal — the SDK falls back gracefully — but
     # we surface warnings early so operators can fix them before users hit
@@ -1398,15 +1403,27 @@ async def main():
             _route_task.add_done_callback(_log_bg_task_exception)
             _background_tasks.append(_route_task)
 
+        # Fused inbound classification: one Haiku call answers both
+        # needs_response (response gate, Case 1) and the work type (session
+        # routing) for this message. Started speculatively here, before the
+        # gate, whenever the gate can plausibly consume it, so it overlaps the
+        # injection screen, message store and media download instead of
+        # following them. Cancelled on every early return below. See
+        # docs/features/fused-inbound-classification.md.
+        _inbound = InboundClassification(text, chat_id=event.chat_id, message_id=message.id)
+        if worth_speculating(text, is_dm=is_dm, chat_title=chat_title, project=project):
+            _inbound.start()
+
         # #1630: pre-execution prompt-injection screen on untrusted inbound text.
         # Runs at the raw-intake seam -- strictly BEFORE the steer/resume/new
         # dispatch decision, so it does not touch the dispatch logic that
         # #2159/#2160 are extracting. Detection-only: a flagged message is
         # annotated with a banner (folded into extra_context below) and still
         # processed; the inspector never blocks and never raises. Trusted = a
-        # whitelisted DM contact. _injection_ctx stays {} for the common case.
-        _injection_ctx: dict = {}
-        if project:
+        # whitelisted DM contact. It runs as a speculative side task of the
+        # classification stage and is collected after the 👀 ack, the first
+        # point its banner is needed. _injection_ctx stays {} for the common case.
+        async def screen_injection() -> dict:
             try:
                 from bridge.injection_inspection import (
                     build_risk_banner,
@@ -1425,9 +1442,13 @@ async def main():
                 )
                 _inj_banner = build_risk_banner(_inj_verdict, source_label="telegram")
                 if _inj_banner:
-                    _injection_ctx = {"injection_risk_banner": _inj_banner}
+                    return {"injection_risk_banner": _inj_banner}
             except Exception as _inj_exc:
                 logger.warning(f"[bridge] injection screen skipped (non-fatal): {_inj_exc}")
+            return {}
+
+        if project:
+            _inbound.speculate("injection", screen_injection())
 
         # Store inbound messages to Redis only for machine-owned chats, plus
         # registered bots (needed for the valor-telegram --await-reply E2E flow,
@@ -1494,6 +1515,7 @@ async def main():
                 f"[routing] Registered bot peer {sender_name} (id={sender_id}) — "
                 "recorded to history, no session spawned (loop-guard #1574)"
             )
+            _inbound.cancel()
             return
 
         # Save to subconscious memory (non-fatal, never crashes bridge).
@@ -1644,8 +1666,10 @@ async def main():
             sender_name,
             sender_username,
             sender_id,
+            classification=_inbound,
         )
         if not should_reply:
+            _inbound.cancel()
             if is_dm and DM_WHITELIST:
                 logger.debug(f"Ignoring DM from {sender_name} (id={sender_id}) - not in whitelist")
             return
@@ -1660,8 +1684,13 @@ async def main():
                 f"[routing] Skipping unowned message from {sender_name} "
                 f"(chat={chat_title or 'DM'}, sender_id={sender_id}): no project resolved"
             )
+            _inbound.cancel()
             return
 
+        # The message will be answered: its work type is now needed whether or
+        # not the fused call was started speculatively (no-op if it was).
+        _inbound.start()
+
         project_name = project.get("name", "DM") if project else "DM"
         message_id = message.id
         # sdlc-1179: log safe_text so bridge.log never contains wrapped content.
@@ -1756,6 +1785,7 @@ async def main():
         # === REACTION WORKFLOW ===
         # 1. 👀 Eyes = Message received/acknowledged
         await set_reaction(client, event.chat_id, message.id, REACTION_RECEIVED)
+        _injection_ctx: dict = await _inbound.side_result("injection", {})
 
         # 2. Embedding-based emoji selection (fire-and-forget async task)
         # find_best_emoji_for_message makes a synchronous HTTP call for embeddings,
@@ -1790,16 +1820,17 @@ async def main():
         classification_result = {}  # Mutable container for async classification result
 
         async def classify_work_type():
-            """Classify work type for session routing."""
+            """Classify work type for session routing (from the fused verdict)."""
             try:
-                from tools.classifier import classify_request_async
-
-                result = await classify_request_async(clean_text)
-                classification_result["type"] = result.get("type")
-                classification_result["confidence"] = result.get("confidence")
+                verdict = await _inbound.verdict()
+                if verdict is None:
+                    return
+                classification_result["type"] = verdict.work_type
+                classification_result["confidence"] = verdict.work_type_confidence
                 logger.debug(
-                    f"Work classified as {result.get('type')} "
-                    f"(confidence: {result.get('confidence')})"
+                    f"Work classified as {verdict.work_type} "
+                    f"(confidence: {verdict.work_type_confidence}, "
+                    f"stages: {_inbound.timings})"
                 )
             except Exception as e:
                 logger.debug(f"Work classification failed (non-fatal): {e}")
@@ -2416,6 +2447,19 @@ async def main():
             except Exception as e:
                 logger.debug(f"Failed to update TelegramMessage with URL metadata: {e}")
 
+        # Start media/YouTube/link enrichment now, while the session waits in
+        # the queue; the worker's enrich_message picks up the results.
+        if stored_msg_id and (message.media or yt_urls_json or non_yt_urls_json):
+            from bridge.pre_enrichment import schedule as schedule_pre_enrichment
+
+            schedule_pre_enrichment(
+                stored_msg_id,
+                message_text=text,
+                sender_name=sender_name,
+                chat_id=str(event.chat_id),
+                message_id=message.id,
+            )
+
         # Generate correlation ID for end-to-end request tracing
         correlation_id = uuid.uuid4().hex[:12]
         logger.info(
@@ -2662,7 +2706,8 @@ async def main():
 
         # sdlc-1297: emit handler latency telemetry. Read by ops/log-scrape; the
         # success criterion is p95 < 2s for media-bearing intake.
-        _intake_dur_ms = int((_intake_time.monotonic() - _intake_t0) * 1000)
+        _intake_elapsed = _intake_time.monotonic() - _intake_t0
+        _intake_dur_ms = int(_intake_elapsed * 1000)
         logger.info(
             f"[bridge] intake_duration_ms={_intake_dur_ms} "
             f"has_media={bool(message.media)} "
@@ -2670,6 +2715,39 @@ async def main():
             f"chat_id={event.chat_id}"
         )
 
+        # Reply trace root + intake span (analytics/tracing.py); the worker,
+        # harness and relay add their spans under the same correlation_id.
+        # One pipeline in a background task, so tracing adds no round trip to
+        # the intake latency it measures. Held in _background_tasks (D3).
+        from analytics import tracing
+
+        _intake_end = _intake_time.time()
+        _trace_started_at = _intake_end - _intake_elapsed
+        _trace_task = asyncio.create_task(
+            asyncio.to_thread(
+                tracing.start_trace,
+                correlation_id,
+                _trace_started_at,
+                spans=[
+                    tracing.make_span(
+                        "intake",
+                        _trace_started_at,
+                        _intake_end,
+                        has_media=bool(message.media),
+                        queue_depth=depth,
+                    )
+                ],
+                session_id=session_id,
+                chat_id=telegram_chat_id,
+                chat_title=chat_title,
+                sender=sender_name,
+                project=project_key,
+            ),
+            name="record_intake_trace",
+        )
+        _trace_task.add_done_callback(_log_bg_task_exception)
+        _background_tasks.append(_trace_task)
+
     # Dedup cache for edit events: (chat_id, message_id, text_hash) -> timestamp
     # Telegram frequently delivers the same edit event 2-3x in rapid succession.
     _edit_dedup: dict[tuple, float] = {}
@@ -2903,6 +2981,11 @@ async def main():
             await asyncio.gather(*_background_tasks, return_exceptions=True)
             logger.info("All background tasks cancelled")
 
+        # Close the loop's pooled Anthropic client (its keep-alive connections).
+        from agent.anthropic_client import aclose_pooled_clients
+
+        await aclose_pooled_clients()
+
         logger.info("Disconnecting Telegram client...")
         await tg_client.disconnect()
 
@@ -3445,6 +3528,17 @@ async def main():
 
     _background_tasks.append(asyncio.create_task(heartbeat_loop()))
 
+    # Boot budget: process start -> ready to serve, Telegram connect included
+    # (scripts/profile_startup.py breaks down the import share).
+    from agent.cold_start_metrics import record_boot
+
+    record_boot(process="bridge")
+    # Import the LLM provider SDKs in a thread now, so the first classified
+    # message does not pay for them on the loop.
+    from agent.llm.wrapper import warm_providers
+
+    _background_tasks.append(asyncio.create_task(warm_providers()))
+
     # Keep running
     await client.run_until_disconnected()
 
@@ -29,10 +29,13 @@ import asyncio
 import json
 import logging
 import os
+import time
 
 import redis
 from telethon.errors import FloodWaitError
 
+from analytics import tracing
+from analytics.metrics import histogram
 from utils.peer import numeric_peer
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,13 @@ RELAY_FLOOD_WAIT_MAX = int(os.environ.get("RELAY_FLOOD_WAIT_MAX", "10"))
 # Known message types accepted by the relay dispatcher
 KNOWN_MESSAGE_TYPES = {None, "reaction", "custom_emoji_message"}
 
+# Per-message Telethon dispatch time, by type and outcome (GET /metrics).
+_SEND_SECONDS = histogram(
+    "valor_telegram_send_seconds",
+    "Relay dispatch time of one outbox entry to Telegram.",
+    ("type", "outcome"),
+)
+
 
 class _DeliveredNoId:
     """Sentinel: a send reached Telegram but no ``message_id`` was captured.
@@ -819,6 +829,20 @@ def _record_sent_message(session_id: str, msg_id: int) -> None:
         logger.warning(f"Relay: failed to record msg_id on session {session_id}: {e}")
 
 
+def _record_sent_root(message: dict, msg_id) -> None:
+    """Cache the sent message's session root so a reply to it resolves in one GET.
+
+    See ``bridge.context.record_sent_message_root``. Best-effort: never
+    raises into the relay.
+    """
+    try:
+        from bridge.context import record_sent_message_root
+
+        record_sent_message_root(message.get("chat_id"), msg_id, message.get("session_id"))
+    except Exception as e:  # noqa: BLE001 — root cache is best-effort bookkeeping
+        logger.debug("Relay: session-root record failed (non-fatal): %s", e)
+
+
 def _record_relay_sent_draft(session_id: str, text: str) -> None:
     """Append a PM self-send to ``AgentSession.recent_sent_drafts``.
 
@@ -1061,6 +1085,8 @@ async def process_outbox(telegram_client) -> int:
                 success = False
                 msg_id = None
                 session_id = message.get("session_id")
+                send_t0 = time.perf_counter()
+                send_started_at = time.time()
                 try:
                     if msg_type == "reaction":
                         if await asyncio.to_thread(_reaction_yields_slot, message):
@@ -1087,6 +1113,9 @@ async def process_outbox(telegram_client) -> int:
                             msg_id = send_result
                             success = msg_id is not None
                 except FloodWaitError as flood_err:
+                    _SEND_SECONDS.labels(msg_type or "text", "flood_wait").observe(
+                        time.perf_counter() - send_t0
+                    )
                     # Borrows only blocking-sleep shape from telegram_bridge.py connect-loop
                     # handler; NOT a connect-path handler; intentionally omits
                     # _write_flood_backoff side-effect (#1749 defect 4).
@@ -1121,8 +1150,22 @@ async def process_outbox(telegram_client) -> int:
                     )
                     success = False
 
+                _SEND_SECONDS.labels(msg_type or "text", "sent" if success else "failed").observe(
+                    time.perf_counter() - send_t0
+                )
                 if success:
                     sent_count += 1
+                    # Close the reply trace (analytics/tracing.py) and rank it
+                    # in today's slowest replies.
+                    if message.get("trace_id"):
+                        await asyncio.to_thread(
+                            tracing.record_reply,
+                            message["trace_id"],
+                            send_started_at,
+                            time.time(),
+                            type=msg_type or "text",
+                            msg_id=msg_id,
+                        )
                     if msg_type != "reaction":
                         await asyncio.to_thread(_reanchor_liveness_counter, message, msg_id)
                     # Record sent message ID on AgentSession
@@ -1130,6 +1173,7 @@ async def process_outbox(telegram_client) -> int:
                         session_id = message.get("session_id")
                         if session_id:
                             await asyncio.to_thread(_record_sent_message, session_id, msg_id)
+                            await asyncio.to_thread(_record_sent_root, message, msg_id)
                             # Opt-in producer-readable ack (issue #2717). Gated on
                             # the payload flag: an unconditional write would add
                             # two Redis ops to every outbound message system-wide
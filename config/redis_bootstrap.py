@@ -148,6 +148,7 @@ def configure_resilient_redis() -> None:
         import sys
 
         new_client = _rdb.POPOTO_REDIS_DB
+        instrument_redis_client(new_client)
         for name, mod in list(sys.modules.items()):
             if (
                 mod is not None
@@ -172,3 +173,75 @@ def configure_resilient_redis() -> None:
             "Starting in degraded mode — Redis operations will fail until Redis recovers.",
             exc,
         )
+
+
+def instrument_redis_client(client=None) -> None:
+    """Time every command and pipeline on ``client`` into ``analytics.metrics``.
+
+    Wraps the instance's ``execute_command`` and ``pipeline`` (defaults to the
+    current ``POPOTO_REDIS_DB``), so every Popoto and raw redis-py call is
+    observed in ``valor_redis_command_seconds`` labelled by command, and
+    pipelines as ``PIPELINE``. Idempotent per client; never raises. Called by
+    :func:`configure_resilient_redis` and by processes that skip it (the
+    reflection worker and the UI).
+    """
+    try:
+        if client is None:
+            import popoto.redis_db as _rdb
+
+            client = _rdb.POPOTO_REDIS_DB
+        if getattr(client, "_valor_metrics", False):
+            return
+
+        from time import perf_counter
+
+        from analytics.metrics import counter, histogram
+
+        seconds = histogram(
+            "valor_redis_command_seconds", "Redis command round-trip time.", ("command",)
+        )
+        errors = counter(
+            "valor_redis_command_errors_total", "Redis commands that raised.", ("command",)
+        )
+        handles: dict = {}
+        execute_command = client.execute_command
+        make_pipeline = client.pipeline
+
+        def timed_execute_command(*args, **options):
+            name = args[0] if args else ""
+            hist = handles.get(name)
+            if hist is None:
+                hist = handles[name] = seconds.labels(str(name).upper())
+            t0 = perf_counter()
+            try:
+                return execute_command(*args, **options)
+            except Exception:
+                errors.labels(str(name).upper()).inc()
+                raise
+            finally:
+                hist.observe(perf_counter() - t0)
+
+        pipeline_hist = seconds.labels("PIPELINE")
+
+        def timed_pipeline(*args, **kwargs):
+            pipe = make_pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            def timed_execute(*eargs, **ekwargs):
+                t0 = perf_counter()
+                try:
+                    return execute(*eargs, **ekwargs)
+                except Exception:
+                    errors.labels("PIPELINE").inc()
+                    raise
+                finally:
+                    pipeline_hist.observe(perf_counter() - t0)
+
+            pipe.execute = timed_execute
+            return pipe
+
+        client.execute_command = timed_execute_command
+        client.pipeline = timed_pipeline
+        client._valor_metrics = True
+    except Exception as exc:
+        logger.debug("[redis_bootstrap] metrics instrumentation skipped: %s", exc)
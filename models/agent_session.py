@@ -34,7 +34,6 @@ from datetime import UTC, datetime
 from popoto import (
     AutoKeyField,
     DatetimeField,
-    DictField,
     Field,
     FloatField,
     IndexedField,
@@ -47,6 +46,7 @@ from popoto import (
 
 from config.enums import ClassificationType, SessionType
 from config.settings import settings
+from models.cold_payload import ColdDictField, ColdListField, ColdPayloadMixin
 from models.session_event import SessionEvent
 
 logger = logging.getLogger(__name__)
@@ -95,7 +95,7 @@ SESSION_TYPE_ENG = SessionType.ENG
 SESSION_TYPE_TEAMMATE = SessionType.TEAMMATE
 
 
-class AgentSession(Model):
+class AgentSession(ColdPayloadMixin, Model):
     """Unified model for all Agent SDK sessions, discriminated by session_type.
 
     Single Popoto model with a session_type discriminator ("eng" or
@@ -148,6 +148,14 @@ class AgentSession(Model):
         - finalize_session(session, status, reason) for terminal transitions
         - transition_status(session, new_status, reason) for non-terminal transitions
         Direct .status = mutations outside the lifecycle module are prohibited.
+
+    Hot/cold storage:
+        The heavy payloads (session_events, chat_message_log, spawn_history,
+        initial_telegram_message, extra_context, project_config) are Cold*Field
+        declarations. Once one encodes past COLD_PAYLOAD_MIN_BYTES it is kept in
+        a per-session side hash and the core hash stores a marker, so scans and
+        scalar-only saves stop moving it. Attribute access is unchanged; see
+        models/cold_payload.py.
     """
 
     # === Identity ===
@@ -184,12 +192,16 @@ class AgentSession(Model):
     working_dir = Field()
 
     # === Telegram origin (consolidated) ===
-    initial_telegram_message = DictField(null=True)  # {sender_name, sender_id, message_text, ...}
+    initial_telegram_message = ColdDictField(
+        null=True
+    )  # {sender_name, sender_id, message_text, ...}
 
     chat_id = KeyField(null=True)
 
     # === Extra context (consolidated) ===
-    extra_context = DictField(null=True)  # revival_context, classification_type/confidence, etc.
+    extra_context = ColdDictField(
+        null=True
+    )  # revival_context, classification_type/confidence, etc.
 
     task_list_id = Field(null=True)
     auto_continue_count = Field(type=int, default=0)
@@ -219,7 +231,7 @@ class AgentSession(Model):
     rework_triggered = Field(null=True)  # "true"/"false" — session retried prior output
 
     # === Structured event log (replaces history, summary, result_text, stage_states) ===
-    session_events = ListField(null=True)  # List of SessionEvent dicts
+    session_events = ColdListField(null=True)  # List of SessionEvent dicts
 
     issue_url = Field(null=True)
     plan_url = Field(null=True)
@@ -350,7 +362,7 @@ class AgentSession(Model):
     # agent_id, ts}, ...]. Newest entry is the live fence. A
     # died-resumed-died-again timeline stays reconstructable for the session's
     # TTL (``Meta.ttl``), not bounded by count.
-    spawn_history = ListField(null=True)
+    spawn_history = ColdListField(null=True)
 
     # === Tracing ===
     correlation_id = Field(null=True)  # End-to-end request tracing ID
@@ -382,7 +394,7 @@ class AgentSession(Model):
     # === Project config (full project dict from projects.json) ===
     # Carried through the pipeline so downstream code never needs to re-derive
     # project properties. Populated at enqueue time; empty dict for legacy sessions.
-    project_config = DictField(null=True)
+    project_config = ColdDictField(null=True)
 
     # === Slugged session fields (null for unslugged eng or teammate sessions) ===
     # KeyField so `query.filter(slug=...)` is an indexed lookup — required for
@@ -623,7 +635,7 @@ class AgentSession(Model):
     # Bounded to CHAT_LOG_MAX_ENTRIES via append_chat_log(). Nullable; existing
     # sessions that have never received a chat-log write return [] via default=list.
     # The drafter reads the last CHAT_LOG_DISPLAY_ENTRIES entries for context.
-    chat_message_log = ListField(default=list)
+    chat_message_log = ColdListField(default=list)
 
     class Meta:
         # 30 days — hard backstop for retain_for_resume BUILD sessions.
@@ -1090,6 +1102,11 @@ class AgentSession(Model):
         """
         from popoto.models.query import POPOTO_REDIS_DB
 
+        from models.cold_payload import cold_key
+
+        # The cold-payload side hash is only re-expired by saves that list a
+        # cold field, so hold it at the same ceiling as the row.
+        POPOTO_REDIS_DB.expire(cold_key(self.db_key.redis_key), self._ttl)
         return bool(POPOTO_REDIS_DB.expire(self.db_key.redis_key, self._ttl))
 
     @classmethod
@@ -1929,6 +1946,10 @@ class AgentSession(Model):
             **kwargs,
         )
         session.save()
+        # Created already started, so no lifecycle transition will index it yet.
+        from models.session_time_index import index_session
+
+        index_session(session)
         return session
 
     @classmethod
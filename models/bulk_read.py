@@ -0,0 +1,173 @@
+"""Bulk hydration helpers for popoto models.
+
+Two read shapes recur across the repo and were each hand-written per call
+site, several of them as one ``query.get`` per key (an N+1 of round trips):
+
+- :func:`bulk_get` hydrates a list of Redis keys with pipelined ``HGETALL``
+  reads, ``BULK_GET_BATCH_SIZE`` keys per round trip. Input order is kept;
+  missing hashes and phantoms are dropped.
+- :func:`top_n_by_sorted_field` answers "newest N in this partition" from a
+  ``SortedField`` index: one bounded range read, then one :func:`bulk_get` of
+  just those members. ``before`` pages further back.
+
+A **phantom** is an instance whose key field still resolves to the class-level
+popoto ``Field`` descriptor instead of a hydrated value -- the same check as
+``agent.session_health._filter_hydrated_sessions``. Attribute reads on a
+phantom silently return descriptors, so they never leave this module.
+
+``scripts/benchmark_bulk_read.py`` counts round trips for the migrated sites
+before and after.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from popoto import Field, SortedField
+
+# Keys per pipelined HGETALL round trip. Large enough that typical reads are
+# one round trip, small enough that one reply never holds thousands of hashes.
+BULK_GET_BATCH_SIZE = int(os.environ.get("BULK_GET_BATCH_SIZE", "200"))
+
+# Extra index members read by top_n_by_sorted_field so members whose hash is
+# already gone do not under-fill the answer.
+DEFAULT_OVERFETCH = 5
+
+
+def _decode(key: Any) -> str:
+    return key.decode() if isinstance(key, bytes) else str(key)
+
+
+def is_hydrated(instance: Any, model: type) -> bool:
+    """True when every key field of ``instance`` holds a value, not a ``Field``."""
+    if instance is None:
+        return False
+    return not any(
+        isinstance(getattr(instance, name, None), Field) for name in model._meta.key_field_names
+    )
+
+
+def _hydrate(model: type, keys: Iterable[str | bytes], batch_size: int | None, lazy: bool):
+    """Yield ``(key, instance)`` for every hydrated key, in input order."""
+    from popoto.models.query import Query
+
+    keys = [_decode(k) for k in keys]
+    size = max(1, batch_size or BULK_GET_BATCH_SIZE)
+    for start in range(0, len(keys), size):
+        batch = keys[start : start + size]
+        if lazy:
+            loaded = Query.get_many_objects(model, batch, lazy=True)
+            by_key = {instance.db_key.redis_key: instance for instance in loaded}
+            instances = [by_key.get(key) for key in batch]
+        else:
+            instances = model.query.get_many(batch)
+        for key, instance in zip(batch, instances, strict=True):
+            if is_hydrated(instance, model):
+                yield key, instance
+
+
+def bulk_get(
+    model: type,
+    keys: Iterable[str | bytes],
+    *,
+    batch_size: int | None = None,
+    lazy: bool = False,
+) -> list:
+    """Hydrate ``keys`` into ``model`` instances, batch by batch.
+
+    Each batch is one pipelined round trip. The default path is
+    ``model.query.get_many``, which decodes every field and fires the model's
+    ``on_read`` hooks. ``lazy=True`` decodes only key fields up front, like a
+    ``filter()`` row: a ``ContentField`` then surfaces its raw ``$CF:``
+    reference (read it with ``models.content_decode.decoded_content``), so a
+    missing content file cannot fail the whole batch. The result keeps the
+    input order and omits keys with no hash and phantom instances.
+
+    Args:
+        model: The popoto Model class.
+        keys: Redis keys, ``str`` or ``bytes`` (as returned by ``ZRANGE``).
+        batch_size: Keys per round trip; defaults to ``BULK_GET_BATCH_SIZE``.
+        lazy: Defer non-key field decoding to first access.
+
+    Returns:
+        The hydrated instances, in key order.
+    """
+    return [instance for _, instance in _hydrate(model, keys, batch_size, lazy)]
+
+
+def bulk_get_by_key(
+    model: type,
+    keys: Iterable[str | bytes],
+    *,
+    batch_size: int | None = None,
+    lazy: bool = False,
+) -> dict[str, Any]:
+    """Like :func:`bulk_get`, keyed by the (decoded) Redis key.
+
+    For callers that carry per-key data, such as a ranking score, alongside
+    the keys they hydrate.
+    """
+    return dict(_hydrate(model, keys, batch_size, lazy))
+
+
+def sorted_field_score(model: type, field: str, value: Any) -> float:
+    """The index score ``value`` would have in ``model.field``'s sorted set.
+
+    Plain numbers pass through, so callers may page with a raw epoch.
+    """
+    if isinstance(value, int | float):
+        return float(value)
+    return float(SortedField.convert_to_numeric(model._meta.fields[field], value))
+
+
+def top_n_by_sorted_field(
+    model: type,
+    field: str,
+    partition: str | Sequence[str] | None,
+    n: int,
+    before: Any = None,
+    *,
+    overfetch: int = DEFAULT_OVERFETCH,
+) -> list:
+    """The ``n`` highest-scored instances in one partition of a sorted field.
+
+    The partition key is derived with ``SortedField.get_sortedset_db_key``,
+    never hand-built: ``DB_key`` escapes ``:`` and ``/`` in partition values.
+    The first page is a ``ZREVRANGE`` by rank. With ``before`` (a field value
+    or a raw score), the read is a ``ZREVRANGEBYSCORE`` strictly below it, so
+    the last item's field value is the cursor for the next page. Members with
+    exactly the cursor's score are skipped; the timestamped fields this serves
+    carry microsecond scores, so ties do not occur in practice.
+
+    ``overfetch`` extra members are read so gone hashes do not under-fill
+    the page. A short result is not re-read.
+
+    Args:
+        model: The popoto Model class.
+        field: Name of the ``SortedField``.
+        partition: The ``partition_by`` value(s); ``None`` when unpartitioned.
+        n: Page size.
+        before: Exclusive upper bound for the page, or ``None`` for the top.
+        overfetch: Extra members to read beyond ``n``.
+
+    Returns:
+        Up to ``n`` instances, highest score first.
+    """
+    if n <= 0:
+        return []
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    if partition is None:
+        partition = ()
+    elif isinstance(partition, str):
+        partition = (partition,)
+    key = SortedField.get_sortedset_db_key(model, field, *partition).redis_key
+    fetch_n = n + max(0, overfetch)
+    if before is None:
+        members = POPOTO_REDIS_DB.zrevrange(key, 0, fetch_n - 1)
+    else:
+        bound = f"({sorted_field_score(model, field, before)!r}"
+        members = POPOTO_REDIS_DB.zrevrangebyscore(key, bound, "-inf", start=0, num=fetch_n)
+    return bulk_get(model, members)[:n]
@@ -0,0 +1,402 @@
+"""models/cold_payload.py — hot/cold storage split for large model payloads.
+
+Why this exists:
+    ``AgentSession`` keeps its scheduling-critical scalars (``status``,
+    heartbeats, PIDs) in the same Redis hash as its heavy payloads
+    (``session_events``, ``chat_message_log``, ``initial_telegram_message``,
+    ``extra_context``, ``project_config``, ``spawn_history``). Every
+    ``query.filter(...)``/``query.all()`` is one HGETALL per row, so a dashboard
+    ``enumerate_sessions()`` scan or a health tick moves every event log over the
+    wire, and every full ``save()`` re-serializes and re-sends all of them even
+    when only ``status`` changed. Field projection
+    (``models/session_projection.py``) fixes the read side for loops that know
+    their field list; this module fixes it for everyone else by keeping the core
+    hash small.
+
+The contract:
+    A field declared as :class:`ColdDictField` / :class:`ColdListField` on a
+    model that mixes in :class:`ColdPayloadMixin` is stored inline exactly as
+    before while its msgpack encoding is under :data:`COLD_PAYLOAD_MIN_BYTES`.
+    Once it grows past that, ``save()`` writes the encoded payload to a
+    per-record side hash (:func:`cold_key`) and the main hash holds only a tiny
+    marker (``{"$cold": nbytes}`` for a dict, ``["$cold", nbytes]`` for a
+    list). Both writes ride the same pipeline/MULTI as the rest of the save, so
+    the marker and its payload commit together.
+
+    Reads are unchanged: ``session.session_events`` returns the list. A marker
+    is resolved with one HGET on first access and cached on the instance, so a
+    scan that never touches a cold field never pays for it. A scan that reads
+    a cold field on every row calls :func:`prefetch_cold_payloads` (or passes
+    ``cold_fields`` to ``enumerate_sessions``) so the whole row set resolves in
+    one pipelined round trip instead of one HGET per row. A re-save that did
+    not change a loaded payload does not re-send it (the encoded bytes are
+    compared against what was loaded), and a save that never loaded it sends
+    only the marker.
+
+Legacy rows:
+    Nothing to migrate. A row written before this module stores the payload
+    inline; it reads as before and is moved to the side hash on its next save
+    once it is over the threshold.
+
+Popoto internals:
+    Cold fields are data descriptors, like popoto's own ``ContentField``: on
+    the class they return the Field (expression queries keep working), on an
+    instance they read ``__dict__`` and resolve a marker. Only the cold fields
+    pay for this; every other attribute read on the model is untouched.
+
+    Lazily loaded rows (popoto's default query path) keep raw bytes in
+    ``_lazy_fields``, and ``Model.__getattribute__`` answers those names before
+    any descriptor runs. When the loader assigns ``_decoded_fields``, the mixin
+    moves the cold names' bytes into ``_cold_raw`` so reads reach the
+    descriptor, which decodes them on first access.
+
+    ``Model.save()`` reads every field through ``getattr`` several times
+    (``is_valid``, the format round-trip, ``encode_popoto_model_obj``, the
+    ``on_save`` loop, the ``_saved_field_values`` snapshot). While the mixin's
+    ``save()``/``delete()`` is running, markers are returned as-is instead of
+    resolved, so popoto validates, encodes and snapshots the marker and never
+    triggers a load. Markers are real dicts/lists, so ``is_valid``'s type check
+    passes without coercion.
+
+TTL:
+    The side hash is given the model's ``Meta.ttl`` whenever a save writes or
+    keeps a marker. A partial ``save(update_fields=[...])`` that does not list a
+    cold field does not touch the side hash, so long-lived rows rely on
+    ``refresh_ttl()`` (which refreshes both keys) to keep them in step. A marker
+    whose payload has expired reads as the field default with a warning rather
+    than raising.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import msgpack
+from popoto import DictField, ListField
+
+logger = logging.getLogger(__name__)
+
+# Encoded payloads at or above this size move to the side hash. Below it the
+# extra HGET on read costs more than the bytes it would keep out of the core
+# hash, and most sessions' spawn_history / extra_context stay well under it.
+COLD_PAYLOAD_MIN_BYTES = 1024
+
+# Marker tag. The side-hash prefix is deliberately NOT ``AgentSession:``:
+# rebuild_indexes() and the archive's cold-start guard SCAN ``AgentSession*``
+# and must never see a side hash as a model row.
+_MARKER_TAG = "$cold"
+_COLD_KEY_PREFIX = "cold_payload:"
+
+
+def cold_key(redis_key: str | bytes) -> str:
+    """Return the side-hash key holding the cold payloads of ``redis_key``."""
+    if isinstance(redis_key, bytes):
+        redis_key = redis_key.decode()
+    return f"{_COLD_KEY_PREFIX}{redis_key}"
+
+
+def is_cold_marker(value) -> bool:
+    """True when ``value`` is a stored marker rather than a real payload."""
+    if type(value) is dict:
+        return len(value) == 1 and _MARKER_TAG in value
+    if type(value) is list:
+        return len(value) == 2 and value[0] == _MARKER_TAG
+    return False
+
+
+def _redis():
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    return POPOTO_REDIS_DB
+
+
+def prefetch_cold_payloads(instances, names=None) -> int:
+    """Resolve the cold markers of a loaded row set in one pipelined round trip.
+
+    A scan that reads a cold field on every row would otherwise pay one HGET
+    per row per field on first access. This queues one HMGET per row for the
+    markers in ``names`` (all cold fields when ``None``) and fills each
+    instance's cache, so the reads that follow are local. Returns how many
+    payloads were loaded. Never raises: anything it could not load is left for
+    the per-field lazy read, which logs a missing payload as before.
+    """
+    from popoto.models.encoding import decode_lazy_field
+
+    try:
+        pending = []
+        for instance in instances:
+            cls = type(instance)
+            cold_names = getattr(cls, "_cold_names", frozenset())
+            wanted = cold_names if names is None else cold_names.intersection(names)
+            cache = instance.__dict__.get("_cold_cache") or {}
+            marked = [
+                name
+                for name in wanted
+                if name not in cache and is_cold_marker(getattr(cls, name)._stored(instance))
+            ]
+            if marked:
+                pending.append((instance, marked))
+        if not pending:
+            return 0
+
+        pipe = _redis().pipeline(transaction=False)
+        for instance, marked in pending:
+            pipe.hmget(cold_key(instance._cold_redis_key()), marked)
+        loaded = 0
+        for (instance, marked), values in zip(pending, pipe.execute(), strict=True):
+            state = instance.__dict__
+            for name, raw in zip(marked, values, strict=True):
+                if raw is None:
+                    continue
+                try:
+                    value = decode_lazy_field(raw)
+                except Exception:
+                    continue
+                state.setdefault("_cold_cache", {})[name] = value
+                state.setdefault("_cold_origin", {})[name] = raw
+                loaded += 1
+        return loaded
+    except Exception as e:
+        logger.debug("[cold-payload] prefetch failed (non-fatal): %s", e)
+        return 0
+
+
+class _ColdPayloadField:
+    """Field-side half: resolves markers on read and writes the side-hash entry.
+
+    ``on_save`` only acts while :class:`ColdPayloadMixin.save` is running
+    (``_cold_pending`` is set). popoto also re-runs ``on_save`` outside a save
+    (``rebuild_indexes``), and that must not rewrite payloads it never staged.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        state = instance.__dict__
+        value = self._stored(instance)
+        if not is_cold_marker(value) or state.get("_cold_passthrough"):
+            return value
+        cache = state.setdefault("_cold_cache", {})
+        if self.name not in cache:
+            cache[self.name] = instance._load_cold_payload(self.name)
+        return cache[self.name]
+
+    def __set__(self, instance, value):
+        state = instance.__dict__
+        if not state.get("_cold_passthrough"):
+            cache = state.get("_cold_cache")
+            if cache:
+                cache.pop(self.name, None)
+        raw = state.get("_cold_raw")
+        if raw:
+            raw.pop(self.name, None)
+        state[self.name] = value
+
+    def _stored(self, instance):
+        """The stored representation (a marker or an inline value), unresolved."""
+        state = instance.__dict__
+        return state[self.name] if self.name in state else self._decode_raw(instance)
+
+    def _decode_raw(self, instance):
+        """Decode this field's bytes from a lazily loaded row, once."""
+        from popoto.models.encoding import _decode_field_value
+
+        state = instance.__dict__
+        raw = state.get("_cold_raw") or {}
+        if self.name not in raw:
+            return None
+        decoded_ok, value = _decode_field_value(
+            type(instance), self.name, raw.pop(self.name), state.get("_redis_key")
+        )
+        if not decoded_ok:
+            # Same quarantine popoto applies to its own lazy fields (#573).
+            state.setdefault("_corrupt_fields", {})[self.name] = value
+            value = self.default() if callable(self.default) else self.default
+        state[self.name] = value
+        return value
+
+    @classmethod
+    def on_save(cls, model_instance, field_name, field_value, pipeline=None, **kwargs):
+        pipeline = super().on_save(
+            model_instance, field_name, field_value, pipeline=pipeline, **kwargs
+        )
+        pending = model_instance.__dict__.get("_cold_pending")
+        if pending is None:
+            return pipeline
+        db = pipeline if pipeline is not None else _redis()
+        key = cold_key(model_instance.db_key.redis_key)
+        if field_name in pending:
+            db.hset(key, field_name, pending[field_name])
+        elif not is_cold_marker(field_value):
+            # Inline now (shrunk, cleared, or never cold): drop any stale copy.
+            db.hdel(key, field_name)
+            return pipeline
+        ttl = getattr(model_instance, "_ttl", None)
+        if ttl:
+            db.expire(key, ttl)
+        return pipeline
+
+    @classmethod
+    def on_delete(cls, model_instance, field_name, field_value, pipeline=None, **kwargs):
+        pipeline = super().on_delete(
+            model_instance, field_name, field_value, pipeline=pipeline, **kwargs
+        )
+        redis_key = (
+            kwargs.get("saved_redis_key")
+            or model_instance._redis_key
+            or model_instance.db_key.redis_key
+        )
+        db = pipeline if pipeline is not None else _redis()
+        db.delete(cold_key(redis_key))
+        return pipeline
+
+
+class ColdDictField(_ColdPayloadField, DictField):
+    """DictField whose large values live in the record's side hash."""
+
+
+class ColdListField(_ColdPayloadField, ListField):
+    """ListField whose large values live in the record's side hash."""
+
+
+class _SplitColdLazyFields:
+    """Set-only descriptor for popoto's ``_decoded_fields``.
+
+    popoto's lazy loader assigns ``_decoded_fields`` right after
+    ``_lazy_fields``. At that point the cold names' bytes move to ``_cold_raw``,
+    and those names are marked decoded so the loader's default-fill loop skips
+    them. With no ``__get__``, reads still come straight from ``__dict__``.
+    """
+
+    def __set__(self, instance, value):
+        state = instance.__dict__
+        state["_decoded_fields"] = value
+        lazy = state.get("_lazy_fields")
+        if not lazy:
+            return
+        raw = {name: lazy.pop(name) for name in type(instance)._cold_names if name in lazy}
+        if raw:
+            state["_cold_raw"] = raw
+            value.update(dict.fromkeys(raw))
+
+
+class ColdPayloadMixin:
+    """Model-side half: loads payloads and stages them on save.
+
+    Mix in ahead of ``popoto.Model``. Per-instance state lives in ``__dict__``:
+    ``_cold_cache`` (resolved payloads for fields whose stored value is a
+    marker) and ``_cold_origin`` (the encoded bytes last loaded from or written
+    to the side hash, used to skip unchanged re-writes).
+    """
+
+    _decoded_fields = _SplitColdLazyFields()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # popoto's ModelBase keeps Field instances as class attributes, so the
+        # cold names are known here, before ``_meta`` exists.
+        cls._cold_names = frozenset(
+            name for name, attr in vars(cls).items() if isinstance(attr, _ColdPayloadField)
+        )
+
+    @classmethod
+    def _cold_field_names(cls) -> frozenset[str]:
+        return cls._cold_names
+
+    def _cold_redis_key(self):
+        return self._redis_key or self.db_key.redis_key
+
+    def _load_cold_payload(self, name: str):
+        from popoto.models.encoding import decode_lazy_field
+
+        redis_key = self._cold_redis_key()
+        raw = _redis().hget(cold_key(redis_key), name)
+        if raw is None:
+            field = self._meta.fields[name]
+            logger.warning(
+                "[cold-payload] %s.%s marker has no payload in %s; reading the field default",
+                type(self).__name__,
+                name,
+                cold_key(redis_key),
+            )
+            return field.default() if callable(field.default) else field.default
+        self.__dict__.setdefault("_cold_origin", {})[name] = raw
+        return decode_lazy_field(raw)
+
+    def _set_raw(self, name: str, value) -> None:
+        """Assign the stored representation without touching the cache."""
+        self.__dict__["_cold_passthrough"] = True
+        try:
+            setattr(self, name, value)
+        finally:
+            self.__dict__.pop("_cold_passthrough", None)
+
+    def _stage_cold_payloads(self, names) -> dict[str, bytes]:
+        """Swap over-threshold payloads for markers; return what to write.
+
+        After this, every cold field in ``names`` holds either an inline value
+        or a marker, and ``_cold_cache`` holds the real payload for every
+        marker this instance has read or been given.
+        """
+        cache = self.__dict__.setdefault("_cold_cache", {})
+        origin = self.__dict__.setdefault("_cold_origin", {})
+        # A KeyField change moves the row to a new key; popoto's on_delete for
+        # the old key drops its side hash, so every cold payload must be
+        # re-written under the new one, including any never loaded here.
+        moving = bool(self._redis_key) and self._redis_key != self.db_key.redis_key
+        pending: dict[str, bytes] = {}
+        for name in names:
+            self.__dict__["_cold_passthrough"] = True
+            try:
+                raw = getattr(self, name)
+            finally:
+                self.__dict__.pop("_cold_passthrough", None)
+            if is_cold_marker(raw):
+                if name not in cache and not moving:
+                    continue  # never read here, so unchanged
+                value = getattr(self, name)
+            else:
+                value = raw
+            packed = msgpack.packb(value)
+            if len(packed) < COLD_PAYLOAD_MIN_BYTES:
+                if raw is not value:
+                    self._set_raw(name, value)
+                    cache.pop(name, None)
+                origin.pop(name, None)
+                continue
+            if raw is not value and origin.get(name) == packed and not moving:
+                continue  # loaded, not changed
+            marker = (
+                {_MARKER_TAG: len(packed)}
+                if isinstance(value, dict)
+                else [_MARKER_TAG, len(packed)]
+            )
+            self._set_raw(name, marker)
+            cache[name] = value
+            pending[name] = packed
+        return pending
+
+    def save(self, *args, update_fields=None, **kwargs):
+        cold = type(self)._cold_field_names()
+        names = cold if update_fields is None else [n for n in update_fields if n in cold]
+        pending = self._stage_cold_payloads(names)
+        self.__dict__["_cold_pending"] = pending
+        self.__dict__["_cold_passthrough"] = True
+        try:
+            result = super().save(*args, update_fields=update_fields, **kwargs)
+        finally:
+            self.__dict__.pop("_cold_passthrough", None)
+            self.__dict__.pop("_cold_pending", None)
+        if result is not False:  # False: popoto declined the save, nothing written
+            self.__dict__["_cold_origin"].update(pending)
+        return result
+
+    def delete(self, *args, **kwargs):
+        self.__dict__["_cold_passthrough"] = True
+        try:
+            return super().delete(*args, **kwargs)
+        finally:
+            self.__dict__.pop("_cold_passthrough", None)
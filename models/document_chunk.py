@@ -15,6 +15,7 @@ from popoto import AutoKeyField, IntField, KeyField, Model
 from popoto.fields.content_field import ContentField
 from popoto.fields.embedding_field import EmbeddingField
 
+from models.bulk_read import bulk_get_by_key
 from models.content_decode import decoded_content
 from models.length_safe_content_store import length_safe_content_store
 
@@ -74,8 +75,10 @@ class DocumentChunk(Model):
     def search(cls, query_text: str, project_key: str | None = None, top_k: int = 5) -> list[dict]:
         """Search chunks by semantic similarity to query text.
 
-        Embeds the query via the configured OpenAI provider, loads all chunk
-        embeddings, computes cosine similarity, and returns the top-K matches.
+        Embeds the query via the configured OpenAI provider, scores it against
+        the pre-normalized chunk embedding matrix in one vectorized product,
+        then hydrates candidates best-first in pipelined batches until
+        ``top_k`` pass the project filter.
 
         Args:
             query_text: The search query string.
@@ -96,33 +99,31 @@ class DocumentChunk(Model):
                 return []
 
             query_vec = np.array(query_embedding, dtype=np.float32)
+            norm_q = np.linalg.norm(query_vec)
+            if top_k <= 0 or norm_q == 0:
+                return []
 
-            # Load all chunk embeddings
-            embeddings_dict = EmbeddingField.load_embeddings(cls)
-            if not embeddings_dict:
+            # Load all chunk embeddings: rows are already unit-normalized
+            matrix, redis_keys = EmbeddingField.load_embeddings(cls)
+            if matrix is None or not redis_keys:
                 return []
 
-            # Score each chunk
+            # Cosine similarity of every chunk at once, best first
+            scores = np.asarray(matrix, dtype=np.float32) @ (query_vec / norm_q)
+            order = [int(i) for i in np.argsort(-scores, kind="stable") if np.isfinite(scores[i])]
+
             results = []
-            for chunk_id, embedding_vec in embeddings_dict.items():
-                try:
-                    chunk = cls.query.get(chunk_id=chunk_id)
+            batch_size = max(top_k * 4, 50)
+            for start in range(0, len(order), batch_size):
+                window = order[start : start + batch_size]
+                found = bulk_get_by_key(cls, [redis_keys[i] for i in window], lazy=True)
+                for i in window:
+                    chunk = found.get(redis_keys[i])
                     if chunk is None:
                         continue
-
                     # Filter by project_key if specified
                     if project_key and chunk.project_key != project_key:
                         continue
-
-                    # Cosine similarity
-                    emb = np.array(embedding_vec, dtype=np.float32)
-                    dot = np.dot(query_vec, emb)
-                    norm_q = np.linalg.norm(query_vec)
-                    norm_e = np.linalg.norm(emb)
-                    if norm_q == 0 or norm_e == 0:
-                        continue
-                    score = float(dot / (norm_q * norm_e))
-
                     results.append(
                         {
                             # Query-loaded rows surface the raw $CF: reference;
@@ -130,17 +131,13 @@ class DocumentChunk(Model):
                             "chunk_text": decoded_content(chunk),
                             "file_path": chunk.file_path or "",
                             "chunk_index": chunk.chunk_index or 0,
-                            "score": score,
+                            "score": float(scores[i]),
                             "project_key": chunk.project_key or "",
                         }
                     )
-                except Exception as e:
-                    logger.debug(f"Error scoring chunk {chunk_id}: {e}")
-                    continue
-
-            # Sort by score descending, return top-K
-            results.sort(key=lambda x: x["score"], reverse=True)
-            return results[:top_k]
+                    if len(results) == top_k:
+                        return results
+            return results
 
         except Exception as e:
             logger.warning(f"DocumentChunk.search failed: {e}")
@@ -425,7 +425,8 @@ class Job(Model):
         ``QueryBuilder`` has no early-limit path for a SortedField, so a
         ``filter()`` here would hydrate every Job in the Room (twice, per
         popoto#2639) to answer a top-5 question. This runs on the bind-or-mint
-        hot path for every routed inbound message.
+        hot path for every routed inbound message. The read itself is
+        :func:`models.bulk_read.top_n_by_sorted_field`.
 
         The partition key is **derived, never hand-built**: ``DB_key.clean()``
         escapes ``:`` and ``/``, and every real ``room_id`` contains a colon,
@@ -443,19 +444,14 @@ class Job(Model):
         if limit <= 0:
             return []
         try:
-            from popoto.redis_db import POPOTO_REDIS_DB
-
-            partition_key = SortedField.get_sortedset_db_key(
-                cls, "last_active_at", room_id
-            ).redis_key
-            fetch_n = limit + JOB_RECENT_OVERFETCH
-            members = POPOTO_REDIS_DB.zrevrange(partition_key, 0, fetch_n - 1)
-            redis_keys = [m.decode() if isinstance(m, bytes) else str(m) for m in members]
-            jobs = cls.query.get_many(redis_keys, skip_none=True)
+            from models.bulk_read import top_n_by_sorted_field
+
+            return top_n_by_sorted_field(
+                cls, "last_active_at", room_id, limit, overfetch=JOB_RECENT_OVERFETCH
+            )
         except Exception as e:  # noqa: BLE001 — candidate lookup must fail open
             logger.warning("[job] recent_for_room failed for %s: %s", room_id, e)
             return []
-        return list(jobs)[:limit]
 
     @classmethod
     def sweep_to_rest(cls, now: float | None = None) -> int:
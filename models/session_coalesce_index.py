@@ -0,0 +1,197 @@
+"""Coalescing index: the open email session an inbound email continues.
+
+``bridge.email_bridge.find_coalescing_session_id`` attaches a customer's email
+to their open session with the same normalized subject. It used to load every
+non-terminal AgentSession of the project and compare subjects in Python for
+each inbound email, so its cost grew with the number of open sessions.
+
+This module keeps the answer by hand, in ``POPOTO_REDIS_DB``:
+
+- ``session_coalesce_index:email:{project_key}:{digest}`` is a sorted set of
+  session ids scored by creation time. ``digest`` hashes the customer id and
+  the normalized subject, the pair a coalescing match requires.
+- ``session_coalesce_index:email:of:{session_id}`` is the set of index keys
+  holding that session, so a terminal transition can remove it without
+  re-deriving the subject.
+- ``session_coalesce_index:email:built:{project_key}`` marks a project's
+  index as built; its TTL is :data:`REBUILD_INTERVAL_S`.
+
+:func:`index_email_session` is called when the email bridge enqueues a
+session and :func:`unindex_session` from
+``models.session_lifecycle.finalize_session``. A lookup is one
+``ZREVRANGEBYSCORE`` over the age window plus one read of the candidate to
+confirm it is still open, however many sessions the project has.
+
+The Telegram side (a reply to one of Valor's messages → its root session) is
+the ``session_root:{chat_id}:{msg_id}`` cache in ``bridge/context.py``.
+
+**This is a read optimization, not a source of truth.** As in
+``models.session_time_index``, the caller rebuilds a project from the
+session scan when its built marker is missing, and candidates that went
+terminal or vanished are pruned as lookups find them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "session_coalesce_index:email"
+
+# Matches the email bridge's coalescing window (COALESCE_MAX_AGE_SECONDS).
+# Index keys expire this long after their last write.
+MAX_AGE_S = 48 * 3600
+
+# The built-marker TTL: once it lapses, the next lookup for the project
+# rebuilds from the scan, healing anything written around the index.
+REBUILD_INTERVAL_S = 6 * 3600
+
+
+def created_ts(session) -> float:
+    """Epoch seconds of ``session.created_at`` (a datetime on real rows); 0 when unset."""
+    value = getattr(session, "created_at", None)
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=UTC)).timestamp()
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def email_key(project_key: str, customer_id: str, normalized_subject: str) -> str:
+    digest = hashlib.sha1(
+        f"{customer_id}\x00{normalized_subject}".encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"{KEY_PREFIX}:{project_key}:{digest}"
+
+
+def _owner_key(session_id: str) -> str:
+    return f"{KEY_PREFIX}:of:{session_id}"
+
+
+def _built_key(project_key: str) -> str:
+    return f"{KEY_PREFIX}:built:{project_key}"
+
+
+def _queue(pipe, session_id, project_key, customer_id, normalized_subject, created_at) -> None:
+    key = email_key(project_key, customer_id, normalized_subject)
+    # NX keeps the first score: a continued session ages from its creation.
+    pipe.zadd(key, {session_id: created_at}, nx=True)
+    pipe.zremrangebyscore(key, "-inf", time.time() - MAX_AGE_S)
+    pipe.expire(key, MAX_AGE_S)
+    pipe.sadd(_owner_key(session_id), key)
+    pipe.expire(_owner_key(session_id), MAX_AGE_S)
+
+
+def index_email_session(
+    session_id: str,
+    project_key: str,
+    customer_id: str,
+    normalized_subject: str,
+    created_at: float | None = None,
+) -> None:
+    """Make ``session_id`` the coalescing target for its customer and subject.
+
+    Never raises. An empty subject is not indexed (it never coalesces).
+    """
+    if not (session_id and customer_id and normalized_subject):
+        return
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+        _queue(
+            pipe,
+            session_id,
+            project_key,
+            customer_id,
+            normalized_subject,
+            created_at or time.time(),
+        )
+        pipe.execute()
+    except Exception as e:
+        logger.debug("[coalesce-index] index_email_session failed (non-fatal): %s", e)
+
+
+def unindex_session(session) -> None:
+    """Remove a session from every index key that holds it. Never raises."""
+    session_id = getattr(session, "session_id", None)
+    extra = getattr(session, "extra_context", None) or {}
+    if not session_id or extra.get("transport") != "email":
+        return
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        keys = POPOTO_REDIS_DB.smembers(_owner_key(session_id))
+        pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+        for key in keys:
+            pipe.zrem(key, session_id)
+        pipe.delete(_owner_key(session_id))
+        pipe.execute()
+    except Exception as e:
+        logger.debug("[coalesce-index] unindex_session failed (non-fatal): %s", e)
+
+
+def is_built(project_key: str) -> bool:
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    return bool(POPOTO_REDIS_DB.exists(_built_key(project_key)))
+
+
+def rebuild_email(project_key: str, entries: Iterable[tuple[str, str, str, float]]) -> int:
+    """Index ``(session_id, customer_id, normalized_subject, created_at)`` entries.
+
+    ``entries`` are the project's open email sessions from the scan; the
+    project is then marked built. Existing entries are left in place (no
+    empty-index window); stale ones are pruned as lookups find them. Returns
+    how many entries were indexed.
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+    count = 0
+    for session_id, customer_id, normalized_subject, created_at in entries:
+        if session_id and customer_id and normalized_subject:
+            _queue(pipe, session_id, project_key, customer_id, normalized_subject, created_at)
+            count += 1
+    pipe.set(_built_key(project_key), str(time.time()), ex=REBUILD_INTERVAL_S)
+    pipe.execute()
+    logger.info("[coalesce-index] rebuilt %s from %d session(s)", project_key, count)
+    return count
+
+
+def _is_open(session_id: str, min_created_at: float) -> bool:
+    from models.agent_session import AgentSession
+    from models.session_lifecycle import NON_TERMINAL_STATUSES
+
+    return any(
+        s.status in NON_TERMINAL_STATUSES and created_ts(s) >= min_created_at
+        for s in AgentSession.query.filter(session_id=session_id)
+    )
+
+
+def find_email_session(
+    project_key: str,
+    customer_id: str,
+    normalized_subject: str,
+    max_age_s: float = MAX_AGE_S,
+) -> str | None:
+    """The newest open session created within ``max_age_s`` for this customer and subject.
+
+    Raises on Redis errors so the caller can fall back to the scan.
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    key = email_key(project_key, customer_id, normalized_subject)
+    min_created_at = time.time() - max_age_s
+    for member in POPOTO_REDIS_DB.zrevrangebyscore(key, "+inf", min_created_at):
+        session_id = member.decode() if isinstance(member, bytes) else member
+        if _is_open(session_id, min_created_at):
+            return session_id
+        POPOTO_REDIS_DB.zrem(key, session_id)
+    return None
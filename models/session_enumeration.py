@@ -54,6 +54,7 @@ def enumerate_sessions(
     *,
     check_divergence: bool = True,
     strict: bool = False,
+    cold_fields: Iterable[str] = (),
 ) -> list:
     """Return AgentSession records, optionally narrowed to ``statuses``.
 
@@ -77,6 +78,9 @@ def enumerate_sessions(
         strict: Raise :class:`SessionScanError` when the scan cannot be read,
             rather than returning an empty list. Callers that destroy or report
             on what they find want this; the dashboard wants the default.
+        cold_fields: Cold payload fields (``models/cold_payload.py``) the caller
+            reads on every kept row. Their markers are resolved up front in one
+            pipelined round trip instead of one HGET per row on first read.
 
     Returns:
         A list of AgentSession instances, unsorted. Empty on any query failure
@@ -113,6 +117,11 @@ def enumerate_sessions(
     if check_divergence:
         check_status_index_divergence(scan_counts, wanted)
 
+    if cold_fields:
+        from models.cold_payload import prefetch_cold_payloads
+
+        prefetch_cold_payloads(kept, cold_fields)
+
     return kept
 
 
@@ -520,6 +520,12 @@ def finalize_session(
     except Exception as e:
         logger.debug(f"[lifecycle] Defensive srem failed (non-fatal): {e}")
 
+    # 5.2. Global time index (started_at / completed_at) for date-range reads.
+    _index_session_times(session)
+
+    # 5.3. A terminal session is no longer an email coalescing target.
+    _unindex_coalescing(session)
+
     # 5.5. Update TaskTypeProfile (after auto_tag sets task_type AND after status is saved)
     # Runs only for completed sessions — profile is now authoritative after the Redis save above.
     if not skip_auto_tag and status == "completed":
@@ -584,6 +590,26 @@ def finalize_session(
         logger.debug("[lifecycle] issue-lease release on finalize failed (non-fatal): %s", e)
 
 
+def _index_session_times(session) -> None:
+    """Keep ``models.session_time_index`` current after a status save (non-fatal)."""
+    try:
+        from models.session_time_index import index_session
+
+        index_session(session)
+    except Exception as e:
+        logger.debug(f"[lifecycle] Session time index update failed (non-fatal): {e}")
+
+
+def _unindex_coalescing(session) -> None:
+    """Drop a terminal session from ``models.session_coalesce_index`` (non-fatal)."""
+    try:
+        from models.session_coalesce_index import unindex_session
+
+        unindex_session(session)
+    except Exception as e:
+        logger.debug(f"[lifecycle] Coalescing index update failed (non-fatal): {e}")
+
+
 def transition_status(
     session,
     new_status: str,
@@ -705,6 +731,7 @@ def transition_status(
             f"already in state {new_status!r}, saving companion fields"
         )
         session.save()
+        _index_session_times(session)
         return
 
     # Lifecycle transition log
@@ -728,6 +755,7 @@ def transition_status(
         session._saved_field_values["status"] = current_status
     session.status = new_status
     session.save()
+    _index_session_times(session)
 
     # Analytics: record session start when transitioning to running
     if new_status == "running" and current_status != "running":
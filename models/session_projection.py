@@ -0,0 +1,263 @@
+"""Field projection with lazy hydration for AgentSession scans.
+
+AgentSession carries ~90 fields, and several of them are unbounded
+(``session_events``, ``chat_message_log``, ``spawn_history``,
+``recent_sent_drafts``) or large dicts (``initial_telegram_message``,
+``extra_context``, ``project_config``). A plain ``query.filter(...)`` issues one
+HGETALL per match, so every health tick pulls every one of those payloads across
+the wire just to read ``status``, a heartbeat and two timestamps.
+
+:func:`only` narrows a query to the fields a hot loop actually reads. It
+resolves the query's keys through popoto's index, issues one pipelined HMGET
+per match instead of an HGETALL, and wraps each row in a
+:class:`SessionProjection`. Reading a
+projected field costs nothing. Reading anything else (an unprojected field, a
+method, ``get_children()``) hydrates the full record once, on first access, and
+answers from it. So a projection is never *wrong*, only slower when a caller
+strays outside its field list.
+
+Properties are the exception to "anything else hydrates": a property such as
+``worker_key`` is evaluated against the projection itself, so it stays cheap as
+long as the fields it reads are projected.
+
+A cold payload field (``session_events``, ``extra_context``, ...; see
+``models/cold_payload.py``) may be projected, but once it has moved to the side
+hash the HMGET row holds only its marker. Reading it then hydrates like an
+unprojected field, so the caller still gets the payload, never the marker.
+
+**Projections are read-only.** Assigning an attribute raises. Every mutation path
+(``finalize_session``, ``_apply_recovery_transition``, ``save()``) needs the real
+record, so callers pass :func:`hydrate` of the entry, never the projection.
+"""
+
+import inspect
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from models.cold_payload import is_cold_marker
+
+logger = logging.getLogger(__name__)
+
+# Fields the worker health loops and the bridge stall watchdog read per entry
+# per tick. Covers identity and routing (worker_key/is_project_keyed are
+# properties over session_type/chat_id/slug/project_key), the phantom filter,
+# the ledger skip, the delivery guard, the no-progress and never-started
+# predicates, and the tool-wedge check. Deliberately excludes every ListField
+# and DictField: those are what the projection exists to avoid reading.
+HEALTH_FIELDS: tuple[str, ...] = (
+    "id",
+    "session_id",
+    "session_type",
+    "project_key",
+    "chat_id",
+    "slug",
+    "status",
+    "is_ledger",
+    "priority",
+    "created_at",
+    "started_at",
+    "updated_at",
+    "response_delivered_at",
+    "last_heartbeat_at",
+    "last_sdk_heartbeat_at",
+    "last_stdout_at",
+    "last_turn_at",
+    "last_tool_use_at",
+    "current_tool_name",
+    "current_tool_timeout_s",
+    "turn_count",
+    "log_path",
+    "claude_session_uuid",
+    "exec_pid",
+    "pid_create_time",
+    "worker_pid",
+)
+
+_MISSING = object()
+
+
+class SessionProjection:
+    """A read-only view over a subset of one AgentSession's fields.
+
+    Built by :func:`only`. Projected fields are served from the HMGET row;
+    ``agent_session_id`` aliases ``id`` exactly as on the model. Any other
+    attribute hydrates the full record on first access (see the module
+    docstring) and is served from it thereafter.
+    """
+
+    __slots__ = ("_values", "_record", "_hydrated")
+
+    def __init__(self, values: dict[str, Any]):
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_record", None)
+        object.__setattr__(self, "_hydrated", False)
+
+    @property
+    def agent_session_id(self) -> str | None:
+        """Backward-compatible alias for id, mirroring AgentSession."""
+        return self._values.get("id")
+
+    @property
+    def is_hydrated(self) -> bool:
+        """True once a full-record load has been attempted."""
+        return self._hydrated
+
+    def hydrate(self):
+        """Load (once) and return the full AgentSession, or None if it is gone."""
+        if not self._hydrated:
+            from models.agent_session import AgentSession
+
+            object.__setattr__(self, "_hydrated", True)
+            object.__setattr__(self, "_record", AgentSession.get_by_id(self._values.get("id")))
+        return self._record
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when normal lookup fails, i.e. for anything that is not
+        # a slot or one of the properties above.
+        values = object.__getattribute__(self, "_values")
+        if name in values:
+            value = values[name]
+            if not is_cold_marker(value):
+                return value
+            # A cold payload (models/cold_payload.py): the HMGET row holds only
+            # its marker, so answer from the hydrated record like any other
+            # unprojected read.
+
+        from models.agent_session import AgentSession
+
+        fields = AgentSession._meta.fields
+        if name not in fields:
+            static = inspect.getattr_static(AgentSession, name, _MISSING)
+            if isinstance(static, property):
+                return static.fget(self)
+            if static is not _MISSING and not callable(static) and not hasattr(static, "__get__"):
+                return static  # class-level constant, e.g. _ENG_WORKTREE_STAGES
+            if name.startswith("__"):
+                raise AttributeError(name)
+
+        record = self.hydrate()
+        if record is None:
+            if name in fields:
+                # The record vanished between the scan and this read. Answer
+                # like a popoto phantom would: the field's declared default.
+                return _declared_default(fields[name])
+            raise AttributeError(
+                f"{name!r}: session {values.get('id')!r} no longer exists to hydrate"
+            )
+        return getattr(record, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"SessionProjection is read-only (tried to set {name!r}); mutate hydrate(entry) instead"
+        )
+
+    def __repr__(self) -> str:
+        return f"<SessionProjection id={self._values.get('id')!r} fields={len(self._values)}>"
+
+
+def _validate_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """Return ``fields`` with ``id`` first, rejecting names the model does not store.
+
+    popoto logs a quarantine warning for every row when asked to HMGET a name
+    that is not a hash field (``pid`` is a property, not a field), so an unknown
+    name is a caller bug worth failing on loudly, once, here.
+    """
+    from models.agent_session import AgentSession
+
+    stored = AgentSession._meta.fields
+    unknown = [f for f in fields if f not in stored]
+    if unknown:
+        raise ValueError(f"not AgentSession fields: {', '.join(sorted(unknown))}")
+    return ("id",) + tuple(dict.fromkeys(f for f in fields if f != "id"))
+
+
+def _declared_default(field) -> Any:
+    default = getattr(field, "default", None)
+    return default() if callable(default) else default
+
+
+def only(rows, *fields: str) -> list:
+    """Project a session query down to ``fields``, hydrating the rest lazily.
+
+    Args:
+        rows: An unevaluated ``AgentSession.query.filter(...)`` builder. Any
+            other iterable is treated as already-hydrated records and returned
+            as a list unchanged, so a caller can hand over whatever its query
+            seam produced without branching.
+        *fields: Model field names to read up front. ``id`` is always included.
+            Defaults to :data:`HEALTH_FIELDS` when omitted.
+
+    Returns:
+        A list of :class:`SessionProjection` for a builder, otherwise
+        ``list(rows)``. A builder whose filters cannot be read (Q objects, or
+        popoto's private filter state is not where this expects it) is also
+        evaluated in full via ``list(rows)``, with a debug log. A key whose
+        hash is gone (an orphan index member) yields no projection, and a row
+        whose KeyField cannot be decoded is skipped with a warning.
+
+    Raises:
+        ValueError: When a name in ``fields`` is not a stored AgentSession field.
+
+    The HMGET pipeline is issued here rather than through popoto's
+    ``values()``: that path decodes every requested name, so a partial hash
+    (the phantom shape ``_filter_hydrated_sessions`` exists to drop) raises
+    ``CorruptFieldError`` on its first missing KeyField and takes the whole
+    scan down with it. Here a missing field is simply absent and reads as its
+    declared default, exactly as it would on a hydrated record.
+    """
+    from popoto.exceptions import CorruptFieldError
+    from popoto.models.encoding import decode_popoto_model_hashmap
+    from popoto.models.query import QueryBuilder
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    if not isinstance(rows, QueryBuilder):
+        return list(rows)
+
+    from models.agent_session import AgentSession
+
+    names = _validate_fields(fields or HEALTH_FIELDS)
+    # The builder's filter state is popoto-private. If a future popoto renames
+    # it, or the builder carries Q objects this path cannot resolve, degrade to
+    # the full HGETALL scan rather than raising on every health tick.
+    filters = getattr(rows, "_filters", None)
+    if not isinstance(filters, dict) or getattr(rows, "_q_objects", None):
+        logger.debug(
+            "[session-projection] builder not projectable (filters=%r); full scan", filters
+        )
+        return list(rows)
+
+    declared = AgentSession._meta.fields
+    defaults = {name: _declared_default(declared[name]) for name in names if name != "id"}
+
+    keys = list(AgentSession.query.filter_for_keys_set(**filters))
+    pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+    for key in keys:
+        pipe.hmget(key, names)
+    projections = []
+    for key, raw in zip(keys, pipe.execute() if keys else []):
+        present = {n.encode(): v for n, v in zip(names, raw) if v is not None}
+        if not present:
+            continue
+        try:
+            decoded = decode_popoto_model_hashmap(
+                AgentSession, present, fields_only=True, source_redis_key=key
+            )
+        except CorruptFieldError as e:
+            logger.warning("[session-projection] skipping undecodable row %r: %s", key, e)
+            continue
+        values = {k.decode() if isinstance(k, bytes) else k: v for k, v in decoded.items()}
+        projections.append(SessionProjection({**defaults, **values}))
+    return projections
+
+
+def hydrate(entry):
+    """Return the full record behind ``entry``.
+
+    A :class:`SessionProjection` is hydrated (once); anything else is assumed
+    to already be a record and is returned as-is. Returns None when the
+    projected session no longer exists.
+    """
+    if isinstance(entry, SessionProjection):
+        return entry.hydrate()
+    return entry
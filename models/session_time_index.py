@@ -0,0 +1,344 @@
+"""Global time index over AgentSession start and completion times.
+
+Date-range analytics ("sessions started yesterday", "completed in the last
+24h") used to scan every AgentSession and compare ``started_at`` /
+``completed_at`` in Python. ``created_at`` is a SortedField partitioned by
+``project_key``, so it cannot answer a cross-project range, and the other two
+timestamps start as ``None`` so they cannot be SortedFields at all.
+
+This module keeps the index by hand, in ``POPOTO_REDIS_DB``:
+
+- ``session_time_index:{kind}`` is a sorted set of session Redis keys scored
+  by the epoch timestamp, for ``kind`` in ``started`` / ``completed``.
+- ``session_time_index:{kind}:{YYYY-MM-DD}`` is the same for one UTC day. Day
+  buckets expire after :data:`RETENTION_DAYS`; the global sets are trimmed to
+  the same window on write.
+
+:func:`index_session` is called on lifecycle transitions
+(``models.session_lifecycle.transition_status`` / ``finalize_session``) and
+where sessions are created already started. A range query then costs
+``O(log N + result)`` instead of ``O(all sessions)``.
+
+**This is a read optimization, not a source of truth.** The #2519 lesson in
+``models.session_enumeration`` applies: an index can miss a record that was
+written around it. So the index is rebuilt from the class-set scan on first
+use and refreshed in a background thread every :data:`REBUILD_INTERVAL_S`
+(reads keep serving the current index meanwhile), members whose hash is gone
+are pruned as reads find them, and nothing that decides ownership or kills a
+session reads from here. :func:`covers_all` tells a caller whether some
+session is missing from the index (aged out of the window, or finished with
+no ``completed_at``), i.e. whether a read that runs off the end of the index
+must fall back to the scan.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "session_time_index"
+KINDS = ("started", "completed")
+
+# How far back the index answers. Older range queries return a partial result.
+RETENTION_DAYS = int(os.environ.get("SESSION_TIME_INDEX_RETENTION_DAYS", "90"))
+RETENTION_S = RETENTION_DAYS * 86400
+
+# The built marker holds the last rebuild time. Once it is older than this,
+# the next query starts a background rebuild from the scan, healing anything
+# written around index_session(). A rebuild costs one scan, which is what
+# every query used to cost.
+REBUILD_INTERVAL_S = 7 * 86400
+_BUILT_KEY = f"{KEY_PREFIX}:built"
+_REBUILD_LOCK_KEY = f"{KEY_PREFIX}:rebuilding"
+_REBUILD_LOCK_TTL_S = 600
+
+# Statuses finalize_session() stamps with completed_at; one without it is not indexed.
+_FINISHED = ("completed", "failed")
+
+
+def _all_key(kind: str) -> str:
+    return f"{KEY_PREFIX}:{kind}"
+
+
+def _day_key(kind: str, day: str) -> str:
+    return f"{KEY_PREFIX}:{kind}:{day}"
+
+
+def _partial_key(kind: str) -> str:
+    """Set while some session that belongs under ``kind`` is not in the index."""
+    return f"{KEY_PREFIX}:partial:{kind}"
+
+
+def _epoch(value) -> float | None:
+    """Epoch seconds for a DatetimeField value; naive datetimes are UTC."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=UTC)).timestamp()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _utc_day(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=UTC).strftime("%Y-%m-%d")
+
+
+def _day_str(day: date | str) -> str:
+    return day if isinstance(day, str) else day.strftime("%Y-%m-%d")
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in KINDS:
+        raise ValueError(f"Unknown session time index kind {kind!r}. Known: {', '.join(KINDS)}")
+
+
+def _write(db, entries: list[tuple[str, dict[str, float | None]]]) -> set[str]:
+    """Index ``[(member, {kind: ts | None})]``, moving members whose day changed.
+
+    Returns the kinds for which an entry fell outside the retention window
+    (skipped or trimmed); their partial flag is set.
+    """
+    lookup = db.pipeline(transaction=False)
+    for member, stamps in entries:
+        for kind in stamps:
+            lookup.zscore(_all_key(kind), member)
+    previous = iter(lookup.execute())
+
+    cutoff = time.time() - RETENTION_S
+    partial: set[str] = set()
+    pipe = db.pipeline(transaction=False)
+    for member, stamps in entries:
+        for kind, ts in stamps.items():
+            old_ts = next(previous)
+            if ts is not None and ts < cutoff:
+                partial.add(kind)
+            if old_ts is not None and ts is not None and float(old_ts) == ts:
+                continue
+            if old_ts is not None:
+                pipe.zrem(_day_key(kind, _utc_day(float(old_ts))), member)
+            if ts is None or ts < cutoff:
+                pipe.zrem(_all_key(kind), member)
+                continue
+            day_key = _day_key(kind, _utc_day(ts))
+            pipe.zadd(_all_key(kind), {member: ts})
+            pipe.zadd(day_key, {member: ts})
+            pipe.expireat(day_key, int(ts + RETENTION_S + 86400))
+    for kind in KINDS:
+        pipe.zremrangebyscore(_all_key(kind), "-inf", cutoff)
+    trimmed = pipe.execute()[-len(KINDS) :]
+    partial.update(kind for kind, n in zip(KINDS, trimmed, strict=True) if n)
+    if partial:
+        db.mset({_partial_key(kind): "1" for kind in partial})
+    return partial
+
+
+def _stamps(session) -> dict[str, float | None]:
+    return {kind: _epoch(getattr(session, f"{kind}_at", None)) for kind in KINDS}
+
+
+def index_session(session) -> None:
+    """Record ``session``'s ``started_at`` / ``completed_at``. Never raises.
+
+    Idempotent and cheap when nothing changed (one pipelined ``ZSCORE`` per
+    kind). A cleared timestamp removes the session from that kind.
+    """
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        _write(POPOTO_REDIS_DB, [(session.db_key.redis_key, _stamps(session))])
+    except Exception as e:
+        logger.debug("[session-time-index] index_session failed (non-fatal): %s", e)
+
+
+def rebuild() -> int:
+    """Re-index every session from the class-set scan; returns how many were seen.
+
+    Existing entries are left in place (no empty-index window); stale ones are
+    pruned as reads find them. The partial flags are recomputed from the
+    scan, so they clear once the old sessions are gone.
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    from models.session_enumeration import enumerate_sessions
+
+    sessions = enumerate_sessions(check_divergence=False, strict=True)
+    entries = [(s.db_key.redis_key, _stamps(s)) for s in sessions]
+    partial: set[str] = set()
+    for i in range(0, len(entries), 500):
+        partial |= _write(POPOTO_REDIS_DB, entries[i : i + 500])
+    if any(
+        getattr(s, "status", None) in _FINISHED and stamps["completed"] is None
+        for s, (_, stamps) in zip(sessions, entries, strict=True)
+    ):
+        partial.add("completed")
+        POPOTO_REDIS_DB.set(_partial_key("completed"), "1")
+    complete = [_partial_key(kind) for kind in KINDS if kind not in partial]
+    if complete:
+        POPOTO_REDIS_DB.delete(*complete)
+    POPOTO_REDIS_DB.set(_BUILT_KEY, str(time.time()))
+    logger.info("[session-time-index] rebuilt from %d session(s)", len(entries))
+    return len(entries)
+
+
+def _rebuild_in_background(db) -> None:
+    """Start one rebuild thread across processes; a no-op while one is running."""
+    if not db.set(_REBUILD_LOCK_KEY, str(os.getpid()), nx=True, ex=_REBUILD_LOCK_TTL_S):
+        return
+
+    def _run() -> None:
+        try:
+            rebuild()
+        except Exception as e:
+            logger.debug("[session-time-index] background rebuild failed (non-fatal): %s", e)
+        finally:
+            db.delete(_REBUILD_LOCK_KEY)
+
+    threading.Thread(target=_run, name="session-time-index-rebuild", daemon=True).start()
+
+
+def ensure_index() -> None:
+    """Build the index if it has never been built; refresh it if it is stale.
+
+    Only the first build runs inline (there is nothing to serve before it).
+    A refresh after :data:`REBUILD_INTERVAL_S` runs in a background thread,
+    so a request never pays for the scan.
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    built = POPOTO_REDIS_DB.get(_BUILT_KEY)
+    if built is None:
+        rebuild()
+        return
+    try:
+        built_at = float(built)
+    except (TypeError, ValueError):
+        built_at = 0.0
+    if time.time() - built_at >= REBUILD_INTERVAL_S:
+        _rebuild_in_background(POPOTO_REDIS_DB)
+
+
+def covers_all(kind: str) -> bool:
+    """True when the index holds every session that belongs under ``kind``.
+
+    False once a ``{kind}_at`` has aged out of the retention window, or (for
+    ``completed``) the last rebuild found a finished session with no
+    ``completed_at``. A read that runs off the end of the index then has nothing older to find;
+    otherwise the caller falls back to the scan for the older part.
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    _check_kind(kind)
+    ensure_index()
+    return not POPOTO_REDIS_DB.exists(_partial_key(kind))
+
+
+def _prune(db, kind: str, members: list[str]) -> None:
+    scores = db.pipeline(transaction=False)
+    for member in members:
+        scores.zscore(_all_key(kind), member)
+    pipe = db.pipeline(transaction=False)
+    for member, ts in zip(members, scores.execute(), strict=True):
+        pipe.zrem(_all_key(kind), member)
+        if ts is not None:
+            pipe.zrem(_day_key(kind, _utc_day(float(ts))), member)
+    pipe.execute()
+
+
+def _load(db, kind: str, keys: list) -> list:
+    from models.agent_session import AgentSession
+
+    keys = [k.decode() if isinstance(k, bytes) else k for k in keys]
+    if not keys:
+        return []
+    sessions = AgentSession.query.get_many(keys)
+    missing = [k for k, s in zip(keys, sessions, strict=True) if s is None]
+    if missing:
+        _prune(db, kind, missing)
+    return [s for s in sessions if s is not None]
+
+
+def session_keys_between(
+    kind: str,
+    start: datetime | float | None = None,
+    end: datetime | float | None = None,
+    *,
+    newest_first: bool = False,
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[str]:
+    """Redis keys of sessions whose ``{kind}_at`` is in ``[start, end]``.
+
+    ``None`` leaves that side open. ``offset`` / ``limit`` page through the
+    range in score order (``newest_first`` reverses it).
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    _check_kind(kind)
+    ensure_index()
+    lo = _epoch(start) if start is not None else "-inf"
+    hi = _epoch(end) if end is not None else "+inf"
+    page = {"start": offset, "num": limit} if limit is not None else {}
+    if newest_first:
+        keys = POPOTO_REDIS_DB.zrevrangebyscore(_all_key(kind), hi, lo, **page)
+    else:
+        keys = POPOTO_REDIS_DB.zrangebyscore(_all_key(kind), lo, hi, **page)
+    return [k.decode() if isinstance(k, bytes) else k for k in keys]
+
+
+def sessions_between(
+    kind: str,
+    start: datetime | float | None = None,
+    end: datetime | float | None = None,
+    *,
+    newest_first: bool = False,
+    offset: int = 0,
+    limit: int | None = None,
+) -> list:
+    """AgentSessions whose ``{kind}_at`` is in ``[start, end]``, in score order.
+
+    Arguments as :func:`session_keys_between`. Loaded in one pipelined
+    ``get_many``; a page can come back short when some members had no hash
+    left (they are pruned).
+    """
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    keys = session_keys_between(
+        kind, start, end, newest_first=newest_first, offset=offset, limit=limit
+    )
+    return _load(POPOTO_REDIS_DB, kind, keys)
+
+
+def sessions_since(kind: str, seconds: float, **kwargs) -> list:
+    """AgentSessions whose ``{kind}_at`` falls in the last ``seconds``."""
+    return sessions_between(kind, time.time() - seconds, None, **kwargs)
+
+
+def sessions_on_day(kind: str, day: date | str) -> list:
+    """AgentSessions whose ``{kind}_at`` falls on UTC ``day`` (date or ``YYYY-MM-DD``)."""
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    _check_kind(kind)
+    ensure_index()
+    keys = POPOTO_REDIS_DB.zrange(_day_key(kind, _day_str(day)), 0, -1)
+    return _load(POPOTO_REDIS_DB, kind, keys)
+
+
+def count_by_day(kind: str, days: Iterable[date | str]) -> dict[str, int]:
+    """``{YYYY-MM-DD: count}`` of sessions per UTC day, one ``ZCARD`` each."""
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    _check_kind(kind)
+    ensure_index()
+    labels = [_day_str(d) for d in days]
+    pipe = POPOTO_REDIS_DB.pipeline(transaction=False)
+    for label in labels:
+        pipe.zcard(_day_key(kind, label))
+    return dict(zip(labels, (int(n) for n in pipe.execute()), strict=True))
@@ -0,0 +1,617 @@
+"""Incremental, checkpointed log scanner with an on-disk error-event index.
+
+Error-extraction reflections used to re-read their log files from scratch on
+every run, with a "last 1 MB if over 50 MB" / "last 1000 lines" tail heuristic
+that silently dropped anything older. This module reads each log byte once:
+
+- **Checkpoints.** Each file is tracked by ``(st_dev, st_ino)`` with the byte
+  offset of the last complete line read. ``scripts/log_rotate.py`` rotates by
+  renaming (``x.log`` -> ``x.log.1``), so a rotated file keeps its inode and is
+  resumed under its new name; the fresh ``x.log`` is a new inode and starts at
+  zero. A file that shrank below its offset, or whose first bytes changed (an
+  inode reused by a new file), is rescanned from zero as a new generation.
+- **Classifier.** One compiled header regex finds ``WARNING`` / ``ERROR`` /
+  ``CRITICAL`` lines across a whole chunk of new bytes (plain-text and
+  ``StructuredJsonFormatter`` JSON lines). Messages are bucketed by
+  :data:`ROOT_CAUSE_PATTERNS`, compiled into one alternation.
+- **Index.** Events go to SQLite (``data/log_index.db``) with their level,
+  root-cause bucket, normalized signature and time. Consumers query counts by
+  bucket, level and day instead of re-parsing.
+
+Connection model follows ``agent/session_archive.py``: every public entry
+point opens its own connection and closes it. A file is scanned inside one
+``BEGIN IMMEDIATE`` transaction, so two threads (audits fan out over a pool)
+scanning the same log serialize instead of double-counting.
+"""
+
+from __future__ import annotations
+
+import calendar
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "log_index.db"
+
+# Rotated backups scanned alongside each live log; matches log_rotate.LOG_MAX_BACKUPS.
+MAX_BACKUPS = 3
+
+# First sight of a live log larger than this starts this many bytes from the
+# end (at a line boundary). The skipped byte count is recorded on the
+# checkpoint and in the scan result rather than dropped silently.
+INITIAL_MAX_BYTES = int(os.environ.get("LOG_INDEX_INITIAL_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Events older than this are pruned on each scan.
+RETENTION_DAYS = int(os.environ.get("LOG_INDEX_RETENTION_DAYS", "30"))
+
+INDEXED_LEVELS = ("WARNING", "ERROR", "CRITICAL")
+ERROR_LEVELS = ("ERROR", "CRITICAL")
+
+_READ_CHUNK = 4 * 1024 * 1024
+_HEAD_BYTES = 256
+_BUSY_TIMEOUT_S = 10.0
+
+# Ordered: the first pattern that matches names the bucket.
+ROOT_CAUSE_PATTERNS: list[tuple[str, str]] = [
+    # Regression marker for #898 (agent/session_pickup.py)
+    (r"Stale index entry", "stale_index_entry"),
+    # Network / Telegram connection
+    (r"Server closed the connection", "telegram_connection_drop"),
+    (r"Connection closed while receiving", "telegram_connection_drop"),
+    (r"Can't assign requested address", "telegram_connection_drop"),
+    (r"ConnectionResetError", "telegram_connection_reset"),
+    (r"ConnectionError", "telegram_connection_error"),
+    (r"ServerDisconnectedError", "telegram_server_disconnect"),
+    (r"The server has closed the connection", "telegram_connection_drop"),
+    (r"RPCError|FloodWaitError|ChatWriteForbiddenError", "telegram_api_error"),
+    (r"TimeoutError|timed out|timeout", "timeout"),
+    # Session / Lock errors
+    (r"session file locked|FailoverError.*locked", "session_lock_conflict"),
+    (r"ModelException|popoto.*exception", "redis_model_error"),
+    (r"unique constraint|duplicate key", "redis_duplicate_key"),
+    # SDK / Claude Code errors
+    (r"SDK.*error|sdk_client.*error", "sdk_error"),
+    (r"Claude Code.*error|claude.*process", "claude_code_error"),
+    (r"Clawdbot error", "clawdbot_error"),
+    (r"Process.*killed|Process.*died|SIGKILL|SIGTERM", "process_killed"),
+    (r"MemoryError|memory|OOM", "memory_error"),
+    # API errors
+    (r"HTTP.*4\d\d|HTTP.*5\d\d|status.*(4\d\d|5\d\d)", "http_error"),
+    (r"rate.limit|429|too many requests", "rate_limit"),
+    (r"overloaded|529|capacity", "api_overloaded"),
+    # Auth errors
+    (r"auth.*error|unauthorized|403|401", "auth_error"),
+    # File / IO errors
+    (r"FileNotFoundError|No such file", "file_not_found"),
+    (r"PermissionError|Permission denied", "permission_error"),
+    (r"OSError|IOError", "io_error"),
+    # Python errors
+    (r"TypeError|AttributeError|KeyError|ValueError|IndexError", "python_error"),
+    (r"ImportError|ModuleNotFoundError", "import_error"),
+    (r"Traceback \(most recent call last\)", "traceback"),
+    # Webhook/callback
+    (r"Got difference for account updates", "telegram_sync_update"),
+]
+
+_BUCKET_PATTERNS = [re.compile(p, re.IGNORECASE) for p, _ in ROOT_CAUSE_PATTERNS]
+# Every pattern as one named alternation: a single search finds the earliest
+# match; only patterns ordered before it are then re-checked.
+_BUCKET_RE = re.compile(
+    "|".join(f"(?P<b{i}>{p})" for i, (p, _) in enumerate(ROOT_CAUSE_PATTERNS)),
+    re.IGNORECASE,
+)
+
+_TS = r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}"
+# "TS[,ms] [LEVEL] msg", "TS UTC name LEVEL msg", "TS,ms - name - LEVEL - msg",
+# "TS LEVEL name msg". The level must sit where a formatter puts it, so an
+# INFO line that mentions "ERROR" never matches.
+_TEXT_HEADER_RE = re.compile(
+    rf"^(?P<ts>{_TS})(?:[,.]\d+)?(?P<utc>Z| UTC)?(?:[ \t]+-)?"
+    r"(?:[ \t]+(?!(?:DEBUG|INFO)\b)[\w.]+(?:[ \t]+-)?)?"
+    r"[ \t]+\[?(?P<level>WARNING|ERROR|CRITICAL)\]?(?:[ \t]+-)?[ \t]*(?P<msg>[^\n]*)",
+    re.MULTILINE,
+)
+_JSON_HEADER_RE = re.compile(
+    r'^\{[^\n]*?"level": "(?:WARNING|ERROR|CRITICAL)"[^\n]*',
+    re.MULTILINE,
+)
+_LINE_TS_RE = re.compile(rf"(?:{_TS}|\{{)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    dev INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    log TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    head_hash TEXT,
+    head_len INTEGER NOT NULL DEFAULT 0,
+    generation REAL NOT NULL,
+    lines INTEGER NOT NULL DEFAULT 0,
+    skipped_bytes INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL,
+    PRIMARY KEY (dev, inode)
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    log TEXT NOT NULL,
+    dev INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    generation REAL NOT NULL,
+    offset INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    ts_text TEXT NOT NULL,
+    level TEXT NOT NULL,
+    bucket TEXT,
+    signature TEXT NOT NULL,
+    message TEXT NOT NULL,
+    context TEXT NOT NULL DEFAULT '',
+    UNIQUE (dev, inode, generation, offset)
+);
+
+CREATE INDEX IF NOT EXISTS events_log_ts ON events (log, ts);
+CREATE INDEX IF NOT EXISTS events_bucket_ts ON events (bucket, ts);
+"""
+
+
+@dataclass
+class ScanResult:
+    """What one :func:`scan_file` call read."""
+
+    log: str
+    new_bytes: int = 0
+    events: int = 0
+    skipped_bytes: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Classification
+# ---------------------------------------------------------------------------
+
+
+def classify(text: str) -> str | None:
+    """Root-cause bucket for ``text``: the first :data:`ROOT_CAUSE_PATTERNS` hit."""
+    match = _BUCKET_RE.search(text)
+    if match is None:
+        return None
+    first = int(match.lastgroup[1:])
+    for i in range(first):
+        if _BUCKET_PATTERNS[i].search(text):
+            return ROOT_CAUSE_PATTERNS[i][1]
+    return ROOT_CAUSE_PATTERNS[first][1]
+
+
+_SIGNATURE_SUBS = [
+    (re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d+ \[\w+\] "), ""),
+    (re.compile(r"tg_\w+_-?\d+_\d+"), "<SESSION>"),
+    (re.compile(r"session[= ]\S+"), "session=<ID>"),
+    (re.compile(r"[0-9a-f]{8,32}"), "<ID>"),
+    (re.compile(r"pid=\d+"), "pid=<PID>"),
+    (re.compile(r"/[\w/.-]+/(\w+\.\w+)"), r".../<FILE:\1>"),
+    (re.compile(r"\d+\.\d+\.\d+\.\d+"), "<IP>"),
+    (re.compile(r"\(\d+ chars?\)"), "(<N> chars)"),
+    (re.compile(r"\(\d+ bytes?\)"), "(<N> bytes)"),
+    (re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}"), "<TIMESTAMP>"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def error_signature(line: str) -> str:
+    """Normalize an error line for grouping.
+
+    Strips timestamps, session IDs, PIDs, paths, and other variable parts so
+    identical errors share a signature.
+    """
+    msg = line
+    for pattern, repl in _SIGNATURE_SUBS:
+        msg = pattern.sub(repl, msg)
+    msg = msg.strip()
+    if len(msg) > 200:
+        msg = msg[:200] + "..."
+    return msg
+
+
+def _epoch(ts_text: str, utc: bool) -> float:
+    parsed = datetime.strptime(ts_text.replace("T", " ")[:19], "%Y-%m-%d %H:%M:%S")
+    if utc:
+        return float(calendar.timegm(parsed.timetuple()))
+    return time.mktime(parsed.timetuple())
+
+
+def _context(text: str, pos: int) -> str:
+    """Up to two continuation lines (traceback, wrapped message) after ``pos``."""
+    lines = []
+    for _ in range(2):
+        if pos >= len(text):
+            break
+        end = text.find("\n", pos)
+        end = len(text) if end == -1 else end
+        line = text[pos:end]
+        if _LINE_TS_RE.match(line):
+            break
+        if line.strip():
+            lines.append(line.strip())
+        pos = end + 1
+    return " | ".join(lines)
+
+
+def parse_events(text: str) -> list[tuple[int, dict]]:
+    """``[(char offset, event)]`` for every WARNING+ line in ``text``."""
+    found = []
+    for m in _TEXT_HEADER_RE.finditer(text):
+        message = m.group("msg").strip()
+        context = _context(text, m.end() + 1)
+        found.append(
+            (
+                m.start(),
+                {
+                    "ts": _epoch(m.group("ts"), bool(m.group("utc"))),
+                    "ts_text": m.group("ts").replace("T", " "),
+                    "level": m.group("level"),
+                    "message": message,
+                    "context": context,
+                },
+            )
+        )
+    for m in _JSON_HEADER_RE.finditer(text):
+        try:
+            record = json.loads(m.group(0))
+            ts_text = str(record["timestamp"])
+            ts = _epoch(ts_text, ts_text.endswith("Z") or bool(record.get("utc")))
+        except (ValueError, KeyError, TypeError):
+            continue
+        found.append(
+            (
+                m.start(),
+                {
+                    "ts": ts,
+                    "ts_text": ts_text.replace("T", " ")[:19],
+                    "level": record.get("level", "ERROR"),
+                    "message": str(record.get("message", "")).strip(),
+                    "context": _context(text, m.end() + 1),
+                },
+            )
+        )
+    for _, event in found:
+        event["bucket"] = classify(f"{event['message']} {event['context']}")
+        event["signature"] = error_signature(event["message"])
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Connection / checkpoints
+# ---------------------------------------------------------------------------
+
+
+def _db_path(db_path: Path | None) -> Path:
+    if db_path is not None:
+        return Path(db_path)
+    return Path(os.environ.get("LOG_INDEX_DB_PATH", _DEFAULT_DB_PATH))
+
+
+def _connect(db_path: Path | None) -> sqlite3.Connection:
+    path = _db_path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=_BUSY_TIMEOUT_S, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _logical_log(path: Path) -> Path:
+    """``x.log.2`` -> ``x.log``; events are keyed by the live log's path."""
+    if path.suffix.lstrip(".").isdigit():
+        return path.with_suffix("")
+    return path
+
+
+def _head_hash(f, length: int) -> str:
+    f.seek(0)
+    return hashlib.sha1(f.read(length)).hexdigest()  # noqa: S324 -- identity, not security
+
+
+def _scan_one(conn: sqlite3.Connection, path: Path, log: str, *, live: bool) -> ScanResult:
+    result = ScanResult(log=log)
+    st = path.stat()
+    row = conn.execute(
+        "SELECT * FROM checkpoints WHERE dev = ? AND inode = ?", (st.st_dev, st.st_ino)
+    ).fetchone()
+
+    with open(path, "rb") as f:
+        # A new generation whenever reading restarts at zero, so the same
+        # offsets in a truncated or reused file are new events, not duplicates.
+        offset, generation = 0, time.time()
+        if row is not None:
+            offset, generation = row["offset"], row["generation"]
+            reused = row["head_len"] and (
+                st.st_size < row["head_len"] or _head_hash(f, row["head_len"]) != row["head_hash"]
+            )
+            if st.st_size < offset or reused:
+                offset, generation = 0, time.time()
+        elif not live:
+            # A backup rotated before this log was ever scanned: history, not
+            # new bytes. Checkpoint at EOF so later appends to it still count.
+            offset = st.st_size
+        elif st.st_size > INITIAL_MAX_BYTES:
+            f.seek(st.st_size - INITIAL_MAX_BYTES)
+            f.readline()
+            offset = f.tell()
+            result.skipped_bytes = offset
+            logger.info(
+                "[log-index] first scan of %s (%d bytes): starting %d bytes in",
+                path,
+                st.st_size,
+                offset,
+            )
+
+        head_len = min(st.st_size, _HEAD_BYTES)
+        head_hash = _head_hash(f, head_len)
+
+        f.seek(offset)
+        lines = 0
+        rows = []
+        while offset < st.st_size:
+            chunk = f.read(min(_READ_CHUNK, st.st_size - offset))
+            if not chunk:
+                break
+            end = chunk.rfind(b"\n")
+            if end == -1:
+                if len(chunk) < _READ_CHUNK:
+                    break  # an unterminated last line: wait for its newline
+                end = len(chunk) - 1  # a line longer than a chunk: take it as is
+            chunk = chunk[: end + 1]
+            f.seek(offset + len(chunk))
+            lines += chunk.count(b"\n")
+            text = chunk.decode("utf-8", errors="replace")
+            byte_pos, prev = offset, 0
+            for char_pos, event in parse_events(text):
+                byte_pos += len(text[prev:char_pos].encode("utf-8", errors="replace"))
+                prev = char_pos
+                rows.append(
+                    (
+                        log,
+                        st.st_dev,
+                        st.st_ino,
+                        generation,
+                        byte_pos,
+                        event["ts"],
+                        event["ts_text"],
+                        event["level"],
+                        event["bucket"],
+                        event["signature"],
+                        event["message"][:2000],
+                        event["context"][:2000],
+                    )
+                )
+            result.new_bytes += len(chunk)
+            offset += len(chunk)
+
+    before = conn.total_changes
+    conn.executemany(
+        "INSERT OR IGNORE INTO events (log, dev, inode, generation, offset, ts, ts_text, level,"
+        " bucket, signature, message, context) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    result.events = conn.total_changes - before
+    conn.execute(
+        "INSERT INTO checkpoints (dev, inode, log, offset, head_hash, head_len, generation,"
+        " lines, skipped_bytes, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (dev, inode) DO UPDATE SET log = excluded.log, offset = excluded.offset,"
+        " head_hash = excluded.head_hash, head_len = excluded.head_len,"
+        " generation = excluded.generation,"
+        " lines = checkpoints.lines + excluded.lines,"
+        " skipped_bytes = checkpoints.skipped_bytes + excluded.skipped_bytes,"
+        " updated_at = excluded.updated_at",
+        (
+            st.st_dev,
+            st.st_ino,
+            log,
+            offset,
+            head_hash,
+            head_len,
+            generation,
+            lines,
+            result.skipped_bytes,
+            time.time(),
+        ),
+    )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def scan_file(log_file: Path | str, *, db_path: Path | None = None) -> ScanResult:
+    """Index the new bytes of ``log_file`` and its rotated backups.
+
+    Backups (``x.log.3`` ... ``x.log.1``) are read before the live file, so a
+    rotation between two scans loses nothing: the tail written before the
+    rename is read from the backup under its old inode.
+    """
+    live = _logical_log(Path(log_file)).resolve()
+    log = str(live)
+    backups = [live.with_name(f"{live.name}.{n}") for n in range(MAX_BACKUPS, 0, -1)]
+    total = ScanResult(log=log)
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            seen = []
+            for path in [*backups, live]:
+                if not path.is_file():
+                    continue
+                part = _scan_one(conn, path, log, live=path == live)
+                st = path.stat()
+                seen.append((st.st_dev, st.st_ino))
+                total.new_bytes += part.new_bytes
+                total.events += part.events
+                total.skipped_bytes += part.skipped_bytes
+            stale = [
+                (r["dev"], r["inode"])
+                for r in conn.execute("SELECT dev, inode FROM checkpoints WHERE log = ?", (log,))
+                if (r["dev"], r["inode"]) not in seen
+            ]
+            conn.executemany("DELETE FROM checkpoints WHERE dev = ? AND inode = ?", stale)
+            cutoff = time.time() - RETENTION_DAYS * 86400
+            conn.execute("DELETE FROM events WHERE log = ? AND ts < ?", (log, cutoff))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+    return total
+
+
+def scan_dir(logs_dir: Path | str, *, db_path: Path | None = None) -> list[ScanResult]:
+    """:func:`scan_file` every ``*.log`` in ``logs_dir``."""
+    return [
+        scan_file(path, db_path=db_path)
+        for path in sorted(Path(logs_dir).glob("*.log"))
+        if path.is_file()
+    ]
+
+
+def _where(
+    log_file: Path | str | None,
+    since: float | None,
+    until: float | None,
+    levels: tuple[str, ...] | None,
+    bucket: str | None = None,
+) -> tuple[str, list]:
+    clauses, params = [], []
+    if log_file is not None:
+        clauses.append("log = ?")
+        params.append(str(_logical_log(Path(log_file)).resolve()))
+    if since is not None:
+        clauses.append("ts >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("ts < ?")
+        params.append(until)
+    if levels:
+        clauses.append(f"level IN ({', '.join('?' * len(levels))})")
+        params.extend(levels)
+    if bucket is not None:
+        clauses.append("bucket = ?")
+        params.append(bucket)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def query_events(
+    log_file: Path | str | None = None,
+    *,
+    since: float | None = None,
+    until: float | None = None,
+    levels: tuple[str, ...] | None = ERROR_LEVELS,
+    bucket: str | None = None,
+    limit: int | None = None,
+    db_path: Path | None = None,
+) -> list[dict]:
+    """Indexed events, oldest first; ``limit`` keeps the newest ``limit``."""
+    where, params = _where(log_file, since, until, levels, bucket)
+    sql = f"SELECT * FROM events{where} ORDER BY ts DESC, id DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    conn = _connect(db_path)
+    try:
+        rows = [dict(r) for r in conn.execute(sql, params)]
+    finally:
+        conn.close()
+    rows.reverse()
+    return rows
+
+
+def _grouped(column: str, where: str, params: list, db_path: Path | None) -> Counter:
+    conn = _connect(db_path)
+    try:
+        return Counter(
+            {
+                key: count
+                for key, count in conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM events{where} GROUP BY 1", params
+                )
+            }
+        )
+    finally:
+        conn.close()
+
+
+def bucket_counts(
+    log_file: Path | str | None = None,
+    *,
+    since: float | None = None,
+    until: float | None = None,
+    levels: tuple[str, ...] | None = INDEXED_LEVELS,
+    db_path: Path | None = None,
+) -> Counter:
+    """``Counter({bucket: n})``; unclassified events count under ``None``."""
+    where, params = _where(log_file, since, until, levels)
+    return _grouped("bucket", where, params, db_path)
+
+
+def level_counts(
+    log_file: Path | str | None = None,
+    *,
+    since: float | None = None,
+    until: float | None = None,
+    db_path: Path | None = None,
+) -> Counter:
+    """``Counter({level: n})`` over the indexed levels."""
+    where, params = _where(log_file, since, until, None)
+    return _grouped("level", where, params, db_path)
+
+
+def daily_counts(
+    log_file: Path | str | None = None,
+    *,
+    since: float | None = None,
+    levels: tuple[str, ...] | None = INDEXED_LEVELS,
+    db_path: Path | None = None,
+) -> Counter:
+    """``Counter({YYYY-MM-DD: n})`` by the day printed in the log line."""
+    where, params = _where(log_file, since, None, levels)
+    return _grouped("substr(ts_text, 1, 10)", where, params, db_path)
+
+
+def signature_counts(
+    log_file: Path | str | None = None,
+    *,
+    since: float | None = None,
+    levels: tuple[str, ...] | None = ERROR_LEVELS,
+    bucket: str | None = None,
+    db_path: Path | None = None,
+) -> Counter:
+    """``Counter({signature: n})``, optionally within one bucket."""
+    where, params = _where(log_file, since, None, levels, bucket)
+    return _grouped("signature", where, params, db_path)
+
+
+def checkpoint_stats(log_file: Path | str, *, db_path: Path | None = None) -> dict:
+    """``{lines, skipped_bytes}`` summed over the tracked files of ``log_file``."""
+    log = str(_logical_log(Path(log_file)).resolve())
+    conn = _connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(lines), 0), COALESCE(SUM(skipped_bytes), 0)"
+            " FROM checkpoints WHERE log = ?",
+            (log,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return {"lines": row[0], "skipped_bytes": row[1]}
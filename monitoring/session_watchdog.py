@@ -47,6 +47,7 @@ from popoto.exceptions import ModelException
 
 from config.settings import settings
 from models.agent_session import AgentSession
+from models.session_projection import only
 
 
 def _to_timestamp(val) -> float | None:
@@ -357,7 +358,9 @@ def check_stalled_sessions() -> list[dict]:
 
     for status_val in ("pending", "running", "active"):
         try:
-            sessions = list(AgentSession.query.filter(status=status_val))
+            # Projected read: the stall check needs ids and timestamps, not the
+            # event logs. Diagnostics for a stalled row hydrate it on demand.
+            sessions = only(AgentSession.query.filter(status=status_val))
         except Exception as e:
             logger.error(
                 "[watchdog] Failed to query %s sessions for stall check: %s",
@@ -133,6 +133,12 @@ async def _run(dry_run: bool) -> None:
 
     _record_boot()  # once per boot, before the tick loop (atomic start-timestamp write)
 
+    from analytics.metrics import start_exporter
+    from config.redis_bootstrap import instrument_redis_client
+
+    instrument_redis_client()
+    start_exporter("reflections")
+
     # Wrap tick to emit the per-tick heartbeat WITHOUT threading process-specific file I/O
     # into the shared ReflectionScheduler class (it is imported by tests and other callers).
     scheduler.tick = _wrap_tick_with_heartbeat(scheduler)  # type: ignore[method-assign]
@@ -34,6 +34,9 @@ from typing import Any
 import yaml
 
 from reflections.utilities import (
+    AUDIT_BUDGET_S,
+    AUDIT_PROJECT_TIMEOUT_S,
+    AUDIT_PROJECT_WORKERS,
     PROJECT_ROOT,
     extract_structured_errors,
     run_per_project_audit,
@@ -262,4 +265,11 @@ def run() -> dict:
             or (repo_root / ".claude" / "settings.json").exists()
         )
 
-    return run_per_project_audit(_hooks_audit_for_project, skip_if=skip_if, name="hooks-audit")
+    return run_per_project_audit(
+        _hooks_audit_for_project,
+        skip_if=skip_if,
+        name="hooks-audit",
+        max_workers=AUDIT_PROJECT_WORKERS,
+        project_timeout=AUDIT_PROJECT_TIMEOUT_S,
+        budget=AUDIT_BUDGET_S,
+    )
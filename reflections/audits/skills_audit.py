@@ -26,7 +26,11 @@ from pathlib import Path
 
 from config.settings import settings
 from reflections.utilities import (
+    AUDIT_BUDGET_S,
+    AUDIT_PROJECT_TIMEOUT_S,
+    AUDIT_PROJECT_WORKERS,
     PROJECT_ROOT,
+    audit_subprocess_run,
     run_per_project_audit,
 )
 
@@ -84,7 +88,7 @@ def _skills_audit_finding_hash(project_slug: str, skill: str, rule_id: int | str
 def _resolve_repo_name_with_owner(repo_root: Path) -> str | None:
     """Look up the GitHub OWNER/NAME for a repo. Returns None on failure."""
     try:
-        proc = subprocess.run(
+        proc = audit_subprocess_run(
             ["gh", "repo", "view", "--json", "nameWithOwner"],
             capture_output=True,
             text=True,
@@ -195,7 +199,7 @@ def _file_skills_audit_issue_if_streaked(
             f"when the underlying rule passes."
         )
         try:
-            proc = subprocess.run(
+            proc = audit_subprocess_run(
                 [
                     "gh",
                     "issue",
@@ -265,7 +269,7 @@ def _skills_audit_for_project(project: dict) -> dict:
 
     t0 = _time.time()
     try:
-        result = subprocess.run(
+        result = audit_subprocess_run(
             [sys.executable, str(audit_script), "--no-sync", "--json"],
             capture_output=True,
             text=True,
@@ -340,4 +344,11 @@ def run() -> dict:
     def skip_if(repo_root: Path) -> bool:
         return not _skills_audit_script_path(repo_root).exists()
 
-    return run_per_project_audit(_skills_audit_for_project, skip_if=skip_if, name="skills-audit")
+    return run_per_project_audit(
+        _skills_audit_for_project,
+        skip_if=skip_if,
+        name="skills-audit",
+        max_workers=AUDIT_PROJECT_WORKERS,
+        project_timeout=AUDIT_PROJECT_TIMEOUT_S,
+        budget=AUDIT_BUDGET_S,
+    )
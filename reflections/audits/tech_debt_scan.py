@@ -14,13 +14,20 @@ See also: config/reflections.yaml (declaration), docs/features/reflections.md
 from __future__ import annotations
 
 import logging
-import subprocess
 
 from config.settings import settings
-from reflections.utilities import run_per_project_audit
+from reflections.utilities import (
+    AUDIT_PROJECT_TIMEOUT_S,
+    AUDIT_PROJECT_WORKERS,
+    audit_subprocess_run,
+    run_per_project_audit,
+)
 
 logger = logging.getLogger("reflections.maintenance")
 
+# Wall-clock budget for the whole scan; under the 2700s YAML ``timeout:``.
+TECH_DEBT_SCAN_BUDGET_S = 2400.0
+
 
 def _legacy_scan_for_project(project: dict) -> dict:
     """Per-project body for tech-debt-scan.
@@ -52,7 +59,7 @@ def _legacy_scan_for_project(project: dict) -> dict:
     error_msg: str | None = None
 
     try:
-        result = subprocess.run(
+        result = audit_subprocess_run(
             ["grep", "-r", "TODO:", "--include=*.py", wd],
             capture_output=True,
             text=True,
@@ -78,7 +85,7 @@ def _legacy_scan_for_project(project: dict) -> dict:
         ]
         for pattern in deprecated_patterns:
             try:
-                result = subprocess.run(
+                result = audit_subprocess_run(
                     ["grep", "-r", pattern, "--include=*.py", wd],
                     capture_output=True,
                     text=True,
@@ -124,4 +131,10 @@ def run() -> dict:
     — TODO/deprecated-typing checks apply to any Python repo) and aggregates
     findings with ``[slug]`` prefixes via :func:`run_per_project_audit`.
     """
-    return run_per_project_audit(_legacy_scan_for_project, name="tech-debt-scan")
+    return run_per_project_audit(
+        _legacy_scan_for_project,
+        name="tech-debt-scan",
+        max_workers=AUDIT_PROJECT_WORKERS,
+        project_timeout=AUDIT_PROJECT_TIMEOUT_S,
+        budget=TECH_DEBT_SCAN_BUDGET_S,
+    )
@@ -19,6 +19,7 @@ Reflection callables return ``{"status": ..., "findings": [...], "summary": str}
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -74,6 +75,17 @@ STUB_DOC_LINE_THRESHOLD = 5
 STALE_BRANCH_AGE_DAYS = 7
 STALE_PR_AGE_DAYS = 14
 
+# Per-document scan cache: a doc is re-scanned only when its bytes, the repo's
+# file listing or ``STALE_TERMS`` change. Bump DOC_SCAN_VERSION with any detector
+# change that alters output for unchanged input.
+DOC_SCAN_VERSION = 1
+DOC_SCAN_CACHE_TTL_SECONDS = 30 * 86400
+
+# Cache misses at or above this count are scanned in a process pool; below it,
+# pool start-up costs more than the scan. DOCS_AUDIT_WORKERS=0 means one per CPU.
+DOC_SCAN_PARALLEL_MIN_DOCS = int(os.environ.get("DOCS_AUDIT_PARALLEL_MIN_DOCS", "64"))
+DOC_SCAN_WORKERS = int(os.environ.get("DOCS_AUDIT_WORKERS", "0"))
+
 # Marker stamped into a docs-audit PR body when the existence invariant withheld
 # any fix on the run that opened it. The rotation path is the one path with no
 # human review — it opens the PR and the branch sweeper can auto-merge it — so
@@ -102,6 +114,7 @@ REDIS_LAST_COMPLETED_TS_KEY = "docs_audit:last_completed_run_ts"
 REDIS_LAST_COMPLETED_SUMMARY_KEY = "docs_audit:last_completed_run_summary"
 REDIS_ISSUE_DEDUP_PREFIX = "docs_audit:issues_filed"
 REDIS_DAILY_PR_KEY = "docs_audit:prs_today"  # capped at 1 PR per calendar day
+REDIS_DOC_SCAN_CACHE = "docs_audit:doc_scan"  # field "{root}:{path}" -> cached scan
 
 
 # ---------------------------------------------------------------------------
@@ -470,7 +483,54 @@ def _has_migration_context(normalized: str, old_term: str, new_term: str) -> boo
     return False
 
 
-def _detect_stale_term_fixes(content: str) -> list[tuple[re.Pattern[str], str]]:
+def _stale_terms_version(stale_terms: dict[str, str] | None = None) -> str:
+    """Digest of the stale-term dictionary plus ``DOC_SCAN_VERSION``.
+
+    Part of every per-document cache key, so editing ``STALE_TERMS`` (or bumping
+    ``DOC_SCAN_VERSION`` alongside a detector change) invalidates every cached
+    scan without a manual flush.
+    """
+    terms = STALE_TERMS if stale_terms is None else stale_terms
+    payload = json.dumps([DOC_SCAN_VERSION, sorted(terms.items())])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=8)
+def _stale_term_scanner(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """One compiled alternation over every stale term, longest key first.
+
+    Word-anchored exactly like the per-term fix patterns, so a single
+    ``finditer`` finds every occurrence of every key instead of one regex pass
+    per ``STALE_TERMS`` entry. Longest-first means that when two keys share a
+    prefix, the longer one is reported.
+    """
+    alternation = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+def _stale_terms_present(content: str, terms: tuple[str, ...]) -> set[str]:
+    """The stale terms occurring in ``content`` outside path tokens, in one pass.
+
+    Path tokens are checked only on the lines of actual hits, with the same
+    ``_match_inside_path_token`` check the apply loop uses: scanning the whole document for
+    path tokens costs several times more than the term scan itself.
+    """
+    if not terms:
+        return set()
+    found: set[str] = set()
+    for match in _stale_term_scanner(terms).finditer(content):
+        term = match.group(0)
+        if term in found or _match_inside_path_token(content, match.start(), match.end()):
+            continue
+        found.add(term)
+        if len(found) == len(terms):
+            break
+    return found
+
+
+def _detect_stale_term_fixes(
+    content: str, stale_terms: dict[str, str] | None = None
+) -> list[tuple[re.Pattern[str], str]]:
     """Detect stale terms from STALE_TERMS dict that lack migration context.
 
     Matching is **word-anchored** with ``\\b``: a key never matches inside a
@@ -499,20 +559,30 @@ def _detect_stale_term_fixes(content: str) -> list[tuple[re.Pattern[str], str]]:
     ``_is_documented_deletion``) and path-token suppression. See
     ``_apply_fixes_to_file``.
 
+    Detection is one pass of ``_stale_term_scanner`` over the document whatever
+    the size of the dictionary. Occurrences inside path tokens are not reported,
+    because apply-time path-token suppression would drop every one of them anyway; a doc
+    whose only hits are path segments is therefore clean, and caches as clean.
+    ``stale_terms`` defaults to ``STALE_TERMS``; the parallel scan passes the
+    parent's dictionary explicitly so a worker process never reads its own copy.
+
     Returns fixes on the regex channel — ``(compiled_pattern, replacement)`` —
     so detection and application share one matching semantics. This is
     ``_apply_fixes_to_file``'s only fix channel. The replacement stays a plain
     ``str``; the suppression callable is built at the apply site so the withheld
     record and this channel's contract stay intact.
     """
+    terms = STALE_TERMS if stale_terms is None else stale_terms
+    present = _stale_terms_present(content, tuple(terms))
+    if not present:
+        return []
     normalized = _normalize_prose(content)
     fixes: list[tuple[re.Pattern[str], str]] = []
-    for old_term, new_term in STALE_TERMS.items():
-        pattern = re.compile(rf"\b{re.escape(old_term)}\b")
-        if not pattern.search(content):
+    for old_term, new_term in terms.items():
+        if old_term not in present:
             continue
         if not _has_migration_context(normalized, old_term, new_term):
-            fixes.append((pattern, new_term))
+            fixes.append((re.compile(rf"\b{re.escape(old_term)}\b"), new_term))
     return fixes
 
 
@@ -527,6 +597,11 @@ _PATH_REF_RE = re.compile(r"(?:[\w.-]+/)*[\w.-]+\.(?:py|md)")
 # run so a long-lived process does not answer from a stale snapshot.
 _BASENAME_INDEX_CACHE: dict[Path, dict[str, int]] = {}
 
+# Digest of the sorted ``git ls-files`` listing behind each index above. Absent
+# for a root whose index degraded to empty, which disables the per-document scan
+# cache for that run. Cleared together with ``_BASENAME_INDEX_CACHE``.
+_BASENAME_INDEX_DIGEST: dict[Path, str] = {}
+
 
 def _repo_basename_index(repo_root: Path) -> dict[str, int]:
     """Map every tracked-or-untracked file's basename to how many paths own it.
@@ -561,10 +636,14 @@ def _repo_basename_index(repo_root: Path) -> dict[str, int]:
                 (proc.stderr or "").strip(),
             )
         else:
-            for line in proc.stdout.splitlines():
+            listing = proc.stdout.splitlines()
+            for line in listing:
                 name = line.rsplit("/", 1)[-1]
                 if name:
                     index[name] = index.get(name, 0) + 1
+            _BASENAME_INDEX_DIGEST[key] = hashlib.sha256(
+                "\n".join(sorted(listing)).encode("utf-8")
+            ).hexdigest()[:16]
     except (OSError, subprocess.SubprocessError) as e:
         logger.warning(
             "docs_auditor: git ls-files errored in %s: %s — bare-name existence "
@@ -577,6 +656,18 @@ def _repo_basename_index(repo_root: Path) -> dict[str, int]:
     return index
 
 
+def _repo_index_digest(repo_root: Path) -> str | None:
+    """Digest of the repo's file listing, or ``None`` when the index degraded.
+
+    Stands in for "the set of paths a doc may reference": any added, removed or
+    renamed file changes it. Files deleted from the working tree but still in
+    the git index keep it unchanged; both callers run on a committed tree, where
+    that state does not occur.
+    """
+    _repo_basename_index(repo_root)
+    return _BASENAME_INDEX_DIGEST.get(repo_root.resolve())
+
+
 def _absent_new_path_refs(
     original_refs: set[str], candidate: str, repo_root: Path, doc_path: Path
 ) -> list[str]:
@@ -959,6 +1050,173 @@ def _detect_orphan_plan_issues(repo_root: Path) -> list[dict]:
     return findings
 
 
+# ---------------------------------------------------------------------------
+# Per-document scan (cached, optionally parallel)
+# ---------------------------------------------------------------------------
+
+
+def _scan_document(path: str, content: str, repo_root: str, stale_terms: dict[str, str]) -> dict:
+    """Run every per-document detector over one doc.
+
+    Module-level, with plain arguments and a JSON-shaped result, so it runs
+    unchanged in a pool worker and its output can be cached as is. Fixes are
+    ``[pattern, flags, replacement]`` triples; ``_scan_documents`` compiles them
+    back onto the regex channel.
+    """
+    doc_path = Path(path)
+    fixes = _detect_stale_term_fixes(content, stale_terms)
+    findings = _detect_deleted_target_issues(doc_path, content, Path(repo_root))
+    stub = _detect_stub_doc(doc_path, content)
+    if stub is not None:
+        findings.append(stub)
+    return {
+        "fixes": [[pattern.pattern, pattern.flags, new] for pattern, new in fixes],
+        "findings": findings,
+    }
+
+
+def _doc_scan_field(repo_root: Path, path: Path) -> str:
+    return f"{repo_root}:{path}"
+
+
+def _load_doc_scans(repo_root: Path, paths: list[Path]) -> dict[Path, dict]:
+    """Cached scan entries for ``paths``, one ``HMGET``. Any failure is a miss."""
+    try:
+        raw = _get_redis().hmget(
+            REDIS_DOC_SCAN_CACHE, [_doc_scan_field(repo_root, p) for p in paths]
+        )
+    except Exception as e:
+        logger.debug(f"docs_auditor: scan cache read failed: {e}")
+        return {}
+    if not isinstance(raw, list | tuple):
+        return {}
+    entries: dict[Path, dict] = {}
+    for path, value in zip(paths, raw, strict=False):
+        if not isinstance(value, str | bytes):
+            continue
+        try:
+            entry = json.loads(value)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            entries[path] = entry
+    return entries
+
+
+def _store_doc_scans(repo_root: Path, entries: dict[Path, dict]) -> None:
+    """Write scan entries and refresh the cache TTL. Best-effort."""
+    if not entries:
+        return
+    try:
+        r = _get_redis()
+        r.hset(
+            REDIS_DOC_SCAN_CACHE,
+            mapping={_doc_scan_field(repo_root, p): json.dumps(e) for p, e in entries.items()},
+        )
+        r.expire(REDIS_DOC_SCAN_CACHE, DOC_SCAN_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.debug(f"docs_auditor: scan cache write failed: {e}")
+
+
+def _run_scans(
+    documents: list[tuple[Path, str]], repo_root: Path, stale_terms: dict[str, str]
+) -> list[dict]:
+    """Scan ``documents``, in a process pool when there are enough of them.
+
+    The pool uses ``forkserver`` so a scan never forks a threaded parent (the
+    worker process runs reflections beside its own threads). Any pool failure
+    falls back to scanning in-process: the audit never depends on the pool.
+    """
+    workers = min(len(documents), DOC_SCAN_WORKERS or os.cpu_count() or 1)
+    if len(documents) >= max(1, DOC_SCAN_PARALLEL_MIN_DOCS) and workers > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+            ) as pool:
+                return list(
+                    pool.map(
+                        _scan_document,
+                        [str(path) for path, _ in documents],
+                        [content for _, content in documents],
+                        [str(repo_root)] * len(documents),
+                        [stale_terms] * len(documents),
+                        chunksize=max(1, len(documents) // (workers * 4)),
+                    )
+                )
+        except Exception as e:
+            logger.warning(f"docs_auditor: parallel scan failed ({e}) — scanning in-process")
+    return [
+        _scan_document(str(path), content, str(repo_root), stale_terms)
+        for path, content in documents
+    ]
+
+
+def _scan_documents(
+    documents: list[tuple[Path, str]], repo_root: Path
+) -> list[tuple[list[tuple[re.Pattern[str], str]], list[dict]]]:
+    """``(regex_fixes, issue_findings)`` for each ``(path, content)``, in order.
+
+    A doc is scanned only when its cached entry was computed for different
+    input. The cache key is the doc's content hash, the repo file-listing digest
+    (``_repo_index_digest``; deleted-target findings depend on which paths
+    exist) and ``_stale_terms_version``. When the listing is unavailable the
+    cache is bypassed for the run rather than trusted. So a rotation or
+    ``/do-docs`` pass over unchanged docs in an unchanged tree reads and hashes
+    each doc and scans none.
+    """
+    if not documents:
+        return []
+    stale_terms = dict(STALE_TERMS)
+    index_digest = _repo_index_digest(repo_root)
+    paths = [path for path, _ in documents]
+    keys: list[str | None] = [None] * len(documents)
+    cached: dict[Path, dict] = {}
+    if index_digest is not None:
+        terms_version = _stale_terms_version(stale_terms)
+        keys = [
+            f"{hashlib.sha256(content.encode('utf-8')).hexdigest()[:32]}"
+            f":{index_digest}:{terms_version}"
+            for _, content in documents
+        ]
+        cached = _load_doc_scans(repo_root, paths)
+
+    scans: list[dict | None] = []
+    misses: list[int] = []
+    for i, path in enumerate(paths):
+        entry = cached.get(path)
+        if keys[i] is not None and entry is not None and entry.get("key") == keys[i]:
+            scans.append(entry.get("scan"))
+        else:
+            scans.append(None)
+            misses.append(i)
+
+    if misses:
+        fresh = _run_scans([documents[i] for i in misses], repo_root, stale_terms)
+        for i, scan in zip(misses, fresh, strict=True):
+            scans[i] = scan
+        if index_digest is not None:
+            _store_doc_scans(
+                repo_root, {paths[i]: {"key": keys[i], "scan": scans[i]} for i in misses}
+            )
+    logger.debug(
+        "docs_auditor: %d doc(s) in scope, %d scanned, %d from cache",
+        len(documents),
+        len(misses),
+        len(documents) - len(misses),
+    )
+
+    return [
+        (
+            [(re.compile(pattern, flags), new) for pattern, flags, new in scan["fixes"]],
+            list(scan["findings"]),
+        )
+        for scan in scans
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Memory refresh hook (no-op placeholder for #1249)
 # ---------------------------------------------------------------------------
@@ -1016,6 +1274,27 @@ def _open_issue_exists(title: str, repo_root: Path) -> bool:
     Redis fast-path still suppresses on the next run.
     """
     normalized_query = _normalize_title(title)
+    from utils import github_api
+
+    repo = github_api.resolve_repo(repo_root) if github_api.enabled() else None
+    if repo:
+        # Same search through the shared broker: a repeat of an unchanged query
+        # is a 304 and costs no search quota.
+        quoted = title.replace('"', " ")
+        try:
+            issues = github_api.search_issues(
+                f'repo:{repo} is:issue is:open label:documentation in:title "{quoted}"'
+            )
+        except github_api.GitHubAPIError as e:
+            logger.warning(
+                "docs_auditor: issue search (dedup) failed for '%s': %s "
+                "— falling back to Redis-only dedup",
+                title,
+                e,
+            )
+            return False
+        return any(_normalize_title(i.get("title", "")) == normalized_query for i in issues)
+
     try:
         result = subprocess.run(
             [
@@ -1193,6 +1472,7 @@ def audit(
     # The bare-name existence oracle is a per-*run* snapshot: a long-lived process
     # must not answer from an index built before the last commit (#2759).
     _BASENAME_INDEX_CACHE.clear()
+    _BASENAME_INDEX_DIGEST.clear()
 
     root = (repo_root or PROJECT_ROOT).resolve()
 
@@ -1231,17 +1511,21 @@ def audit(
     issue_findings: list[dict] = []
     withheld: list[dict] = []
 
+    documents: list[tuple[Path, str]] = []
     for path in files:
         full = root / path
         if not full.exists():
             continue
         try:
-            content = full.read_text(encoding="utf-8", errors="replace")
+            documents.append((path, full.read_text(encoding="utf-8", errors="replace")))
         except Exception:
             continue
 
+    # Detectors run once per changed doc; see ``_scan_documents``.
+    scans = _scan_documents(documents, root)
+
+    for (path, _content), (regex_fixes, doc_findings) in zip(documents, scans, strict=True):
         # Auto-fix detectors — anchored stale terms are the only fix channel.
-        regex_fixes = _detect_stale_term_fixes(content)
 
         # Apply-mode writes are markdown-only (#2058). The detector above is
         # markdown-regex based (bare-term renames), so a committed non-.md file
@@ -1264,10 +1548,7 @@ def audit(
         # which is the documentation-label duplicate flood. Auto-fix detectors
         # above still run per-PR; only issue-filing is gated to rotation.
         if scope_mode == "rotation":
-            issue_findings.extend(_detect_deleted_target_issues(path, content, root))
-            stub = _detect_stub_doc(path, content)
-            if stub is not None:
-                issue_findings.append(stub)
+            issue_findings.extend(doc_findings)
 
     # Orphan plans (repo-wide, run once)
     if scope_mode == "rotation":
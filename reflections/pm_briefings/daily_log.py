@@ -357,23 +357,26 @@ def _iso_in_window(iso: str, start: datetime, end: datetime) -> bool:
 def _collect_sessions(target_date: datetime) -> tuple[list[dict], str | None]:
     """Collect AgentSession records that completed on target_date.
 
-    Filters via `Model.query.filter(status="completed")` (uses the IndexedField
-    on status), then walks results comparing `completed_at`. Returns minimal
-    dicts safe to serialize into Markdown.
+    Reads the target day's bucket of the session time index
+    (`models.session_time_index`), keeps `status == "completed"`, and
+    re-checks `completed_at` against the day window. Returns minimal dicts
+    safe to serialize into Markdown.
     """
     try:
-        from models.agent_session import AgentSession
+        from models.session_time_index import sessions_on_day
     except Exception as e:
-        return ([], f"AgentSession import failed: {e}")
+        return ([], f"session_time_index import failed: {e}")
 
     start, end = _utc_day_bounds(target_date)
     items: list[dict] = []
     try:
-        completed = AgentSession.query.filter(status="completed")
+        completed = sessions_on_day("completed", start.date())
     except Exception as e:
         return ([], f"AgentSession.query failed: {e}")
 
     for s in completed:
+        if getattr(s, "status", None) != "completed":
+            continue
         ca = getattr(s, "completed_at", None)
         if ca is None:
             continue
@@ -11,12 +11,12 @@ dispatcher in ``__init__.py`` owns all side effects.
 Output format: a plain-text findings block (no audio). The dispatcher
 delivers it as a Telegram text message rather than a voice note.
 
-This module owns the bounded log reader and Sentry helper that used to
-live in ``reflections/auditing.py`` (where they were called by
-``run_log_review``). The helpers were inlined as part of issue #1292 (the
-legacy ``daily-log-review`` registry entry was retired in the same cutover).
-``extract_structured_errors`` stays in ``reflections.utilities`` because
-``run_hooks_audit`` still imports it from there.
+Log reads go through ``monitoring.log_index``: each run indexes only the
+bytes appended (or rotated) since the last run, then counts errors, warnings
+and the ``stale_index_entry`` bucket for the last 24h from the index. This
+replaced a "last 1 MB if over 50 MB" tail read that silently dropped older
+errors. The Sentry helper used to live in ``reflections/auditing.py`` and was
+inlined as part of issue #1292.
 """
 
 from __future__ import annotations
@@ -26,11 +26,13 @@ import logging
 import os
 import shutil
 import subprocess
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from config.settings import settings
+from monitoring import log_index
 from reflections.utilities import extract_structured_errors
 
 logger = logging.getLogger("reflections.pm_briefings.log_audit")
@@ -38,44 +40,11 @@ logger = logging.getLogger("reflections.pm_briefings.log_audit")
 
 SLOT_TYPE = "log_audit"
 
-# Bound the bytes read from any single log file so a runaway log
-# (e.g. ``logs/worker.log``) cannot stall the reflection scheduler. If a
-# file exceeds ``_LOG_READ_MAX_BYTES``, the reader tail-reads only the last
-# ``_LOG_READ_TAIL_BYTES``. Constants originated as a hotfix (sibling of
-# PR #1056) in ``reflections/auditing.py`` and were inlined here in #1292.
-_LOG_READ_MAX_BYTES = 50 * 1024 * 1024  # 50 MB trip point
-_LOG_READ_TAIL_BYTES = 1 * 1024 * 1024  # Tail-read the last 1 MB
+# Window the scan reports on. Older events stay in the index for other readers.
+_SCAN_WINDOW_S = 24 * 3600
 
-
-def _read_log_text_bounded(log_file: Path) -> str:
-    """Read a log file as text, tail-reading if it exceeds the size cap.
-
-    Returns the decoded text content (errors replaced). Always closes the
-    file. If the file is larger than ``_LOG_READ_MAX_BYTES``, only the last
-    ``_LOG_READ_TAIL_BYTES`` are returned (with a leading truncation marker).
-    """
-    try:
-        size = os.path.getsize(log_file)
-    except OSError:
-        size = 0
-
-    if size > _LOG_READ_MAX_BYTES:
-        # Seek from end to avoid loading a multi-GB file into memory.
-        with open(log_file, "rb") as f:
-            f.seek(-_LOG_READ_TAIL_BYTES, os.SEEK_END)
-            chunk = f.read()
-        text = chunk.decode("utf-8", errors="replace")
-        return f"[... truncated: showing last {_LOG_READ_TAIL_BYTES} bytes of {size} ...]\n{text}"
-
-    with open(log_file, encoding="utf-8", errors="replace") as f:
-        return f.read()
-
-
-def _read_log_tail_lines(log_file: Path, n: int = 1000) -> list[str]:
-    """Return the last ``n`` lines of a log file, honoring the size cap."""
-    text = _read_log_text_bounded(log_file)
-    lines = text.splitlines(keepends=True)
-    return lines[-n:]
+# A log is noisy above this many warnings in the window.
+_WARNING_THRESHOLD = 10
 
 
 def _collect_sentry_counts(project: dict) -> str | None:
@@ -167,8 +136,9 @@ def _scan_project_logs(project: dict) -> list[str]:
                     f"[{slug}] Log file {log_file.name} is {size_mb:.1f}MB - consider rotation"
                 )
 
+            since = time.time() - _SCAN_WINDOW_S
             try:
-                errors = extract_structured_errors(log_file)
+                errors = extract_structured_errors(log_file, since=since)
             except Exception as exc:  # swallow-ok: per-file scan failure
                 errors = []
                 logger.debug(
@@ -182,15 +152,11 @@ def _scan_project_logs(project: dict) -> list[str]:
                     msg = error["message"][:200]
                     findings.append(f"  [{error['level']}] {error['timestamp']}: {msg}")
 
-            lines = _read_log_tail_lines(log_file, n=1000)
-            warning_count = sum(1 for line in lines if "WARNING" in line)
-            if warning_count > 10:
-                findings.append(
-                    f"[{slug}] {log_file.name}: {warning_count} warnings in recent logs"
-                )
+            warning_count = log_index.level_counts(log_file, since=since)["WARNING"]
+            if warning_count > _WARNING_THRESHOLD:
+                findings.append(f"[{slug}] {log_file.name}: {warning_count} warnings in last 24h")
 
-            log_content = _read_log_text_bounded(log_file)
-            stale_index_count = log_content.count("Stale index entry")
+            stale_index_count = log_index.bucket_counts(log_file, since=since)["stale_index_entry"]
             if stale_index_count > 0:
                 findings.append(
                     f"[{slug}] {log_file.name}: {stale_index_count} 'Stale index entry' "
@@ -40,20 +40,13 @@ def _analyze_sessions_from_redis(target_date: str) -> dict:
     }
 
     try:
-        from models.agent_session import AgentSession
-
-        all_sessions = AgentSession.query.all()
-        target_sessions = []
-        for session in all_sessions:
-            if session.started_at:
-                sa = session.started_at
-                if isinstance(sa, datetime):
-                    session_date = sa.strftime("%Y-%m-%d")
-                else:
-                    session_date = datetime.fromtimestamp(sa).strftime("%Y-%m-%d")
-                if session_date == target_date:
-                    target_sessions.append(session)
+        from models.session_time_index import sessions_on_day
 
+        # UTC day bucket of started_at: O(sessions that day), not a full scan.
+        # target_date is a UTC day (run() derives it from utc_now()), and
+        # started_at is stored tz-aware UTC. Before the index, a legacy
+        # epoch-float started_at was bucketed by the host's local day instead.
+        target_sessions = sessions_on_day("started", target_date)
         target_sessions.sort(key=lambda s: s.turn_count or 0, reverse=True)
         target_sessions = target_sessions[:20]
 
@@ -65,9 +58,12 @@ def _analyze_sessions_from_redis(target_date: str) -> dict:
                 log_path = Path(session.log_path)
                 if log_path.exists():
                     try:
-                        content = log_path.read_text()
-                        for line in content.splitlines():
-                            if "USER:" in line or "user:" in line:
+                        # Streamed line by line: a long session log is never
+                        # held in memory whole.
+                        with open(log_path, encoding="utf-8", errors="replace") as f:
+                            for line in f:
+                                if "USER:" not in line and "user:" not in line:
+                                    continue
                                 for pattern in CORRECTION_PATTERNS:
                                     if pattern.search(line):
                                         result["corrections"].append(
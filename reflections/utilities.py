@@ -15,6 +15,7 @@ import logging
 import os
 import re
 import subprocess
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -115,11 +116,213 @@ def load_local_projects() -> list[dict]:
     return projects
 
 
+# Bounded-concurrency knobs for ``run_per_project_audit`` callers that opt in
+# (audits that shell out to git/gh per repo). Provisional/tunable. The budget
+# sits under the smallest audit YAML ``timeout:`` (600s) so a slow run returns
+# partial results instead of being killed by the scheduler with none.
+AUDIT_PROJECT_WORKERS = int(os.environ.get("REFLECTION_AUDIT_WORKERS", "4"))
+AUDIT_PROJECT_TIMEOUT_S = float(os.environ.get("REFLECTION_AUDIT_PROJECT_TIMEOUT_S", "300"))
+AUDIT_BUDGET_S = float(os.environ.get("REFLECTION_AUDIT_BUDGET_S", "540"))
+
+# Upper bucket edges (seconds) of the per-run project duration histogram.
+AUDIT_DURATION_BUCKETS = (1.0, 5.0, 15.0, 60.0, 300.0)
+
+# Monotonic time a pooled project's worker must be done by (``project_timeout``
+# or the audit budget, whichever is sooner); unset outside a pooled audit.
+_audit_limit = threading.local()
+
+
+def audit_subprocess_run(cmd: list[str], *, timeout: float, **kwargs: Any):
+    """``subprocess.run`` for per-project audit bodies, capped by the project's time left.
+
+    In a pooled audit, ``timeout`` is cut to what remains before the project
+    is abandoned, and a call made after that raises
+    :class:`subprocess.TimeoutExpired` without starting. ``subprocess.run``
+    kills the child on timeout, so an abandoned project's thread ends with
+    its limits instead of holding interpreter exit on the pool's atexit join.
+    """
+    limit = getattr(_audit_limit, "deadline", None)
+    if limit is not None:
+        remaining = limit - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(cmd, 0)
+        timeout = min(timeout, remaining)
+    return subprocess.run(cmd, timeout=timeout, **kwargs)
+
+
+def _audit_record(slug: str, status: str, duration: float = 0.0, **extra: Any) -> dict:
+    return {
+        "slug": slug,
+        "status": status,
+        "duration": duration,
+        "findings_count": 0,
+        "error": None,
+        **extra,
+    }
+
+
+def _audit_project(
+    project: dict,
+    audit_one: Callable[[dict], dict],
+    skip_if: Callable[[Path], bool] | None,
+    name: str,
+) -> tuple[dict, list[str]]:
+    """Run one project's audit; returns ``(record, prefixed findings)``. Never raises."""
+    slug = project.get("slug", "?")
+    wd = project.get("working_directory", "")
+    repo_root = Path(wd) if wd else Path()
+
+    try:
+        if skip_if is not None and skip_if(repo_root):
+            return _audit_record(slug, "skipped", skipped_by_predicate=True), []
+
+        t0 = time.time()
+        result = audit_one(project)
+        elapsed = time.time() - t0
+
+        if not isinstance(result, dict):
+            raise TypeError(f"audit_one returned {type(result).__name__}, expected dict")
+
+        per_status = result.get("status", "ok")
+        per_findings = result.get("findings", []) or []
+        per_error = result.get("error")
+        if per_error is not None:
+            per_error = str(per_error)[:500]
+
+        findings = []
+        if per_status != "skipped":
+            findings = [f"[{slug}] {f}" for f in per_findings]
+        record = _audit_record(
+            slug,
+            per_status,
+            float(result.get("duration", elapsed)),
+            findings_count=len(per_findings),
+            error=per_error,
+        )
+        return record, findings
+    except Exception as exc:
+        err_str = f"{type(exc).__name__}: {exc}"
+        logger.warning("[%s] per-project audit failed for %s: %s", name, slug, err_str)
+        return _audit_record(slug, "error", error=err_str[:500]), []
+
+
+def _run_audits_pooled(
+    projects: list[dict],
+    run_one: Callable[[dict], tuple[dict, list[str]]],
+    *,
+    name: str,
+    max_workers: int,
+    project_timeout: float | None,
+    deadline: float | None,
+) -> list[tuple[dict, list[str]]]:
+    """Run ``run_one`` over ``projects`` in a thread pool, enforcing both time limits.
+
+    A project still running past ``project_timeout`` (measured from its own
+    start, not from submission) or past the global ``deadline`` is recorded
+    as an ``error`` and abandoned. Python threads cannot be killed, so its
+    worker finishes in the background and its result is discarded; the
+    subprocesses it starts through :func:`audit_subprocess_run` are killed at
+    that same limit, so the thread does not outlive it by much. Projects
+    that never started before the deadline are cancelled.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    started: dict[int, float] = {}
+    submitted = time.monotonic()
+
+    def timed(index: int, project: dict) -> tuple[dict, list[str]]:
+        started[index] = time.monotonic()
+        limits = [deadline] if deadline is not None else []
+        if project_timeout is not None:
+            limits.append(started[index] + project_timeout)
+        _audit_limit.deadline = min(limits, default=None)
+        try:
+            record, findings = run_one(project)
+        finally:
+            _audit_limit.deadline = None
+        record["queue_wait"] = round(started[index] - submitted, 3)
+        return record, findings
+
+    results: list[tuple[dict, list[str]] | None] = [None] * len(projects)
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"audit-{name}")
+    try:
+        futures = {pool.submit(timed, i, p): i for i, p in enumerate(projects)}
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            deadlines = [deadline] if deadline is not None else []
+            if project_timeout is not None:
+                deadlines += [
+                    started[futures[f]] + project_timeout for f in pending if futures[f] in started
+                ]
+            wait_s = min([d - now for d in deadlines] + [1.0])
+            done, pending = wait(pending, timeout=max(wait_s, 0.0), return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                slug = projects[index].get("slug", "?")
+                if deadline is not None and now >= deadline:
+                    if future.cancel():
+                        error = "TimeoutError: audit wall-clock budget exhausted before start"
+                    else:
+                        error = "TimeoutError: audit wall-clock budget exhausted"
+                elif (
+                    project_timeout is not None
+                    and index in started
+                    and now - started[index] >= project_timeout
+                ):
+                    error = f"TimeoutError: project audit exceeded {project_timeout:g}s"
+                else:
+                    continue
+                logger.warning("[%s] per-project audit failed for %s: %s", name, slug, error)
+                elapsed = now - started[index] if index in started else 0.0
+                results[index] = (_audit_record(slug, "error", elapsed, error=error), [])
+                pending.discard(future)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results  # type: ignore[return-value]
+
+
+def _duration_histogram(durations: list[float]) -> dict[str, int]:
+    """Bucket per-project durations: ``{"<=1s": n, ..., ">300s": n}``."""
+    histogram = {f"<={edge:g}s": 0 for edge in AUDIT_DURATION_BUCKETS}
+    histogram[f">{AUDIT_DURATION_BUCKETS[-1]:g}s"] = 0
+    for duration in durations:
+        for edge in AUDIT_DURATION_BUCKETS:
+            if duration <= edge:
+                histogram[f"<={edge:g}s"] += 1
+                break
+        else:
+            histogram[f">{AUDIT_DURATION_BUCKETS[-1]:g}s"] += 1
+    return histogram
+
+
+def _emit_project_durations(name: str, records: list[dict]) -> None:
+    try:
+        from analytics.collector import record_metric
+
+        for record in records:
+            if record["status"] != "skipped":
+                record_metric(
+                    "reflection.audit.project_duration",
+                    record["duration"],
+                    {"audit": name, "project": record["slug"], "status": record["status"]},
+                )
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("[%s] project duration metrics skipped: %r", name, exc)
+
+
 def run_per_project_audit(
     audit_one: Callable[[dict], dict],
     *,
     skip_if: Callable[[Path], bool] | None = None,
     name: str,
+    max_workers: int = 1,
+    project_timeout: float | None = None,
+    budget: float | None = None,
 ) -> dict:
     """Iterate `load_local_projects()` and run a per-project audit body.
 
@@ -129,6 +332,12 @@ def run_per_project_audit(
     project, so a network-mount race or permission error on one project
     cannot abort the whole audit.
 
+    By default projects run serially in the calling thread. Audits that
+    shell out to git/gh per repo pass ``max_workers`` (usually
+    ``AUDIT_PROJECT_WORKERS``) to fan out over a thread pool; ``audit_one``
+    must then be safe to run for several projects at once. Findings and
+    ``projects`` keep ``load_local_projects()`` order either way.
+
     Args:
         audit_one: sync callable taking the full project dict and returning
             ``{status, findings, summary, duration}``. Must NOT be a coroutine.
@@ -136,11 +345,21 @@ def run_per_project_audit(
             ``Path``; return ``True`` to silently skip.
         name: stable audit identifier (matches ``name:`` in the registry YAML).
             Used in the aggregate ``summary`` string and log lines — not decorative.
+        max_workers: projects audited concurrently; ``1`` is the serial mode.
+        project_timeout: seconds one project may run before it is recorded
+            as an ``error`` (``TimeoutError``) and abandoned. Runs the audit in
+            a worker thread even when ``max_workers`` is 1.
+        budget: wall-clock seconds for the whole audit. Projects still running
+            or not yet started when it runs out are recorded as ``error``.
 
     Returns:
         ``{status, findings, summary, projects: [{slug, status, duration,
-        findings_count, error}]}``. Per-project ``status`` is one of
-        ``"ok" | "error" | "skipped" | "disabled"``.
+        findings_count, error[, queue_wait]}], wall_clock, duration_histogram}``.
+        Per-project ``status`` is one of ``"ok" | "error" | "skipped" |
+        "disabled"``. ``queue_wait`` (pooled mode) is the seconds a project
+        waited for a worker. ``duration_histogram`` buckets the durations of
+        non-skipped projects; each one is also recorded as the
+        ``reflection.audit.project_duration`` metric.
 
         Aggregate ``status`` rules:
         - any ``error`` → ``"error"``
@@ -155,81 +374,44 @@ def run_per_project_audit(
             "findings": [],
             "summary": f"{name}: no qualifying projects",
             "projects": [],
+            "wall_clock": 0.0,
+            "duration_histogram": _duration_histogram([]),
         }
 
-    findings: list[str] = []
-    project_records: list[dict] = []
-    scanned = 0
-    skipped = 0
-    errored = 0
-    disabled = 0
+    t_start = time.monotonic()
+    deadline = t_start + budget if budget is not None else None
 
-    for project in projects:
-        slug = project.get("slug", "?")
-        wd = project.get("working_directory", "")
-        repo_root = Path(wd) if wd else Path()
+    def run_one(project: dict) -> tuple[dict, list[str]]:
+        return _audit_project(project, audit_one, skip_if, name)
 
-        try:
-            if skip_if is not None and skip_if(repo_root):
-                project_records.append(
-                    {
-                        "slug": slug,
-                        "status": "skipped",
-                        "duration": 0.0,
-                        "findings_count": 0,
-                        "error": None,
-                    }
-                )
-                skipped += 1
+    if max_workers <= 1 and project_timeout is None:
+        results = []
+        for project in projects:
+            if deadline is not None and time.monotonic() >= deadline:
+                error = "TimeoutError: audit wall-clock budget exhausted before start"
+                record = _audit_record(project.get("slug", "?"), "error", error=error)
+                results.append((record, []))
                 continue
+            results.append(run_one(project))
+    else:
+        results = _run_audits_pooled(
+            projects,
+            run_one,
+            name=name,
+            max_workers=max(1, max_workers),
+            project_timeout=project_timeout,
+            deadline=deadline,
+        )
 
-            t0 = time.time()
-            result = audit_one(project)
-            elapsed = time.time() - t0
-
-            if not isinstance(result, dict):
-                raise TypeError(f"audit_one returned {type(result).__name__}, expected dict")
-
-            per_status = result.get("status", "ok")
-            per_findings = result.get("findings", []) or []
-            per_duration = float(result.get("duration", elapsed))
-            per_error = result.get("error")
-            if per_error is not None:
-                per_error = str(per_error)[:500]
-
-            if per_status == "disabled":
-                disabled += 1
-            elif per_status == "error":
-                errored += 1
-            else:
-                scanned += 1
-
-            if per_status != "skipped":
-                for f in per_findings:
-                    findings.append(f"[{slug}] {f}")
-
-            project_records.append(
-                {
-                    "slug": slug,
-                    "status": per_status,
-                    "duration": per_duration,
-                    "findings_count": len(per_findings),
-                    "error": per_error,
-                }
-            )
-        except Exception as exc:
-            err_str = f"{type(exc).__name__}: {exc}"
-            logger.warning("[%s] per-project audit failed for %s: %s", name, slug, err_str)
-            project_records.append(
-                {
-                    "slug": slug,
-                    "status": "error",
-                    "duration": 0.0,
-                    "findings_count": 0,
-                    "error": err_str[:500],
-                }
-            )
-            errored += 1
+    findings = [f for _, project_findings in results for f in project_findings]
+    project_records = [record for record, _ in results]
+    # ``skipped`` counts skip_if skips only; an audit_one that itself reports
+    # "skipped" still counts as scanned.
+    skipped = sum(1 for r in project_records if r.pop("skipped_by_predicate", False))
+    statuses = [record["status"] for record in project_records]
+    errored = statuses.count("error")
+    disabled = statuses.count("disabled")
+    scanned = len(statuses) - skipped - errored - disabled
 
     if errored > 0:
         agg_status = "error"
@@ -242,11 +424,16 @@ def run_per_project_audit(
     if disabled:
         summary += f", {disabled} disabled"
 
+    _emit_project_durations(name, project_records)
     return {
         "status": agg_status,
         "findings": findings,
         "summary": summary,
         "projects": project_records,
+        "wall_clock": round(time.monotonic() - t_start, 3),
+        "duration_histogram": _duration_histogram(
+            [r["duration"] for r in project_records if r["status"] != "skipped"]
+        ),
     }
 
 
@@ -490,63 +677,42 @@ Return ONLY the JSON array, no other text. If no issues found, return [].
         return []
 
 
-def extract_structured_errors(log_file: Path) -> list[dict[str, str]]:
+def extract_structured_errors(
+    log_file: Path, *, since: float | None = None, limit: int = 1000
+) -> list[dict[str, str]]:
     """Extract structured error information from a log file.
 
+    Indexes the file's new bytes (and any rotated backups) into
+    ``monitoring.log_index`` and reads the ERROR / CRITICAL events back, so
+    each byte of the log is parsed once across runs and nothing is dropped by
+    a tail heuristic.
+
     Args:
         log_file: Path to a log file (e.g., bridge.log).
+        since: Only events at or after this epoch time.
+        limit: Keep the newest ``limit`` events.
 
     Returns:
-        List of dicts with timestamp, level, message, and context.
+        List of dicts with timestamp, level, message, and context, oldest first.
     """
-    errors: list[dict[str, str]] = []
-    log_pattern = re.compile(
-        r"(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})" r".*?(ERROR|CRITICAL)\s*[-:]\s*(.*)"
-    )
-
-    # Hotfix (sibling of PR #1056): guard against unbounded log files. If the
-    # file is over 50 MB, seek to the last 1 MB instead of loading the whole
-    # thing into memory just to discard all but the last 1000 lines.
-    max_bytes = 50 * 1024 * 1024
-    tail_bytes = 1 * 1024 * 1024
+    from monitoring import log_index
 
     try:
-        try:
-            size = os.path.getsize(log_file)
-        except OSError:
-            size = 0
-
-        if size > max_bytes:
-            with open(log_file, "rb") as f:
-                f.seek(-tail_bytes, os.SEEK_END)
-                chunk = f.read()
-            lines = chunk.decode("utf-8", errors="replace").splitlines(keepends=True)[-1000:]
-        else:
-            with open(log_file, encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()[-1000:]
-
-        for i, line in enumerate(lines):
-            match = log_pattern.search(line)
-            if match:
-                timestamp, level, message = match.groups()
-                context_lines = []
-                for j in range(i + 1, min(i + 3, len(lines))):
-                    stripped = lines[j].strip()
-                    if stripped and not log_pattern.search(lines[j]):
-                        context_lines.append(stripped)
-
-                errors.append(
-                    {
-                        "timestamp": timestamp,
-                        "level": level,
-                        "message": message.strip(),
-                        "context": " | ".join(context_lines),
-                    }
-                )
+        log_index.scan_file(log_file)
+        events = log_index.query_events(log_file, since=since, limit=limit)
     except Exception as e:
         logger.warning(f"Could not extract errors from {log_file}: {e}")
+        return []
 
-    return errors
+    return [
+        {
+            "timestamp": event["ts_text"],
+            "level": event["level"],
+            "message": event["message"],
+            "context": event["context"],
+        }
+        for event in events
+    ]
 
 
 def is_high_confidence(reflection: dict) -> bool:
@@ -4,6 +4,11 @@
 Identifies the most common errors, groups them by root cause,
 and produces an actionable summary.
 
+The log is read through ``monitoring.log_index``: a run indexes only the bytes
+appended (or rotated into ``bridge.error.log.N``) since the previous run, and
+the report is built from index queries. Only WARNING and above are indexed, so
+the level distribution covers those levels.
+
 Usage:
     python scripts/analyze_error_log.py
     python scripts/analyze_error_log.py --since 2026-02-01
@@ -11,107 +16,25 @@ Usage:
 """
 
 import argparse
-import re
 import sys
-from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
 
-LOG_FILE = Path(__file__).parent.parent / "logs" / "bridge.error.log"
-
-# Patterns to classify errors into root cause buckets
-ROOT_CAUSE_PATTERNS = [
-    # Network / Telegram connection
-    (r"Server closed the connection", "telegram_connection_drop"),
-    (r"Connection closed while receiving", "telegram_connection_drop"),
-    (r"Can't assign requested address", "telegram_connection_drop"),
-    (r"ConnectionResetError", "telegram_connection_reset"),
-    (r"ConnectionError", "telegram_connection_error"),
-    (r"ServerDisconnectedError", "telegram_server_disconnect"),
-    (r"The server has closed the connection", "telegram_connection_drop"),
-    (r"RPCError|FloodWaitError|ChatWriteForbiddenError", "telegram_api_error"),
-    (r"TimeoutError|timed out|timeout", "timeout"),
-    # Session / Lock errors
-    (r"session file locked|FailoverError.*locked", "session_lock_conflict"),
-    (r"ModelException|popoto.*exception", "redis_model_error"),
-    (r"unique constraint|duplicate key", "redis_duplicate_key"),
-    # SDK / Claude Code errors
-    (r"SDK.*error|sdk_client.*error", "sdk_error"),
-    (r"Claude Code.*error|claude.*process", "claude_code_error"),
-    (r"Clawdbot error", "clawdbot_error"),
-    (r"Process.*killed|Process.*died|SIGKILL|SIGTERM", "process_killed"),
-    (r"MemoryError|memory|OOM", "memory_error"),
-    # API errors
-    (r"HTTP.*4\d\d|HTTP.*5\d\d|status.*(4\d\d|5\d\d)", "http_error"),
-    (r"rate.limit|429|too many requests", "rate_limit"),
-    (r"overloaded|529|capacity", "api_overloaded"),
-    # Auth errors
-    (r"auth.*error|unauthorized|403|401", "auth_error"),
-    # File / IO errors
-    (r"FileNotFoundError|No such file", "file_not_found"),
-    (r"PermissionError|Permission denied", "permission_error"),
-    (r"OSError|IOError", "io_error"),
-    # Python errors
-    (r"TypeError|AttributeError|KeyError|ValueError|IndexError", "python_error"),
-    (r"ImportError|ModuleNotFoundError", "import_error"),
-    (r"Traceback \(most recent call last\)", "traceback"),
-    # Webhook/callback
-    (r"Got difference for account updates", "telegram_sync_update"),
-]
-
-
-def classify_error(line: str) -> str | None:
-    """Classify a log line into a root cause bucket."""
-    for pattern, cause in ROOT_CAUSE_PATTERNS:
-        if re.search(pattern, line, re.IGNORECASE):
-            return cause
-    return None
-
-
-def parse_log_line(line: str) -> dict | None:
-    """Parse a log line into components."""
-    # Format: 2026-01-19 15:22:54,554 [LEVEL] message
-    match = re.match(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \[(\w+)\] (.*)", line)
-    if match:
-        return {
-            "timestamp": match.group(1),
-            "level": match.group(2),
-            "message": match.group(3),
-        }
-    return None
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
+from monitoring import log_index  # noqa: E402
+from monitoring.log_index import (  # noqa: E402, F401 -- re-exported for callers of this script
+    ROOT_CAUSE_PATTERNS,
+    classify,
+    error_signature,
+)
 
-def extract_error_signature(line: str) -> str:
-    """Extract a normalized error signature for deduplication.
+LOG_FILE = PROJECT_ROOT / "logs" / "bridge.error.log"
 
-    Strips timestamps, session IDs, PIDs, paths, and other variable parts
-    to group identical errors together.
-    """
-    msg = line
-    # Remove timestamp prefix
-    msg = re.sub(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d+ \[\w+\] ", "", msg)
-    # Remove session IDs
-    msg = re.sub(r"tg_\w+_-?\d+_\d+", "<SESSION>", msg)
-    msg = re.sub(r"session[= ]\S+", "session=<ID>", msg)
-    # Remove job IDs / UUIDs
-    msg = re.sub(r"[0-9a-f]{8,32}", "<ID>", msg)
-    # Remove PIDs
-    msg = re.sub(r"pid=\d+", "pid=<PID>", msg)
-    # Remove file paths (keep filename)
-    msg = re.sub(r"/[\w/.-]+/(\w+\.\w+)", r".../<FILE:\1>", msg)
-    # Remove IP addresses
-    msg = re.sub(r"\d+\.\d+\.\d+\.\d+", "<IP>", msg)
-    # Remove numeric values in parens
-    msg = re.sub(r"\(\d+ chars?\)", "(<N> chars)", msg)
-    msg = re.sub(r"\(\d+ bytes?\)", "(<N> bytes)", msg)
-    # Remove timestamps in messages
-    msg = re.sub(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}", "<TIMESTAMP>", msg)
-    # Collapse whitespace
-    msg = re.sub(r"\s+", " ", msg).strip()
-    # Truncate long signatures
-    if len(msg) > 200:
-        msg = msg[:200] + "..."
-    return msg
+# Kept under their old names; the patterns and normalizer now live in the index.
+classify_error = classify
+extract_error_signature = error_signature
 
 
 def analyze_log(log_path: Path, since: str | None = None, top_n: int = 15):
@@ -120,90 +43,20 @@ def analyze_log(log_path: Path, since: str | None = None, top_n: int = 15):
         print(f"Log file not found: {log_path}")
         sys.exit(1)
 
-    since_dt = None
-    if since:
-        since_dt = datetime.strptime(since, "%Y-%m-%d")
-
-    # Counters
-    level_counts = Counter()
-    root_cause_counts = Counter()
-    error_signature_counts = Counter()
-    error_examples = defaultdict(list)  # root_cause -> [example lines]
-    root_cause_signatures = defaultdict(Counter)  # root_cause -> {sig: count}
-    daily_errors = Counter()  # date -> count
-    total_lines = 0
-    error_lines = 0
-    warning_lines = 0
-
-    # Traceback aggregation
-    in_traceback = False
-    traceback_buffer = []
-    traceback_trigger_line = ""
-
-    with open(log_path, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.rstrip()
-            if not line:
-                continue
-
-            parsed = parse_log_line(line)
-
-            # Handle traceback continuation lines
-            if in_traceback:
-                if parsed and parsed["level"] in ("ERROR", "WARNING", "INFO", "DEBUG"):
-                    # Traceback ended, process it
-                    sig = extract_error_signature(traceback_trigger_line)
-                    error_signature_counts[sig] += 1
-                    in_traceback = False
-                    traceback_buffer = []
-                else:
-                    traceback_buffer.append(line)
-                    continue
-
-            if not parsed:
-                # Could be traceback continuation
-                if line.startswith("  ") or line.startswith("Traceback"):
-                    traceback_buffer.append(line)
-                    in_traceback = True
-                continue
-
-            # Filter by date
-            if since_dt:
-                try:
-                    line_dt = datetime.strptime(parsed["timestamp"], "%Y-%m-%d %H:%M:%S")
-                    if line_dt < since_dt:
-                        continue
-                except ValueError:
-                    continue
-
-            total_lines += 1
-            level = parsed["level"]
-            level_counts[level] += 1
-            message = parsed["message"]
-
-            # Track daily error/warning counts
-            date_str = parsed["timestamp"][:10]
-
-            if level in ("ERROR", "WARNING", "CRITICAL"):
-                if level == "ERROR":
-                    error_lines += 1
-                elif level == "WARNING":
-                    warning_lines += 1
-
-                daily_errors[date_str] += 1
-
-                # Classify root cause
-                cause = classify_error(message)
-                if cause and cause != "telegram_sync_update":
-                    root_cause_counts[cause] += 1
-                    root_cause_signatures[cause][extract_error_signature(line)] += 1
-                    if len(error_examples[cause]) < 3:
-                        error_examples[cause].append(parsed["timestamp"] + " " + message[:200])
-
-                # Track error signatures
-                sig = extract_error_signature(line)
-                if level == "ERROR":
-                    error_signature_counts[sig] += 1
+    since_ts = datetime.strptime(since, "%Y-%m-%d").timestamp() if since else None
+
+    scan = log_index.scan_file(log_path)
+    levels = log_index.INDEXED_LEVELS
+    level_counts = log_index.level_counts(log_path, since=since_ts)
+    daily_errors = log_index.daily_counts(log_path, since=since_ts)
+    error_signature_counts = log_index.signature_counts(log_path, since=since_ts, levels=("ERROR",))
+    root_cause_counts = log_index.bucket_counts(log_path, since=since_ts)
+    root_cause_counts.pop(None, None)
+    root_cause_counts.pop("telegram_sync_update", None)
+    total_lines = log_index.checkpoint_stats(log_path)["lines"]
+    error_lines = level_counts["ERROR"]
+    warning_lines = level_counts["WARNING"]
+    indexed = sum(level_counts.values())
 
     # === Print Report ===
     print("=" * 80)
@@ -212,19 +65,20 @@ def analyze_log(log_path: Path, since: str | None = None, top_n: int = 15):
     print(f"Size: {log_path.stat().st_size / 1024 / 1024:.1f} MB")
     if since:
         print(f"Filtered: since {since}")
+    print(f"Scanned:  {scan.new_bytes:,} new bytes, {scan.events:,} new events")
     print("=" * 80)
 
-    print(f"\n### Log Level Distribution ({total_lines:,} total lines)")
+    print(f"\n### Log Level Distribution ({indexed:,} {'/'.join(levels)} lines)")
     for level, count in level_counts.most_common():
-        pct = count / total_lines * 100 if total_lines else 0
+        pct = count / indexed * 100 if indexed else 0
         bar = "█" * int(pct / 2)
         print(f"  {level:10s} {count:>8,}  ({pct:5.1f}%)  {bar}")
 
     print("\n### Error/Warning Rate")
     print(f"  Total errors:   {error_lines:,}")
     print(f"  Total warnings: {warning_lines:,}")
-    if total_lines:
-        print(f"  Error rate:     {error_lines / total_lines * 100:.2f}% of all log lines")
+    if total_lines and not since:
+        print(f"  Error rate:     {error_lines / total_lines * 100:.2f}% of all indexed log lines")
 
     print("\n### Daily Error+Warning Volume (last 14 days)")
     sorted_days = sorted(daily_errors.keys())[-14:]
@@ -241,6 +95,7 @@ def analyze_log(log_path: Path, since: str | None = None, top_n: int = 15):
     for cause, count in root_cause_counts.most_common(top_n):
         pct = count / total_classified * 100 if total_classified else 0
         desc = {
+            "stale_index_entry": "Stale session index entries (#898)",
             "telegram_connection_drop": "Telegram server closed connection",
             "telegram_connection_reset": "TCP connection reset by peer",
             "telegram_connection_error": "General connection failure",
@@ -278,12 +133,17 @@ def analyze_log(log_path: Path, since: str | None = None, top_n: int = 15):
     for cause, count in root_cause_counts.most_common(10):
         print(f"\n  ── {cause} ({count:,}) ──")
         # Show top signatures for this cause
-        top_sigs = root_cause_signatures[cause].most_common(3)
+        top_sigs = log_index.signature_counts(
+            log_path, since=since_ts, levels=levels, bucket=cause
+        ).most_common(3)
         for sig, sig_count in top_sigs:
             print(f"     [{sig_count:>4}x] {sig[:100]}")
         # Show example timestamps
-        for ex in error_examples[cause][:2]:
-            print(f"     e.g.: {ex[:120]}")
+        examples = log_index.query_events(
+            log_path, since=since_ts, levels=levels, bucket=cause, limit=2
+        )
+        for ex in examples:
+            print(f"     e.g.: {(ex['ts_text'] + ' ' + ex['message'])[:120]}")
 
     print("\n### Recommendations")
     print()
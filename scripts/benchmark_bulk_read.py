@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Local benchmark: Redis round trips for per-key hydration vs models.bulk_read.
+
+Mints ``--jobs`` scratch Jobs in one throwaway Room and reads them back the
+way the migrated call sites used to and the way they do now:
+
+* ``hydrate`` -- one ``query.get`` per key (the old
+  ``agent.memory_retrieval`` and ``DocumentChunk.search`` loops) vs
+  ``bulk_get``, one pipelined round trip per ``BULK_GET_BATCH_SIZE`` keys.
+* ``hydrate_by_field`` -- ``query.get(<key fields>)`` per record, which falls
+  back to ``filter()`` when a key field is missing (the old
+  ``DocumentChunk.search`` lookup by ``chunk_id``) vs lazy ``bulk_get``.
+* ``top_n`` -- ``filter(room_id=...)`` plus a Python sort (hydrates the whole
+  Room) vs ``top_n_by_sorted_field`` (one range read plus one batch).
+
+A round trip is one command sent on its own or one pipeline ``execute``;
+``hash_reads`` counts ``HGETALL``/``HMGET`` commands however they were sent.
+Every scratch Job is deleted afterwards.
+
+Usage::
+
+    python scripts/benchmark_bulk_read.py
+    python scripts/benchmark_bulk_read.py --jobs 500 --limit 10 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+HASH_READS = {"HGETALL", "HMGET"}
+
+
+@contextlib.contextmanager
+def count_round_trips():
+    """Count round trips and hash reads on ``POPOTO_REDIS_DB``."""
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    counter = {"n": 0, "hash_reads": 0}
+    real_command = POPOTO_REDIS_DB.execute_command
+    real_pipeline = POPOTO_REDIS_DB.pipeline
+
+    def command(*args, **kwargs):
+        counter["n"] += 1
+        counter["hash_reads"] += args[0] in HASH_READS
+        return real_command(*args, **kwargs)
+
+    def pipeline(*args, **kwargs):
+        pipe = real_pipeline(*args, **kwargs)
+        real_execute = pipe.execute
+        real_pipe_command = pipe.pipeline_execute_command
+
+        def pipe_command(*a, **kw):
+            counter["hash_reads"] += a[0] in HASH_READS
+            return real_pipe_command(*a, **kw)
+
+        def execute(*a, **kw):
+            counter["n"] += 1
+            return real_execute(*a, **kw)
+
+        pipe.execute = execute
+        pipe.pipeline_execute_command = pipe_command
+        return pipe
+
+    POPOTO_REDIS_DB.execute_command = command
+    POPOTO_REDIS_DB.pipeline = pipeline
+    try:
+        yield counter
+    finally:
+        del POPOTO_REDIS_DB.execute_command
+        del POPOTO_REDIS_DB.pipeline
+
+
+def _measure(name: str, mode: str, read) -> dict:
+    with count_round_trips() as counter:
+        start = time.perf_counter()
+        found = read()
+        seconds = time.perf_counter() - start
+    return {
+        "case": name,
+        "mode": mode,
+        "records": len(found),
+        "round_trips": counter["n"],
+        "hash_reads": counter["hash_reads"],
+        "ms": round(seconds * 1000, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200, help="Scratch Jobs to mint")
+    parser.add_argument("--limit", type=int, default=5, help="Page size for top_n")
+    parser.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args(argv)
+
+    from models.bulk_read import bulk_get, top_n_by_sorted_field
+    from models.job import Job
+
+    room_id = f"bench-bulkread-{uuid.uuid4().hex[:8]}|telegram:1"
+    jobs = [Job.mint(room_id, f"task {i}") for i in range(args.jobs)]
+    keys = [job.db_key.redis_key for job in jobs]
+    try:
+        rows = [
+            _measure("hydrate", "per_key", lambda: [Job.query.get(redis_key=k) for k in keys]),
+            _measure("hydrate", "bulk_get", lambda: bulk_get(Job, keys)),
+            _measure(
+                "hydrate_by_field",
+                "per_key",
+                lambda: [Job.query.get(id=job.id) for job in jobs],
+            ),
+            _measure("hydrate_by_field", "bulk_get", lambda: bulk_get(Job, keys, lazy=True)),
+            _measure(
+                "top_n",
+                "filter_sort",
+                lambda: sorted(
+                    Job.query.filter(room_id=room_id),
+                    key=lambda job: job.last_active_at,
+                    reverse=True,
+                )[: args.limit],
+            ),
+            _measure(
+                "top_n",
+                "top_n_by_sorted_field",
+                lambda: top_n_by_sorted_field(Job, "last_active_at", room_id, args.limit),
+            ),
+        ]
+    finally:
+        for job in jobs:
+            job.delete()
+
+    if args.json:
+        for row in rows:
+            print(json.dumps(row))
+    else:
+        print(
+            f"{'case':<18} {'mode':<22} {'records':>8} {'round_trips':>12} "
+            f"{'hash_reads':>11} {'ms':>8}"
+        )
+        for row in rows:
+            print(
+                f"{row['case']:<18} {row['mode']:<22} {row['records']:>8} "
+                f"{row['round_trips']:>12} {row['hash_reads']:>11} {row['ms']:>8}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
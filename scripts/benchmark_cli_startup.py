@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Import-time and wall-time benchmark for the top agent-facing CLI commands.
+
+Measures the ten ``valor-session`` / ``sdlc-tool`` invocations agents make most
+often in an SDLC run, three ways:
+
+* ``import`` -- seconds to import the tool module in a fresh interpreter (the
+  floor every cold invocation pays before doing any work).
+* ``cold`` -- wall time of ``python -m tools.cli_client <tool> ...`` with the
+  fast path disabled, i.e. today's ``python -m tools.<tool>``.
+* ``fast`` -- the same call handed to the command server
+  (``tools/cli_server.py``). A server is started for the run unless
+  ``--socket`` points at one that is already listening.
+
+Every command is read-only: ``list``/``status``/``children`` lookups, ``get``
+verdicts and ``stage-query``. None of them writes to Redis.
+
+Usage::
+
+    python scripts/benchmark_cli_startup.py
+    python scripts/benchmark_cli_startup.py --runs 5 --json
+    python scripts/benchmark_cli_startup.py --socket data/cli_server.sock
+
+Output: one row per command with the median of ``--runs`` samples.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# (tool, argv) -- the ten most frequent agent invocations, all read-only.
+TOP_COMMANDS: list[tuple[str, list[str]]] = [
+    ("valor_session", ["list", "--limit", "5"]),
+    ("valor_session", ["list", "--status", "running"]),
+    ("valor_session", ["status", "--id", "benchmark-missing"]),
+    ("valor_session", ["children", "--id", "benchmark-missing"]),
+    ("valor_session", ["inspect", "--id", "benchmark-missing"]),
+    ("sdlc_stage_query", ["--issue-number", "1"]),
+    ("sdlc_verdict", ["get", "--stage", "CRITIQUE", "--issue-number", "1"]),
+    ("sdlc_dispatch", ["get", "--issue-number", "1"]),
+    ("sdlc_run_health", ["--issue-number", "1", "--run-id", "benchmark"]),
+    ("sdlc_next_skill", ["--help"]),
+]
+
+
+def _time_run(cmd: list[str], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        cmd, cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return time.perf_counter() - start
+
+
+def measure_import(tool: str, env: dict[str, str]) -> float:
+    """Seconds to import ``tools.<tool>`` in a fresh interpreter, measured inside it."""
+    code = (
+        f"import time; t = time.perf_counter(); import tools.{tool}; print(time.perf_counter() - t)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1]) if out.returncode == 0 else float("nan")
+
+
+def _wait_for_socket(path: Path, timeout: float = 60.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="Samples per command (default: 3)")
+    parser.add_argument("--socket", default=None, help="Use an already-running server")
+    parser.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args()
+
+    server = None
+    if args.socket:
+        sock = Path(args.socket)
+    else:
+        sock = Path(tempfile.mkdtemp(prefix="vcs-", dir="/tmp")) / "cli.sock"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "tools.cli_server", "--socket", str(sock)],
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    try:
+        if not _wait_for_socket(sock):
+            print(f"command server never listened on {sock}", file=sys.stderr)
+            return 1
+        base_env = {**os.environ, "VALOR_CLI_SOCKET": str(sock)}
+        cold_env = {**base_env, "VALOR_CLI_FAST_PATH": "0"}
+        rows = []
+        for tool, argv in TOP_COMMANDS:
+            cmd = [sys.executable, "-m", "tools.cli_client", tool, *argv]
+            rows.append(
+                {
+                    "command": " ".join([tool, *argv]),
+                    "import_s": statistics.median(
+                        measure_import(tool, cold_env) for _ in range(args.runs)
+                    ),
+                    "cold_s": statistics.median(_time_run(cmd, cold_env) for _ in range(args.runs)),
+                    "fast_s": statistics.median(_time_run(cmd, base_env) for _ in range(args.runs)),
+                }
+            )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'command':<58} {'import':>8} {'cold':>8} {'fast':>8} {'speedup':>8}")
+    for row in rows:
+        speedup = row["cold_s"] / row["fast_s"] if row["fast_s"] else float("nan")
+        print(
+            f"{row['command']:<58} {row['import_s']:>7.2f}s {row['cold_s']:>7.2f}s "
+            f"{row['fast_s']:>7.2f}s {speedup:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Local benchmark: video_watch frame dedup, serial adjacent-only vs vectorized pHash.
+
+Renders a synthetic scene-change frame set the way ``_extract_scene_frames``
+would hand it over (512px-wide JPEGs) and dedups it two ways:
+
+* ``serial`` -- the previous ``_dedup_frames``: each frame opened in turn, a
+  16x16 grayscale Python list, a pure-Python mean-abs-diff against the
+  previously kept frame only.
+* ``vectorized`` -- the current ``tools.video_watch.pipeline._dedup_frames``:
+  thumbnails decoded in a thread pool with JPEG draft scaling, then one
+  NumPy comparison (mean-abs-diff and pHash Hamming distance) against every
+  kept frame.
+
+The frame set walks through ``--slides`` slides and revisits earlier ones
+(``--revisit``). Every shown frame is a variant: an exact repeat, a lower
+quality re-encode, a fade (brightness shift) or a moved cursor. Because the
+slide id of every frame is known, the run reports how many kept frames are
+redundant (a slide already kept) and how many slides were lost.
+
+Usage::
+
+    python scripts/benchmark_frame_dedup.py
+    python scripts/benchmark_frame_dedup.py --slides 60 --frames 800 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _render_slide(slide: int, width: int, height: int):
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(slide)
+    bg = tuple(rng.randrange(200, 250) for _ in range(3))
+    img = Image.new("RGB", (width, height), bg)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([20, 16, width - 20, 56], fill=(30, 50, 110))  # title bar
+    for row in range(rng.randrange(4, 9)):  # "bullet" lines
+        y = 80 + row * 24
+        draw.rectangle([40, y, 40 + rng.randrange(120, width - 80), y + 10], fill=(40, 40, 40))
+    if rng.random() < 0.5:  # a chart block on some slides
+        x = rng.randrange(width // 2, width - 140)
+        draw.rectangle([x, 90, x + 120, 220], fill=(rng.randrange(256), 120, 60))
+    return img
+
+
+def _variant(img, rng: random.Random, out: Path) -> None:
+    from PIL import ImageDraw
+
+    kind = rng.choice(["exact", "reencode", "fade", "cursor"])
+    quality = 90
+    if kind == "reencode":
+        quality = 55
+    elif kind == "fade":
+        shift = rng.choice([-35, -25, 25])
+        img = img.point(lambda v: max(0, min(255, v + shift)))
+    elif kind == "cursor":
+        img = img.copy()
+        x, y = rng.randrange(img.width - 12), rng.randrange(img.height - 18)
+        ImageDraw.Draw(img).polygon([(x, y), (x, y + 16), (x + 10, y + 11)], fill=(0, 0, 0))
+    img.save(out, quality=quality)
+
+
+def build_frames(
+    workdir: Path, slides: int, frames: int, revisit: float, seed: int
+) -> list[tuple[Path, float, int]]:
+    """Render ``frames`` JPEGs; returns ``[(path, ts, slide_id), ...]``."""
+    rng = random.Random(seed)
+    rendered = {}
+    out = []
+    current = 0
+    for i in range(frames):
+        if i and rng.random() < revisit:
+            slide = rng.randrange(current + 1)
+        else:
+            if rng.random() < slides / frames:
+                current = min(current + 1, slides - 1)
+            slide = current
+        if slide not in rendered:
+            rendered[slide] = _render_slide(slide, 512, 288)
+        path = workdir / f"frame_{i:04d}.jpg"
+        _variant(rendered[slide], rng, path)
+        out.append((path, float(i * 2), slide))
+    return out
+
+
+def serial_dedup(frames: list[tuple[Path, float]], threshold: float):
+    """The pre-vectorization ``_dedup_frames``, kept here as the baseline."""
+    from PIL import Image
+
+    def thumb(path: Path) -> list[int]:
+        with Image.open(path) as im:
+            return list(im.convert("L").resize((16, 16)).tobytes())
+
+    kept = []
+    prev_sig = None
+    for path, ts in frames:
+        sig = thumb(path)
+        if prev_sig is not None:
+            mad = sum(abs(a - b) for a, b in zip(prev_sig, sig, strict=False)) / len(sig)
+            if mad < threshold:
+                continue
+        kept.append((path, ts))
+        prev_sig = sig
+    return kept
+
+
+def _score(name, kept, truth, seconds) -> dict:
+    slide_of = {path: slide for path, _, slide in truth}
+    kept_slides = [slide_of[path] for path, _ in kept]
+    return {
+        "mode": name,
+        "frames_in": len(truth),
+        "kept": len(kept),
+        "redundant_kept": len(kept_slides) - len(set(kept_slides)),
+        "slides_lost": len({s for _, _, s in truth} - set(kept_slides)),
+        "ms": round(seconds * 1000, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=40, help="Distinct slides")
+    parser.add_argument("--frames", type=int, default=400, help="Scene-change frames")
+    parser.add_argument("--revisit", type=float, default=0.25, help="Revisit probability")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args(argv)
+
+    from tools.video_watch import pipeline
+    from tools.video_watch.constants import VIDEO_WATCH_DEDUP_THRESHOLD
+
+    with tempfile.TemporaryDirectory(prefix="frame_dedup_bench_") as work:
+        truth = build_frames(Path(work), args.slides, args.frames, args.revisit, args.seed)
+        frames = [(path, ts) for path, ts, _ in truth]
+
+        rows = []
+        start = time.perf_counter()
+        kept = serial_dedup(frames, VIDEO_WATCH_DEDUP_THRESHOLD)
+        rows.append(_score("serial", kept, truth, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        kept = pipeline._dedup_frames(frames)
+        rows.append(_score("vectorized", kept, truth, time.perf_counter() - start))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'mode':<11} {'in':>5} {'kept':>5} {'redundant':>9} {'lost':>5} {'ms':>8}")
+    for r in rows:
+        print(
+            f"{r['mode']:<11} {r['frames_in']:>5} {r['kept']:>5} {r['redundant_kept']:>9} "
+            f"{r['slides_lost']:>5} {r['ms']:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
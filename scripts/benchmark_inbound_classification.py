@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Local benchmark: serial inbound classification vs the fused, speculative stage.
+
+Replays the bridge's receive-to-ack path for a batch of unaddressed messages
+in an ``Eng:`` group with ``respond_to_unaddressed`` on (Case 1 of
+``bridge.routing.should_respond_async``, the path that classifies) with
+stubbed LLM latencies. No API or Redis is touched:
+
+* ``serial`` -- the pre-fusion handler: injection screen, then message store,
+  then ``should_respond_async`` (its own ``classify_needs_response`` call),
+  then the 👀 ack; the work type (``classify_request_async``) starts after
+  the ack.
+* ``fused`` -- ``bridge.inbound_classification``: the fused call and the
+  injection screen start at receive, the store runs meanwhile, and
+  ``should_respond_async(classification=...)`` reads the fused verdict.
+  The work type comes from the same verdict.
+
+Both modes run the real ``should_respond_async``; only ``run_typed`` (and the
+classifier and injection calls) are replaced by sleeps of ``--llm-ms``
+(jittered +-25%), and the Redis store by ``--store-ms``.
+
+Reports per mode: receive-to-ack p50/p95 for answered messages, time until
+the work type is known, and LLM calls made.
+
+Usage::
+
+    python scripts/benchmark_inbound_classification.py
+    python scripts/benchmark_inbound_classification.py --messages 200 --llm-ms 800 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_PROJECT = {
+    "_key": "bench",
+    "name": "Bench",
+    "telegram": {"respond_to_all": False, "respond_to_unaddressed": True},
+}
+_CHAT_TITLE = "Eng: Bench"
+
+# Roughly the mix an Eng: group sees; "thanks!" hits the no-LLM fast path.
+_MESSAGES = [
+    ("the deploy script fails on the staging box since yesterday", True, "bug"),
+    ("can we add CSV export to the weekly report?", True, "feature"),
+    ("bump the httpx pin and clean up the old migration files", True, "chore"),
+    ("run the pipeline on issue #412 please", True, "sdlc"),
+    ("lol that meme from standup", False, "chore"),
+    ("thanks!", False, "chore"),
+]
+
+
+class _Stubs:
+    """Sleep-based stand-ins for every LLM call on the intake path."""
+
+    def __init__(self, llm_s: float, seed: int) -> None:
+        self.llm_s = llm_s
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._truth: dict[str, tuple[bool, str]] = {}
+
+    async def _llm(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.llm_s * self._rng.uniform(0.75, 1.25))
+
+    async def run_typed(self, prompt, output_type, **kwargs):
+        await self._llm()
+        needs, work_type = next(v for k, v in self._truth.items() if k in prompt)
+        fields = {"needs_response": needs}
+        if "work_type" in output_type.model_fields:
+            fields |= {"work_type": work_type, "work_type_confidence": 0.9}
+        return output_type(**fields)
+
+    async def classify_request(self, text: str) -> dict:
+        await self._llm()
+        return {"type": self._truth[text][1], "confidence": 0.9}
+
+    async def inspect(self, text: str) -> dict:
+        await self._llm()
+        return {}
+
+
+def _event(message_id: int) -> SimpleNamespace:
+    message = SimpleNamespace(id=message_id, reply_to_msg_id=None)
+    return SimpleNamespace(message=message, chat_id=-100123)
+
+
+async def _one(mode: str, message_id: int, text: str, stubs: _Stubs, store_s: float) -> dict:
+    from bridge.inbound_classification import InboundClassification, worth_speculating
+    from bridge.routing import should_respond_async
+
+    event = _event(message_id)
+    start = time.perf_counter()
+    work_type_at: float | None = None
+
+    if mode == "serial":
+        await stubs.inspect(text)
+        await asyncio.sleep(store_s)
+        should, _ = await should_respond_async(
+            None, event, text, False, _CHAT_TITLE, _PROJECT, "bench", None, 1
+        )
+        ack_at = time.perf_counter() - start
+        if should:
+            await stubs.classify_request(text)
+            work_type_at = time.perf_counter() - start
+    else:
+        stage = InboundClassification(text, chat_id=event.chat_id, message_id=message_id)
+        if worth_speculating(text, is_dm=False, chat_title=_CHAT_TITLE, project=_PROJECT):
+            stage.start()
+        stage.speculate("injection", stubs.inspect(text))
+        await asyncio.sleep(store_s)
+        should, _ = await should_respond_async(
+            None,
+            event,
+            text,
+            False,
+            _CHAT_TITLE,
+            _PROJECT,
+            "bench",
+            None,
+            1,
+            classification=stage,
+        )
+        if not should:
+            stage.cancel()
+        ack_at = time.perf_counter() - start
+        if should:
+            await stage.side_result("injection", {})
+            await stage.verdict()
+            work_type_at = time.perf_counter() - start
+    return {"answered": should, "ack_s": ack_at, "work_type_s": work_type_at}
+
+
+def _pct(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))] if values else 0.0
+
+
+async def _run(mode: str, messages: int, llm_s: float, store_s: float, seed: int) -> dict:
+    from bridge import inbound_classification, routing
+
+    stubs = _Stubs(llm_s, seed)
+    routing.run_typed = stubs.run_typed
+    inbound_classification.run_typed = stubs.run_typed
+    inbound_classification.get_cached_verdict = lambda *_a: None
+    inbound_classification._store_verdict = lambda *_a: None
+
+    batch = [_MESSAGES[i % len(_MESSAGES)] for i in range(messages)]
+    for text, needs, work_type in _MESSAGES:
+        stubs._truth[text] = (needs, work_type)
+    rows = await asyncio.gather(
+        *(_one(mode, i, text, stubs, store_s) for i, (text, _, _) in enumerate(batch))
+    )
+    answered = [r for r in rows if r["answered"]]
+    acks = [r["ack_s"] for r in answered]
+    work = [r["work_type_s"] for r in answered]
+    return {
+        "mode": mode,
+        "messages": messages,
+        "answered": len(answered),
+        "ack_p50_s": round(_pct(acks, 0.5), 4),
+        "ack_p95_s": round(_pct(acks, 0.95), 4),
+        "ack_mean_s": round(statistics.fmean(acks), 4),
+        "work_type_p50_s": round(_pct(work, 0.5), 4),
+        "llm_calls": stubs.calls,
+    }
+
+
+async def _main(messages: int, llm_s: float, store_s: float, seed: int) -> list[dict]:
+    return [await _run(mode, messages, llm_s, store_s, seed) for mode in ("serial", "fused")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=60, help="Messages per mode (default: 60)")
+    parser.add_argument(
+        "--llm-ms", type=float, default=600.0, help="Stubbed Haiku latency (default: 600)"
+    )
+    parser.add_argument(
+        "--store-ms", type=float, default=30.0, help="Stubbed Redis store latency (default: 30)"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Jitter seed (default: 7)")
+    parser.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(_main(args.messages, args.llm_ms / 1000, args.store_ms / 1000, args.seed))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(
+        f"{'mode':<7} {'answered':>8} {'ack p50':>9} {'ack p95':>9} {'work type':>10} {'calls':>6}"
+    )
+    for row in rows:
+        print(
+            f"{row['mode']:<7} {row['answered']:>8} {row['ack_p50_s'] * 1000:>7.0f}ms "
+            f"{row['ack_p95_s'] * 1000:>7.0f}ms {row['work_type_p50_s'] * 1000:>8.0f}ms "
+            f"{row['llm_calls']:>6}"
+        )
+    serial, fused = rows
+    print(
+        f"\nreceive-to-ack p50: {serial['ack_p50_s'] * 1000:.0f}ms -> "
+        f"{fused['ack_p50_s'] * 1000:.0f}ms "
+        f"({1 - fused['ack_p50_s'] / serial['ack_p50_s']:.0%} faster)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Local benchmark: concurrent link enrichment vs the old one-at-a-time loop.
+
+Starts one local HTTP stand-in listening on ``127.0.0.1`` to ``127.0.0.N``.
+Each loopback address counts as a separate host for the per-host limit; by
+default every link gets its own, as in a real message. The stand-in serves
+HTML pages at ``/page/<n>`` and answers Perplexity-style ``/chat/completions``
+requests. ``tools.link_analysis.PERPLEXITY_URL`` points at it, and the link
+cache (``get_link_by_url`` / ``store_link``) is replaced with an in-memory
+dict so Redis is not involved.
+
+Two ways to enrich the same message:
+
+* ``sequential`` -- the pre-change ``get_link_summaries`` loop. Per URL it
+  runs ``get_metadata`` (``fetch_sync`` in a worker thread, since
+  ``asyncio.run`` cannot run inside the loop), then ``summarize_url_content``
+  with a fresh client. The summarizer would fetch the page a second time,
+  which is counted as one extra page request.
+* ``concurrent`` -- ``bridge.link_enrichment.enrich_links``: one fetch per
+  URL through the pooled client, all URLs at once.
+
+Every page and summary response is held for ``--latency-ms`` (default 150ms).
+New connections wait a further ``--handshake-ms`` (default 40ms), which
+stands in for TCP+TLS setup.
+
+Usage::
+
+    python scripts/benchmark_link_enrichment.py
+    python scripts/benchmark_link_enrichment.py --links 5 --latency-ms 300 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_PAGE = (
+    "<html><head><title>Benchmark page {n}</title>"
+    '<meta name="description" content="Page {n} of the link benchmark"></head>'
+    "<body>" + "<p>Paragraph of benchmark text for the summarizer.</p>" * 40 + "</body></html>"
+)
+_SUMMARY = json.dumps({"choices": [{"message": {"content": "A two sentence summary."}}]})
+
+
+class StandIn:
+    """Keep-alive HTTP/1.1 server for pages and the summarizer API."""
+
+    def __init__(self, latency_s: float, handshake_s: float, hosts: int = 1) -> None:
+        self.hosts = hosts
+        self.latency_s = latency_s
+        self.handshake_s = handshake_s
+        self.connections = 0
+        self.page_requests = 0
+        self.summary_requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        return self.host_url(0)
+
+    def host_url(self, index: int) -> str:
+        """URL of one of the listening loopback hosts (each is its own netloc)."""
+        sockets = self._server.sockets
+        host, port = sockets[index % len(sockets)].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        first = True
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ", 2)[1].decode()
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+                if first and self.handshake_s:
+                    await asyncio.sleep(self.handshake_s)
+                first = False
+                await asyncio.sleep(self.latency_s)
+                if path.startswith("/chat"):
+                    self.summary_requests += 1
+                    body, kind = _SUMMARY.encode(), b"application/json"
+                else:
+                    self.page_requests += 1
+                    body = _PAGE.format(n=path.rsplit("/", 1)[-1]).encode()
+                    kind = b"text/html; charset=utf-8"
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: %s\r\ncontent-length: %d\r\n\r\n"
+                    % (kind, len(body))
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self) -> StandIn:
+        addresses = [f"127.0.0.{i + 1}" for i in range(self.hosts)]
+        self._server = await asyncio.start_server(self._handle, addresses, 0)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+
+async def _sequential(urls: list[str]) -> int:
+    from tools.link_analysis import get_metadata, summarize_url_content
+
+    done = 0
+    for url in urls:
+        await asyncio.to_thread(get_metadata, url)
+        if await summarize_url_content(url):
+            done += 1
+    return done
+
+
+async def _concurrent(urls: list[str]) -> int:
+    from bridge.link_enrichment import enrich_links
+
+    return len(await enrich_links(urls, "bench", "bench", 0, None, deadline_s=60))
+
+
+async def _run(mode: str, links: int, hosts: int, latency_s: float, handshake_s: float) -> dict:
+    import tools.link_analysis as link_analysis
+    from bridge import link_enrichment
+
+    async with StandIn(latency_s, handshake_s, hosts) as server:
+        link_analysis.PERPLEXITY_URL = f"{server.base_url}/chat/completions"
+        urls = [f"{server.host_url(i)}/page/{mode}-{i}" for i in range(links)]
+        started = time.perf_counter()
+        if mode == "sequential":
+            done = await _sequential(urls)
+        else:
+            done = await _concurrent(urls)
+        elapsed = time.perf_counter() - started
+        await link_enrichment.aclose_link_clients()
+
+    page_requests = server.page_requests + (links if mode == "sequential" else 0)
+    return {
+        "mode": mode,
+        "links": links,
+        "enriched": done,
+        "elapsed_s": round(elapsed, 3),
+        "page_fetches": page_requests,
+        "summary_calls": server.summary_requests,
+        "connections": server.connections,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--links", type=int, default=5)
+    parser.add_argument(
+        "--hosts", type=int, default=0, help="Distinct page hosts (default: one per link)"
+    )
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--handshake-ms", type=float, default=40.0)
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args()
+
+    os.environ["PERPLEXITY_API_KEY"] = "benchmark"
+    os.environ["LLM_CACHE_DISABLED"] = "1"
+
+    from bridge import link_enrichment
+
+    memory: dict[str, dict] = {}
+    link_enrichment.get_link_by_url = lambda url, max_age_hours=None: memory.get(url)
+    link_enrichment.store_link = lambda url, **kw: memory.setdefault(url, kw)
+
+    hosts = args.hosts or args.links
+    results = [
+        asyncio.run(_run(mode, args.links, hosts, args.latency_ms / 1000, args.handshake_ms / 1000))
+        for mode in ("sequential", "concurrent")
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{args.links} links on {hosts} hosts, {args.latency_ms:.0f}ms per response, "
+        f"{args.handshake_ms:.0f}ms per new connection\n"
+    )
+    print(f"{'mode':<12}{'elapsed':>10}{'pages':>8}{'summaries':>11}{'conns':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<12}{r['elapsed_s']:>9.2f}s{r['page_fetches']:>8}"
+            f"{r['summary_calls']:>11}{r['connections']:>8}"
+        )
+    speedup = results[0]["elapsed_s"] / max(results[1]["elapsed_s"], 1e-9)
+    print(f"\nspeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Local benchmark: pooled keep-alive Anthropic client vs a fresh client per call.
+
+Starts a fake Messages API on ``127.0.0.1`` and makes the same burst of
+``messages.create`` calls two ways:
+
+* ``fresh`` -- ``semaphore_slot()`` plus ``async with
+  anthropic.AsyncAnthropic(...)`` per call, the pre-pool pattern the
+  hotfix #1055 call sites still use. Each call builds a client (CA bundle,
+  httpx pool) and opens a new connection.
+* ``pooled`` -- ``anthropic_slot(lane)``, which leases the event loop's
+  long-lived client, so calls reuse kept-alive connections.
+
+Localhost has no real TLS handshake to save, so the server holds the first
+response on every new connection for ``--handshake-ms`` (default 40ms, about
+a TCP+TLS setup to the API from a home connection). Pass ``0`` to measure
+client construction and connect cost alone.
+
+Calls rotate through the three priority lanes, so the pooled run also prints
+``lane_metrics()``: queue wait, p95 call latency and connection reuse rate.
+
+Usage::
+
+    python scripts/benchmark_llm_pool.py
+    python scripts/benchmark_llm_pool.py --calls 200 --handshake-ms 0 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_RESPONSE_BODY = json.dumps(
+    {
+        "id": "msg_benchmark",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-haiku-benchmark",
+        "content": [{"type": "text", "text": "ok"}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 1, "output_tokens": 1},
+    }
+).encode()
+
+
+class FakeMessagesServer:
+    """Keep-alive HTTP/1.1 server that answers every request with one Messages reply."""
+
+    def __init__(self, handshake_s: float = 0.0) -> None:
+        self.handshake_s = handshake_s
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        first = True
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+                if first and self.handshake_s:
+                    await asyncio.sleep(self.handshake_s)
+                first = False
+                self.requests += 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                    b"content-length: %d\r\n\r\n" % len(_RESPONSE_BODY) + _RESPONSE_BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self) -> FakeMessagesServer:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+
+async def _create(client) -> None:
+    await client.messages.create(
+        model="claude-haiku-benchmark",
+        max_tokens=8,
+        messages=[{"role": "user", "content": "ping"}],
+    )
+
+
+async def _run(mode: str, calls: int, server: FakeMessagesServer) -> dict:
+    import anthropic
+
+    from agent import anthropic_client
+    from config.settings import settings
+
+    anthropic_client._scheduler = anthropic_client.LaneScheduler(
+        settings.features.anthropic_concurrency
+    )
+    connections_before = server.connections
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        lane = anthropic_client.LANES[i % len(anthropic_client.LANES)]
+        start = time.perf_counter()
+        if mode == "fresh":
+            async with anthropic_client.semaphore_slot(lane):
+                async with anthropic.AsyncAnthropic(
+                    api_key="benchmark", base_url=server.base_url, timeout=10.0
+                ) as client:
+                    await _create(client)
+        else:
+            async with anthropic_client.anthropic_slot(lane, timeout=10.0) as client:
+                await _create(client)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    wall_s = time.perf_counter() - start
+    if mode == "pooled":
+        await anthropic_client.aclose_pooled_clients()
+    latencies.sort()
+    return {
+        "mode": mode,
+        "calls": calls,
+        "wall_s": round(wall_s, 3),
+        "mean_call_s": round(statistics.fmean(latencies), 4),
+        "p95_call_s": round(latencies[int(0.95 * (len(latencies) - 1))], 4),
+        "connections": server.connections - connections_before,
+        "lanes": anthropic_client.lane_metrics() if mode == "pooled" else None,
+    }
+
+
+async def _main(calls: int, handshake_s: float) -> list[dict]:
+    async with FakeMessagesServer(handshake_s) as server:
+        os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+        os.environ["ANTHROPIC_API_KEY"] = "benchmark"
+        return [await _run(mode, calls, server) for mode in ("fresh", "pooled")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=60, help="Calls per mode (default: 60)")
+    parser.add_argument(
+        "--handshake-ms",
+        type=float,
+        default=40.0,
+        help="Simulated connection setup delay on the server (default: 40)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(_main(args.calls, args.handshake_ms / 1000))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'mode':<8} {'calls':>6} {'wall':>8} {'mean':>8} {'p95':>8} {'conns':>6}")
+    for row in rows:
+        print(
+            f"{row['mode']:<8} {row['calls']:>6} {row['wall_s']:>7.2f}s "
+            f"{row['mean_call_s'] * 1000:>6.1f}ms {row['p95_call_s'] * 1000:>6.1f}ms "
+            f"{row['connections']:>6}"
+        )
+    print("\npooled lane metrics:")
+    for lane, metrics in rows[1]["lanes"].items():
+        print(
+            f"  {lane:<12} calls={metrics['calls']:<4} "
+            f"wait_p95={metrics['queue_wait_p95_s'] * 1000:.1f}ms "
+            f"call_p95={metrics['call_p95_s'] * 1000:.1f}ms "
+            f"reuse={metrics['connection_reuse_rate']:.0%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Import-time profiler and startup budget for the bridge and worker boot paths.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter for
+each boot target and attributes the cost per top-level package, so a slow boot
+reads as "anthropic 0.9s, telethon 0.25s" rather than a single wall-clock
+number. ``-X importtime`` reports a *self* time (the module's own body) and a
+*cumulative* time (body plus everything it imported first) per module; the
+per-package table sums self time, which adds up to the total without double
+counting.
+
+Boot targets:
+
+* ``worker`` -- ``agent.agent_session_queue`` plus ``worker.__main__``, i.e.
+  what ``python -m worker`` imports before its first loop tick.
+* ``bridge`` -- ``bridge.telegram_bridge``.
+
+``--budget SECONDS`` turns the run into a gate: exit 1 when any target's
+total import time (median of ``--runs``) meets or exceeds the budget. The
+live end-to-end number (process start to first loop tick) is recorded by the
+running processes in ``logs/boot_metrics.jsonl``; see
+:func:`agent.cold_start_metrics.record_boot`.
+
+Usage::
+
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --target bridge --top 30
+    python scripts/profile_startup.py --budget 2.5 --runs 3
+    python scripts/profile_startup.py --module tools.valor_session --json
+
+Exit codes:
+
+* ``0`` -- profiled (and every target within ``--budget``, when given)
+* ``1`` -- a target exceeded ``--budget`` or failed to import
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+BOOT_TARGETS: dict[str, list[str]] = {
+    "worker": ["agent.agent_session_queue", "worker.__main__"],
+    "bridge": ["bridge.telegram_bridge"],
+}
+
+# Import-time budget per boot target, checked by tests/unit/test_startup_imports.py.
+# Before the provider SDKs were deferred the bridge took ~4.4s and the worker ~2.0s.
+BOOT_IMPORT_BUDGET_S = 2.5
+
+# ``import time:       self [us] |  cumulative | imported package``
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+@dataclass
+class ImportProfile:
+    """Parsed ``-X importtime`` output for one interpreter run."""
+
+    total_s: float = 0.0
+    by_package: Counter = field(default_factory=Counter)
+    modules: list[tuple[str, float, float]] = field(default_factory=list)
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """Parse ``-X importtime`` stderr into per-package self time (seconds).
+
+    ``modules`` holds ``(module, self_s, cumulative_s)`` per imported module in
+    import order. Lines that are not importtime records (warnings, the header)
+    are ignored.
+    """
+    profile = ImportProfile()
+    for line in stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        self_s = int(m.group(1)) / 1e6
+        cumulative_s = int(m.group(2)) / 1e6
+        module = m.group(4)
+        profile.modules.append((module, self_s, cumulative_s))
+        profile.by_package[module.split(".")[0]] += self_s
+        profile.total_s += self_s
+    return profile
+
+
+def profile_imports(modules: list[str]) -> ImportProfile:
+    """Import ``modules`` in a fresh interpreter under ``-X importtime``."""
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["(no output)"]
+        raise RuntimeError(f"import {', '.join(modules)} failed: {tail[0]}")
+    return parse_importtime(proc.stderr)
+
+
+def _print_profile(name: str, profile: ImportProfile, top: int) -> None:
+    print(f"{name}: {profile.total_s:.2f}s total import time")
+    for package, seconds in profile.by_package.most_common(top):
+        share = seconds / profile.total_s if profile.total_s else 0.0
+        print(f"  {package:<32} {seconds * 1000:>8.1f}ms {share:>6.1%}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target",
+        choices=sorted(BOOT_TARGETS),
+        action="append",
+        help="Boot target to profile (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--module", action="append", default=[], help="Profile an arbitrary module instead"
+    )
+    parser.add_argument("--top", type=int, default=20, help="Packages to list (default: 20)")
+    parser.add_argument("--runs", type=int, default=1, help="Samples per target (default: 1)")
+    parser.add_argument(
+        "--budget", type=float, default=None, help="Fail if a target's import time >= SECONDS"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of tables")
+    args = parser.parse_args(argv)
+
+    if args.module:
+        targets = {m: [m] for m in args.module}
+    else:
+        targets = {t: BOOT_TARGETS[t] for t in (args.target or sorted(BOOT_TARGETS))}
+
+    results: dict[str, dict] = {}
+    failed = False
+    for name, modules in targets.items():
+        try:
+            samples = [profile_imports(modules) for _ in range(max(args.runs, 1))]
+        except RuntimeError as exc:
+            print(f"profile_startup: {exc}", file=sys.stderr)
+            failed = True
+            continue
+        median_s = statistics.median(p.total_s for p in samples)
+        # Attribute against the sample closest to the median, not an average
+        # of runs that may have imported different optional modules.
+        profile = min(samples, key=lambda p: abs(p.total_s - median_s))
+        within = args.budget is None or median_s < args.budget
+        failed = failed or not within
+        results[name] = {
+            "total_s": round(median_s, 3),
+            "within_budget": within,
+            "packages": {k: round(v, 4) for k, v in profile.by_package.most_common(args.top)},
+        }
+        if not args.json:
+            _print_profile(name, profile, args.top)
+            if args.budget is not None:
+                verdict = "PASS" if within else "FAIL"
+                print(f"  budget={args.budget:g}s median={median_s:.2f}s [{verdict}]")
+            print()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -92,6 +92,12 @@ _logger = logging.getLogger("tests.conftest")
 # cannot re-pollute it. Production code is untouched.
 os.environ["SENTRY_DSN"] = ""
 
+# Worktree pool guard: create_worktree / cleanup_after_merge would otherwise
+# claim from, recycle into and background-refill `.worktrees/.pool/` -- real
+# `git worktree add` + `uv sync` runs against whatever repo a test points at.
+# Pool tests opt back in with monkeypatch.setenv("WORKTREE_POOL_SIZE", ...).
+os.environ["WORKTREE_POOL_SIZE"] = "0"
+
 
 # ---------------------------------------------------------------------------
 # Live-Haiku guard on the outbound context-recall check (#2694)
@@ -431,6 +437,75 @@ def isolate_catchup_kill_switch(_catchup_flag_redirect_dir):
         bridge.catchup.CATCHUP_DISABLED_FLAG = original
 
 
+@pytest.fixture(autouse=True)
+def isolate_log_index_db(_catchup_flag_redirect_dir, monkeypatch):
+    """Point ``monitoring.log_index`` at a per-test SQLite file.
+
+    ``extract_structured_errors`` checkpoints every log it reads, so without
+    this a test that scans a tmp log would write into the real
+    ``data/log_index.db`` -- and a later test reusing the same tmp inode
+    would resume from a stale offset. Shares the session temp dir above for
+    the same reason (no per-test ``mktemp``).
+    """
+    monkeypatch.setenv(
+        "LOG_INDEX_DB_PATH", str(_catchup_flag_redirect_dir / f"log-index-{uuid4().hex}.db")
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolate_web_cache(_catchup_flag_redirect_dir, monkeypatch):
+    """Point ``tools.web.cache`` at a per-test directory.
+
+    ``tools.web.fetch`` and ``web_search`` read and write the cache on every
+    call; a shared directory would let one test's stored page answer
+    another's fetch.
+    """
+    monkeypatch.setenv(
+        "WEB_CACHE_DIR", str(_catchup_flag_redirect_dir / f"web-cache-{uuid4().hex}")
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolate_emoji_query_cache(_catchup_flag_redirect_dir, monkeypatch):
+    """Point ``tools.emoji_embedding`` query-embedding persistence at a per-test file.
+
+    Any test reaching ``find_best_emoji`` with a mocked embedding would
+    otherwise write it into the real ``data/emoji_query_embeddings.json``.
+    The in-memory LRU and its unsaved flag are reset too (and restored on
+    teardown), so nothing is left pending for the atexit flush.
+    """
+    from tools import emoji_embedding
+
+    monkeypatch.setattr(
+        emoji_embedding,
+        "QUERY_CACHE_PATH",
+        _catchup_flag_redirect_dir / f"emoji-query-{uuid4().hex}.json",
+    )
+    monkeypatch.setattr(emoji_embedding, "_query_cache", None)
+    monkeypatch.setattr(emoji_embedding, "_query_cache_dirty", False)
+    monkeypatch.setattr(emoji_embedding, "_query_cache_saved_at", None)
+
+
+@pytest.fixture(autouse=True)
+def disable_github_broker(monkeypatch):
+    """Keep call sites on their ``gh`` subprocess path.
+
+    With a token in the environment ``utils.github_api.enabled()`` would send
+    reads to the real API, bypassing the subprocess mocks most tests install.
+    Broker tests delete this variable and point ``GITHUB_API_URL`` at a fake.
+    """
+    monkeypatch.setenv("GITHUB_BROKER_DISABLED", "1")
+
+
+@pytest.fixture(autouse=True)
+def disable_pre_enrichment(monkeypatch):
+    """Keep bridge handler tests from starting background enrichment tasks.
+
+    Pre-enrichment tests delete this variable.
+    """
+    monkeypatch.setenv("PRE_ENRICHMENT_DISABLED", "1")
+
+
 @pytest.fixture(autouse=True)
 def agent_hooks_consistency_guard():
     """Detect and repair a corrupt `agent` package/submodule cache state.
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 from reflections.pm_briefings import log_audit
@@ -153,24 +154,28 @@ class TestCollectSentryCounts:
         assert result is None
 
 
-class TestReadLogTextBounded:
-    """Tail-read guard: large files must not be loaded fully into memory."""
-
-    def test_tails_files_over_size_cap(self, tmp_path):
-        """_read_log_text_bounded returns only the tail for files over the size cap."""
-        log_file = tmp_path / "huge.log"
-        # Build a file larger than the 50 MB trip point cheaply.
-        chunk = b"x" * (1024 * 1024)  # 1 MB of 'x'
-        size_mb = 55
-        with open(log_file, "wb") as f:
-            for _ in range(size_mb):
-                f.write(chunk)
-            # Trailing marker we expect to see after the truncation header.
-            f.write(b"TAIL_MARKER\n")
-
-        text = log_audit._read_log_text_bounded(log_file)
-        # Truncation notice is present and we still saw the final marker.
-        assert "truncated: showing last" in text
-        assert "TAIL_MARKER" in text
-        # The returned string is bounded: 1 MB tail + a short header, not 55 MB.
-        assert len(text) < 2 * 1024 * 1024
+class TestScanProjectLogs:
+    """Counts come from the incremental log index, windowed to the last 24h."""
+
+    def test_counts_recent_errors_and_stale_index_markers(self, tmp_path):
+        """Old errors fall outside the window; each run reports only the window."""
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        now = datetime.now()
+        old = (now - timedelta(days=3)).strftime("%Y-%m-%d %H:%M:%S")
+        recent = (now - timedelta(minutes=5)).strftime("%Y-%m-%d %H:%M:%S")
+        (logs_dir / "bridge.log").write_text(
+            f"{old},000 [ERROR] ancient failure\n"
+            f"{recent},000 [ERROR] fresh failure\n"
+            f"{recent},000 [WARNING] Stale index entry for session abc\n"
+        )
+        project = {"slug": "proj-a", "working_directory": str(tmp_path)}
+
+        with patch("reflections.pm_briefings.log_audit._collect_sentry_counts", return_value=None):
+            findings = log_audit._scan_project_logs(project)
+            again = log_audit._scan_project_logs(project)
+
+        assert "[proj-a] bridge.log: 1 structured errors extracted" in findings
+        assert not any("ancient failure" in f for f in findings)
+        assert any("1 'Stale index entry' warnings" in f for f in findings)
+        assert again == findings
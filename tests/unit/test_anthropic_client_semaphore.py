@@ -1,30 +1,39 @@
-"""Unit tests for the shared AsyncAnthropic semaphore (#1111).
+"""Unit tests for the shared AsyncAnthropic slot scheduler and client pool (#1111).
 
 Every bridge/tools/agent call site must go through ``agent.anthropic_client``
-so that an asyncio.Semaphore gates concurrent API calls. This prevents
+so that one slot budget gates concurrent API calls. This prevents
 fan-out from breaching Anthropic's per-minute request limits.
 
 These tests prove:
 
-1. The semaphore actually serializes concurrent acquisitions to the
+1. The scheduler actually serializes concurrent acquisitions to the
    configured slot count (``anthropic_slot()`` is the public entry point).
 2. The configured value is read from ``settings.features.anthropic_concurrency``
    (and therefore from the ``ANTHROPIC_CONCURRENCY`` env var by pydantic-settings
    resolution).
 3. The context manager releases the slot on exception, not just on success.
-4. No stray ``anthropic.AsyncAnthropic(`` instantiations exist outside the
+4. Queued lanes are admitted by weight, one slot stays reserved for the
+   interactive lane, and a cancelled waiter never leaks a slot.
+5. The pooled client is reused within a loop, retired after a timeout (the
+   hotfix #1055 guarantee), and closed at shutdown; per-lane metrics count
+   connection reuse.
+6. No stray ``anthropic.AsyncAnthropic(`` instantiations exist outside the
    shared module (regression canary).
 """
 
 from __future__ import annotations
 
 import asyncio
+import copy
+import weakref
+from collections import Counter
 
+import httpx
 import pytest
 
 
 class TestSemaphoreSerialization:
-    """Prove the shared semaphore actually gates concurrent slots."""
+    """Prove the shared scheduler actually gates concurrent slots."""
 
     @pytest.mark.asyncio
     async def test_only_n_slots_run_concurrently(self, monkeypatch):
@@ -34,11 +43,13 @@ class TestSemaphoreSerialization:
         maximum observed concurrency. Must equal the configured limit
         (not 10).
         """
-        # Force a deterministic small limit for the test — re-build module-level
-        # semaphore against the monkeypatched settings value.
+        # Force a deterministic small limit for the test — re-build the module-level
+        # scheduler with no interactive reserve so every slot is usable here.
         from agent import anthropic_client
 
-        monkeypatch.setattr(anthropic_client, "_semaphore", asyncio.Semaphore(3))
+        monkeypatch.setattr(
+            anthropic_client, "_scheduler", anthropic_client.LaneScheduler(3, interactive_reserve=0)
+        )
 
         concurrent = 0
         max_concurrent = 0
@@ -58,7 +69,7 @@ class TestSemaphoreSerialization:
         await asyncio.gather(*[worker() for _ in range(10)])
 
         assert max_concurrent == 3, (
-            f"semaphore must serialize to 3 slots, observed peak concurrency of {max_concurrent}"
+            f"scheduler must serialize to 3 slots, observed peak concurrency of {max_concurrent}"
         )
 
     @pytest.mark.asyncio
@@ -71,7 +82,7 @@ class TestSemaphoreSerialization:
         """
         from agent import anthropic_client
 
-        monkeypatch.setattr(anthropic_client, "_semaphore", asyncio.Semaphore(1))
+        monkeypatch.setattr(anthropic_client, "_scheduler", anthropic_client.LaneScheduler(1))
 
         async def failing():
             async with anthropic_client.anthropic_slot():
@@ -92,7 +103,7 @@ class TestSemaphoreSerialization:
 
 
 class TestSemaphoreConfiguration:
-    """Prove the semaphore reads its value from settings.features."""
+    """Prove the scheduler reads its slot count from settings.features."""
 
     def test_default_value_is_configured(self):
         """settings.features.anthropic_concurrency must have a sane default.
@@ -108,19 +119,284 @@ class TestSemaphoreConfiguration:
         assert isinstance(value, int)
         assert value >= 1, "anthropic_concurrency must be at least 1"
 
-    def test_module_semaphore_initialized_from_settings(self):
-        """The module-level _semaphore must be built from the settings value.
-
-        Read the semaphore's internal counter via asyncio.Semaphore._value
-        (private attr; only used in tests) and confirm it matches
-        settings.features.anthropic_concurrency at import time.
-        """
+    def test_module_scheduler_initialized_from_settings(self):
+        """The module-level _scheduler must be built from the settings value."""
         from agent import anthropic_client
         from config.settings import settings
 
-        # _value is the remaining slot count on a freshly-imported semaphore
-        # (no tasks holding slots at module load). It equals the configured limit.
-        assert anthropic_client._semaphore._value == settings.features.anthropic_concurrency
+        assert anthropic_client._scheduler.capacity == settings.features.anthropic_concurrency
+
+
+class TestLaneAdmission:
+    """Prove queued lanes are admitted by weight and interactive keeps a slot."""
+
+    @pytest.mark.asyncio
+    async def test_queued_lanes_admitted_by_weight(self):
+        from agent.anthropic_client import LANES, LaneScheduler
+
+        sched = LaneScheduler(1, interactive_reserve=0)
+        await sched.acquire("pipeline")  # hold the only slot so everyone queues
+        order: list[str] = []
+
+        async def waiter(lane):
+            await sched.acquire(lane)
+            order.append(lane)
+
+        tasks = [asyncio.create_task(waiter(lane)) for lane in LANES for _ in range(10)]
+        await asyncio.sleep(0)
+        for _ in range(10):
+            sched.release()
+            await asyncio.sleep(0)
+
+        assert Counter(order) == {"interactive": 6, "pipeline": 3, "background": 1}
+        assert order[:3] == ["interactive", "pipeline", "interactive"], "grants interleave"
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_last_slot_reserved_for_interactive(self):
+        from agent.anthropic_client import LaneScheduler
+
+        sched = LaneScheduler(2)
+        await sched.acquire("background")
+        queued = asyncio.create_task(sched.acquire("background"))
+        await asyncio.sleep(0)
+        assert not queued.done(), "background must not take the reserved slot"
+
+        await asyncio.wait_for(sched.acquire("interactive"), timeout=1.0)
+        assert sched.in_use == 2
+
+        sched.release()
+        sched.release()
+        await asyncio.wait_for(queued, timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        from agent.anthropic_client import LaneScheduler
+
+        sched = LaneScheduler(1)
+        await sched.acquire("pipeline")
+        queued = asyncio.create_task(sched.acquire("background"))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+
+        sched.release()
+        await asyncio.wait_for(sched.acquire("background"), timeout=1.0)
+        assert sched.in_use == 1
+
+    def test_unknown_lane_rejected(self):
+        from agent.anthropic_client import anthropic_slot, semaphore_slot
+
+        with pytest.raises(ValueError, match="unknown anthropic lane"):
+            anthropic_slot("urgent")
+        with pytest.raises(ValueError, match="unknown anthropic lane"):
+            semaphore_slot("urgent")
+
+
+class _FakePooledClient:
+    """Network-free stand-in for the pooled ``AsyncAnthropic``."""
+
+    def __init__(self) -> None:
+        self.timeout = None
+        self.closed = False
+        self.root = self
+
+    def with_options(self, *, timeout):
+        clone = copy.copy(self)
+        clone.timeout = timeout
+        return clone
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    """Fresh pool and scheduler; ``_new_client`` builds recorded fakes."""
+    from agent import anthropic_client
+
+    made: list[_FakePooledClient] = []
+
+    def new_client():
+        made.append(_FakePooledClient())
+        return made[-1]
+
+    monkeypatch.setattr(anthropic_client, "_new_client", new_client)
+    monkeypatch.setattr(anthropic_client, "_pools", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(anthropic_client, "_scheduler", anthropic_client.LaneScheduler(3))
+    return made
+
+
+class TestPooledClient:
+    """Prove the loop's client is reused, retired on timeouts, and closed at shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls_on_same_loop(self, fake_pool):
+        from agent.anthropic_client import anthropic_slot
+
+        async with anthropic_slot() as first:
+            pass
+        async with anthropic_slot("interactive", timeout=3.0) as second:
+            assert second.timeout == 3.0, "per-call SDK timeout applied via with_options"
+
+        assert len(fake_pool) == 1
+        assert first is fake_pool[0] and second.root is fake_pool[0]
+        assert not fake_pool[0].closed
+
+    def test_each_event_loop_gets_its_own_client(self, fake_pool):
+        from agent.anthropic_client import pooled_client
+
+        async def grab():
+            async with pooled_client() as client:
+                return client
+
+        assert asyncio.run(grab()) is not asyncio.run(grab())
+        assert len(fake_pool) == 2
+
+    def test_short_lived_loop_closes_its_client(self, fake_pool):
+        """asyncio.run callers (CLIs, hooks) must not leak the loop's pool."""
+        from agent import anthropic_client
+        from agent.anthropic_client import pooled_client
+
+        async def call():
+            async with pooled_client():
+                pass
+            async with pooled_client():
+                pass
+
+        asyncio.run(call())
+
+        assert len(fake_pool) == 1
+        assert fake_pool[0].closed
+        assert len(anthropic_client._pools) == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_retires_pooled_client(self, fake_pool):
+        from agent.anthropic_client import anthropic_slot
+
+        with pytest.raises(TimeoutError):
+            async with anthropic_slot():
+                raise TimeoutError("half-open socket")
+        assert fake_pool[0].closed, "hotfix #1055: a timed-out client must be closed"
+
+        with pytest.raises(RuntimeError):
+            async with anthropic_slot():
+                raise RuntimeError("application error")
+        async with anthropic_slot() as client:
+            pass
+
+        assert len(fake_pool) == 2, "only the transport failure forces a new client"
+        assert client is fake_pool[1] and not fake_pool[1].closed
+
+    @pytest.mark.asyncio
+    async def test_cancellation_keeps_pooled_client(self, fake_pool):
+        """Speculative classification cancels calls routinely; that must not cycle the pool."""
+        from agent.anthropic_client import anthropic_slot
+
+        started = asyncio.Event()
+
+        async def call():
+            async with anthropic_slot("interactive"):
+                started.set()
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(call())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        async with anthropic_slot() as client:
+            pass
+
+        assert len(fake_pool) == 1 and client is fake_pool[0]
+        assert not fake_pool[0].closed
+
+    @pytest.mark.asyncio
+    async def test_retired_client_closed_after_last_in_flight_call(self, fake_pool):
+        from agent.anthropic_client import anthropic_slot
+
+        other_call = anthropic_slot()
+        await other_call.__aenter__()
+        with pytest.raises(TimeoutError):
+            async with anthropic_slot():
+                raise TimeoutError
+        assert not fake_pool[0].closed, "must not close under an in-flight call"
+
+        await other_call.__aexit__(None, None, None)
+        assert fake_pool[0].closed
+
+    @pytest.mark.asyncio
+    async def test_aclose_pooled_clients(self, fake_pool):
+        from agent.anthropic_client import aclose_pooled_clients, anthropic_slot
+
+        async with anthropic_slot():
+            pass
+        await aclose_pooled_clients()
+
+        assert fake_pool[0].closed
+
+
+class TestLaneMetrics:
+    """Prove per-lane queue wait, latency and connection reuse are recorded."""
+
+    @pytest.mark.asyncio
+    async def test_calls_and_latency_recorded_per_lane(self, fake_pool):
+        from agent.anthropic_client import anthropic_slot, lane_metrics
+
+        async with anthropic_slot("background"):
+            await asyncio.sleep(0.02)
+
+        metrics = lane_metrics()
+        assert metrics["background"]["calls"] == 1
+        assert metrics["background"]["call_p95_s"] >= 0.02
+        assert metrics["interactive"]["calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_connection_reuse_counted_from_trace_events(self, monkeypatch):
+        from agent import anthropic_client
+
+        monkeypatch.setattr(anthropic_client, "_scheduler", anthropic_client.LaneScheduler(2))
+        token = anthropic_client._current_lane.set("interactive")
+        try:
+            for new_connection in (True, False, False, False):
+                request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+                await anthropic_client._on_request(request)
+                if new_connection:
+                    await request.extensions["trace"]("connection.connect_tcp.started", {})
+                await anthropic_client._on_response(httpx.Response(200, request=request))
+        finally:
+            anthropic_client._current_lane.reset(token)
+
+        interactive = anthropic_client.lane_metrics()["interactive"]
+        assert interactive["requests"] == 4
+        assert interactive["connection_reuse_rate"] == 0.75
+
+    @pytest.mark.asyncio
+    async def test_real_client_reuses_keep_alive_connection(self, monkeypatch):
+        """End to end against the benchmark's local fake Messages API."""
+        from agent import anthropic_client
+        from scripts.benchmark_llm_pool import FakeMessagesServer
+
+        monkeypatch.setattr(anthropic_client, "_pools", weakref.WeakKeyDictionary())
+        monkeypatch.setattr(anthropic_client, "_scheduler", anthropic_client.LaneScheduler(2))
+        async with FakeMessagesServer() as server:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", server.base_url)
+            monkeypatch.setenv("ANTHROPIC_API_KEY", "fake-test-key")
+            for _ in range(3):
+                async with anthropic_client.anthropic_slot("pipeline", timeout=5.0) as client:
+                    await client.messages.create(
+                        model="claude-haiku-benchmark",
+                        max_tokens=8,
+                        messages=[{"role": "user", "content": "ping"}],
+                    )
+            await anthropic_client.aclose_pooled_clients()
+
+        assert server.connections == 1
+        pipeline = anthropic_client.lane_metrics()["pipeline"]
+        assert pipeline["requests"] == 3
+        assert pipeline["connection_reuse_rate"] == pytest.approx(0.667, abs=0.001)
 
 
 class TestSharedModuleIsTheOnlyConstructor:
@@ -153,7 +429,6 @@ class TestSharedModuleIsTheOnlyConstructor:
             "agent/session_completion.py",  # mirrors read_the_room #1055 pattern (issue #1262)
             "bridge/read_the_room.py",  # hotfix #1055 pattern (issue #1193)
             "bridge/promise_gate.py",  # mirrors read_the_room #1055 pattern
-            "agent/llm/wrapper.py",  # PydanticAI wrapper (#1925) -- semaphore_slot() + fresh client
         }
     )
 
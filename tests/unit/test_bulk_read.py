@@ -0,0 +1,139 @@
+"""Tests for the bulk hydration helpers (models/bulk_read.py).
+
+Real Redis (per-test DB from the autouse ``redis_test_db``) with scratch Jobs,
+the repo's model with a partitioned ``SortedField``.
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from popoto import Field
+
+from models import bulk_read
+from models.bulk_read import bulk_get, bulk_get_by_key, top_n_by_sorted_field
+from models.job import Job
+
+
+@pytest.fixture
+def room_id():
+    rid = f"test-bulkread-{uuid.uuid4().hex[:8]}|telegram:1"
+    yield rid
+    for job in Job.query.filter(room_id=rid):
+        job.delete()
+
+
+@pytest.fixture
+def round_trips(monkeypatch):
+    """Count pipeline executions and standalone commands."""
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    counter = {"n": 0}
+    real_command = POPOTO_REDIS_DB.execute_command
+    real_pipeline = POPOTO_REDIS_DB.pipeline
+
+    def command(*args, **kwargs):
+        counter["n"] += 1
+        return real_command(*args, **kwargs)
+
+    def pipeline(*args, **kwargs):
+        pipe = real_pipeline(*args, **kwargs)
+        real_execute = pipe.execute
+
+        def execute(*a, **kw):
+            counter["n"] += 1
+            return real_execute(*a, **kw)
+
+        pipe.execute = execute
+        return pipe
+
+    monkeypatch.setattr(POPOTO_REDIS_DB, "execute_command", command)
+    monkeypatch.setattr(POPOTO_REDIS_DB, "pipeline", pipeline)
+    return counter
+
+
+def _mint(room_id, count):
+    return [Job.mint(room_id, f"task {i}") for i in range(count)]
+
+
+def test_bulk_get_keeps_order_and_drops_missing(room_id, round_trips):
+    jobs = _mint(room_id, 4)
+    keys = [job.db_key.redis_key for job in reversed(jobs)]
+    keys.insert(1, "Job:test-no-such-hash:nowhere")
+    round_trips["n"] = 0
+
+    found = bulk_get(Job, [k.encode() for k in keys])
+
+    assert [job.job_id for job in found] == [job.job_id for job in reversed(jobs)]
+    assert round_trips["n"] == 1
+
+
+def test_bulk_get_batches_round_trips(room_id, round_trips):
+    jobs = _mint(room_id, 7)
+    keys = [job.db_key.redis_key for job in jobs]
+    round_trips["n"] = 0
+
+    assert len(bulk_get(Job, keys, batch_size=3)) == 7
+    assert round_trips["n"] == 3
+
+
+def test_bulk_get_filters_phantoms(room_id, monkeypatch):
+    jobs = _mint(room_id, 2)
+    real_get_many = Job.query.get_many
+
+    def with_phantom(keys, **kwargs):
+        found = real_get_many(keys, **kwargs)
+        object.__setattr__(found[0], "room_id", Field())  # Key field never hydrated
+        return found
+
+    monkeypatch.setattr(Job.query, "get_many", with_phantom)
+
+    found = bulk_get(Job, [job.db_key.redis_key for job in jobs])
+
+    assert [job.job_id for job in found] == [jobs[1].job_id]
+
+
+def test_bulk_get_by_key_and_lazy_rows(room_id):
+    jobs = _mint(room_id, 3)
+    keys = [job.db_key.redis_key for job in jobs]
+
+    eager = bulk_get_by_key(Job, keys)
+    lazy = bulk_get_by_key(Job, [*keys, "Job:test-no-such-hash:nowhere"], lazy=True)
+
+    assert list(eager) == keys
+    assert sorted(lazy) == sorted(keys)
+    assert lazy[keys[0]].goal == jobs[0].goal
+
+
+def test_top_n_pages_newest_first(room_id, round_trips):
+    jobs = _mint(room_id, 12)
+    newest_first = [job.job_id for job in reversed(jobs)]
+    round_trips["n"] = 0
+
+    first = top_n_by_sorted_field(Job, "last_active_at", room_id, 5)
+    assert round_trips["n"] == 2  # One range read, one hydration batch
+
+    second = top_n_by_sorted_field(
+        Job, "last_active_at", room_id, 5, before=first[-1].last_active_at
+    )
+    last = top_n_by_sorted_field(
+        Job, "last_active_at", room_id, 5, before=second[-1].last_active_at
+    )
+
+    assert [job.job_id for job in first + second + last] == newest_first
+
+
+def test_top_n_before_accepts_a_raw_score(room_id):
+    jobs = _mint(room_id, 3)
+    cutoff = jobs[1].last_active_at + timedelta(microseconds=1)
+    score = bulk_read.sorted_field_score(Job, "last_active_at", cutoff)
+
+    found = top_n_by_sorted_field(Job, "last_active_at", room_id, 5, before=score)
+
+    assert [job.job_id for job in found] == [jobs[1].job_id, jobs[0].job_id]
+
+
+def test_top_n_empty_partition_and_zero_n(room_id):
+    assert top_n_by_sorted_field(Job, "last_active_at", room_id, 5) == []
+    _mint(room_id, 1)
+    assert top_n_by_sorted_field(Job, "last_active_at", room_id, 0) == []
@@ -0,0 +1,142 @@
+"""Tests for the CLI command server fast path (tools/cli_server.py, tools/cli_client.py).
+
+Covers the startup budget the thin client exists for, the in-process fallback
+when no server listens, and a real round trip through a server subprocess
+(output on the caller's stdio, exit codes passed through).
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from tests.db_claim import subprocess_env
+from tools import cli_client
+
+pytestmark = [pytest.mark.unit, pytest.mark.tools]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Seconds `import tools.cli_client` may take in a fresh interpreter. A cold
+# `python -m tools.sdlc_stage_query` spends ~2s importing popoto, settings and
+# models; the client must stay orders of magnitude under that, so anything
+# near this budget means a heavy import leaked into it.
+CLIENT_IMPORT_BUDGET_S = 0.25
+
+HEAVY_PREFIXES = ("popoto", "pydantic", "redis", "models", "config", "agent")
+
+
+def _short_socket() -> Path:
+    # AF_UNIX paths are capped at ~104 bytes on macOS; pytest's tmp_path is not.
+    return Path("/tmp") / f"vcs-test-{uuid.uuid4().hex[:8]}.sock"
+
+
+class _Server:
+    """A command server subprocess on a private socket, stoppable mid-test."""
+
+    def __init__(self):
+        self.sock = _short_socket()
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "tools.cli_server", "--socket", str(self.sock), "--no-preload"],
+            cwd=REPO_ROOT,
+            env=subprocess_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        deadline = time.monotonic() + 30
+        while not self.sock.exists():
+            if self.proc.poll() is not None or time.monotonic() > deadline:
+                self.proc.kill()
+                pytest.fail(f"command server did not start: {self.proc.communicate()[0]}")
+            time.sleep(0.05)
+
+    def stop(self) -> str:
+        """Terminate the server and return its log."""
+        if self.proc.returncode is None:
+            self.proc.terminate()
+        return self.proc.communicate(timeout=10)[0]
+
+
+@pytest.fixture
+def server():
+    srv = _Server()
+    yield srv
+    srv.stop()
+    assert not srv.sock.exists(), "server must remove its socket on exit"
+
+
+def _client(sock: Path, *args: str, **env) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "tools.cli_client", *args],
+        cwd=REPO_ROOT,
+        env=subprocess_env(VALOR_CLI_SOCKET=str(sock), **env),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+class TestStartupBudget:
+    def test_client_import_is_stdlib_only_and_within_budget(self):
+        code = (
+            "import sys, time; t = time.perf_counter(); import tools.cli_client; "
+            "print(time.perf_counter() - t); "
+            f"print(sorted(m for m in sys.modules if m.startswith({HEAVY_PREFIXES!r})))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT,
+            env=subprocess_env(),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, heavy = out.stdout.strip().splitlines()[-2:]
+        assert heavy == "[]"
+        assert float(elapsed) < CLIENT_IMPORT_BUDGET_S
+
+
+class TestFallback:
+    def test_no_socket_runs_in_process(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("VALOR_CLI_SOCKET", str(tmp_path / "absent.sock"))
+        assert cli_client.run_via_server("tools.sdlc_next_skill", ["--help"]) is None
+
+        assert cli_client.run("tools.sdlc_next_skill", ["--help"]) == 0
+        assert "usage" in capsys.readouterr().out.lower()
+
+    def test_unserved_module_never_uses_server(self, monkeypatch):
+        monkeypatch.setenv("VALOR_CLI_SOCKET", "/nonexistent")
+        assert cli_client.run_via_server("tools.doctor", []) is None
+
+    def test_exit_code_mapping(self):
+        assert cli_client._exit_code(None) == 0
+        assert cli_client._exit_code(3) == 3
+        assert cli_client._exit_code("boom") == 1
+
+
+class TestRoundTrip:
+    def test_output_and_exit_code_come_from_server(self, server):
+        ok = _client(server.sock, "sdlc_next_skill", "--help")
+        bad = _client(server.sock, "sdlc_next_skill", "--no-such-flag")
+        log = server.stop()
+
+        assert ok.returncode == 0
+        assert "usage" in ok.stdout.lower()
+        assert "RuntimeWarning" not in ok.stderr
+        assert bad.returncode == 2
+        assert "unrecognized arguments" in bad.stderr
+        assert log.count("tools.sdlc_next_skill") == 2
+
+    def test_fast_path_disabled_skips_server(self, server):
+        result = _client(server.sock, "sdlc_next_skill", "--help", VALOR_CLI_FAST_PATH="0")
+        log = server.stop()
+
+        assert result.returncode == 0
+        assert "usage" in result.stdout.lower()
+        assert "tools.sdlc_next_skill" not in log
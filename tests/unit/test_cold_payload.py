@@ -0,0 +1,177 @@
+"""Tests for the AgentSession hot/cold payload split (models/cold_payload.py).
+
+Covers the attribute contract (reads are unchanged whether a payload is inline
+or cold), what lands in the core hash vs. the side hash, the write-avoidance
+rules, and cleanup on shrink and delete.
+"""
+
+import time
+
+import pytest
+
+from config.enums import SessionType
+from models.agent_session import AgentSession
+from models.cold_payload import (
+    COLD_PAYLOAD_MIN_BYTES,
+    cold_key,
+    is_cold_marker,
+    prefetch_cold_payloads,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.sessions, pytest.mark.models]
+
+HEAVY_EVENTS = [{"event_type": "log", "text": "x" * 400} for _ in range(10)]
+
+
+@pytest.fixture
+def redis():
+    import popoto.redis_db as rdb
+
+    return rdb.POPOTO_REDIS_DB
+
+
+def _make_session(**extra) -> AgentSession:
+    return AgentSession.create(
+        project_key=extra.pop("project_key", "test-cold-payload"),
+        chat_id="cold-chat",
+        session_type=SessionType.ENG,
+        session_id=f"cold-{time.time_ns()}",
+        working_dir="/tmp",
+        status="running",
+        **extra,
+    )
+
+
+class TestStorage:
+    def test_large_payload_moves_to_side_hash(self, redis):
+        session = _make_session(session_events=HEAVY_EVENTS)
+        key = session.db_key.redis_key
+
+        assert len(redis.hget(key, "session_events")) < 32
+        assert redis.hkeys(cold_key(key)) == [b"session_events"]
+        assert redis.ttl(cold_key(key)) > 0
+
+    def test_small_payload_stays_inline(self, redis):
+        session = _make_session(extra_context={"classification_type": "bug"})
+        key = session.db_key.redis_key
+
+        assert redis.hkeys(cold_key(key)) == []
+        assert AgentSession.get_by_id(session.id).extra_context == {"classification_type": "bug"}
+
+    def test_cold_read_round_trips(self):
+        config = {"notes": "z" * (COLD_PAYLOAD_MIN_BYTES * 2)}
+        session = _make_session(session_events=HEAVY_EVENTS, project_config=config)
+
+        loaded = AgentSession.get_by_id(session.id)
+        assert loaded.session_events == HEAVY_EVENTS
+        assert loaded.project_config == config
+        assert not is_cold_marker(loaded.session_events)
+
+    def test_legacy_inline_payload_reads_and_migrates_on_save(self, redis):
+        import msgpack
+
+        session = _make_session()
+        key = session.db_key.redis_key
+        # A row written before the split: the payload sits in the core hash.
+        redis.hset(key, "session_events", msgpack.packb(HEAVY_EVENTS))
+
+        loaded = AgentSession.get_by_id(session.id)
+        assert loaded.session_events == HEAVY_EVENTS
+        loaded.save()
+        assert redis.hkeys(cold_key(key)) == [b"session_events"]
+        assert AgentSession.get_by_id(session.id).session_events == HEAVY_EVENTS
+
+    def test_lazy_row_resolves_cold_fields_through_the_descriptor(self):
+        from popoto import Model
+
+        session = _make_session(session_events=HEAVY_EVENTS, extra_context={"k": "v"})
+
+        loaded = AgentSession.query.filter(session_id=session.session_id)[0]
+        # Only the cold fields are hooked; everything else reads as on popoto.
+        assert AgentSession.__getattribute__ is Model.__getattribute__
+        assert "session_events" in loaded.__dict__["_cold_raw"]
+        assert loaded.extra_context == {"k": "v"}
+        assert loaded.session_events == HEAVY_EVENTS
+        assert "session_events" not in loaded.__dict__["_cold_raw"]
+
+    def test_prefetch_resolves_a_row_set_without_per_row_reads(self, monkeypatch):
+        project = f"test-cold-prefetch-{time.time_ns()}"
+        for _ in range(3):
+            _make_session(session_events=HEAVY_EVENTS, project_key=project)
+        rows = list(AgentSession.query.filter(project_key=project))
+
+        assert prefetch_cold_payloads(rows, ("session_events",)) == 3
+        monkeypatch.setattr(
+            AgentSession, "_load_cold_payload", lambda *a: pytest.fail("per-row HGET")
+        )
+        assert all(row.session_events == HEAVY_EVENTS for row in rows)
+        assert prefetch_cold_payloads(rows, ("session_events",)) == 0
+
+
+class TestWrites:
+    def test_scalar_save_does_not_rewrite_unread_payload(self, redis):
+        session = _make_session(session_events=HEAVY_EVENTS)
+        key = session.db_key.redis_key
+        redis.hset(cold_key(key), "session_events", b"sentinel")
+
+        loaded = AgentSession.get_by_id(session.id)
+        loaded.status = "completed"
+        loaded.save()
+
+        assert redis.hget(cold_key(key), "session_events") == b"sentinel"
+
+    def test_unchanged_loaded_payload_is_not_resent(self, redis):
+        session = _make_session(session_events=HEAVY_EVENTS)
+        key = session.db_key.redis_key
+        loaded = AgentSession.get_by_id(session.id)
+        assert loaded.session_events == HEAVY_EVENTS
+
+        redis.hset(cold_key(key), "other", b"untouched")
+        before = redis.hget(cold_key(key), "session_events")
+        loaded.save()
+        assert redis.hget(cold_key(key), "session_events") == before
+
+    def test_in_place_mutation_is_persisted(self):
+        session = _make_session(session_events=list(HEAVY_EVENTS))
+        loaded = AgentSession.get_by_id(session.id)
+        loaded.session_events.append({"event_type": "log", "text": "new"})
+        loaded.save(update_fields=["session_events", "updated_at"])
+
+        assert AgentSession.get_by_id(session.id).session_events[-1]["text"] == "new"
+
+    def test_shrunk_payload_returns_inline(self, redis):
+        session = _make_session(session_events=HEAVY_EVENTS)
+        key = session.db_key.redis_key
+        loaded = AgentSession.get_by_id(session.id)
+        loaded.session_events = [{"event_type": "log", "text": "short"}]
+        loaded.save()
+
+        assert redis.hkeys(cold_key(key)) == []
+        assert AgentSession.get_by_id(session.id).session_events[0]["text"] == "short"
+
+    def test_delete_drops_side_hash(self, redis):
+        session = _make_session(session_events=HEAVY_EVENTS)
+        key = session.db_key.redis_key
+        AgentSession.get_by_id(session.id).delete()
+
+        assert not redis.exists(cold_key(key))
+
+    def test_missing_payload_reads_default(self, redis):
+        session = _make_session(chat_message_log=[{"content": "m" * 2000}])
+        redis.delete(cold_key(session.db_key.redis_key))
+
+        assert AgentSession.get_by_id(session.id).chat_message_log == []
+
+
+class TestHashSize:
+    def test_core_hash_shrinks(self, redis):
+        session = _make_session(
+            session_events=HEAVY_EVENTS,
+            extra_context={"revival_context": "y" * 2000},
+            project_config={"notes": "z" * 2000},
+        )
+        key = session.db_key.redis_key
+        core = sum(len(k) + len(v) for k, v in redis.hgetall(key).items())
+        cold = sum(len(v) for v in redis.hgetall(cold_key(key)).values())
+
+        assert core * 3 < cold
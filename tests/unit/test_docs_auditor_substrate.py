@@ -774,6 +774,143 @@ class TestStaleTermWordBoundary:
         assert "AgentSession" not in text
 
 
+# ---------------------------------------------------------------------------
+# TestStaleTermScanner — one pass over every stale term and path token
+# ---------------------------------------------------------------------------
+
+
+class TestStaleTermScanner:
+    TERMS = ("SessionLog", "session_log", "redis_job")
+
+    def test_reports_terms_outside_path_tokens_only(self):
+        content = (
+            "The session_log field is written on exit.\n"
+            "The shim lives in `models/redis_job.py` and `SessionLog.md`.\n"
+        )
+        assert docs_auditor._stale_terms_present(content, self.TERMS) == {"session_log"}
+
+    def test_longer_key_wins_over_its_prefix(self):
+        terms = ("Session", "SessionLog")
+        assert docs_auditor._stale_terms_present("A SessionLog row.", terms) == {"SessionLog"}
+
+    def test_path_only_occurrence_queues_no_fix(self):
+        """Gate 3 would suppress every hit, so detection reports the doc clean."""
+        content = "The backward-compat shim lives in `models/session_log.py`.\n"
+        assert docs_auditor._detect_stale_term_fixes(content) == []
+
+    def test_detection_matches_a_per_term_search(self):
+        content = (
+            "| `agent/session_logs.py` | RedisJob rows | the redis_job key |\n"
+            "See `docs/SessionLog.md`; session_log_writer is unrelated.\n"
+        )
+        expected = [
+            (rf"\b{re.escape(old)}\b", new)
+            for old, new in docs_auditor.STALE_TERMS.items()
+            if re.search(rf"\b{re.escape(old)}\b", re.sub(docs_auditor._PATH_TOKEN_RE, "", content))
+        ]
+        assert _stale_pairs(content) == expected
+
+
+# ---------------------------------------------------------------------------
+# TestDocScanCache — per-document results keyed on what they depend on
+# ---------------------------------------------------------------------------
+
+
+class TestDocScanCache:
+    @pytest.fixture()
+    def docs(self, git_repo):
+        docs_auditor._BASENAME_INDEX_CACHE.clear()
+        docs_auditor._BASENAME_INDEX_DIGEST.clear()
+        (git_repo / "docs" / "features" / "a.md").write_text("The SessionLog holds state.\n")
+        (git_repo / "docs" / "features" / "b.md").write_text("See `agent/gone.py`.\n")
+        yield [Path("docs/features/a.md"), Path("docs/features/b.md")]
+        docs_auditor._BASENAME_INDEX_CACHE.clear()
+        docs_auditor._BASENAME_INDEX_DIGEST.clear()
+        docs_auditor._get_redis().delete(docs_auditor.REDIS_DOC_SCAN_CACHE)
+
+    def _scan(self, repo, paths):
+        docs_auditor._BASENAME_INDEX_CACHE.clear()  # audit() clears it per run
+        docs_auditor._BASENAME_INDEX_DIGEST.clear()
+        documents = [(p, (repo / p).read_text()) for p in paths]
+        with patch.object(
+            docs_auditor, "_scan_document", wraps=docs_auditor._scan_document
+        ) as scan:
+            result = docs_auditor._scan_documents(documents, repo)
+        return result, [Path(c.args[0]) for c in scan.call_args_list]
+
+    def test_unchanged_docs_are_served_from_cache(self, git_repo, docs):
+        first, scanned = self._scan(git_repo, docs)
+        assert scanned == docs
+
+        second, scanned = self._scan(git_repo, docs)
+        assert scanned == []
+        assert [[(p.pattern, new) for p, new in fixes] for fixes, _ in second] == [
+            [(r"\bSessionLog\b", "AgentSession")],
+            [],
+        ]
+        assert second[1][1] == first[1][1]
+        assert second[1][1][0]["category"] == "deleted-target"
+
+    def test_only_the_edited_doc_is_rescanned(self, git_repo, docs):
+        self._scan(git_repo, docs)
+        (git_repo / docs[1]).write_text("Nothing stale here.\n")
+
+        result, scanned = self._scan(git_repo, docs)
+
+        assert scanned == [docs[1]]
+        assert [f["category"] for f in result[1][1]] == ["stub-doc"]
+
+    def test_repo_listing_change_rescans_everything(self, git_repo, docs):
+        self._scan(git_repo, docs)
+        (git_repo / "agent").mkdir()
+        (git_repo / "agent" / "gone.py").write_text("")
+
+        result, scanned = self._scan(git_repo, docs)
+
+        assert scanned == docs
+        assert [f["category"] for f in result[1][1]] == ["stub-doc"]
+
+    def test_stale_terms_edit_rescans_everything(self, git_repo, docs, monkeypatch):
+        self._scan(git_repo, docs)
+        monkeypatch.setitem(docs_auditor.STALE_TERMS, "holds", "keeps")
+
+        _, scanned = self._scan(git_repo, docs)
+
+        assert scanned == docs
+
+    def test_degraded_index_bypasses_the_cache(self, repo):
+        (repo / "docs" / "features" / "a.md").write_text("The SessionLog holds state.\n")
+        paths = [Path("docs/features/a.md")]
+
+        self._scan(repo, paths)  # not a git checkout: no listing digest
+        _, scanned = self._scan(repo, paths)
+
+        assert scanned == paths
+
+    def test_audit_reuses_cached_scans(self, git_repo, docs, auth_ok):
+        with patch.object(docs_auditor, "_resolve_pr_changed_files", return_value=docs):
+            docs_auditor.audit(
+                scope_mode="pr-changed-files", apply_mode="dry-run", repo_root=git_repo
+            )
+            with patch.object(docs_auditor, "_scan_document") as scan:
+                docs_auditor.audit(
+                    scope_mode="pr-changed-files", apply_mode="dry-run", repo_root=git_repo
+                )
+        scan.assert_not_called()
+
+    def test_process_pool_matches_in_process_scan(self, git_repo, docs, monkeypatch):
+        documents = [(p, (git_repo / p).read_text()) for p in docs]
+        serial = docs_auditor._run_scans(documents, git_repo, dict(docs_auditor.STALE_TERMS))
+        monkeypatch.setattr(docs_auditor, "DOC_SCAN_PARALLEL_MIN_DOCS", 1)
+        monkeypatch.setattr(docs_auditor, "DOC_SCAN_WORKERS", 2)
+
+        with patch.object(docs_auditor.logger, "warning") as warning:
+            pooled = docs_auditor._run_scans(documents, git_repo, dict(docs_auditor.STALE_TERMS))
+
+        warning.assert_not_called()
+        assert pooled == serial
+
+
 # ---------------------------------------------------------------------------
 # TestExistenceInvariant — no fix may introduce an absent repo path
 # ---------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 """Tests for the DocumentChunk model."""
 
+import numpy as np
 import pytest
 
 
@@ -80,8 +81,9 @@ def stubbed_search_pipeline(monkeypatch):
 
     - EmbeddingField.on_save -> no-op (no network on chunk.save()).
     - OpenAIProvider -> fixed query vector (no network on search()).
-    - EmbeddingField.load_embeddings -> the saved chunk's id with a vector
-      identical to the query vector (cosine similarity 1.0).
+    - EmbeddingField.load_embeddings -> a one-row matrix holding a vector
+      identical to the query vector (cosine similarity 1.0), keyed by the
+      saved chunk's Redis key -- the real ``(matrix, redis_keys)`` shape.
 
     Yields the saved DocumentChunk; ORM-deletes test rows on teardown.
     """
@@ -114,7 +116,12 @@ def stubbed_search_pipeline(monkeypatch):
     monkeypatch.setattr(
         EmbeddingField,
         "load_embeddings",
-        classmethod(lambda cls, model_cls, **kw: {chunk.chunk_id: list(vector)}),
+        classmethod(
+            lambda cls, model_cls, **kw: (
+                np.array([vector], dtype=np.float32),
+                [chunk.db_key.redis_key],
+            )
+        ),
     )
 
     try:
@@ -5,9 +5,11 @@ the standard library. SMTP is mocked via unittest.mock.patch to avoid network
 calls.
 """
 
+import email
 import email.message
 import email.mime.multipart
 import email.mime.text
+import re
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -734,95 +736,270 @@ class TestEmailOutputHandlerSend:
 # ---------------------------------------------------------------------------
 
 
+class _FakeImapServer:
+    """In-memory IMAP account standing in for the server behind ``imaplib``.
+
+    Speaks the subset ``_poll_imap`` uses — UID SEARCH (UNSEEN + FROM
+    substrings), UID STORE +/-FLAGS \\Seen and UID FETCH (UID RFC822) over
+    UID sets — and answers in imaplib's response shapes.
+    """
+
+    def __init__(self):
+        self.mailboxes: dict[str, dict[int, dict]] = {}
+        self.commands: list[tuple[str, str, bytes]] = []
+        self.withheld: set[int] = set()  # UIDs FETCH silently omits
+
+    def deliver(self, mailbox: str, uid: int, raw: bytes) -> None:
+        sender = email.message_from_bytes(raw)["From"] or ""
+        self.mailboxes.setdefault(mailbox, {})[uid] = {"raw": raw, "from": sender, "seen": False}
+
+    def seen(self, mailbox: str) -> set[int]:
+        return {uid for uid, m in self.mailboxes[mailbox].items() if m["seen"]}
+
+    def connect(self, host, port, timeout=None):
+        conn = MagicMock()
+        state = {"mailbox": None}
+
+        def _select(mailbox):
+            state["mailbox"] = mailbox
+            return ("OK", [str(len(self.mailboxes.get(mailbox, {}))).encode()])
+
+        def _uids(uid_set: bytes) -> list[int]:
+            found = []
+            for part in uid_set.decode().split(","):
+                lo, _, hi = part.partition(":")
+                found.extend(range(int(lo), int(hi or lo) + 1))
+            return [u for u in found if u in self.mailboxes[state["mailbox"]]]
+
+        def _uid(command, *args):
+            box = self.mailboxes.get(state["mailbox"], {})
+            self.commands.append((state["mailbox"], command, args[0] or b""))
+            if command == "search":
+                senders = re.findall(r'FROM "([^"]+)"', args[1])
+                hits = [
+                    str(u).encode()
+                    for u, m in sorted(box.items())
+                    if not m["seen"] and any(s in m["from"] for s in senders)
+                ]
+                return ("OK", [b" ".join(hits)])
+            if command == "store":
+                for u in _uids(args[0]):
+                    box[u]["seen"] = args[1] == "+FLAGS"
+                return ("OK", [])
+            if command == "fetch":
+                data = []
+                for seq, u in enumerate(_uids(args[0]), start=1):
+                    if u in self.withheld:
+                        continue
+                    raw = box[u]["raw"]
+                    data.append((b"%d (UID %d RFC822 {%d}" % (seq, u, len(raw)), raw))
+                    data.append(b")")
+                return ("OK", data)
+            return ("BAD", [b"unsupported"])
+
+        conn.select.side_effect = _select
+        conn.uid.side_effect = _uid
+        return conn
+
+
+@pytest.fixture
+def imap_server():
+    server = _FakeImapServer()
+    with patch("bridge.email_bridge.imaplib.IMAP4_SSL", side_effect=server.connect):
+        yield server
+
+
+IMAP_CONFIG = {
+    "host": "imap.example.com",
+    "port": 993,
+    "user": "test@example.com",
+    "password": "secret",
+    "ssl": True,
+}
+
+
 class TestPollImapBatchCap:
     """_poll_imap() caps fetches to IMAP_MAX_BATCH per poll cycle."""
 
     @pytest.mark.asyncio
-    async def test_batch_cap_limits_fetched_messages(self):
-        """When IMAP returns more than IMAP_MAX_BATCH unseen UIDs, only
-        IMAP_MAX_BATCH are stored+fetched and returned."""
+    async def test_batch_cap_limits_fetched_messages(self, imap_server):
+        """When IMAP returns more than IMAP_MAX_BATCH unseen UIDs, only the
+        newest IMAP_MAX_BATCH are stored+fetched, in one command each."""
         total_unseen = IMAP_MAX_BATCH + 10
-        fake_uids = b" ".join(str(i).encode() for i in range(1, total_unseen + 1))
-
-        def _uid_side_effect(command, *args):
-            cmd = command.lower()
-            if cmd == "search":
-                return ("OK", [fake_uids])
-            if cmd == "store":
-                return ("OK", [])
-            if cmd == "fetch":
-                return ("OK", [(b"1", b"raw email bytes")])
-            return ("OK", [])
-
-        mock_conn = MagicMock()
-        mock_conn.login.return_value = ("OK", [])
-        mock_conn.select.return_value = ("OK", [])
-        mock_conn.uid.side_effect = _uid_side_effect
-
-        imap_config = {
-            "host": "imap.example.com",
-            "port": 993,
-            "user": "test@example.com",
-            "password": "secret",
-            "ssl": True,
-        }
+        for uid in range(1, total_unseen + 1):
+            imap_server.deliver("INBOX", uid, _make_plain_email(message_id=f"<m{uid}@x>"))
 
-        with patch("bridge.email_bridge.imaplib.IMAP4_SSL", return_value=mock_conn):
-            # Patch asyncio.to_thread to call the sync function directly
-            with patch(
-                "bridge.email_bridge.asyncio.to_thread",
-                side_effect=lambda fn: fn(),
-            ):
-                result = await _poll_imap(imap_config, known_senders=["sender@example.com"])
+        result = await _poll_imap(IMAP_CONFIG, known_senders=["alice@example.com"])
 
-        store_calls = [c for c in mock_conn.uid.call_args_list if c.args[0].lower() == "store"]
-        fetch_calls = [c for c in mock_conn.uid.call_args_list if c.args[0].lower() == "fetch"]
-        assert len(store_calls) == IMAP_MAX_BATCH
-        assert len(fetch_calls) == IMAP_MAX_BATCH
-        assert len(result) == IMAP_MAX_BATCH
+        newest = list(range(11, total_unseen + 1))
+        assert [int(uid) for uid, _ in result] == newest
+        assert parse_email_message(result[0][1])["message_id"] == "<m11@x>"
+        assert [c[1:] for c in imap_server.commands if c[1] != "search"] == [
+            ("store", b"11:30"),
+            ("fetch", b"11:30"),
+        ]
+        assert imap_server.seen("INBOX") == set(newest)
 
     @pytest.mark.asyncio
-    async def test_batch_cap_exact_boundary(self):
+    async def test_batch_cap_exact_boundary(self, imap_server):
         """When IMAP returns exactly IMAP_MAX_BATCH UIDs, all are fetched
         (no truncation)."""
-        fake_uids = b" ".join(str(i).encode() for i in range(1, IMAP_MAX_BATCH + 1))
-
-        def _uid_side_effect(command, *args):
-            cmd = command.lower()
-            if cmd == "search":
-                return ("OK", [fake_uids])
-            if cmd == "store":
-                return ("OK", [])
-            if cmd == "fetch":
-                return ("OK", [(b"1", b"raw email bytes")])
-            return ("OK", [])
-
-        mock_conn = MagicMock()
-        mock_conn.login.return_value = ("OK", [])
-        mock_conn.select.return_value = ("OK", [])
-        mock_conn.uid.side_effect = _uid_side_effect
-
-        imap_config = {
-            "host": "imap.example.com",
-            "port": 993,
-            "user": "test@example.com",
-            "password": "secret",
-            "ssl": True,
-        }
+        for uid in range(1, IMAP_MAX_BATCH + 1):
+            imap_server.deliver("INBOX", uid, _make_plain_email(message_id=f"<m{uid}@x>"))
 
-        with patch("bridge.email_bridge.imaplib.IMAP4_SSL", return_value=mock_conn):
-            with patch(
-                "bridge.email_bridge.asyncio.to_thread",
-                side_effect=lambda fn: fn(),
-            ):
-                result = await _poll_imap(imap_config, known_senders=["sender@example.com"])
+        result = await _poll_imap(IMAP_CONFIG, known_senders=["alice@example.com"])
 
-        store_calls = [c for c in mock_conn.uid.call_args_list if c.args[0].lower() == "store"]
-        fetch_calls = [c for c in mock_conn.uid.call_args_list if c.args[0].lower() == "fetch"]
-        assert len(store_calls) == IMAP_MAX_BATCH
-        assert len(fetch_calls) == IMAP_MAX_BATCH
         assert len(result) == IMAP_MAX_BATCH
 
+    @pytest.mark.asyncio
+    async def test_unknown_senders_and_gaps(self, imap_server):
+        """Unknown senders stay UNSEEN; non-contiguous UIDs share one set."""
+        for uid in (3, 4, 5, 9):
+            imap_server.deliver("INBOX", uid, _make_plain_email(message_id=f"<m{uid}@x>"))
+        imap_server.deliver("INBOX", 7, _make_plain_email(from_addr="mallory@evil.test"))
+
+        result = await _poll_imap(IMAP_CONFIG, known_senders=["alice@example.com"])
+
+        assert [uid for uid, _ in result] == [b"3", b"4", b"5", b"9"]
+        assert ("INBOX", "fetch", b"3:5,9") in imap_server.commands
+        assert imap_server.seen("INBOX") == {3, 4, 5, 9}
+
+    @pytest.mark.asyncio
+    async def test_unfetched_uids_are_unmarked(self, imap_server):
+        for uid in (1, 2, 3):
+            imap_server.deliver("INBOX", uid, _make_plain_email(message_id=f"<m{uid}@x>"))
+        imap_server.withheld = {2}
+
+        result = await _poll_imap(IMAP_CONFIG, known_senders=["alice@example.com"])
+
+        assert [uid for uid, _ in result] == [b"1", b"3"]
+        assert imap_server.seen("INBOX") == {1, 3}
+
+
+class TestMultiMailboxIngest:
+    """The poll loop fans out over IMAP_MAILBOXES and ingests the batch."""
+
+    def test_mailboxes_from_env(self, monkeypatch):
+        monkeypatch.setenv("IMAP_HOST", "imap.example.com")
+        monkeypatch.setenv("IMAP_USER", "u")
+        monkeypatch.setenv("IMAP_PASSWORD", "p")
+        monkeypatch.setenv("IMAP_MAILBOXES", "INBOX, Clients ,")
+
+        assert eb._get_imap_config()["mailboxes"] == ["INBOX", "Clients"]
+
+    @pytest.mark.asyncio
+    async def test_polls_each_mailbox(self, imap_server):
+        imap_server.deliver("INBOX", 1, _make_plain_email(message_id="<a@x>"))
+        imap_server.deliver("Clients", 40, _make_plain_email(message_id="<b@x>"))
+        config = {**IMAP_CONFIG, "mailboxes": ["INBOX", "Clients", "Missing"]}
+
+        messages, errors = await eb._poll_mailboxes(config, ["alice@example.com"])
+
+        assert [(box["mailbox"], uid) for box, uid, _ in messages] == [
+            ("INBOX", b"1"),
+            ("Clients", b"40"),
+        ]
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_failed_mailbox_is_reported_not_fatal(self, imap_server):
+        imap_server.deliver("INBOX", 1, _make_plain_email())
+        real_poll = eb._poll_imap
+
+        async def flaky(box_config, senders):
+            if box_config["mailbox"] == "Clients":
+                raise OSError("connection reset")
+            return await real_poll(box_config, senders)
+
+        config = {**IMAP_CONFIG, "mailboxes": ["INBOX", "Clients"]}
+        with patch("bridge.email_bridge._poll_imap", side_effect=flaky):
+            messages, errors = await eb._poll_mailboxes(config, ["alice@example.com"])
+
+        assert len(messages) == 1
+        assert [str(e) for e in errors] == ["connection reset"]
+
+    @pytest.mark.asyncio
+    async def test_ingest_records_per_mailbox_and_keeps_thread_order(self, history_redis):
+        import asyncio
+        import json as _json
+
+        order: list[str] = []
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_process(parsed, config, imap_uid=None, imap_config=None):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.05)
+            order.append(f"{imap_config['mailbox']}:{parsed['message_id']}")
+            in_flight["now"] -= 1
+
+        inbox = {**IMAP_CONFIG, "mailbox": "INBOX"}
+        clients = {**IMAP_CONFIG, "mailbox": "Clients"}
+        messages = [
+            (inbox, b"1", _make_plain_email(subject="Plan", message_id="<root@x>")),
+            (clients, b"7", _make_plain_email(from_addr="bob@b.test", message_id="<other@x>")),
+            (
+                inbox,
+                b"2",
+                _make_plain_email(subject="Re: Plan", message_id="<r1@x>", in_reply_to="<root@x>"),
+            ),
+        ]
+        with patch("bridge.email_bridge._process_inbound_email", side_effect=fake_process):
+            await eb._ingest_messages(messages, config={})
+
+        assert order.index("INBOX:<root@x>") < order.index("INBOX:<r1@x>")
+        assert in_flight["max"] == 2  # Two conversations, processed side by side
+        assert history_redis.zscore(HISTORY_SET_KEY.format(mailbox="Clients"), "<other@x>")
+        assert history_redis.zcard(HISTORY_SET_KEY.format(mailbox="INBOX")) == 2
+        thread = _json.loads(history_redis.hget(HISTORY_THREADS_KEY, "<root@x>"))
+        assert thread["message_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_ingest_unmarks_a_message_that_fails_to_prepare(self, history_redis):
+        processed: list[str] = []
+        unmarked: list[tuple[str, bytes]] = []
+
+        async def fake_process(parsed, config, imap_uid=None, imap_config=None):
+            processed.append(parsed["message_id"])
+
+        async def fake_unmark(imap_config, uid):
+            unmarked.append((imap_config["mailbox"], uid))
+
+        real_prepare = eb._prepare_inbound
+
+        def flaky_prepare(raw):
+            if b"<bad@x>" in raw:
+                raise RuntimeError("disk full")
+            return real_prepare(raw)
+
+        inbox = {**IMAP_CONFIG, "mailbox": "INBOX"}
+        messages = [
+            (inbox, b"1", _make_plain_email(subject="One", message_id="<good@x>")),
+            (inbox, b"2", _make_plain_email(subject="Two", message_id="<bad@x>")),
+        ]
+        with (
+            patch("bridge.email_bridge._prepare_inbound", side_effect=flaky_prepare),
+            patch("bridge.email_bridge._process_inbound_email", side_effect=fake_process),
+            patch("bridge.email_bridge._unmark_seen", side_effect=fake_unmark),
+        ):
+            await eb._ingest_messages(messages, config={})
+
+        assert processed == ["<good@x>"]
+        assert unmarked == [("INBOX", b"2")]
+
+    def test_coalescing_groups(self):
+        groups = eb._coalescing_groups(
+            [
+                {"from_addr": "a@x", "subject": "One", "message_id": "<1>"},
+                {"from_addr": "b@x", "subject": "Two", "message_id": "<2>"},
+                {"from_addr": "c@x", "subject": "Re: two", "message_id": "<3>"},
+                {"from_addr": "d@x", "subject": "", "message_id": "<4>", "in_reply_to": "<1>"},
+                {"from_addr": "A@x", "subject": "Other", "message_id": "<5>"},
+            ]
+        )
+
+        assert sorted(groups) == [[0, 3, 4], [1, 2]]
+
 
 # ---------------------------------------------------------------------------
 # main() env loading
@@ -1,15 +1,32 @@
 """Tests for tools/emoji_embedding.py -- emoji embedding index.
 
-Tests label completeness, fallback behavior, cache round-trip, and
-embedding-based emoji selection.
+Tests label completeness, fallback behavior, cache round-trip,
+embedding-based emoji selection, and the persistent query-embedding cache.
 """
 
+import asyncio
 import json
 import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Start each test with empty in-memory caches.
+
+    ``QUERY_CACHE_PATH`` itself is redirected per test by the autouse
+    ``isolate_emoji_query_cache`` fixture in ``tests/conftest.py``.
+    """
+    from tools import emoji_embedding
+
+    emoji_embedding.clear_cache()
+    yield
+    emoji_embedding.clear_cache()
+
 
 class TestEmojiLabels:
     """Test emoji label completeness and consistency."""
@@ -449,3 +466,250 @@ class TestWorktypeToAction:
         assert not asyncio.iscoroutinefunction(find_best_emoji_for_message), (
             "find_best_emoji_for_message must be synchronous (B2) — bridge uses asyncio.to_thread"
         )
+
+
+class TestVectorizedIndex:
+    """The matrix index must agree with brute-force cosine scoring."""
+
+    def test_matmul_ranking_matches_brute_force(self):
+        import numpy as np
+
+        from tools.emoji_embedding import REACTION_TOP_K, _EmojiIndex
+
+        rng = np.random.default_rng(7)
+        emojis = ["\U0001f525", "\U0001f622", "\U0001f44d", "\U0001f440", "\U0001f914"]
+        embeddings = {e: rng.normal(size=16).tolist() for e in emojis}
+        query = rng.normal(size=16)
+
+        def cosine(v):
+            v = np.asarray(v)
+            return float(v @ query / (np.linalg.norm(v) * np.linalg.norm(query)))
+
+        expected = sorted(((e, cosine(v)) for e, v in embeddings.items()), key=lambda x: -x[1])
+        got = _EmojiIndex.build(embeddings).candidates(query.tolist())
+
+        assert [e for e, _ in got] == [e for e, _ in expected[:REACTION_TOP_K]]
+        for (_, a), (_, b) in zip(got, expected, strict=False):
+            assert a == pytest.approx(b, abs=1e-5)
+
+    def test_blocked_and_zero_rows_are_excluded(self):
+        from tools.emoji_embedding import _EmojiIndex
+
+        index = _EmojiIndex.build(
+            {
+                "\U0001f595": [1.0, 0.0],  # blocked middle finger
+                "\U0001f525": [0.0, 0.0],  # zero vector: unscorable
+                "\U0001f44d": [0.0, 1.0],
+            }
+        )
+        assert index.emojis == ("\U0001f44d",)
+
+
+class TestQueryEmbeddingCache:
+    """Repeated feelings are answered without another embedding call."""
+
+    FAKE = {
+        "\U0001f525": [1.0, 0.0, 0.0],
+        "\U0001f622": [0.0, 1.0, 0.0],
+        "\U0001f44d": [0.0, 0.0, 1.0],
+    }
+
+    def test_repeat_feeling_skips_network(self):
+        from tools.emoji_embedding import find_best_emoji
+
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch(
+                "tools.emoji_embedding._compute_embedding", return_value=[0.9, 0.1, 0.0]
+            ) as compute,
+        ):
+            for _ in range(5):
+                find_best_emoji("Excited  ")
+            find_best_emoji("excited")
+
+        assert compute.call_count == 1
+
+    def test_cache_survives_process_restart_without_api_key(self):
+        from tools import emoji_embedding
+        from tools.emoji_embedding import QUERY_CACHE_PATH, clear_cache, find_best_emoji
+
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch("tools.emoji_embedding._compute_embedding", return_value=[0.0, 0.0, 1.0]),
+        ):
+            find_best_emoji("approve")
+        emoji_embedding.flush_query_cache()  # what the atexit hook does
+        assert QUERY_CACHE_PATH.exists()
+
+        clear_cache()  # a new process: only the disk cache remains
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {}, clear=True),
+            patch(
+                "tools.emoji_embedding._compute_embedding",
+                side_effect=AssertionError("cached feeling must not be re-embedded"),
+            ),
+        ):
+            result = find_best_emoji("approve")
+
+        assert result.emoji in self.FAKE
+        # Precomputed on index load from the persisted embedding: 👍 is nearest.
+        assert emoji_embedding._index.nearest["approve"][0] == ("\U0001f44d", pytest.approx(1.0))
+
+    def test_lru_evicts_oldest_entry(self, monkeypatch):
+        from tools import emoji_embedding
+
+        monkeypatch.setattr(emoji_embedding, "QUERY_CACHE_MAX_ENTRIES", 2)
+        for key in ("a", "b", "c"):
+            emoji_embedding._remember_query(key, [1.0, 0.0, 0.0])
+
+        emoji_embedding.flush_query_cache()
+        emoji_embedding.clear_cache()
+        assert list(emoji_embedding._load_query_cache()) == ["b", "c"]
+
+    def test_misses_are_flushed_together_through_unique_temp_files(self, monkeypatch):
+        from tools import emoji_embedding
+
+        writes = []
+        real_save = emoji_embedding._save_query_cache
+        monkeypatch.setattr(
+            emoji_embedding,
+            "_save_query_cache",
+            lambda cache: (writes.append(list(cache)), real_save(cache)),
+        )
+        for key in ("a", "b", "c"):
+            emoji_embedding._remember_query(key, [1.0, 0.0, 0.0])
+
+        assert writes == [["a"]]  # first miss written, the rest debounced
+        emoji_embedding.flush_query_cache()
+        emoji_embedding.flush_query_cache()  # nothing left unsaved: no write
+
+        assert writes == [["a"], ["a", "b", "c"]]
+        path = emoji_embedding.QUERY_CACHE_PATH
+        assert list(path.parent.glob(f".{path.name}.*.tmp")) == []
+
+    def test_flush_writes_a_snapshot_while_the_lru_keeps_moving(self, monkeypatch):
+        from tools import emoji_embedding
+
+        for key in ("a", "b", "c"):
+            emoji_embedding._remember_query(key, [1.0, 0.0, 0.0])
+        live = emoji_embedding._query_cache
+        written = []
+
+        def save(cache):
+            assert cache is not live
+            for key in cache:  # a loop-side lookup reorders the LRU mid-write
+                live.move_to_end("a")
+                written.append(key)
+
+        monkeypatch.setattr(emoji_embedding, "_save_query_cache", save)
+        emoji_embedding.flush_query_cache()
+
+        assert written == ["a", "b", "c"]
+
+    def test_cached_lookup_never_embeds(self):
+        from tools import emoji_embedding
+
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch("tools.emoji_embedding._compute_embedding", return_value=[0.0, 1.0, 0.0]),
+        ):
+            assert emoji_embedding.find_best_emoji_cached("sad") is None  # index not loaded
+            emoji_embedding.find_best_emoji("sad")
+            assert emoji_embedding.find_best_emoji_cached("sad").emoji in self.FAKE
+            assert emoji_embedding.find_best_emoji_cached("joy") is None
+
+    def test_dimension_mismatch_is_a_miss(self):
+        from tools import emoji_embedding
+        from tools.emoji_embedding import find_best_emoji
+
+        emoji_embedding._remember_query("excited", [1.0] * 8)  # stale model width
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch(
+                "tools.emoji_embedding._compute_embedding", return_value=[0.9, 0.1, 0.0]
+            ) as compute,
+        ):
+            result = find_best_emoji("excited")
+
+        assert compute.call_count == 1
+        assert result.emoji in self.FAKE
+
+
+class TestAsyncVariant:
+    FAKE = TestQueryEmbeddingCache.FAKE
+
+    def test_async_uses_pooled_client_once_then_cache(self):
+        from tools.emoji_embedding import close_async_client, find_best_emoji_async
+
+        calls = []
+
+        async def fake_embed(text, api_key):
+            calls.append(text)
+            return [0.0, 1.0, 0.0]
+
+        async def run():
+            results = [await find_best_emoji_async("sad") for _ in range(3)]
+            await close_async_client()
+            return results
+
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch("tools.emoji_embedding._compute_embedding_async", fake_embed),
+        ):
+            results = asyncio.run(run())
+
+        assert calls == ["sad"]
+        assert all(r.emoji in self.FAKE for r in results)
+
+    def test_async_failure_returns_default(self):
+        from tools.emoji_embedding import DEFAULT_EMOJI, find_best_emoji_async
+
+        async def failing(text, api_key):
+            return None
+
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch("tools.emoji_embedding._compute_embedding_async", failing),
+        ):
+            result = asyncio.run(find_best_emoji_async("excited"))
+
+        assert result.emoji == DEFAULT_EMOJI
+
+    def test_offloop_runs_async_path_and_closes_client(self):
+        from tools import emoji_embedding
+
+        async def fake_embed(text, api_key):
+            emoji_embedding._get_async_client()
+            return [1.0, 0.0, 0.0]
+
+        with (
+            patch("tools.emoji_embedding._embedding_cache", self.FAKE),
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch("tools.emoji_embedding._compute_embedding_async", fake_embed),
+            patch(
+                "tools.emoji_embedding._compute_embedding",
+                side_effect=AssertionError("sync embed must not run"),
+            ),
+        ):
+            result = emoji_embedding.find_best_emoji_offloop("hot")
+
+        assert result.emoji in self.FAKE
+        assert emoji_embedding._async_client is None
+
+    def test_pooled_client_is_reused_within_a_loop(self):
+        from tools.emoji_embedding import _get_async_client, close_async_client
+
+        async def run():
+            first, second = _get_async_client(), _get_async_client()
+            await close_async_client()
+            return first is second, first.is_closed
+
+        same, closed = asyncio.run(run())
+        assert same and closed
@@ -98,13 +98,13 @@ class TestReflectionsEmptySummaryGuard:
         )
 
     @patch("models.bridge_event.BridgeEvent")
-    @patch("models.agent_session.AgentSession")
+    @patch("models.session_time_index.sessions_on_day")
     def test_skips_empty_summary_failed_session(
-        self, mock_agent_session, mock_bridge_event, caplog
+        self, mock_sessions_on_day, mock_bridge_event, caplog
     ):
         """Failed sessions with empty summary are skipped with a warning."""
         session = self._make_session("sess-empty", "failed", summary="", started_at=1710000000)
-        mock_agent_session.query.all.return_value = [session]
+        mock_sessions_on_day.return_value = [session]
         mock_bridge_event.query.filter.return_value = []
 
         with caplog.at_level(logging.WARNING):
@@ -116,11 +116,13 @@ class TestReflectionsEmptySummaryGuard:
         assert any("Skipping failed session sess-empty" in r.message for r in caplog.records)
 
     @patch("models.bridge_event.BridgeEvent")
-    @patch("models.agent_session.AgentSession")
-    def test_skips_none_summary_failed_session(self, mock_agent_session, mock_bridge_event, caplog):
+    @patch("models.session_time_index.sessions_on_day")
+    def test_skips_none_summary_failed_session(
+        self, mock_sessions_on_day, mock_bridge_event, caplog
+    ):
         """Failed sessions with None summary are skipped."""
         session = self._make_session("sess-none", "failed", summary=None, started_at=1710000000)
-        mock_agent_session.query.all.return_value = [session]
+        mock_sessions_on_day.return_value = [session]
         mock_bridge_event.query.filter.return_value = []
 
         with caplog.at_level(logging.WARNING):
@@ -130,13 +132,15 @@ class TestReflectionsEmptySummaryGuard:
         assert any("Skipping failed session sess-none" in r.message for r in caplog.records)
 
     @patch("models.bridge_event.BridgeEvent")
-    @patch("models.agent_session.AgentSession")
-    def test_includes_nonempty_summary_failed_session(self, mock_agent_session, mock_bridge_event):
+    @patch("models.session_time_index.sessions_on_day")
+    def test_includes_nonempty_summary_failed_session(
+        self, mock_sessions_on_day, mock_bridge_event
+    ):
         """Failed sessions with a populated summary are included normally."""
         session = self._make_session(
             "sess-good", "failed", summary="ConnectionError: Redis refused", started_at=1710000000
         )
-        mock_agent_session.query.all.return_value = [session]
+        mock_sessions_on_day.return_value = [session]
         mock_bridge_event.query.filter.return_value = []
 
         result = analyze_sessions_from_redis("2024-03-09")
@@ -146,11 +150,11 @@ class TestReflectionsEmptySummaryGuard:
         assert result["error_patterns"][0]["summary"] == "ConnectionError: Redis refused"
 
     @patch("models.bridge_event.BridgeEvent")
-    @patch("models.agent_session.AgentSession")
-    def test_skips_whitespace_only_summary(self, mock_agent_session, mock_bridge_event, caplog):
+    @patch("models.session_time_index.sessions_on_day")
+    def test_skips_whitespace_only_summary(self, mock_sessions_on_day, mock_bridge_event, caplog):
         """Failed sessions with whitespace-only summary are skipped."""
         session = self._make_session("sess-ws", "failed", summary="   \n  ", started_at=1710000000)
-        mock_agent_session.query.all.return_value = [session]
+        mock_sessions_on_day.return_value = [session]
         mock_bridge_event.query.filter.return_value = []
 
         with caplog.at_level(logging.WARNING):
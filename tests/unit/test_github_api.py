@@ -0,0 +1,223 @@
+"""Tests for the shared GitHub read broker (utils/github_api.py).
+
+A local fake API server stands in for GitHub; the ETag cache runs against the
+per-test Redis (autouse ``redis_test_db``).
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from agent import pipeline_state
+from reflections import docs_auditor
+from ui.data import sdlc
+from utils import github_api
+
+ISSUES = {
+    1: ("Issue", "Fix the bridge", "OPEN"),
+    2: ("PullRequest", "Bridge fix", "MERGED"),
+    3: ("Issue", "Docs drift", "CLOSED"),
+}
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Minimal REST + GraphQL API; every request is logged on the server."""
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload=None, headers=()):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("x-ratelimit-remaining", "4999")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        self.server.log.append(("GET", url.path, self.headers.get("If-None-Match")))
+        assert self.headers["Authorization"] == "Bearer test-token"
+        if url.path == "/repos/o/r/pulls/7":
+            etag = f'"v{self.server.version}"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._reply(304, headers=[("etag", etag)])
+            sha = f"{self.server.version:040d}"
+            return self._reply(200, {"number": 7, "head": {"sha": sha}}, [("etag", etag)])
+        if url.path == "/repos/o/r/pulls":
+            time.sleep(0.3)  # Long enough for concurrent callers to overlap
+            assert query["head"] == ["o:feat"]
+            pulls = [{"number": 9, "head": {"ref": "feat"}, "state": "closed", "merged_at": "x"}]
+            return self._reply(200, pulls, [("etag", '"pulls"')])
+        if url.path == "/search/issues":
+            self.server.search_queries.append(query["q"][0])
+            return self._reply(200, {"items": [{"number": 3, "title": "Docs  drift"}]})
+        if url.path == "/repos/o/r/broken":
+            return self._reply(500, {"message": "boom"})
+        return self._reply(404, {"message": "Not Found"})
+
+    def do_POST(self):
+        length = int(self.headers["content-length"])
+        request = json.loads(self.rfile.read(length))
+        query = request["query"]
+        self.server.log.append(("POST", "/graphql", query))
+        if "statusCheckRollup" in query:
+            nodes = [
+                {
+                    "__typename": "CheckRun",
+                    "name": "ci",
+                    "status": "COMPLETED",
+                    "conclusion": "FAILURE",
+                },
+                {"__typename": "StatusContext", "context": "lint", "state": "SUCCESS"},
+            ]
+            rollup = {"contexts": {"nodes": nodes}}
+            pull = {"commits": {"nodes": [{"commit": {"statusCheckRollup": rollup}}]}}
+            return self._reply(200, {"data": {"repository": {"pullRequest": pull}}})
+        repository = {}
+        for n in map(int, re.findall(r"i(\d+): issueOrPullRequest", query)):
+            if n in ISSUES:
+                kind, title, state = ISSUES[n]
+                path = "pull" if kind == "PullRequest" else "issues"
+                repository[f"i{n}"] = {
+                    "__typename": kind,
+                    "number": n,
+                    "title": title,
+                    "state": state,
+                    "url": f"https://github.com/o/r/{path}/{n}",
+                }
+            else:
+                repository[f"i{n}"] = None
+        self._reply(200, {"data": {"repository": repository}})
+
+
+@pytest.fixture
+def api(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+    server.log = []
+    server.search_queries = []
+    server.version = 1
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.delenv("GITHUB_BROKER_DISABLED", raising=False)
+    monkeypatch.setenv("GH_TOKEN", "test-token")
+    monkeypatch.setenv("GH_REPO", "o/r")
+    monkeypatch.setenv("GITHUB_API_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    yield server
+    github_api.close()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(github_api, "_emit", lambda n, v, d: emitted.append((n, v, d)))
+    return emitted
+
+
+def _results(metrics):
+    return [d["result"] for n, _, d in metrics if n == "github_api.request"]
+
+
+def test_reads_revalidate_with_etag_across_clients(api, metrics):
+    assert github_api.pull_head_sha(7, "o/r") == f"{1:040d}"
+    github_api.close()  # A new client (another process) shares the Redis cache
+    assert github_api.pull_head_sha(7, "o/r") == f"{1:040d}"
+
+    assert api.log[-1] == ("GET", "/repos/o/r/pulls/7", '"v1"')
+    assert _results(metrics) == ["fetched", "not_modified"]
+
+    api.version = 2  # A changed resource is fetched in full again
+    assert github_api.pull_head_sha(7, "o/r") == f"{2:040d}"
+
+
+def test_max_age_skips_the_request(api, metrics):
+    github_api.get("repos/o/r/pulls/7")
+    github_api.get("repos/o/r/pulls/7", max_age_s=60)
+    assert len(api.log) == 1
+    assert _results(metrics) == ["fetched", "fresh"]
+
+
+def test_not_found_is_none_and_errors_raise(api):
+    assert github_api.get("repos/o/r/issues/999") is None
+    with pytest.raises(github_api.GitHubAPIError) as excinfo:
+        github_api.get("repos/o/r/broken")
+    assert excinfo.value.status == 500
+
+
+def test_concurrent_identical_reads_are_coalesced(api, metrics):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(github_api.pulls_for_branch("feat", "o/r")))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(api.log) == 1
+    assert results == [[{"number": 9, "headRefName": "feat", "state": "MERGED"}]] * 5
+    assert _results(metrics).count("coalesced") == 4
+
+
+def test_items_are_batched_and_cached(api, monkeypatch):
+    monkeypatch.setattr(github_api, "BATCH_SIZE", 2)
+
+    found = github_api.items("o/r", [3, 1, 2, 404])
+    assert sorted(found) == [1, 2, 3]
+    assert found[2] == {
+        "number": 2,
+        "title": "Bridge fix",
+        "state": "MERGED",
+        "url": "https://github.com/o/r/pull/2",
+        "is_pr": True,
+    }
+    assert len(api.log) == 2
+
+    urls = ["https://github.com/o/r/issues/1", "https://github.com/o/r/pull/2#top"]
+    assert github_api.titles_for_urls(urls) == {urls[0]: "Fix the bridge", urls[1]: "Bridge fix"}
+    assert len(api.log) == 2  # Both served from the item cache
+
+
+def test_enabled_needs_a_token_and_no_kill_switch(api, monkeypatch):
+    assert github_api.enabled()
+    monkeypatch.setenv("GITHUB_BROKER_DISABLED", "1")
+    assert not github_api.enabled()
+
+
+def test_pipeline_state_reads_pr_and_checks_through_broker(api):
+    assert pipeline_state._durable_gh_pr_for_branch("feat") == {
+        "number": 9,
+        "headRefName": "feat",
+        "state": "MERGED",
+    }
+    assert pipeline_state._durable_pr_checks_verdict(9) == "failure"
+
+
+def test_dashboard_prefetches_titles_in_one_query(api, monkeypatch):
+    monkeypatch.setattr(sdlc, "_github_title_cache", {})
+    urls = [f"https://github.com/o/r/issues/{n}" for n in (1, 3)]
+
+    sdlc._prefetch_github_titles(urls)
+
+    assert sdlc._fetch_github_title(urls[1]) == "Docs drift"
+    assert [entry[:2] for entry in api.log] == [("POST", "/graphql")]
+
+
+def test_docs_auditor_dedup_uses_issue_search(api, tmp_path):
+    assert docs_auditor._open_issue_exists("Docs drift", tmp_path)
+    assert not docs_auditor._open_issue_exists("Other finding", tmp_path)
+    assert api.search_queries[0] == (
+        'repo:o/r is:issue is:open label:documentation in:title "Docs drift"'
+    )
@@ -0,0 +1,149 @@
+"""Unit tests for bridge.inbound_classification (fused single-pass classification).
+
+Covers the one-call contract (needs_response and work type from one
+``run_typed``), the per-message Redis cache the worker reads, the
+conservative defaults on failure, speculative side stages and cancellation,
+and ``should_respond_async`` consuming the fused verdict in Case 1.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agent.llm import LLMCallError
+from bridge import inbound_classification, routing
+from bridge.inbound_classification import (
+    InboundClassification,
+    InboundVerdict,
+    cached_work_type,
+    classify_inbound,
+    get_cached_verdict,
+    worth_speculating,
+)
+
+_VERDICT = InboundVerdict(
+    needs_response=True, work_type="bug", work_type_confidence=0.8, reason="broken deploy"
+)
+_PROJECT = {
+    "_key": "demo",
+    "telegram": {
+        "respond_to_all": False,
+        "respond_to_unaddressed": True,
+        "mention_triggers": ["@valor"],
+    },
+}
+
+
+@pytest.fixture
+def fused_llm(monkeypatch):
+    mock = AsyncMock(return_value=_VERDICT)
+    monkeypatch.setattr(inbound_classification, "run_typed", mock)
+    return mock
+
+
+async def test_classify_inbound_is_one_call_and_cached(fused_llm):
+    first = await classify_inbound("the deploy is broken again", chat_id=-100, message_id=7)
+    second = await classify_inbound("the deploy is broken again", chat_id=-100, message_id=7)
+
+    assert first == second == _VERDICT
+    fused_llm.assert_awaited_once()
+    assert fused_llm.await_args.args[1] is InboundVerdict
+    assert fused_llm.await_args.kwargs["lane"] == "interactive"
+    assert get_cached_verdict(-100, 7) == _VERDICT
+    assert cached_work_type(-100, 7) == "bug"
+
+
+def test_cached_work_type_missing():
+    assert cached_work_type(-100, 404) is None
+    assert cached_work_type(None, None) is None
+
+
+async def test_stage_shares_one_call_between_consumers(fused_llm):
+    stage = InboundClassification("the deploy is broken again", chat_id=-100, message_id=8)
+    stage.start()
+    stage.start()
+
+    assert await stage.needs_response() is True
+    assert (await stage.verdict()).work_type == "bug"
+    fused_llm.assert_awaited_once()
+    assert "fused" in stage.timings
+
+
+async def test_stage_failure_defaults_to_respond(monkeypatch):
+    monkeypatch.setattr(
+        inbound_classification, "run_typed", AsyncMock(side_effect=LLMCallError("down"))
+    )
+    stage = InboundClassification("please look at the flaky test", chat_id=-100, message_id=9)
+
+    assert await stage.verdict() is None
+    assert await stage.needs_response() is True
+    assert cached_work_type(-100, 9) is None
+
+
+async def test_acknowledgment_fast_path_skips_llm(fused_llm):
+    stage = InboundClassification("thanks!", chat_id=-100, message_id=10)
+
+    assert await stage.needs_response() is False
+    fused_llm.assert_not_awaited()
+
+
+async def test_side_stage_result_failure_and_cancel(fused_llm):
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return {"injection_risk_banner": "x"}
+
+    async def broken():
+        raise RuntimeError("inspector down")
+
+    stage = InboundClassification("hello there team", chat_id=-100, message_id=11)
+    stage.speculate("slow", slow())
+    stage.speculate("broken", broken())
+    release.set()
+
+    assert await stage.side_result("slow") == {"injection_risk_banner": "x"}
+    assert await stage.side_result("broken", {}) == {}
+    assert await stage.side_result("never-started", "default") == "default"
+
+    stage2 = InboundClassification("hello there team", chat_id=-100, message_id=12)
+    pending = stage2.speculate("slow", slow())
+    release.clear()
+    stage2.start()
+    stage2.cancel()
+    await asyncio.sleep(0)
+    assert pending.cancelled()
+    assert await stage2.side_result("slow", {}) == {}
+
+
+@pytest.mark.parametrize(
+    "text, chat_title, project, expected",
+    [
+        ("the build is red", "Eng: Demo", _PROJECT, True),
+        ("the build is red", "Eng: Demo", None, False),
+        ("thanks!", "Eng: Demo", _PROJECT, False),
+        ("the build is red", "Demo Team", _PROJECT, False),
+        ("@valor the build is red", "Demo Team", _PROJECT, True),
+    ],
+)
+def test_worth_speculating(text, chat_title, project, expected):
+    assert worth_speculating(text, is_dm=False, chat_title=chat_title, project=project) is expected
+
+
+async def test_should_respond_case1_uses_fused_verdict(fused_llm, monkeypatch):
+    needs_response_llm = AsyncMock(side_effect=AssertionError("must not call"))
+    monkeypatch.setattr(routing, "run_typed", needs_response_llm)
+    fused_llm.return_value = _VERDICT.model_copy(update={"needs_response": False})
+    event = SimpleNamespace(message=SimpleNamespace(id=13, reply_to_msg_id=None), chat_id=-100)
+    stage = InboundClassification("we should chat about lunch", chat_id=-100, message_id=13)
+
+    should, is_reply = await routing.should_respond_async(
+        None, event, stage.text, False, "Eng: Demo", _PROJECT, classification=stage
+    )
+
+    assert (should, is_reply) == (False, False)
+    fused_llm.assert_awaited_once()
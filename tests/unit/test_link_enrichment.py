@@ -0,0 +1,214 @@
+"""Tests for concurrent link enrichment (bridge/link_enrichment.py).
+
+Pages come from a local asyncio HTTP server; the link cache and the
+summarizer are replaced with in-memory fakes so only the pipeline is tested.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import tools.link_analysis as link_analysis
+from bridge import context, link_enrichment
+from tools.link_analysis import _html_metadata
+
+PAGE = (
+    "<html><head><title>Page {name}</title>"
+    '<meta name="description" content="About {name} &amp; more">'
+    "</head><body><p>{body}</p></body></html>"
+)
+
+
+class PageServer:
+    """Keep-alive HTTP/1.1 server: ``GET /<delay_ms>/<name>`` returns an HTML page."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._server = None
+
+    def url(self, delay_ms: int, name: str) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/{delay_ms}/{name}"
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ", 2)[1].decode()
+                self.requests.append(path)
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                _, delay_ms, name = path.split("/")
+                await asyncio.sleep(int(delay_ms) / 1000)
+                self.active -= 1
+                if name == "missing":
+                    writer.write(b"HTTP/1.1 404 Not Found\r\ncontent-length: 0\r\n\r\n")
+                else:
+                    body = PAGE.format(name=name, body=f"Body text of {name}. " * 5).encode()
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\ncontent-type: text/html; charset=utf-8\r\n"
+                        b"content-length: %d\r\n\r\n" % len(body) + body
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+
+@pytest.fixture
+async def server():
+    async with PageServer() as srv:
+        yield srv
+        # Drop the pooled keep-alive connections before the server waits on them.
+        await link_enrichment.aclose_link_clients()
+
+
+@pytest.fixture
+def links(monkeypatch):
+    """In-memory link cache plus fake summarizers; returns the stored links."""
+    stored: dict[str, dict] = {}
+    calls: dict[str, list] = {"page": [], "url": []}
+
+    def get_link_by_url(url, max_age_hours=None):
+        return stored.get(url)
+
+    def store_link(url, **kwargs):
+        stored[url] = {"url": url, **kwargs}
+        return stored[url]
+
+    async def summarize_page_content(url, content, title=None, timeout=30.0, client=None):
+        calls["page"].append((url, content, title))
+        return f"summary of {title}"
+
+    async def summarize_url_content(url, timeout=30.0, client=None):
+        calls["url"].append(url)
+        return f"browsed {url}"
+
+    monkeypatch.setattr(link_enrichment, "get_link_by_url", get_link_by_url)
+    monkeypatch.setattr(link_enrichment, "store_link", store_link)
+    monkeypatch.setattr(link_enrichment, "summarize_page_content", summarize_page_content)
+    monkeypatch.setattr(link_enrichment, "summarize_url_content", summarize_url_content)
+    stored["calls"] = calls
+    return stored
+
+
+async def test_links_are_enriched_concurrently_from_one_fetch(server, links, monkeypatch):
+    monkeypatch.setattr(link_enrichment, "LINK_FETCH_PER_HOST", 4)
+    urls = [server.url(300, f"p{i}") for i in range(4)]
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    result = await link_enrichment.enrich_links(urls, "alice", "chat", 7, None)
+    elapsed = loop.time() - started
+
+    assert elapsed < 0.9  # sequential would be >= 1.2s
+    assert [r["url"] for r in result] == urls
+    assert [r["summary"] for r in result] == [f"summary of Page p{i}" for i in range(4)]
+    assert sorted(server.requests) == [f"/300/p{i}" for i in range(4)]  # one fetch per URL
+    stored = links[urls[0]]
+    assert stored["title"] == "Page p0"
+    assert stored["description"] == "About p0 & more"
+    assert stored["ai_summary"] == "summary of Page p0"
+    assert "Body text of p0" in links["calls"]["page"][0][1]
+
+
+async def test_per_host_limit_caps_concurrent_fetches(server, links):
+    urls = [server.url(100, f"h{i}") for i in range(5)]
+    result = await link_enrichment.enrich_links(urls, "alice", "chat", 7, None)
+    assert len(result) == 5
+    assert server.max_active == link_enrichment.LINK_FETCH_PER_HOST
+
+
+async def test_deadline_returns_partial_and_finishes_late_links(server, links):
+    fast, slow = server.url(10, "fast"), server.url(600, "slow")
+
+    result = await link_enrichment.enrich_links(
+        [slow, fast], "alice", "chat", 7, None, deadline_s=0.3
+    )
+
+    assert [r["url"] for r in result] == [fast]
+    assert slow not in links
+    await asyncio.gather(*link_enrichment._late_tasks)
+    assert links[slow]["ai_summary"] == "summary of Page slow"
+
+
+async def test_cached_link_skips_fetch(server, links):
+    url = server.url(10, "cached")
+    links[url] = {"ai_summary": "from cache", "title": "Cached"}
+
+    result = await link_enrichment.enrich_links([url], "alice", "chat", 7, None)
+
+    assert result == [{"url": url, "summary": "from cache", "title": "Cached", "cached": True}]
+    assert server.requests == []
+
+
+async def test_unreadable_page_falls_back_to_url_summary(server, links):
+    url = server.url(10, "missing")
+    result = await link_enrichment.enrich_links([url], "alice", "chat", 7, None)
+    assert result[0]["summary"] == f"browsed {url}"
+    assert links["calls"]["page"] == []
+
+
+async def test_get_link_summaries_caps_links_per_message(server, links):
+    urls = [server.url(10, f"m{i}") for i in range(7)]
+    result = await context.get_link_summaries(" ".join(urls), "alice", "chat", 7, None)
+    assert len(result) == context.MAX_LINKS_PER_MESSAGE
+
+
+def test_html_metadata_reads_title_and_og_description():
+    page = (
+        "<head><TITLE>\n  A  &amp; B </TITLE>"
+        "<meta content='OG text' property='og:description'></head>"
+    )
+    assert _html_metadata(page) == ("A & B", "OG text")
+    assert _html_metadata("<p>no head</p>") == (None, None)
+
+
+def _streaming_client(
+    content_type: str, blocks: int, block: bytes
+) -> tuple[httpx.AsyncClient, list]:
+    """Client whose every response streams ``blocks`` x ``block``; records blocks sent."""
+    sent = []
+
+    async def body():
+        for _ in range(blocks):
+            sent.append(len(block))
+            yield block
+
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": content_type}, content=body())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), sent
+
+
+async def test_fetch_page_rejects_binary_from_the_headers():
+    client, sent = _streaming_client("application/pdf", 100, b"%PDF" * 16384)
+    async with client:
+        result = await link_analysis.fetch_page("https://example.com/a.pdf", client)
+
+    assert result["error"] == "Unsupported application/pdf"
+    assert sent == []
+
+
+async def test_fetch_page_reads_at_most_the_byte_cap(monkeypatch):
+    monkeypatch.setattr(link_analysis, "PAGE_MAX_BYTES", 100_000)
+    head = b"<html><head><title>Big</title></head><body>"
+    client, sent = _streaming_client("text/html", 1000, head + b"x" * (65536 - len(head)))
+    async with client:
+        result = await link_analysis.fetch_page("https://example.com/big", client)
+
+    assert result["title"] == "Big"
+    assert len(sent) == 2
+    assert len(result["content"]) < 100_000
@@ -0,0 +1,245 @@
+"""Unit tests for utils.llm_cache (shared Redis LLM result cache).
+
+Runs against the per-worker test Redis (autouse ``redis_test_db``): exact hits
+across whitespace variants, version invalidation, non-cacheable results, LRU
+eviction, near-duplicate hits with a deterministic fake embedder, metrics, and
+the kill switch.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from utils import llm_cache
+from utils.llm_cache import llm_cached
+
+_FAMILIES = (llm_cache._HITS, llm_cache._MISSES, llm_cache._SAVED_S)
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Empty the cache counters; returns the ``{(family, *labels): value}`` view."""
+    for family in _FAMILIES:
+        monkeypatch.setattr(family, "children", {})
+    monkeypatch.delenv("LLM_CACHE_DISABLED", raising=False)
+
+    def counted() -> dict[tuple[str, ...], float]:
+        return {
+            (family.name, *labels): child.value
+            for family in _FAMILIES
+            for labels, child in family.children.items()
+        }
+
+    return counted
+
+
+def test_sync_exact_hit_ignores_whitespace(metrics):
+    calls = []
+
+    @llm_cached("t_sync", model="m", version="v1")
+    def summarize(text: str, style: str = "brief") -> dict:
+        calls.append(text)
+        return {"summary": text.upper()}
+
+    assert summarize("fix  the\nbug") == {"summary": "FIX  THE\nBUG"}
+    assert summarize("fix the bug ") == {"summary": "FIX  THE\nBUG"}
+    assert summarize("fix the bug", style="long") == {"summary": "FIX THE BUG"}
+    assert len(calls) == 2
+    assert metrics() == {
+        ("valor_llm_cache_hits_total", "t_sync", "exact"): 1.0,
+        ("valor_llm_cache_misses_total", "t_sync"): 2.0,
+    }
+
+
+async def test_async_hit_and_version_bump():
+    calls = []
+
+    async def classify(text: str) -> str:
+        calls.append(text)
+        return "bug"
+
+    v1 = llm_cached("t_async", version="v1")(classify)
+    v2 = llm_cached("t_async", version="v2")(classify)
+
+    assert await v1("it broke") == "bug"
+    assert await v1("it broke") == "bug"
+    assert await v2("it broke") == "bug"
+    assert len(calls) == 2, "a new prompt version must not reuse v1 entries"
+
+
+async def test_async_cache_io_runs_off_the_loop(metrics, monkeypatch):
+    import threading
+
+    loop_thread = threading.get_ident()
+    io_threads = []
+
+    @llm_cached("t_thread")
+    async def classify(text: str) -> str:
+        return "bug"
+
+    cache = classify.cache
+    for name in ("probe", "set"):
+        real = getattr(cache, name)
+
+        def traced(*args, _real=real, **kwargs):
+            io_threads.append(threading.get_ident())
+            return _real(*args, **kwargs)
+
+        monkeypatch.setattr(cache, name, traced)
+
+    assert await classify("x") == "bug"
+    assert await classify("x") == "bug"
+    assert len(io_threads) == 3  # miss lookup, store, hit lookup
+    assert loop_thread not in io_threads
+
+
+def test_errors_and_rejected_results_not_cached(metrics):
+    results = iter([{"error": "timeout"}, {"ok": 1}])
+
+    @llm_cached("t_err")
+    def judge(text: str) -> dict:
+        return next(results)
+
+    assert judge("x") == {"error": "timeout"}
+    assert judge("x") == {"ok": 1}
+    assert judge("x") == {"ok": 1}
+
+    @llm_cached("t_raise")
+    def boom(text: str) -> str:
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        boom("x")
+
+
+def test_lru_eviction_caps_namespace(metrics):
+    calls = []
+
+    @llm_cached("t_lru", max_entries=2)
+    def echo(text: str) -> str:
+        calls.append(text)
+        return text
+
+    echo("a")
+    echo("b")
+    echo("a")  # refresh a
+    echo("c")  # evicts b
+    echo("a")
+    echo("b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_decode_rehydrates_cached_value(metrics):
+    @llm_cached("t_decode", decode=tuple)
+    def pair(text: str) -> list:
+        return [text, len(text)]
+
+    assert pair("abc") == ["abc", 3]
+    assert pair("abc") == ("abc", 3)
+
+
+async def test_semantic_near_duplicate_hit(metrics):
+    vectors = {
+        "the deploy is broken": [1.0, 0.0, 0.0],
+        "the deploy is broken!": [0.99, 0.05, 0.0],
+        "add csv export": [0.0, 1.0, 0.0],
+    }
+    calls = []
+
+    @llm_cached("t_sem", semantic=True, semantic_threshold=0.95)
+    async def classify(message: str, context: str = "") -> dict:
+        calls.append(message)
+        return {"type": "bug" if "deploy" in message else "feature"}
+
+    classify.cache.embed = lambda text: vectors[text]
+
+    assert await classify("the deploy is broken") == {"type": "bug"}
+    assert await classify("the deploy is broken!") == {"type": "bug"}
+    assert await classify("add csv export") == {"type": "feature"}
+    # Same text, different remaining arguments: separate semantic context.
+    assert await classify("the deploy is broken!", context="other") == {"type": "bug"}
+
+    assert calls == ["the deploy is broken", "add csv export", "the deploy is broken!"]
+    hits = {k: v for k, v in metrics().items() if k[0] == "valor_llm_cache_hits_total"}
+    assert hits == {("valor_llm_cache_hits_total", "t_sem", "semantic"): 1.0}
+
+
+def test_semantic_without_provider_is_exact_only(metrics):
+    calls = []
+
+    @llm_cached("t_noprov", semantic=True)
+    def classify(message: str) -> str:
+        calls.append(message)
+        return "chore"
+
+    classify.cache.embed = lambda text: None
+    classify("bump deps")
+    classify("bump deps please")
+    classify("bump deps")
+    assert calls == ["bump deps", "bump deps please"]
+
+
+def test_semantic_lookup_embeds_only_when_vectors_exist(metrics):
+    embedded = []
+
+    @llm_cached("t_lazy_embed", semantic=True)
+    def classify(message: str) -> str:
+        return "chore"
+
+    def embed(text):
+        embedded.append(text)
+        return [1.0, 0.0] if text == "bump deps" else [0.0, 1.0]
+
+    classify.cache.embed = embed
+    classify("bump deps")
+    assert embedded == ["bump deps"], "first miss embeds once, for the store"
+
+    classify("bump deps")
+    assert embedded == ["bump deps"], "an exact hit never embeds"
+
+    classify("add a readme")
+    assert embedded == ["bump deps", "add a readme"], (
+        "the lookup's embedding is reused by the store"
+    )
+
+
+def test_trim_vectors_keeps_the_recent_half(metrics, monkeypatch):
+    monkeypatch.setattr(llm_cache, "SEMANTIC_MAX_VECTORS", 4)
+    cache = llm_cache.LLMCache("t_trim", semantic_threshold=0.9)
+    context = cache.context_for({})
+    for i in range(5):
+        cache.set(f"d{i}", i, 0.1, context=context, vector=[1.0, float(i)])
+
+    db = llm_cache._redis()
+    kept = sorted(llm_cache._as_str(d) for d in db.hkeys(cache._vec_key(context)))
+    assert kept == ["d3", "d4"]
+
+
+def test_saved_seconds_metric(metrics, monkeypatch):
+    @llm_cached("t_saved")
+    def slow(text: str) -> str:
+        return "done"
+
+    slow("x")
+    key = slow.cache._entry_key(slow.cache.key_for({"text": "x"}))
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    POPOTO_REDIS_DB.set(key, '{"value": "done", "compute_s": 1.5, "ts": 0}')
+    slow("x")
+    saved = metrics()[("valor_llm_cache_saved_seconds_total", "t_saved")]
+    assert 1.4 < saved <= 1.5
+
+
+def test_kill_switch(metrics, monkeypatch):
+    calls = []
+
+    @llm_cached("t_off")
+    def echo(text: str) -> str:
+        calls.append(text)
+        return text
+
+    monkeypatch.setenv("LLM_CACHE_DISABLED", "1")
+    echo("a")
+    echo("a")
+    assert calls == ["a", "a"]
+    assert metrics() == {}
@@ -12,9 +12,10 @@ wrapper's contract without hitting the real Anthropic API:
 * The shared ``agent.anthropic_client.semaphore_slot()`` is held for the
   *entire* ``Agent.run()`` call, matching the hotfix #1055/#1111
   per-call-slot invariant (Spike Results spike-1).
-* The ``AsyncAnthropic`` client the wrapper constructs is the one
+* The pooled ``AsyncAnthropic`` client the wrapper leases is the one
   PydanticAI's ``AnthropicProvider`` actually uses (injection took
-  effect) -- not one PydanticAI built itself.
+  effect) -- not one PydanticAI built itself -- and it is reused across
+  calls until a timeout retires it (hotfix #1055).
 * The outer ``asyncio.wait_for(hard_timeout)`` bounds wall-clock time
   regardless of a larger SDK-level ``timeout`` kwarg.
 * Empty/None/whitespace-only prompts fail fast with no LLM call and no
@@ -29,7 +30,9 @@ no test makes a real Anthropic API call.
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
+import weakref
 
 import anthropic
 import pytest
@@ -37,6 +40,7 @@ from pydantic import BaseModel
 from pydantic_ai.messages import ModelMessage, ModelResponse, ToolCallPart
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 
+from agent import anthropic_client
 from agent.llm import LLMCallError, run_typed
 from agent.llm import wrapper as wrapper_mod
 
@@ -51,21 +55,32 @@ class Classification(BaseModel):
 class FakeAsyncAnthropic:
     """Stand-in for ``anthropic.AsyncAnthropic`` -- no real network I/O.
 
-    Records every construction (api_key/timeout kwargs) and supports the
-    ``async with`` protocol the wrapper relies on for hotfix #1055 httpx
-    cleanup. Tests assert on ``instances`` to prove the wrapper builds a
-    fresh client per call and that PydanticAI's provider ends up wired to
+    Records every construction and supports ``with_options(timeout=...)``
+    and ``close()``, the two calls the client pool makes. Tests assert on
+    ``instances`` to prove the wrapper reuses the pooled client, that a
+    timeout retires it, and that PydanticAI's provider ends up wired to
     *that* instance.
     """
 
     instances: list[FakeAsyncAnthropic] = []
 
-    def __init__(self, *, api_key: str | None = None, timeout: float | None = None) -> None:
+    def __init__(
+        self, *, api_key: str | None = None, timeout: float | None = None, http_client=None
+    ) -> None:
         self.api_key = api_key
         self.timeout = timeout
         self.closed = False
+        self.root = self
         FakeAsyncAnthropic.instances.append(self)
 
+    def with_options(self, *, timeout: float) -> FakeAsyncAnthropic:
+        clone = copy.copy(self)
+        clone.timeout = timeout
+        return clone
+
+    async def close(self) -> None:
+        self.closed = True
+
     async def __aenter__(self) -> FakeAsyncAnthropic:
         return self
 
@@ -84,6 +99,7 @@ class SpySemaphoreSlot:
     def __init__(self) -> None:
         self.entered = False
         self.exited = False
+        self.lane: str | None = None
         self.held_during_model_call: bool | None = None
 
     async def __aenter__(self) -> None:
@@ -103,10 +119,11 @@ def _tool_response(info: AgentInfo, args: dict) -> ModelResponse:
 
 @pytest.fixture(autouse=True)
 def _isolate_anthropic_client(monkeypatch):
-    """Every test gets a network-free ``anthropic.AsyncAnthropic``."""
+    """Every test gets a network-free ``anthropic.AsyncAnthropic`` and an empty pool."""
     FakeAsyncAnthropic.instances = []
     monkeypatch.setattr(anthropic, "AsyncAnthropic", FakeAsyncAnthropic)
-    monkeypatch.setattr(wrapper_mod, "get_anthropic_api_key", lambda: "fake-test-key")
+    monkeypatch.setattr(anthropic_client, "get_anthropic_api_key", lambda: "fake-test-key")
+    monkeypatch.setattr(anthropic_client, "_pools", weakref.WeakKeyDictionary())
     yield
 
 
@@ -114,7 +131,12 @@ def _isolate_anthropic_client(monkeypatch):
 def spy_semaphore_slot(monkeypatch):
     """Replace ``semaphore_slot`` with a recording spy; return the spy instance."""
     spy = SpySemaphoreSlot()
-    monkeypatch.setattr(wrapper_mod, "semaphore_slot", lambda: spy)
+
+    def slot(lane: str = anthropic_client.DEFAULT_LANE) -> SpySemaphoreSlot:
+        spy.lane = lane
+        return spy
+
+    monkeypatch.setattr(wrapper_mod, "semaphore_slot", slot)
     return spy
 
 
@@ -259,6 +281,18 @@ class TestSemaphoreSlotAcquisition:
 
         assert spy_semaphore_slot.exited is True
 
+    async def test_lane_forwarded_to_slot(self, monkeypatch, spy_semaphore_slot):
+        def fn(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            return _tool_response(info, {"label": "x", "confidence": 0.5})
+
+        _install_function_model(monkeypatch, fn)
+
+        await run_typed("classify: hello there", Classification)
+        assert spy_semaphore_slot.lane == "pipeline"
+
+        await run_typed("classify: hello there", Classification, lane="interactive")
+        assert spy_semaphore_slot.lane == "interactive"
+
 
 class TestInjectedClientTookEffect:
     async def test_provider_client_is_the_wrapper_constructed_client(self, monkeypatch):
@@ -273,12 +307,12 @@ class TestInjectedClientTookEffect:
 
         assert len(FakeAsyncAnthropic.instances) == 1
         wrapper_client = FakeAsyncAnthropic.instances[0]
-        assert capture["provider"].client is wrapper_client, (
-            "AnthropicProvider must be wired to the client run_typed constructed "
-            "per-call, not one PydanticAI built itself"
+        assert capture["provider"].client.root is wrapper_client, (
+            "AnthropicProvider must be wired to the pooled client run_typed "
+            "leased, not one PydanticAI built itself"
         )
 
-    async def test_fresh_client_per_call_not_shared(self, monkeypatch):
+    async def test_pooled_client_reused_across_calls(self, monkeypatch):
         def fn(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
             return _tool_response(info, {"label": "x", "confidence": 0.5})
 
@@ -287,18 +321,40 @@ class TestInjectedClientTookEffect:
         await run_typed("first call", Classification)
         await run_typed("second call", Classification)
 
-        assert len(FakeAsyncAnthropic.instances) == 2
-        assert FakeAsyncAnthropic.instances[0] is not FakeAsyncAnthropic.instances[1]
+        assert len(FakeAsyncAnthropic.instances) == 1
+        assert FakeAsyncAnthropic.instances[0].closed is False
+
+    async def test_sdk_timeout_applied_per_call(self, monkeypatch):
+        capture: dict = {}
 
-    async def test_sdk_timeout_passed_to_constructed_client(self, monkeypatch):
         def fn(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
             return _tool_response(info, {"label": "x", "confidence": 0.5})
 
-        _install_function_model(monkeypatch, fn)
+        _install_function_model(monkeypatch, fn, capture=capture)
 
         await run_typed("classify: hello there", Classification, sdk_timeout=7.5)
 
-        assert FakeAsyncAnthropic.instances[0].timeout == 7.5
+        assert capture["provider"].client.timeout == 7.5
+
+    async def test_hard_timeout_retires_pooled_client(self, monkeypatch):
+        async def slow(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            await asyncio.sleep(5.0)
+            return _tool_response(info, {"label": "x", "confidence": 0.5})
+
+        _install_function_model(monkeypatch, slow)
+        with pytest.raises(LLMCallError):
+            await run_typed("classify: hello there", Classification, hard_timeout=0.1)
+
+        def fn(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            return _tool_response(info, {"label": "x", "confidence": 0.5})
+
+        _install_function_model(monkeypatch, fn)
+        await run_typed("classify: hello there", Classification)
+
+        assert FakeAsyncAnthropic.instances[0].closed is True, (
+            "hotfix #1055: a client whose call timed out must be closed, not reused"
+        )
+        assert len(FakeAsyncAnthropic.instances) == 2
 
 
 class TestHardTimeoutBound:
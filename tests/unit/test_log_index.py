@@ -0,0 +1,152 @@
+"""Tests for the incremental log scanner (monitoring/log_index.py).
+
+Each test scans real files under ``tmp_path`` into the per-test SQLite index
+that the autouse ``isolate_log_index_db`` fixture points at: rescans read only
+appended bytes, a ``log_rotate.py``-style rename neither loses nor repeats an
+event, truncation and inode reuse restart from zero, and classification keeps
+the original first-match-wins priority.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from monitoring import log_index
+from reflections.utilities import extract_structured_errors
+
+pytestmark = pytest.mark.unit
+
+
+def _line(level: str, message: str, minutes_ago: int = 1) -> str:
+    ts = (datetime.now() - timedelta(minutes=minutes_ago)).strftime("%Y-%m-%d %H:%M:%S")
+    return f"{ts},123 [{level}] {message}\n"
+
+
+def _append(path, *lines: str) -> None:
+    with open(path, "a") as f:
+        f.writelines(lines)
+
+
+def _messages(log) -> list[str]:
+    return [e["message"] for e in log_index.query_events(log, levels=log_index.INDEXED_LEVELS)]
+
+
+def test_rescan_reads_only_new_bytes(tmp_path):
+    log = tmp_path / "bridge.log"
+    _append(log, _line("INFO", "started"), _line("ERROR", "first failure"))
+    first = log_index.scan_file(log)
+    assert first.new_bytes == log.stat().st_size
+    assert first.events == 1
+
+    assert log_index.scan_file(log).new_bytes == 0
+
+    appended = _line("WARNING", "slow") + _line("ERROR", "second failure")
+    _append(log, appended)
+    second = log_index.scan_file(log)
+    assert second.new_bytes == len(appended.encode())
+    assert second.events == 2
+    assert _messages(log) == ["first failure", "slow", "second failure"]
+    assert log_index.checkpoint_stats(log)["lines"] == 4
+
+
+def test_unterminated_line_waits_for_its_newline(tmp_path):
+    log = tmp_path / "bridge.log"
+    partial = _line("ERROR", "half written").rstrip("\n")
+    _append(log, partial)
+    assert log_index.scan_file(log).events == 0
+
+    _append(log, "\n")
+    assert log_index.scan_file(log).events == 1
+    assert _messages(log) == ["half written"]
+
+
+def test_rotation_rename_loses_and_repeats_nothing(tmp_path):
+    log = tmp_path / "bridge.log"
+    _append(log, _line("ERROR", "before scan"))
+    log_index.scan_file(log)
+
+    # Written after the last scan, then rotated away before the next one.
+    _append(log, _line("ERROR", "tail before rotation"))
+    os.rename(log, tmp_path / "bridge.log.1")
+    _append(log, _line("ERROR", "after rotation"))
+
+    result = log_index.scan_file(log)
+    assert result.events == 2
+    assert sorted(_messages(log)) == ["after rotation", "before scan", "tail before rotation"]
+    assert log_index.scan_file(log).events == 0
+
+
+def test_truncation_rescans_from_start(tmp_path):
+    log = tmp_path / "bridge.log"
+    _append(log, _line("ERROR", "old one"), _line("ERROR", "old two"))
+    log_index.scan_file(log)
+
+    with open(log, "w") as f:
+        f.write(_line("ERROR", "new"))
+    assert log_index.scan_file(log).events == 1
+    assert _messages(log)[-1] == "new"
+
+
+def test_reused_inode_with_different_head_rescans(tmp_path):
+    log = tmp_path / "bridge.log"
+    _append(log, _line("ERROR", "original", minutes_ago=5))
+    log_index.scan_file(log)
+
+    # Same inode, same-or-larger size, different first bytes.
+    replacement = _line("ERROR", "replacement content") + _line("ERROR", "and more")
+    with open(log, "r+") as f:
+        f.write(replacement)
+    assert log_index.scan_file(log).events == 2
+
+
+def test_classifier_keeps_first_match_priority():
+    # "timeout" appears first in the text but ConnectionResetError is listed first.
+    assert log_index.classify("timeout while ConnectionResetError") == "telegram_connection_reset"
+    assert log_index.classify("Stale index entry for session x") == "stale_index_entry"
+    assert log_index.classify("KeyError: 'x'") == "python_error"
+    assert log_index.classify("all good") is None
+
+
+def test_level_must_sit_in_the_header():
+    text = _line("INFO", "retrying after ERROR from upstream") + _line("ERROR", "real one")
+    assert [e["message"] for _, e in log_index.parse_events(text)] == ["real one"]
+
+
+def test_json_lines_and_counts(tmp_path):
+    log = tmp_path / "worker.log"
+    ts = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    records = [
+        {"timestamp": ts, "level": "ERROR", "logger": "w", "message": "HTTP 503 from api"},
+        {"timestamp": ts, "level": "INFO", "logger": "w", "message": "ok"},
+        {"timestamp": ts, "level": "WARNING", "logger": "w", "message": "rate limit hit"},
+    ]
+    _append(log, *(json.dumps(r) + "\n" for r in records))
+    log_index.scan_file(log)
+
+    assert log_index.level_counts(log) == {"ERROR": 1, "WARNING": 1}
+    assert log_index.bucket_counts(log) == {"http_error": 1, "rate_limit": 1}
+    assert log_index.daily_counts(log) == {ts[:10]: 2}
+
+
+def test_extract_structured_errors_reads_the_index(tmp_path):
+    log = tmp_path / "hooks.log"
+    _append(
+        log,
+        _line("ERROR", "old failure", minutes_ago=3 * 24 * 60),
+        _line("ERROR", "hook crashed"),
+        "Traceback (most recent call last):\n",
+        '  File "hook.py", line 1\n',
+        _line("WARNING", "not an error"),
+    )
+    since = (datetime.now() - timedelta(days=1)).timestamp()
+
+    errors = extract_structured_errors(log, since=since)
+    assert [e["message"] for e in errors] == ["hook crashed"]
+    assert errors[0]["level"] == "ERROR"
+    assert errors[0]["context"].startswith("Traceback (most recent call last):")
+    assert [e["message"] for e in extract_structured_errors(log)] == [
+        "old failure",
+        "hook crashed",
+    ]
@@ -19,6 +19,15 @@ def _force_legacy_retrieval_mode(monkeypatch):
     monkeypatch.setattr(settings.hybrid_eval, "retrieval_mode", "current")
 
 
+def _serve(mock_memory_cls, lookup):
+    """Answer the batched hydration (``Memory.query.get_many``) key by key."""
+    mock_memory_cls.query.get_many.side_effect = lambda keys, **kw: [lookup(k) for k in keys]
+
+
+def _hydrated_keys(mock_memory_cls):
+    return [k for c in mock_memory_cls.query.get_many.call_args_list for k in c.args[0]]
+
+
 class TestFilterByProject:
     """Test the _filter_by_project() helper."""
 
@@ -353,7 +362,7 @@ class TestRetrieveMemories:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = mock_record
+            _serve(mock_memory_cls, lambda key: mock_record)
 
             result = retrieve_memories("test query", "project", limit=10)
 
@@ -384,7 +393,7 @@ class TestRetrieveMemories:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = mock_record
+            _serve(mock_memory_cls, lambda key: mock_record)
 
             result = retrieve_memories("test query", "project", limit=10)
 
@@ -412,7 +421,7 @@ class TestRetrieveMemories:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.side_effect = Exception("BM25 index missing")
-            mock_memory_cls.query.get.return_value = mock_record
+            _serve(mock_memory_cls, lambda key: mock_record)
 
             result = retrieve_memories("test query", "project", limit=10)
 
@@ -451,7 +460,7 @@ class TestRetrieveMemories:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = [(key, 5.0)]
-            mock_memory_cls.query.get.return_value = mock_record
+            _serve(mock_memory_cls, lambda key: mock_record)
 
             result = retrieve_memories("test", "proj", rrf_k=20)
 
@@ -461,7 +470,7 @@ class TestRetrieveMemories:
         assert abs(result[0].score - expected_score) < 1e-10
 
     def test_hydration_failure_skips_record(self):
-        """If Memory.query.get fails for a key, that key is skipped."""
+        """A key with no Memory hash is skipped."""
         from agent.memory_retrieval import retrieve_memories
 
         with (
@@ -472,7 +481,7 @@ class TestRetrieveMemories:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = [("Memory:missing:proj", 5.0)]
-            mock_memory_cls.query.get.return_value = None  # Not found
+            _serve(mock_memory_cls, lambda key: None)  # Not found
 
             result = retrieve_memories("test query", "proj")
 
@@ -501,14 +510,14 @@ class TestRetrieveMemories:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = mock_record
+            _serve(mock_memory_cls, lambda key: mock_record)
 
             result = retrieve_memories("test query", "projA", limit=10)
 
         # projB key should be excluded -- only 2 results from projA
         assert len(result) == 2
         # Verify hydration was only called for projA keys
-        hydrated_keys = [call.args[0] for call in mock_memory_cls.query.get.call_args_list]
+        hydrated_keys = _hydrated_keys(mock_memory_cls)
         assert all("projA" in k for k in hydrated_keys)
         assert not any("projB" in k for k in hydrated_keys)
 
@@ -547,7 +556,7 @@ class TestRetrieveMemories:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = owned_record
+            _serve(mock_memory_cls, lambda key: owned_record)
 
             result = retrieve_memories("test query", "projA", limit=10)
 
@@ -555,7 +564,7 @@ class TestRetrieveMemories:
         assert len(result) == 1
         assert result[0].memory_id == "owned"
         # Verify hydration only called with projA key
-        hydrated_keys = [call.args[0] for call in mock_memory_cls.query.get.call_args_list]
+        hydrated_keys = _hydrated_keys(mock_memory_cls)
         assert len(hydrated_keys) == 1
         assert "projA" in hydrated_keys[0]
 
@@ -592,7 +601,7 @@ class TestRelevanceThreshold:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = rec
+            _serve(mock_memory_cls, lambda key: rec)
 
             result = retrieve_memories("query", "proj", limit=50, min_rrf_score=None)
 
@@ -616,7 +625,7 @@ class TestRelevanceThreshold:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = rec
+            _serve(mock_memory_cls, lambda key: rec)
 
             result = retrieve_memories("q", "proj", limit=10, min_rrf_score=0.02)
 
@@ -643,7 +652,7 @@ class TestRelevanceThreshold:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = rec
+            _serve(mock_memory_cls, lambda key: rec)
 
             result = retrieve_memories("q", "proj", limit=10, min_rrf_score=0.02)
 
@@ -666,7 +675,7 @@ class TestRelevanceThreshold:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = rec
+            _serve(mock_memory_cls, lambda key: rec)
 
             result = retrieve_memories("q", "proj", limit=10, min_rrf_score=0)
 
@@ -691,7 +700,7 @@ class TestRelevanceThreshold:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = rec
+            _serve(mock_memory_cls, lambda key: rec)
 
             result = retrieve_memories("q", "proj", limit=10, min_rrf_score=float("inf"))
 
@@ -712,7 +721,7 @@ class TestRelevanceThreshold:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = [(key, 5.0)]
-            mock_memory_cls.query.get.return_value = rec
+            _serve(mock_memory_cls, lambda key: rec)
 
             # malformed threshold -- function must return results, not crash
             result = retrieve_memories("q", "proj", limit=10, min_rrf_score="bogus")
@@ -721,7 +730,7 @@ class TestRelevanceThreshold:
         assert len(result) == 1
 
     def test_threshold_does_not_hydrate_dropped_keys(self):
-        """Filtered keys must not trigger Memory.query.get -- saves Redis I/O."""
+        """Filtered keys must not be hydrated -- saves Redis I/O."""
         from agent.memory_retrieval import retrieve_memories
 
         survivor = self._make_record("survivor")
@@ -743,13 +752,13 @@ class TestRelevanceThreshold:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.return_value = survivor
+            _serve(mock_memory_cls, lambda key: survivor)
 
             retrieve_memories("q", "proj", limit=10, min_rrf_score=0.02)
 
         # Only the surviving key should be hydrated -- the dropped key
-        # must not appear in any Memory.query.get call.
-        hydrated = [c.args[0] for c in mock_memory_cls.query.get.call_args_list]
+        # must not be passed to Memory.query.get_many.
+        hydrated = _hydrated_keys(mock_memory_cls)
         assert key_drop not in hydrated
 
 
@@ -788,7 +797,7 @@ class TestSupersededFilter:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = bm25_results
-            mock_memory_cls.query.get.side_effect = mock_get
+            _serve(mock_memory_cls, mock_get)
 
             result = retrieve_memories("test query", "testproj", limit=10)
 
@@ -815,7 +824,7 @@ class TestSupersededFilter:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = [(key, 0.9)]
-            mock_memory_cls.query.get.return_value = none_superseded_record
+            _serve(mock_memory_cls, lambda key: none_superseded_record)
 
             result = retrieve_memories("test query", "testproj", limit=10)
 
@@ -946,7 +955,7 @@ class TestGetEmbeddingRanked:
             patch("models.memory.Memory") as mock_memory_cls,
         ):
             mock_bm25.search.return_value = [(key, 5.0)]
-            mock_memory_cls.query.get.return_value = mock_record
+            _serve(mock_memory_cls, lambda key: mock_record)
 
             result = retrieve_memories("test query", "proj", limit=10)
 
@@ -1114,7 +1123,7 @@ class TestParaphraseRecall:
             # BM25 returns nothing -- no keyword overlap between
             # "terse replies" and "keep answers short"
             mock_bm25.search.return_value = []
-            mock_memory_cls.query.get.return_value = mock_record
+            _serve(mock_memory_cls, lambda key: mock_record)
 
             result = retrieve_memories("keep answers short", "proj", limit=10)
 
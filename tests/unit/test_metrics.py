@@ -0,0 +1,163 @@
+"""Tests for the in-process metrics core (analytics/metrics.py).
+
+Histogram math and the Prometheus rendering are pure; the snapshot export,
+the ``/metrics`` route and the Redis client instrumentation run against the
+per-test Redis (autouse ``redis_test_db``).
+"""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+import redis
+
+from analytics import metrics
+from analytics.metrics import Histogram, counter, gauge, histogram, render_prometheus, timed
+
+pytestmark = pytest.mark.unit
+
+
+def test_observe_buckets_and_quantile():
+    h = Histogram()
+    for _ in range(90):
+        h.observe(0.0002)  # (1e-4, 2.5e-4]
+    for _ in range(10):
+        h.observe(0.02)  # (1e-2, 2.5e-2]
+
+    assert h.count == 100
+    assert h.sum == pytest.approx(90 * 0.0002 + 10 * 0.02)
+    assert 1e-4 < h.quantile(0.5) <= 2.5e-4
+    assert 1e-2 < h.quantile(0.95) <= 2.5e-2
+    h.observe(10_000)  # Past the last bound
+    assert h.quantile(1.0) == metrics.LATENCY_BOUNDS[-1]
+
+
+def test_window_ring_ages_out_old_slots(monkeypatch):
+    monkeypatch.setattr(metrics, "WINDOW_SLOTS", 3)
+    h = Histogram()
+    h.observe(5.0)
+    for _ in range(2):
+        h.rotate()
+        h.observe(0.001)
+
+    assert h.quantile(1.0) > 1.0  # Slow sample still inside the window
+    h.rotate()
+    assert h.quantile(1.0) <= 0.001  # Rotated out of the window...
+    assert h.quantile(1.0, window=False) > 1.0  # ...but kept in lifetime counts
+    assert h.count == 3
+
+
+def test_families_dedupe_and_reject_conflicts():
+    fam = histogram("test_dedupe_seconds", "x", ("op",))
+
+    assert histogram("test_dedupe_seconds", "x", ("op",)) is fam
+    assert fam.labels("get") is fam.labels("get")
+    with pytest.raises(ValueError):
+        counter("test_dedupe_seconds", "x", ("op",))
+    with pytest.raises(ValueError):
+        fam.labels("get", "extra")
+
+
+def test_timed_context_manager_and_decorators():
+    h = Histogram()
+
+    with timed(h):
+        time.sleep(0.01)
+
+    @timed(h)
+    def sync_call():
+        return 1
+
+    @timed(h)
+    async def async_call():
+        await asyncio.sleep(0)
+        return 2
+
+    assert sync_call() == 1
+    assert asyncio.run(async_call()) == 2
+    assert h.count == 3
+    assert h.sum >= 0.01
+
+
+# An observation costs about 0.2us uncontended. The bound is 25x that, so a
+# loaded CI host (xdist workers, parallel agents) does not fail it, while a
+# lock, an allocation per call or an I/O write on the hot path still would.
+# The best of several trials estimates the uncontended cost, not the load.
+_OBSERVE_BUDGET_S = 5e-6
+
+
+@pytest.mark.slow
+def test_observation_overhead_budget():
+    h = Histogram()
+    n = 20_000
+    best = float("inf")
+    for _ in range(7):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            h.observe(0.0003)
+        best = min(best, (time.perf_counter() - t0) / n)
+
+    assert best < _OBSERVE_BUDGET_S, f"observe() took {best * 1e6:.2f}us"
+
+
+def test_render_merges_processes_by_name():
+    fam = histogram("test_render_seconds", "Render test.", ("op",))
+    fam.labels("get").observe(0.0002)
+    counter("test_render_total", "Render count.").inc(2)
+    gauge("test_render_inflight", "In flight.").set(3)
+    one = metrics.snapshot("worker")
+    twice = {**one, "pid": one["pid"] + 1}
+
+    text = render_prometheus([one, twice, metrics.snapshot("bridge")])
+
+    assert "# TYPE test_render_seconds histogram" in text
+    assert 'test_render_seconds_bucket{process="worker",op="get",le="0.0001"} 0' in text
+    assert 'test_render_seconds_bucket{process="worker",op="get",le="+Inf"} 2' in text
+    assert 'test_render_seconds_count{process="bridge",op="get"} 1' in text
+    assert 'test_render_total{process="worker"} 4' in text
+    assert 'test_render_inflight{process="bridge"} 3' in text
+
+
+def test_export_and_metrics_route():
+    from fastapi.testclient import TestClient
+
+    from ui.app import create_app
+
+    histogram("test_route_seconds", "Route test.").observe(0.5)
+    assert metrics.export_snapshot("worker")
+    remote = {**metrics.snapshot("bridge"), "pid": os.getpid() + 1}
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    POPOTO_REDIS_DB.set(f"metrics:snapshot:bridge:{remote['pid']}", json.dumps(remote))
+
+    response = TestClient(create_app()).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'test_route_seconds_count{process="bridge"} 1' in response.text
+    assert 'test_route_seconds_count{process="ui"} 1' in response.text  # Live, not the stored copy
+    assert 'process="worker"' not in response.text
+
+
+def test_redis_client_instrumentation():
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    from config.redis_bootstrap import instrument_redis_client
+
+    client = redis.Redis(connection_pool=POPOTO_REDIS_DB.connection_pool)
+    instrument_redis_client(client)
+    instrument_redis_client(client)  # Idempotent: no double wrapping
+    fam = histogram("valor_redis_command_seconds", "", ("command",))
+    before_set = fam.labels("SET").count
+    before_pipe = fam.labels("PIPELINE").count
+
+    client.set("metrics-test", "1")
+    pipe = client.pipeline()
+    pipe.get("metrics-test")
+    pipe.incr("metrics-test")
+    assert pipe.execute() == [b"1", 2]
+
+    assert fam.labels("SET").count == before_set + 1
+    assert fam.labels("PIPELINE").count == before_pipe + 1
@@ -0,0 +1,145 @@
+"""Tests for speculative enrichment at bridge intake (bridge/pre_enrichment.py).
+
+Stage results are shared through the per-test Redis (autouse ``redis_test_db``);
+the AI and network work behind each stage is replaced with counting fakes.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bridge import enrichment, pre_enrichment
+from models.telegram import TelegramMessage
+
+DESCRIPTION = "[User sent an image]\nImage description: a cat."
+
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.delenv("PRE_ENRICHMENT_DISABLED", raising=False)
+
+
+@pytest.fixture
+def stored_message(tmp_path):
+    img = tmp_path / "photo.png"
+    img.write_bytes(b"\x89PNG\r\n\x1a\n")
+    tm = TelegramMessage(
+        chat_id="-100",
+        message_id=7,
+        direction="in",
+        sender="alice",
+        content="look https://youtu.be/abc",
+        timestamp=time.time(),
+        has_media=True,
+        media_type="photo",
+        media_local_path=str(img),
+        youtube_urls=json.dumps([["https://youtu.be/abc", "abc"]]),
+    )
+    tm.save()
+    yield tm
+    tm.delete()
+
+
+@pytest.fixture
+def media_ai():
+    with patch(
+        "bridge.media.process_downloaded_media",
+        new_callable=AsyncMock,
+        return_value=(DESCRIPTION, []),
+    ) as proc:
+        yield proc
+
+
+@pytest.fixture
+def youtube_ai():
+    results = [{"success": True, "url": "https://youtu.be/abc", "transcript": "word " * 100}]
+
+    async def fake(text):
+        await asyncio.sleep(0.2)
+        return f"{text}\n\n[YouTube: abc]", results
+
+    mock = AsyncMock(side_effect=fake)
+    with patch("tools.link_analysis.process_youtube_urls_in_text", mock):
+        yield mock
+
+
+async def _worker_enrich(tm, text="look https://youtu.be/abc"):
+    return await enrichment.enrich_message(
+        text,
+        telegram_message=tm,
+        youtube_urls=tm.youtube_urls,
+        message_key=tm.msg_id,
+    )
+
+
+async def test_worker_reuses_stages_the_bridge_finished(stored_message, media_ai, youtube_ai):
+    ran = await pre_enrichment.pre_enrich(stored_message.msg_id, message_text="look")
+
+    result = await _worker_enrich(stored_message)
+
+    assert sorted(ran) == ["media", "youtube"]
+    assert result == f"{DESCRIPTION}\n\nlook https://youtu.be/abc\n\n[YouTube: abc]"
+    assert media_ai.await_count == 1
+    assert youtube_ai.await_count == 1
+
+
+async def test_worker_joins_a_stage_still_in_flight(stored_message, media_ai, youtube_ai):
+    bridge = asyncio.create_task(pre_enrichment.pre_enrich(stored_message.msg_id, message_text=""))
+    await asyncio.sleep(0.05)  # Bridge has claimed both stages and is mid-YouTube
+
+    result = await _worker_enrich(stored_message)
+    await bridge
+
+    assert "[YouTube: abc]" in result
+    assert youtube_ai.await_count == 1
+
+
+async def test_stages_run_concurrently(stored_message, media_ai, youtube_ai):
+    async def slow_media(path, media_type):
+        await asyncio.sleep(0.2)
+        return DESCRIPTION, []
+
+    media_ai.side_effect = slow_media
+    start = time.monotonic()
+
+    await _worker_enrich(stored_message)
+
+    assert time.monotonic() - start < 0.35
+
+
+async def test_failed_stage_is_released_for_a_retry(stored_message, youtube_ai):
+    with patch(
+        "bridge.media.process_downloaded_media",
+        new_callable=AsyncMock,
+        side_effect=RuntimeError("vision down"),
+    ):
+        await pre_enrichment.pre_enrich(stored_message.msg_id, message_text="")
+
+    assert pre_enrichment.peek(stored_message.msg_id, "media") is None
+    assert pre_enrichment.peek(stored_message.msg_id, "youtube")["state"] == "done"
+
+
+async def test_stale_claim_is_computed_after_join_timeout(stored_message, media_ai, monkeypatch):
+    monkeypatch.setattr(pre_enrichment, "JOIN_TIMEOUT_S", 0.3)
+    assert pre_enrichment._claim(stored_message.msg_id, "media")  # An owner that never finishes
+
+    result = await pre_enrichment.resolve(
+        stored_message.msg_id, "media", lambda: enrichment.media_stage(stored_message)
+    )
+
+    assert result["description"] == DESCRIPTION
+    assert media_ai.await_count == 1
+
+
+async def test_disabled_computes_without_redis(stored_message, media_ai, monkeypatch):
+    monkeypatch.setenv("PRE_ENRICHMENT_DISABLED", "1")
+
+    assert pre_enrichment.schedule(stored_message.msg_id, message_text="") is None
+    await pre_enrichment.resolve(
+        stored_message.msg_id, "media", lambda: enrichment.media_stage(stored_message)
+    )
+
+    assert pre_enrichment.peek(stored_message.msg_id, "media") is None
@@ -14,7 +14,7 @@ send tool's retirement (``docs/plans/consolidate_delivery_paths.md`` Decision C)
   historical schema.
 
 The real tool functions run; only the Redis client (``_get_redis``) is
-replaced with a MagicMock and only ``find_best_emoji`` (the embedding lookup)
+replaced with a MagicMock and only ``find_best_emoji_offloop`` (the embedding lookup)
 is stubbed so the resolved emoji is deterministic without loading the
 sticker-set embeddings. Nothing about the tool's own payload construction is
 mocked.
@@ -67,7 +67,7 @@ class TestReact:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_redis),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f525"),
             ),
         ):
@@ -95,7 +95,7 @@ class TestReact:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_redis),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f525"),
             ),
         ):
@@ -160,7 +160,7 @@ class TestReact:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_redis),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f44d"),
             ),
             patch("sys.argv", ["react_with_emoji.py", "happy"]),
@@ -190,7 +190,7 @@ class TestStandalone:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_redis),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f389", document_id=42, is_custom=True),
             ),
         ):
@@ -215,7 +215,7 @@ class TestStandalone:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_custom),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f389", document_id=42, is_custom=True),
             ),
         ):
@@ -229,7 +229,7 @@ class TestStandalone:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_std),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f525"),
             ),
         ):
@@ -254,7 +254,7 @@ class TestStandalone:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_redis),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f525"),
             ),
         ):
@@ -304,7 +304,7 @@ class TestStandalone:
         with (
             patch("tools.react_with_emoji._get_redis", return_value=mock_redis),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 return_value=EmojiResult(emoji="\U0001f525"),
             ),
             patch("sys.argv", ["react_with_emoji.py", "--standalone", "excited"]),
@@ -76,7 +76,7 @@ class TestErrorReactionPinned:
         with (
             patch.dict("os.environ", {}, clear=True),
             patch(
-                "tools.emoji_embedding.find_best_emoji",
+                "tools.emoji_embedding.find_best_emoji_offloop",
                 side_effect=AssertionError("pinned path must not call find_best_emoji"),
             ),
         ):
@@ -197,7 +197,7 @@ class TestSemanticDrawExcludesReservedGlyphs:
         from tools.emoji_embedding import EmojiResult
 
         with patch(
-            "tools.emoji_embedding.find_best_emoji",
+            "tools.emoji_embedding.find_best_emoji_offloop",
             return_value=EmojiResult(emoji="\U0001fae1"),  # 🫡
         ):
             from agent.constants import REACTION_SUCCESS
@@ -213,7 +213,7 @@ class TestSemanticDrawExcludesReservedGlyphs:
 
         # 🎉 is not reserved — a legitimate semantic result for REACTION_SUCCESS.
         with patch(
-            "tools.emoji_embedding.find_best_emoji",
+            "tools.emoji_embedding.find_best_emoji_offloop",
             return_value=EmojiResult(emoji="\U0001f389"),  # 🎉
         ):
             assert constants.REACTION_SUCCESS.emoji == "\U0001f389"
@@ -9,13 +9,16 @@ Covers:
 - aggregate status rules from the plan's table
 - `name` kwarg appears in summary
 - `disabled` aggregation
+- pooled mode: concurrency, order, queue_wait, per-project timeout, budget
+- duration histogram and per-project duration metric
 """
 
 from __future__ import annotations
 
+import time
 from unittest.mock import patch
 
-from reflections.utilities import run_per_project_audit
+from reflections.utilities import audit_subprocess_run, run_per_project_audit
 
 
 def _project(slug: str, wd: str = "/tmp") -> dict:
@@ -225,3 +228,136 @@ def test_audit_returning_non_dict_recorded_as_error():
     assert result["status"] == "error"
     assert result["projects"][0]["status"] == "error"
     assert "TypeError" in result["projects"][0]["error"]
+
+
+def _sleepy_audit(delays: dict[str, float]):
+    def audit(p):
+        time.sleep(delays.get(p["slug"], 0.0))
+        return {"status": "ok", "findings": [p["slug"]], "summary": "", "duration": 0.0}
+
+    return audit
+
+
+def test_pooled_runs_projects_concurrently_and_keeps_order():
+    projects = [_project(s) for s in ("a", "b", "c", "d")]
+    delays = {"a": 0.2, "b": 0.1, "c": 0.15, "d": 0.05}
+    with patch("reflections.utilities.load_local_projects", return_value=projects):
+        t0 = time.monotonic()
+        result = run_per_project_audit(_sleepy_audit(delays), name="pooled", max_workers=4)
+        elapsed = time.monotonic() - t0
+
+    assert elapsed < 0.45, "four projects should overlap, not sum to 0.5s"
+    assert result["status"] == "ok"
+    assert result["findings"] == ["[a] a", "[b] b", "[c] c", "[d] d"]
+    assert [r["slug"] for r in result["projects"]] == ["a", "b", "c", "d"]
+    assert all("queue_wait" in r for r in result["projects"])
+
+
+def test_pooled_queue_wait_reflects_worker_bound():
+    projects = [_project("a"), _project("b")]
+    with patch("reflections.utilities.load_local_projects", return_value=projects):
+        result = run_per_project_audit(
+            _sleepy_audit({"a": 0.1}), name="pooled", max_workers=1, project_timeout=5
+        )
+    a, b = result["projects"]
+    assert a["queue_wait"] < 0.05
+    assert b["queue_wait"] >= 0.09
+
+
+def test_project_timeout_records_error_and_keeps_others():
+    projects = [_project("slow"), _project("fast")]
+    with patch("reflections.utilities.load_local_projects", return_value=projects):
+        result = run_per_project_audit(
+            _sleepy_audit({"slow": 0.5}), name="timeouts", max_workers=2, project_timeout=0.1
+        )
+
+    slow, fast = result["projects"]
+    assert slow["status"] == "error"
+    assert slow["error"].startswith("TimeoutError: project audit exceeded 0.1s")
+    assert fast["status"] == "ok"
+    assert result["findings"] == ["[fast] fast"]
+    assert result["status"] == "error"
+    assert result["wall_clock"] < 0.45
+
+
+def test_abandoned_project_subprocess_is_killed_at_its_limit():
+    ended: list[float] = []
+
+    def audit(project):
+        t0 = time.monotonic()
+        try:
+            audit_subprocess_run(["sleep", "30"], timeout=60)
+        finally:
+            ended.append(time.monotonic() - t0)
+        return {"status": "ok", "findings": [], "summary": "", "duration": 0.0}
+
+    with patch("reflections.utilities.load_local_projects", return_value=[_project("hung")]):
+        result = run_per_project_audit(audit, name="hung", max_workers=1, project_timeout=0.2)
+
+    assert result["projects"][0]["status"] == "error"
+    for _ in range(50):
+        if ended:
+            break
+        time.sleep(0.05)
+    assert ended and ended[0] < 1.0, "the subprocess outlived the project timeout"
+
+
+def test_audit_subprocess_run_is_uncapped_outside_a_pool():
+    assert audit_subprocess_run(["true"], timeout=5).returncode == 0
+
+
+def test_budget_exhaustion_errors_running_and_unstarted_projects():
+    projects = [_project("a"), _project("b"), _project("c")]
+    with patch("reflections.utilities.load_local_projects", return_value=projects):
+        result = run_per_project_audit(
+            _sleepy_audit({"a": 0.05, "b": 0.5, "c": 0.5}),
+            name="budget",
+            max_workers=1,
+            project_timeout=5,
+            budget=0.2,
+        )
+
+    a, b, c = result["projects"]
+    assert a["status"] == "ok"
+    assert b["error"] == "TimeoutError: audit wall-clock budget exhausted"
+    assert c["error"] == "TimeoutError: audit wall-clock budget exhausted before start"
+    assert result["summary"] == "budget: 1 project(s) scanned, 0 skipped, 2 error(s)"
+
+
+def test_serial_budget_is_checked_between_projects():
+    projects = [_project("a"), _project("b")]
+    with patch("reflections.utilities.load_local_projects", return_value=projects):
+        result = run_per_project_audit(_sleepy_audit({"a": 0.1}), name="serial", budget=0.05)
+
+    assert result["projects"][0]["status"] == "ok"
+    assert result["projects"][1]["error"].endswith("budget exhausted before start")
+    assert "queue_wait" not in result["projects"][0]
+
+
+def test_duration_histogram_and_metric():
+    projects = [_project("a"), _project("b"), _project("c")]
+
+    def audit(p):
+        duration = {"a": 0.5, "b": 12.0, "c": 900.0}[p["slug"]]
+        return {"status": "ok", "findings": [], "summary": "", "duration": duration}
+
+    with (
+        patch("reflections.utilities.load_local_projects", return_value=projects),
+        patch("analytics.collector.record_metric") as record_metric,
+    ):
+        result = run_per_project_audit(audit, name="histo")
+
+    assert result["duration_histogram"] == {
+        "<=1s": 1,
+        "<=5s": 0,
+        "<=15s": 1,
+        "<=60s": 0,
+        "<=300s": 0,
+        ">300s": 1,
+    }
+    assert result["wall_clock"] >= 0.0
+    record_metric.assert_any_call(
+        "reflection.audit.project_duration",
+        12.0,
+        {"audit": "histo", "project": "b", "status": "ok"},
+    )
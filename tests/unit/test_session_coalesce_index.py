@@ -0,0 +1,136 @@
+"""Tests for the coalescing index (models/session_coalesce_index.py).
+
+Runs against the per-worker test Redis with real AgentSession rows: the email
+bridge's subject coalescing is answered from the index once a project is
+built, terminal sessions drop out, and Telegram replies to Valor's sent
+messages resolve their root session from the ``session_root`` cache.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bridge import context
+from bridge.email_bridge import find_coalescing_session_id
+from models import session_coalesce_index as sci
+from models.agent_session import AgentSession
+from models.session_lifecycle import finalize_session
+
+pytestmark = [pytest.mark.unit, pytest.mark.sessions]
+
+PROJECT = "coalesce-test"
+
+
+def _email_session(session_id, customer_id="cust-1", subject="Invoice", age_s=60, **kwargs):
+    session = AgentSession.create(
+        session_id=session_id,
+        project_key=PROJECT,
+        status=kwargs.pop("status", "pending"),
+        created_at=datetime.now(tz=UTC) - timedelta(seconds=age_s),
+        extra_context={
+            "transport": "email",
+            "customer_id": customer_id,
+            "email_subject": subject,
+        },
+        **kwargs,
+    )
+    sci.index_email_session(session_id, PROJECT, customer_id, subject.lower(), time.time() - age_s)
+    return session
+
+
+@pytest.fixture
+def built():
+    """An empty project index marked built, so lookups never scan."""
+    sci.rebuild_email(PROJECT, [])
+
+
+@pytest.fixture
+def no_scan():
+    with patch(
+        "bridge.email_bridge._query_non_terminal_sessions",
+        side_effect=AssertionError("scanned"),
+    ):
+        yield
+
+
+def test_lookup_uses_index_and_picks_newest(built, no_scan):
+    _email_session("email-old", age_s=7200)
+    _email_session("email-new", age_s=60)
+    _email_session("email-other-customer", customer_id="cust-2")
+    _email_session("email-other-subject", subject="Refund")
+
+    assert find_coalescing_session_id(PROJECT, "cust-1", "invoice") == "email-new"
+    assert find_coalescing_session_id(PROJECT, "cust-3", "invoice") is None
+
+
+def test_terminal_session_leaves_the_index(built, no_scan):
+    older = _email_session("email-a", age_s=600)
+    newer = _email_session("email-b", age_s=60)
+
+    finalize_session(newer, "completed", skip_auto_tag=True, skip_checkpoint=True)
+    assert find_coalescing_session_id(PROJECT, "cust-1", "invoice") == "email-a"
+
+    finalize_session(older, "failed", skip_auto_tag=True, skip_checkpoint=True)
+    assert find_coalescing_session_id(PROJECT, "cust-1", "invoice") is None
+
+
+def test_stale_and_expired_candidates_are_skipped(built, no_scan):
+    _email_session("email-kept", age_s=3600)
+    _email_session("email-closed-elsewhere", status="completed")  # never finalized here
+    _email_session("email-too-old", age_s=49 * 3600)
+    key = sci.email_key(PROJECT, "cust-1", "invoice")
+
+    assert find_coalescing_session_id(PROJECT, "cust-1", "invoice") == "email-kept"
+
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    members = {m.decode() for m in POPOTO_REDIS_DB.zrange(key, 0, -1)}
+    assert "email-closed-elsewhere" not in members
+
+
+def test_first_lookup_scans_and_builds_the_index():
+    AgentSession.create(
+        session_id="email-preexisting",
+        project_key=PROJECT,
+        status="running",
+        created_at=datetime.now(tz=UTC) - timedelta(hours=1),
+        extra_context={
+            "transport": "email",
+            "customer_id": "cust-1",
+            "email_subject": "Re: Invoice",
+        },
+    )
+    assert not sci.is_built(PROJECT)
+
+    assert find_coalescing_session_id(PROJECT, "cust-1", "invoice") == "email-preexisting"
+    assert sci.is_built(PROJECT)
+
+    with patch(
+        "bridge.email_bridge._query_non_terminal_sessions",
+        side_effect=AssertionError("scanned"),
+    ):
+        assert find_coalescing_session_id(PROJECT, "cust-1", "invoice") == "email-preexisting"
+
+
+def test_index_failure_falls_back_to_scan(built):
+    _email_session("email-scan", age_s=60)
+
+    with patch.object(sci, "find_email_session", side_effect=ConnectionError("down")):
+        assert find_coalescing_session_id(PROJECT, "cust-1", "invoice") == "email-scan"
+
+
+async def test_reply_to_sent_message_resolves_root_in_one_get():
+    context.record_sent_message_root(-1001, 555, "tg_my_proj_-1001_42")
+    context.record_sent_message_root(-1001, 556, "email_proj_x_1")  # Not a Telegram id
+
+    with (
+        patch.object(context, "_cache_walk_root", AsyncMock(side_effect=AssertionError("walked"))),
+        patch.object(context, "fetch_reply_chain", AsyncMock(return_value=[])),
+    ):
+        resolved = await context.resolve_root_session_id(None, -1001, 555, "my_proj")
+        fallback = await context.resolve_root_session_id(None, -1001, 556, "my_proj")
+
+    assert resolved == "tg_my_proj_-1001_42"
+    assert fallback == "tg_my_proj_-1001_556"
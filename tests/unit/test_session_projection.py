@@ -0,0 +1,203 @@
+"""Tests for AgentSession field projection with lazy hydration.
+
+Covers the contract the health loops rely on: projected fields are served from
+the HMGET row without loading the record, anything outside the projection
+hydrates it exactly once, projections refuse writes, and an already-materialized
+iterable passes through untouched. The byte comparison at the bottom is the
+per-tick benchmark the migration is justified by.
+"""
+
+import time
+
+import pytest
+
+from config.enums import SessionType
+from models.agent_session import AgentSession
+from models.session_projection import (
+    HEALTH_FIELDS,
+    SessionProjection,
+    hydrate,
+    only,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.sessions, pytest.mark.models]
+
+
+def _make_session(status: str = "running", **extra) -> AgentSession:
+    return AgentSession.create(
+        project_key="test-projection",
+        chat_id="proj-chat",
+        session_type=SessionType.ENG,
+        session_id=f"projection-{time.time_ns()}",
+        working_dir="/tmp",
+        status=status,
+        **extra,
+    )
+
+
+class TestOnly:
+    def test_projects_requested_fields_without_hydrating(self):
+        session = _make_session()
+        rows = only(AgentSession.query.filter(status="running"), "session_id", "status")
+
+        assert len(rows) == 1
+        row = rows[0]
+        assert isinstance(row, SessionProjection)
+        assert row.agent_session_id == session.id
+        assert row.session_id == session.session_id
+        assert row.status == "running"
+        assert not row.is_hydrated
+
+    def test_unprojected_field_hydrates_once(self):
+        session = _make_session(extra_context={"classification_type": "bug"})
+        row = only(AgentSession.query.filter(status="running"), "status")[0]
+
+        assert row.extra_context == {"classification_type": "bug"}
+        assert row.is_hydrated
+        assert row.hydrate().id == session.id
+        assert row.hydrate() is row.hydrate()
+
+    def test_property_evaluates_against_projection(self):
+        _make_session()
+        row = only(AgentSession.query.filter(status="running"))[0]
+
+        # Slugless eng session: routes by project_key, computed from projected
+        # fields alone.
+        assert row.worker_key == "test-projection"
+        assert row.is_project_keyed is True
+        assert not row.is_hydrated
+
+    def test_projection_is_read_only(self):
+        _make_session()
+        row = only(AgentSession.query.filter(status="running"))[0]
+
+        with pytest.raises(AttributeError, match="read-only"):
+            row.status = "failed"
+
+    def test_hydrate_helper_returns_full_record(self):
+        session = _make_session()
+        row = only(AgentSession.query.filter(status="running"))[0]
+
+        record = hydrate(row)
+        assert isinstance(record, AgentSession)
+        assert record.id == session.id
+        assert hydrate(record) is record
+
+    def test_vanished_record_reads_declared_default(self):
+        session = _make_session()
+        row = only(AgentSession.query.filter(status="running"), "status")[0]
+        session.delete()
+
+        assert row.hydrate() is None
+        assert row.turn_count == 0
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError, match="pid"):
+            only(AgentSession.query.filter(status="running"), "pid")
+
+    def test_cold_payload_field_reads_payload_not_marker(self):
+        context = {"revival_context": "y" * 3000}
+        _make_session(extra_context=context)
+        row = only(AgentSession.query.filter(status="running"), "status", "extra_context")[0]
+
+        assert row.extra_context == context
+        assert row.is_hydrated
+
+    def test_materialized_rows_pass_through(self):
+        rows = [object(), object()]
+        assert only(rows) == rows
+
+    def test_unreadable_builder_falls_back_to_full_scan(self):
+        from popoto.models.query import QueryBuilder
+
+        class _RenamedStateBuilder(QueryBuilder):
+            """A builder from a popoto that keeps its filters somewhere else."""
+
+            def __init__(self, rows):
+                self._rows = rows
+
+            def __iter__(self):
+                return iter(self._rows)
+
+            def __len__(self):
+                return len(self._rows)
+
+        records = [object(), object()]
+        assert only(_RenamedStateBuilder(records)) == records
+
+    def test_q_object_builder_falls_back_to_full_scan(self):
+        from popoto import Q
+
+        session = _make_session()
+        rows = only(AgentSession.query.filter(Q(status="running")))
+
+        assert [type(r) for r in rows] == [AgentSession]
+        assert rows[0].id == session.id
+
+    def test_health_fields_are_all_stored_fields(self):
+        stored = AgentSession._meta.fields
+        assert [f for f in HEALTH_FIELDS if f not in stored] == []
+
+
+def _reply_bytes(value) -> int:
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_reply_bytes(k) + _reply_bytes(v) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return sum(_reply_bytes(v) for v in value)
+    return 0
+
+
+class TestProjectionBytes:
+    """Per-tick reply bytes: a full query scan vs. ``only()`` with HEALTH_FIELDS."""
+
+    @staticmethod
+    def _measure(monkeypatch, scan) -> tuple[list, int]:
+        """Run ``scan`` and total the bytes of every Redis reply it reads.
+
+        Wraps the client classes rather than one instance, so popoto's own
+        read paths are counted whichever client object they go through.
+        """
+        import redis.client
+
+        total = 0
+
+        def recording(real):
+            def wrapper(*args, **kwargs):
+                nonlocal total
+                reply = real(*args, **kwargs)
+                total += _reply_bytes(reply)
+                return reply
+
+            return wrapper
+
+        with monkeypatch.context() as m:
+            m.setattr(
+                redis.client.Redis, "execute_command", recording(redis.client.Redis.execute_command)
+            )
+            m.setattr(redis.client.Pipeline, "execute", recording(redis.client.Pipeline.execute))
+            rows = scan()
+        return rows, total
+
+    def test_projection_reads_fraction_of_full_scan(self, monkeypatch):
+        # Heavy fields that stay in the core hash. The event log and context
+        # dicts are cold payloads (models/cold_payload.py): once large they are
+        # already out of a full scan's HGETALL, so they no longer measure the
+        # projection.
+        for _ in range(10):
+            _make_session(
+                tags=[f"tag-{i}-" + "t" * 60 for i in range(60)],
+                recent_sent_drafts=[{"text": "d" * 300} for _ in range(10)],
+            )
+
+        full_rows, full = self._measure(
+            monkeypatch, lambda: list(AgentSession.query.filter(status="running"))
+        )
+        projected_rows, projected = self._measure(
+            monkeypatch, lambda: only(AgentSession.query.filter(status="running"))
+        )
+
+        assert len(full_rows) == len(projected_rows) == 10
+        assert projected > 0
+        assert projected * 10 < full
@@ -0,0 +1,165 @@
+"""Tests for the global AgentSession time index (models/session_time_index.py).
+
+Runs against the per-worker test Redis with real AgentSession rows: lifecycle
+transitions keep the index current, range and day queries return only the
+matching sessions, and the index builds from the scan when its marker is
+missing and refreshes in the background when it is stale.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from popoto.redis_db import POPOTO_REDIS_DB
+
+from models import session_time_index as sti
+from models.agent_session import AgentSession
+from models.session_lifecycle import finalize_session, transition_status
+
+pytestmark = [pytest.mark.unit, pytest.mark.sessions]
+
+
+def _session(session_id: str, **kwargs) -> AgentSession:
+    return AgentSession.create(
+        session_id=session_id,
+        project_key=kwargs.pop("project_key", "time-index-test"),
+        created_at=datetime.now(tz=UTC),
+        **kwargs,
+    )
+
+
+def _ids(sessions) -> list[str]:
+    return [s.session_id for s in sessions]
+
+
+@pytest.fixture
+def built():
+    """An empty index marked built, so only index_session() writes are visible."""
+    sti.rebuild()
+
+
+def test_lifecycle_transitions_index_started_and_completed(built):
+    session = _session("life-1", status="pending")
+    assert sti.sessions_since("started", 3600) == []
+
+    session.started_at = datetime.now(tz=UTC)
+    transition_status(session, "running", reason="test pickup")
+    assert _ids(sti.sessions_since("started", 3600)) == ["life-1"]
+    assert sti.sessions_since("completed", 3600) == []
+
+    finalize_session(session, "completed", skip_auto_tag=True, skip_checkpoint=True)
+    assert _ids(sti.sessions_since("completed", 3600)) == ["life-1"]
+    today = datetime.now(tz=UTC).strftime("%Y-%m-%d")
+    assert sti.count_by_day("completed", [today]) == {today: 1}
+
+
+def test_range_and_day_queries_return_only_matching_sessions(built):
+    now = datetime.now(tz=UTC)
+    yesterday = (now - timedelta(days=1)).date()
+    noon = datetime(yesterday.year, yesterday.month, yesterday.day, 12, tzinfo=UTC)
+    started = {
+        "a": now - timedelta(minutes=1),
+        "b": noon - timedelta(minutes=1),
+        "c": noon,
+        "d": now - timedelta(days=3),
+    }
+    for sid, started_at in started.items():
+        sti.index_session(_session(sid, started_at=started_at))
+
+    assert sorted(_ids(sti.sessions_on_day("started", yesterday))) == ["b", "c"]
+    assert _ids(sti.sessions_since("started", 2 * 86400)) == ["b", "c", "a"]
+    assert _ids(sti.sessions_between("started", newest_first=True, limit=2)) == ["a", "c"]
+    assert _ids(sti.sessions_between("started", newest_first=True, offset=2, limit=2)) == [
+        "b",
+        "d",
+    ]
+
+
+def test_moved_timestamp_leaves_old_day_bucket(built):
+    now = datetime.now(tz=UTC)
+    session = _session("moved", started_at=now - timedelta(days=2))
+    sti.index_session(session)
+    session.started_at = now
+    session.save()
+    sti.index_session(session)
+
+    assert sti.sessions_on_day("started", (now - timedelta(days=2)).date()) == []
+    assert _ids(sti.sessions_on_day("started", now.date())) == ["moved"]
+
+    session.started_at = None
+    sti.index_session(session)
+    assert sti.sessions_since("started", 86400) == []
+
+
+def test_deleted_session_is_pruned_on_read(built):
+    session = _session("gone", started_at=datetime.now(tz=UTC))
+    sti.index_session(session)
+    session.delete()
+
+    assert sti.sessions_since("started", 3600) == []
+    assert POPOTO_REDIS_DB.zcard(sti._all_key("started")) == 0
+
+
+def test_first_query_rebuilds_from_scan():
+    """Sessions written around index_session() are found by the first build."""
+    _session("direct", status="completed", completed_at=time.time())
+
+    assert _ids(sti.sessions_since("completed", 3600)) == ["direct"]
+    assert POPOTO_REDIS_DB.get(sti._BUILT_KEY) is not None
+
+
+def test_stale_index_is_refreshed_off_the_request(monkeypatch, built):
+    """A lapsed marker serves the current index and rebuilds in a thread."""
+    started = []
+
+    class Thread:
+        def __init__(self, target, **kwargs):
+            self.target = target
+
+        def start(self):
+            started.append(self.target)
+
+    monkeypatch.setattr(sti.threading, "Thread", Thread)
+    _session("direct", status="completed", completed_at=time.time())
+    POPOTO_REDIS_DB.set(sti._BUILT_KEY, str(time.time() - sti.REBUILD_INTERVAL_S - 1))
+
+    assert sti.sessions_since("completed", 3600) == []
+    assert sti.sessions_since("completed", 3600) == []
+    assert len(started) == 1
+
+    started[0]()
+    assert _ids(sti.sessions_since("completed", 3600)) == ["direct"]
+    assert not POPOTO_REDIS_DB.exists(sti._REBUILD_LOCK_KEY)
+
+
+def test_entries_older_than_retention_are_not_indexed(built):
+    old = datetime.now(tz=UTC) - timedelta(days=sti.RETENTION_DAYS + 1)
+    sti.index_session(_session("ancient", started_at=old))
+
+    assert sti.session_keys_between("started") == []
+    assert not sti.covers_all("started")
+    assert sti.covers_all("completed")
+
+
+def test_partial_flag_clears_on_rebuild(built):
+    old = datetime.now(tz=UTC) - timedelta(days=sti.RETENTION_DAYS + 1)
+    session = _session("ancient", started_at=old)
+    sti.index_session(session)
+    assert not sti.covers_all("started")
+
+    session.delete()
+    sti.rebuild()
+    assert sti.covers_all("started")
+
+
+def test_finished_session_without_completed_at_marks_completed_partial(built):
+    _session("unstamped", status="failed")
+    assert sti.covers_all("completed")
+
+    sti.rebuild()
+    assert not sti.covers_all("completed")
+
+
+def test_unknown_kind_rejected():
+    with pytest.raises(ValueError, match="Unknown session time index kind"):
+        sti.sessions_since("created", 60)
@@ -834,7 +834,9 @@ class TestReactionPayloadSchemaParity:
         monkeypatch.setenv("TELEGRAM_CHAT_ID", "-100")
         monkeypatch.setenv("TELEGRAM_REPLY_TO", "42")
         monkeypatch.setenv("VALOR_SESSION_ID", "tg_user_-100_42")
-        with patch("tools.emoji_embedding.find_best_emoji", return_value=EmojiResult(emoji="🔥")):
+        with patch(
+            "tools.emoji_embedding.find_best_emoji_offloop", return_value=EmojiResult(emoji="🔥")
+        ):
             rwe.react("excited")
         payload = json.loads(fr.lists["telegram:outbox:tg_user_-100_42"][0])
         self._assert_parity(
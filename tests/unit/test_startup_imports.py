@@ -0,0 +1,156 @@
+"""Startup import discipline and boot-time budget for the worker and bridge.
+
+The provider SDKs (``anthropic``, ``pydantic_ai`` and the ``openai`` client it
+builds on, ``claude_agent_sdk`` with its mcp/starlette/uvicorn server stack)
+are loaded on first use, not at boot. These tests assert that on the real
+import chain in a fresh interpreter, hold each boot target to the measured
+import-time budget, and cover the ``-X importtime`` parser in
+``scripts/profile_startup.py`` and the ``record_boot`` metric it pairs with.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts import profile_startup
+from tests.db_claim import subprocess_env
+
+pytestmark = [pytest.mark.unit, pytest.mark.monitoring]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Top-level packages that must not load while the worker or bridge boots.
+DEFERRED_PACKAGES = ("anthropic", "pydantic_ai", "openai", "claude_agent_sdk", "mcp", "uvicorn")
+
+
+def _loaded_after(modules: list[str]) -> list[str]:
+    imports = "; ".join(f"import {m}" for m in modules)
+    code = (
+        f"import sys; {imports}; "
+        f"print('loaded:' + ','.join(p for p in {DEFERRED_PACKAGES!r} if p in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        env=subprocess_env(),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert out.returncode == 0, f"import failed: {out.stderr[-500:]}"
+    loaded = out.stdout.strip().splitlines()[-1].removeprefix("loaded:")
+    return [p for p in loaded.split(",") if p]
+
+
+class TestDeferredImports:
+    def test_worker_boot_defers_provider_sdks(self):
+        assert _loaded_after(profile_startup.BOOT_TARGETS["worker"]) == []
+
+    def test_bridge_boot_defers_provider_sdks(self):
+        assert _loaded_after(profile_startup.BOOT_TARGETS["bridge"]) == []
+
+    def test_lazy_wrapper_names_stay_patchable(self, monkeypatch):
+        from agent.llm import wrapper
+
+        sentinel = object()
+        monkeypatch.setattr(wrapper, "AnthropicModel", sentinel)
+        wrapper._load_providers()
+        assert wrapper.AnthropicModel is sentinel
+        assert wrapper.Agent.__name__ == "Agent"
+
+    async def test_first_call_imports_providers_off_the_loop(self, monkeypatch):
+        import threading
+
+        from agent.llm import wrapper
+
+        for name in wrapper._LAZY_IMPORTS:
+            monkeypatch.delitem(wrapper.__dict__, name, raising=False)
+        loop_thread = threading.get_ident()
+        import_threads = []
+        real = wrapper.__getattr__
+
+        def traced(name):
+            import_threads.append(threading.get_ident())
+            return real(name)
+
+        monkeypatch.setattr(wrapper, "__getattr__", traced)
+        await wrapper.warm_providers()
+
+        assert len(import_threads) == len(wrapper._LAZY_IMPORTS)
+        assert loop_thread not in import_threads
+
+    def test_unknown_attribute_still_raises(self):
+        from agent.llm import wrapper
+
+        with pytest.raises(AttributeError):
+            wrapper.NoSuchName  # noqa: B018
+
+
+class TestImportBudget:
+    """Measured import time of each boot target, best of three fresh interpreters."""
+
+    @pytest.mark.parametrize("target", sorted(profile_startup.BOOT_TARGETS))
+    def test_boot_target_within_budget(self, target):
+        modules = profile_startup.BOOT_TARGETS[target]
+        best = min(profile_startup.profile_imports(modules).total_s for _ in range(3))
+        assert best < profile_startup.BOOT_IMPORT_BUDGET_S, (
+            f"{target} imports take {best:.2f}s; run scripts/profile_startup.py "
+            f"--target {target} to see which package grew"
+        )
+
+
+class TestParseImporttime:
+    def test_self_time_summed_per_top_level_package(self):
+        stderr = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       100 |        100 |     anthropic._types",
+                "import time:       400 |        500 |   anthropic",
+                "import time:      1000 |       1500 | bridge.telegram_bridge",
+                "RuntimeWarning: unrelated noise",
+            ]
+        )
+        profile = profile_startup.parse_importtime(stderr)
+
+        assert profile.by_package["anthropic"] == pytest.approx(0.0005)
+        assert profile.by_package["bridge"] == pytest.approx(0.001)
+        assert profile.total_s == pytest.approx(0.0015)
+        assert profile.modules[-1] == ("bridge.telegram_bridge", 0.001, 0.0015)
+
+    def test_budget_gate_exit_code(self, monkeypatch, capsys):
+        profile = profile_startup.parse_importtime("import time:   2000000 |   2000000 | slow")
+        monkeypatch.setattr(profile_startup, "profile_imports", lambda modules: profile)
+
+        assert profile_startup.main(["--module", "slow", "--budget", "3"]) == 0
+        assert profile_startup.main(["--module", "slow", "--budget", "1"]) == 1
+        assert "[FAIL]" in capsys.readouterr().out
+
+
+class TestRecordBoot:
+    def test_appends_jsonl_entry(self, tmp_path, monkeypatch):
+        from agent import cold_start_metrics
+
+        log = tmp_path / "logs" / "boot_metrics.jsonl"
+        monkeypatch.setattr(cold_start_metrics, "_BOOT_METRICS_FILE", log)
+
+        cold_start_metrics.record_boot(process="worker", boot_seconds=1.23456)
+        cold_start_metrics.record_boot(process="bridge")
+
+        entries = [json.loads(line) for line in log.read_text().splitlines()]
+        assert [e["process"] for e in entries] == ["worker", "bridge"]
+        assert entries[0]["boot_seconds"] == 1.235
+        assert entries[1]["boot_seconds"] >= 0.0
+
+    def test_write_failure_is_swallowed(self, tmp_path, monkeypatch):
+        from agent import cold_start_metrics
+
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        monkeypatch.setattr(cold_start_metrics, "_BOOT_METRICS_FILE", blocker / "boot.jsonl")
+
+        cold_start_metrics.record_boot(process="worker", boot_seconds=1.0)
@@ -0,0 +1,250 @@
+"""Tests for test impact selection, sharding and the persistent scheduler store.
+
+Real git repos under ``tmp_path``; the coverage map is seeded directly in the
+store, and the semantic impact finder is faked.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import tools.code_impact_finder
+import tools.test_scheduler as test_scheduler
+from tools.test_scheduler import impact, store
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def scheduler_db(tmp_path, monkeypatch):
+    path = tmp_path / "test_scheduler.db"
+    monkeypatch.setenv("TEST_SCHEDULER_DB_PATH", str(path))
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repo on ``main`` with one source module and two test files."""
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "calc.py").write_text("def add(a, b):\n    return a + b\n")
+    (root / "tests" / "test_calc.py").write_text(
+        "from pkg.calc import add\n\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+    )
+    (root / "tests" / "test_other.py").write_text("def test_other():\n    assert True\n")
+    (root / "README.md").write_text("readme\n")
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "Test")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "seed")
+    _git(root, "checkout", "-q", "-b", "session/x")
+    return root
+
+
+@pytest.fixture
+def mapped(repo):
+    store.replace_coverage_map(
+        impact.repo_key(repo), {"pkg/calc.py": {"tests/test_calc.py::test_add"}}, "abc"
+    )
+    return repo
+
+
+def _select(repo):
+    changed, base_rev = impact.changed_files(repo, "main")
+    return impact.select_tests(changed, repo, base_rev=base_rev)
+
+
+def _fake_finder(monkeypatch, paths=(), degraded=False):
+    calls = []
+
+    def find_affected_code(summary, repo_root=None):
+        calls.append(summary)
+        affected = [SimpleNamespace(path=p) for p in paths]
+        return affected, SimpleNamespace(degraded=degraded, reason="test")
+
+    monkeypatch.setattr(tools.code_impact_finder, "find_affected_code", find_affected_code)
+    return calls
+
+
+class TestSelection:
+    def test_changed_source_selects_mapped_tests(self, mapped):
+        (mapped / "pkg" / "calc.py").write_text("def add(a, b):\n    return b + a\n")
+
+        selection = _select(mapped)
+
+        assert selection.tests == ["tests/test_calc.py::test_add"]
+        assert not selection.full_run
+        assert selection.map_commit == "abc"
+
+    def test_changed_and_untracked_test_files_run_whole(self, mapped):
+        _git(mapped, "commit", "-q", "--allow-empty", "-m", "noop")
+        (mapped / "tests" / "test_other.py").write_text("def test_other():\n    pass\n")
+        (mapped / "tests" / "test_new.py").write_text("def test_new():\n    pass\n")
+
+        assert _select(mapped).tests == ["tests/test_new.py", "tests/test_other.py"]
+
+    def test_conftest_selects_its_directory(self, mapped):
+        (mapped / "tests" / "conftest.py").write_text("")
+        assert _select(mapped).tests == ["tests"]
+
+    def test_project_config_forces_full_run(self, mapped):
+        (mapped / "pyproject.toml").write_text("[project]\n")
+        selection = _select(mapped)
+        assert selection.full_run
+        assert "pyproject.toml" in selection.reason
+
+    def test_no_map_forces_full_run(self, repo):
+        (repo / "pkg" / "calc.py").write_text("")
+        assert _select(repo).full_run
+
+    def test_non_python_change_uses_impact_finder(self, mapped, monkeypatch):
+        calls = _fake_finder(monkeypatch, paths=["pkg/calc.py", "tests/test_other.py"])
+        (mapped / "README.md").write_text("changed\n")
+
+        selection = _select(mapped)
+
+        assert selection.fallback == ["README.md"]
+        assert selection.tests == ["tests/test_calc.py::test_add", "tests/test_other.py"]
+        assert "README.md" in calls[0] and "+changed" in calls[0]
+
+    def test_degraded_impact_finder_forces_full_run(self, mapped, monkeypatch):
+        _fake_finder(monkeypatch, degraded=True)
+        (mapped / "run.sh").write_text("echo\n")
+        assert _select(mapped).full_run
+
+    def test_mapped_test_of_deleted_file_is_dropped(self, mapped):
+        store.replace_coverage_map(
+            impact.repo_key(mapped), {"pkg/calc.py": {"tests/test_gone.py::test_x"}}, "abc"
+        )
+        (mapped / "pkg" / "calc.py").write_text("")
+        assert _select(mapped).tests == []
+
+    def test_no_changes_selects_nothing(self, mapped):
+        selection = _select(mapped)
+        assert selection.tests == [] and not selection.full_run
+
+
+class TestShard:
+    def test_balances_by_history_and_keeps_files_together(self):
+        history = {"a.py::t1": 6.0, "a.py::t2": 4.0, "b.py::t": 5.0, "c.py::t": 3.0}
+        units = ["a.py::t1", "a.py::t2", "b.py", "c.py"]
+
+        shards = impact.shard(units, 2, history)
+
+        assert shards == [(10.0, ["a.py::t1", "a.py::t2"]), (8.0, ["b.py", "c.py"])]
+
+    def test_parametrized_history_counts_toward_base_node(self):
+        history = {"a.py::t[1]": 2.0, "a.py::t[2]": 2.0, "b.py::t": 1.0}
+        shards = impact.shard(["a.py::t", "b.py::t"], 4, history)
+        assert shards == [(4.0, ["a.py::t"]), (1.0, ["b.py::t"])]
+
+    def test_unknown_files_assume_the_median(self):
+        history = {"a.py::t": 2.0, "b.py::t": 4.0, "c.py::t": 9.0}
+        shards = impact.shard(["a.py", "b.py", "c.py", "new.py"], 2, history)
+        assert sorted(cost for cost, _ in shards) == [9.0, 10.0]
+
+
+class TestStore:
+    def test_history_is_trimmed_to_window(self, monkeypatch):
+        monkeypatch.setattr(store, "HISTORY_WINDOW", 3)
+        for duration in (10.0, 1.0, 2.0, 3.0):
+            store.record_results("r", [{"nodeid": "t", "outcome": "passed", "duration": duration}])
+        assert store.durations("r") == {"t": 2.0}
+
+    def test_flaky_needs_repeated_flips(self):
+        for outcome in ("passed", "failed", "passed", "skipped"):
+            store.record_results("r", [{"nodeid": "flaky", "outcome": outcome, "duration": 0}])
+        for outcome in ("failed", "failed", "passed"):
+            store.record_results("r", [{"nodeid": "fixed", "outcome": outcome, "duration": 0}])
+        assert store.flaky_tests("r") == {"flaky": 2}
+
+    def test_sessions_survive_a_restart(self, monkeypatch):
+        store.save_session(
+            {"agent_session_id": "gone", "status": "running", "created_at": "2026-10-19"}
+        )
+        monkeypatch.setattr(test_scheduler, "_sessions", {})
+
+        assert test_scheduler.get_session_status("gone")["status"] == "interrupted"
+        listed = test_scheduler.list_sessions()["sessions"]
+        assert [s["agent_session_id"] for s in listed] == ["gone"]
+
+
+def test_coverage_map_requires_coverage(repo, monkeypatch):
+    monkeypatch.setattr(impact.importlib.util, "find_spec", lambda name: None)
+    with pytest.raises(test_scheduler.TestSchedulerError) as excinfo:
+        impact.build_coverage_map(repo)
+    assert excinfo.value.category == "dependency"
+
+
+def test_schedule_impacted_tests_runs_shards_and_records_history(mapped, monkeypatch):
+    monkeypatch.setattr(impact, "_python", lambda _root: sys.executable)
+    (mapped / "pkg" / "calc.py").write_text("def add(a, b):\n    return a - b\n")
+    (mapped / "tests" / "test_other.py").write_text("def test_other():\n    assert True\n\n")
+
+    result = test_scheduler.schedule_impacted_tests(mapped, max_workers=2)
+    assert result["test_count"] == 2
+    assert result["shards"] == 2
+
+    for _ in range(100):
+        status = test_scheduler.get_session_status(result["agent_session_id"])
+        if status["status"] == "completed":
+            break
+        time.sleep(0.2)
+
+    summary = status["summary"]
+    assert (summary["passed"], summary["failed"]) == (1, 1)
+    assert summary["failed_tests"] == ["tests/test_calc.py::test_add"]
+    assert set(store.durations(impact.repo_key(mapped))) == {
+        "tests/test_calc.py::test_add",
+        "tests/test_other.py::test_other",
+    }
+    assert store.load_session(result["agent_session_id"])["status"] == "completed"
+
+
+def test_schedule_impacted_tests_with_nothing_to_run(mapped):
+    result = test_scheduler.schedule_impacted_tests(mapped)
+    assert result["status"] == "nothing_to_run"
+    assert "agent_session_id" not in result
+
+
+def test_run_impacted_tests_waits_for_the_summary(mapped, monkeypatch):
+    monkeypatch.setattr(impact, "_python", lambda _root: sys.executable)
+    (mapped / "pkg" / "calc.py").write_text("def add(a, b):\n    return a - b\n")
+
+    result = test_scheduler.run_impacted_tests(mapped, poll_interval_s=0.1)
+
+    assert result["status"] == "completed"
+    assert result["summary"]["failed_tests"] == ["tests/test_calc.py::test_add"]
+
+
+def test_unreadable_diff_falls_back_to_a_full_run(mapped, monkeypatch):
+    monkeypatch.setattr(impact, "_python", lambda _root: sys.executable)
+    (mapped / "tests" / "unit").mkdir()
+    (mapped / "tests" / "unit" / "test_unit.py").write_text("def test_unit():\n    pass\n")
+
+    result = test_scheduler.run_impacted_tests(mapped, base="no-such-branch", poll_interval_s=0.1)
+
+    assert result["selection"]["full_run"] is True
+    assert result["summary"]["passed"] == 1
+
+
+def test_build_coverage_map_maps_sources_to_tests(repo, monkeypatch):
+    pytest.importorskip("coverage")
+    monkeypatch.setattr(impact, "_python", lambda _root: sys.executable)
+
+    built = impact.build_coverage_map(repo, test_paths=("tests",), timeout_s=120)
+
+    assert built["sources"] >= 1
+    mapped = store.tests_for_sources(impact.repo_key(repo), ["pkg/calc.py"])
+    assert mapped["pkg/calc.py"] == {"tests/test_calc.py::test_add"}
@@ -0,0 +1,142 @@
+"""Tests for reply traces (analytics/tracing.py).
+
+Spans are stored in the per-test Redis (autouse ``redis_test_db``). Covers the
+storage helpers, the outbox payload carrying the trace id, the harness
+recording its spans from ``$VALOR_TRACE_ID``, and the ``/traces`` view.
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agent.output_handler import build_telegram_outbox_payload
+from analytics import tracing
+
+pytestmark = pytest.mark.unit
+
+
+def _trace(trace_id="abc123", started_at=None):
+    started_at = started_at or time.time() - 10
+    tracing.start_trace(trace_id, started_at, session_id="tg_valor_-1_7", sender="alice")
+    return started_at
+
+
+def test_spans_round_trip_sorted_by_start():
+    t0 = time.time() - 10
+    tracing.start_trace(
+        "abc123",
+        t0,
+        spans=[tracing.make_span("intake", t0, t0 + 0.5)],
+        session_id="tg_valor_-1_7",
+        sender="alice",
+    )
+    tracing.record_spans(
+        "abc123", [tracing.make_span("enrichment", t0 + 2, t0 + 3, media="photo", links=None)]
+    )
+    tracing.record_span("abc123", "queue_wait", t0 + 0.5, t0 + 2)
+
+    trace = tracing.load_trace("abc123")
+
+    assert [s["name"] for s in trace["spans"]] == ["intake", "queue_wait", "enrichment"]
+    assert trace["spans"][2]["attrs"] == {"media": "photo"}
+    assert trace["meta"]["sender"] == "alice"
+    assert trace["duration"] == pytest.approx(3.0)
+
+
+def test_missing_trace_id_is_a_no_op():
+    tracing.start_trace(None, time.time())
+    tracing.record_span("", "intake", 0.0, 1.0)
+    tracing.record_reply(None, 0.0, 1.0)
+
+    assert tracing.slowest_replies() == []
+    assert tracing.load_trace("never") is None
+
+
+def test_slowest_replies_rank_first_reply_only():
+    now = time.time()
+    _trace("fast", now - 2)
+    _trace("slow", now - 30)
+    tracing.record_reply("fast", now - 0.1, now)
+    tracing.record_reply("slow", now - 0.1, now)
+    tracing.record_reply("slow", now + 60, now + 61)  # Later follow-up keeps the first score
+
+    ranked = tracing.slowest_replies(limit=5)
+
+    assert [r["trace_id"] for r in ranked] == ["slow", "fast"]
+    assert ranked[0]["seconds"] == pytest.approx(30, abs=0.1)
+    assert ranked[0]["meta"]["session_id"] == "tg_valor_-1_7"
+    assert [s["name"] for s in tracing.load_trace("slow")["spans"]] == ["relay_send", "relay_send"]
+
+
+def test_outbox_payload_carries_only_string_trace_ids():
+    with_trace = build_telegram_outbox_payload("-1", "hi", None, "s", trace_id="abc123")
+    without = build_telegram_outbox_payload("-1", "hi", None, "s", trace_id=object())
+
+    assert with_trace["trace_id"] == "abc123"
+    assert "trace_id" not in without
+
+
+class _Stdout:
+    def __init__(self, events):
+        self._lines = [(json.dumps(e) + "\n").encode() for e in events]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._lines:
+            raise StopAsyncIteration
+        return self._lines.pop(0)
+
+    async def readline(self):
+        return self._lines.pop(0) if self._lines else b""
+
+
+async def test_harness_records_spawn_first_output_and_tool_spans():
+    from agent.sdk_client import get_response_via_harness
+
+    tool_use = {"type": "tool_use", "id": "tu_1", "name": "Bash"}
+    tool_result = {"type": "tool_result", "tool_use_id": "tu_1"}
+    proc = AsyncMock()
+    proc.stdout = _Stdout(
+        [
+            {"type": "system", "subtype": "init", "session_id": "s"},
+            {"type": "assistant", "message": {"content": [tool_use]}},
+            {"type": "user", "message": {"content": [tool_result]}},
+            {"type": "result", "result": "done", "session_id": "s"},
+        ]
+    )
+    proc.communicate = AsyncMock(return_value=(b"", b""))
+    proc.returncode = 0
+
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn:
+        result = await get_response_via_harness(
+            message="hi", working_dir="/tmp", env={tracing.TRACE_ENV: "trace-h"}
+        )
+
+    assert result == "done"
+    assert spawn.call_args.kwargs["env"][tracing.TRACE_ENV] == "trace-h"
+    names = [s["name"] for s in tracing.load_trace("trace-h")["spans"]]
+    assert sorted(names) == ["first_output", "harness_spawn", "harness_turn", "tool:Bash"]
+
+
+def test_traces_page_renders_ranking_and_waterfall():
+    from fastapi.testclient import TestClient
+
+    from ui.app import create_app
+
+    now = time.time()
+    _trace("view1", now - 12)
+    tracing.record_span("view1", "queue_wait", now - 11, now - 4)
+    tracing.record_reply("view1", now - 1, now)
+
+    client = TestClient(create_app())
+    page = client.get("/traces", params={"trace_id": "view1"})
+    unknown = client.get("/traces", params={"trace_id": "nope"})
+
+    assert page.status_code == 200
+    assert "queue_wait" in page.text and "relay_send" in page.text
+    assert "/traces?trace_id=view1" in page.text
+    assert "No spans stored for trace nope" in unknown.text
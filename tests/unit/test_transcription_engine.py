@@ -0,0 +1,244 @@
+"""Unit tests for tools.transcribe.engine (cached, chunked transcription).
+
+The Whisper endpoint is a local stand-in HTTP server: both real client paths
+(``tools.link_analysis`` over httpx, ``tools.transcribe`` over requests) post
+multipart uploads to it. ffmpeg segmentation is replaced by writing labelled
+chunk files unless ffmpeg is installed (``test_real_ffmpeg_segmentation``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import shutil
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+import tools.link_analysis as link_analysis
+import tools.transcribe as transcribe_tool
+from tools.transcribe import engine
+from tools.transcribe.engine import plan_chunks, transcribe_audio
+
+
+class _StandIn:
+    """Whisper-compatible endpoint: answers ``AUDIO[label]`` uploads with ``said label``."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.requests: list[str] = []
+        self.fail_labels: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802 -- http.server API
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                match = re.search(rb"AUDIO\[(.*?)\]", body)
+                label = match.group(1).decode() if match else "?"
+                with stand_in._lock:
+                    stand_in.requests.append(label)
+                    stand_in.in_flight += 1
+                    stand_in.max_in_flight = max(stand_in.max_in_flight, stand_in.in_flight)
+                time.sleep(stand_in.delay)
+                with stand_in._lock:
+                    stand_in.in_flight -= 1
+                if label in stand_in.fail_labels:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                payload = json.dumps({"text": f"said {label}", "language": "en"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v1/audio/transcriptions"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def whisper(monkeypatch):
+    stand_in = _StandIn()
+    monkeypatch.setattr(link_analysis, "OPENAI_TRANSCRIBE_URL", stand_in.url)
+    monkeypatch.setattr(transcribe_tool, "WHISPER_URL", stand_in.url)
+    monkeypatch.setattr(transcribe_tool, "_is_superwhisper_available", lambda: False)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    monkeypatch.delenv("TRANSCRIPT_CACHE_DISABLED", raising=False)
+    yield stand_in
+    stand_in.server.shutdown()
+
+
+@pytest.fixture
+def long_audio(monkeypatch, tmp_path):
+    """A 1000s 'recording' with silences; chunks are files labelled by their span."""
+    source = tmp_path / "talk.mp3"
+    source.write_bytes(b"AUDIO[whole]")
+    monkeypatch.setattr(engine, "probe_duration", lambda p: 1000.0 if p == source else 10.0)
+    monkeypatch.setattr(engine, "detect_silences", lambda p: [(290.0, 292.0), (598.0, 600.0)])
+
+    def extract_chunk(src, start, end, dest):
+        dest.write_bytes(f"AUDIO[{start:.0f}-{end:.0f}]".encode())
+        return dest
+
+    monkeypatch.setattr(engine, "extract_chunk", extract_chunk)
+    return source
+
+
+def test_plan_chunks_cuts_inside_silences():
+    assert plan_chunks(200, [], target_s=300) == [(0.0, 200)]
+    assert plan_chunks(1000, [(290, 292), (598, 600)], target_s=300) == [
+        (0.0, 291.0),
+        (291.0, 599.0),
+        (599.0, 1000),
+    ]
+    # No silence in a window: hard cut at the target.
+    assert plan_chunks(700, [], target_s=300) == [(0.0, 300.0), (300.0, 700)]
+
+
+async def test_long_audio_chunks_concurrently_and_stitches(whisper, long_audio, monkeypatch):
+    monkeypatch.setattr(engine, "CHUNK_CONCURRENCY", 2)
+    partials = []
+
+    text = await link_analysis.transcribe_audio_file(long_audio, on_partial=partials.append)
+
+    assert text == "said 0-291 said 291-599 said 599-1000"
+    assert sorted(whisper.requests) == ["0-291", "291-599", "599-1000"]
+    assert whisper.max_in_flight == 2
+    assert [(c.index, c.start) for c in partials] == [(0, 0.0), (1, 291.0), (2, 599.0)]
+    assert partials[1].segments == [{"start": 291.0, "end": 599.0, "text": "said 291-599"}]
+
+
+async def test_transcript_served_from_content_cache(whisper, long_audio, tmp_path):
+    first = await link_analysis.transcribe_audio_file(long_audio)
+    copy = tmp_path / "same-bytes.mp3"
+    copy.write_bytes(long_audio.read_bytes())
+    second = await link_analysis.transcribe_audio_file(copy)
+
+    assert first == second
+    assert len(whisper.requests) == 3
+
+
+async def test_cache_io_runs_off_the_loop_and_is_counted(whisper, long_audio, monkeypatch):
+    for family in (engine._HITS, engine._MISSES):
+        monkeypatch.setattr(family, "children", {})
+    loop_thread = threading.get_ident()
+    io_threads = []
+    for name in ("get_cached_transcript", "store_transcript"):
+        real = getattr(engine, name)
+
+        def traced(*args, _real=real):
+            io_threads.append(threading.get_ident())
+            return _real(*args)
+
+        monkeypatch.setattr(engine, name, traced)
+
+    await link_analysis.transcribe_audio_file(long_audio)
+    await link_analysis.transcribe_audio_file(long_audio)
+
+    assert len(io_threads) == 3  # miss lookup, store, hit lookup
+    assert loop_thread not in io_threads
+    assert engine._MISSES.labels().value == 1
+    assert engine._HITS.labels().value == 1
+
+
+async def test_failed_chunk_fails_transcript_and_is_not_cached(whisper, long_audio):
+    whisper.fail_labels = {"291-599"}
+
+    assert await link_analysis.transcribe_audio_file(long_audio) is None
+
+    whisper.fail_labels = set()
+    assert await link_analysis.transcribe_audio_file(long_audio) is not None
+
+
+async def test_stitch_shifts_backend_timestamps(long_audio, monkeypatch):
+    monkeypatch.delenv("TRANSCRIPT_CACHE_DISABLED", raising=False)
+
+    async def backend(path: Path) -> dict:
+        label = re.search(r"\[(.*)\]", path.read_text()).group(1)
+        await asyncio.sleep(0.01 if label.startswith("0-") else 0)
+        return {
+            "text": label,
+            "segments": [{"id": 0, "start": 1.0, "end": 2.5, "text": label}],
+            "words": [{"word": label, "start": 1.0, "end": 1.5}],
+        }
+
+    result = await transcribe_audio(long_audio, backend, use_cache=False)
+
+    assert result["chunks"] == 3
+    assert [s["start"] for s in result["segments"]] == [1.0, 292.0, 600.0]
+    assert [s["id"] for s in result["segments"]] == [0, 1, 2]
+    assert result["words"][2] == {"word": "599-1000", "start": 600.0, "end": 600.5}
+    assert result["duration"] == 1000.0
+
+
+def test_sync_transcribe_caches_by_content(whisper, tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, "probe_duration", lambda p: 12.0)
+    voice = tmp_path / "voice.ogg"
+    voice.write_bytes(b"AUDIO[voice-note]")
+
+    first = transcribe_tool.transcribe(str(voice))
+    second = transcribe_tool.transcribe(str(voice))
+    verbose = transcribe_tool.transcribe(str(voice), response_format="verbose_json")
+
+    assert first == {"text": "said voice-note", "language": "en"}
+    assert second["text"] == first["text"]
+    assert verbose["segments"][0]["end"] == 12.0
+    assert whisper.requests == ["voice-note", "voice-note"], "options are part of the key"
+
+
+async def test_youtube_video_id_cache_skips_download(whisper, monkeypatch):
+    engine.store_transcript(
+        engine.video_key("youtube", "dQw4w9WgXcQ"),
+        {"text": "never gonna give you up", "title": "Song", "source": "captions"},
+    )
+
+    def no_yt_dlp(*args, **kwargs):
+        raise AssertionError("cached video must not call yt-dlp")
+
+    monkeypatch.setattr(link_analysis, "get_youtube_video_info", no_yt_dlp)
+    monkeypatch.setattr(link_analysis, "download_youtube_audio_async", no_yt_dlp)
+
+    result = await link_analysis.process_youtube_url("https://youtu.be/dQw4w9WgXcQ")
+
+    assert result["success"] is True
+    assert result["transcript"] == "never gonna give you up"
+    assert "Song" in result["context"]
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_real_ffmpeg_segmentation(tmp_path):
+    tone = "sine=frequency=440:duration=4"
+    audio = tmp_path / "tones.mp3"
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-y", "-f", "lavfi", "-i", tone,
+            "-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono:d=2",
+            "-f", "lavfi", "-i", tone,
+            "-filter_complex", "[0][1][2]concat=n=3:v=0:a=1", str(audio),
+        ],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+
+    duration = engine.probe_duration(audio)
+    silences = engine.detect_silences(audio)
+    spans = plan_chunks(duration, silences, target_s=4)
+
+    assert 9.5 < duration < 10.5
+    assert len(spans) == 2 and 4.0 < spans[0][1] < 6.0
+    chunk = engine.extract_chunk(audio, *spans[1], tmp_path / "c1.mp3")
+    assert 3.5 < engine.probe_duration(chunk) < 6.0
@@ -1410,6 +1410,70 @@ class TestSdlcQueryFunctions:
         result = get_recent_completions()
         assert isinstance(result, list)
 
+    def test_load_pipelines_prefetches_cold_payloads(self, monkeypatch):
+        """A dashboard scan resolves cold payloads in one round trip, not per row."""
+        from models.agent_session import AgentSession
+        from ui.data.sdlc import load_pipelines
+
+        for _ in range(3):
+            AgentSession.create(
+                session_id=f"cold-scan-{time.time_ns()}",
+                project_key="cold-scan-test",
+                status="running",
+                session_events=[{"event_type": "log", "text": "x" * 400} for _ in range(10)],
+                extra_context={"classification_type": "bug", "pad": "y" * 2000},
+                initial_telegram_message={"text": "z" * 2000},
+            )
+        monkeypatch.setattr(
+            AgentSession, "_load_cold_payload", lambda *a: pytest.fail("per-row cold HGET")
+        )
+
+        assert load_pipelines()
+
+    def test_get_recent_completions_reaches_past_the_time_index(self):
+        """A completion older than the index retention still shows up."""
+        from models.agent_session import AgentSession
+        from models.session_time_index import RETENTION_DAYS, rebuild
+        from ui.data.sdlc import get_recent_completions
+
+        old = datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(days=RETENTION_DAYS + 30)
+        session = AgentSession.create(
+            session_id=f"old-completion-{time.time_ns()}",
+            project_key="recent-completions-test",
+            status="completed",
+            created_at=old,
+            completed_at=old,
+            stage_states={"ISSUE": "completed"},
+        )
+        rebuild()
+
+        ids = [p.agent_session_id for p in get_recent_completions(limit=500)]
+        assert session.agent_session_id in ids
+
+    def test_get_recent_completions_skips_the_scan_when_the_index_covers_all(self, monkeypatch):
+        """A short page is final when no completion has aged out of the index."""
+        import models.session_enumeration
+        from models.agent_session import AgentSession
+        from models.session_time_index import rebuild
+        from ui.data.sdlc import get_recent_completions
+
+        session = AgentSession.create(
+            session_id=f"recent-completion-{time.time_ns()}",
+            project_key="recent-completions-test",
+            status="completed",
+            completed_at=time.time(),
+            stage_states={"ISSUE": "completed"},
+        )
+        rebuild()
+        monkeypatch.setattr(
+            models.session_enumeration,
+            "enumerate_sessions",
+            lambda *a, **k: pytest.fail("full session scan"),
+        )
+
+        ids = [p.agent_session_id for p in get_recent_completions(limit=500)]
+        assert session.agent_session_id in ids
+
     def test_get_pipeline_detail_not_found(self):
         from ui.data.sdlc import get_pipeline_detail
 
@@ -0,0 +1,284 @@
+"""Tests for the tools/web response cache (tools/web/cache.py).
+
+Pages come from a local asyncio HTTP server; the paid providers and the search
+providers are replaced with fakes. ``WEB_CACHE_DIR`` is per-test (conftest).
+"""
+
+import asyncio
+import importlib
+import os
+import time
+
+import pytest
+
+from tools.web import cache as web_cache
+from tools.web import fetch, web_search
+from tools.web.providers import firecrawl, perplexity, tavily
+from tools.web.types import FetchResult, SearchResult, Source
+
+# ``tools.web.fetch`` the attribute is the function; the module holds the helpers.
+fetch_module = importlib.import_module("tools.web.fetch")
+
+ARTICLE = "<html><head><title>{name}</title></head><body>{body}</body></html>"
+
+# path -> (extra headers, body); the etag page answers If-None-Match with 304.
+PAGES = {
+    "/fresh": (b"cache-control: max-age=60\r\n", "fresh"),
+    "/etag": (b'cache-control: no-cache\r\netag: "v1"\r\n', "etag"),
+    "/nostore": (b"cache-control: no-store\r\n", "nostore"),
+    "/blocked": (b"", None),
+    "/js": (b"", ""),
+}
+
+
+class PageServer:
+    """HTTP/1.1 server for the pages in ``PAGES``; records request headers."""
+
+    def __init__(self):
+        self.requests: list[tuple[str, bytes]] = []
+        self._server = None
+
+    def url(self, path: str) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}{path}"
+
+    def hits(self, path: str) -> int:
+        return sum(1 for p, _ in self.requests if p == path)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ", 2)[1].decode()
+                self.requests.append((path, head.lower()))
+                extra, name = PAGES[path]
+                if name is None:
+                    writer.write(b"HTTP/1.1 403 Forbidden\r\ncontent-length: 0\r\n\r\n")
+                elif b'if-none-match: "v1"' in head.lower():
+                    writer.write(b"HTTP/1.1 304 Not Modified\r\n" + extra + b"\r\n")
+                else:
+                    body = ARTICLE.format(
+                        name=name, body=f"<p>Article text for {name}.</p>" * 5 if name else ""
+                    ).encode()
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\ncontent-type: text/html\r\n"
+                        + extra
+                        + b"content-length: %d\r\n\r\n" % len(body)
+                        + body
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+
+@pytest.fixture
+async def server():
+    async with PageServer() as srv:
+        yield srv
+
+
+_FAMILIES = (web_cache._HITS, web_cache._MISSES, web_cache._BYTES_SAVED)
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Empty the cache counters; returns the ``{(family, *labels): value}`` view."""
+    for family in _FAMILIES:
+        monkeypatch.setattr(family, "children", {})
+
+    def counted() -> dict[tuple[str, ...], float]:
+        return {
+            (family.name, *labels): child.value
+            for family in _FAMILIES
+            for labels, child in family.children.items()
+        }
+
+    return counted
+
+
+@pytest.fixture
+def paid(monkeypatch):
+    """Fake Firecrawl (renders anything) and Tavily (always fails); no API keys."""
+    calls = []
+
+    async def firecrawl_fetch(url, **kwargs):
+        calls.append(url)
+        return FetchResult(content="rendered page", title="JS", url=url, provider="firecrawl")
+
+    async def tavily_fetch(url, **kwargs):
+        return None
+
+    monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    monkeypatch.setattr(firecrawl, "fetch", firecrawl_fetch)
+    monkeypatch.setattr(tavily, "fetch", tavily_fetch)
+    return calls
+
+
+async def test_fresh_response_is_served_without_a_request(server, metrics, paid):
+    url = server.url("/fresh")
+
+    first = await fetch(url)
+    second = await fetch(url + "#section")
+
+    assert second == first
+    assert "Article text for fresh" in second.content
+    assert server.hits("/fresh") == 1
+    counted = metrics()
+    assert counted[("valor_web_cache_hits_total", "fetch", "fresh")] == 1
+    assert counted[("valor_web_cache_misses_total", "fetch")] == 1
+    assert counted[("valor_web_cache_bytes_saved_total", "fetch")] > len(second.content) // 2
+
+
+async def test_stale_entry_is_revalidated_with_etag(server, metrics, paid):
+    url = server.url("/etag")
+
+    first = await fetch(url)
+    second = await fetch(url)
+
+    assert second == first
+    assert server.hits("/etag") == 2
+    assert b'if-none-match: "v1"' in server.requests[-1][1]
+    assert metrics()[("valor_web_cache_hits_total", "fetch", "revalidated")] == 1
+
+
+async def test_no_store_is_never_cached(server, paid):
+    url = server.url("/nostore")
+    await fetch(url)
+    await fetch(url)
+    assert server.hits("/nostore") == 2
+    assert web_cache.lookup(url) is None
+
+
+async def test_js_page_goes_straight_to_firecrawl_next_time(server, paid, monkeypatch):
+    monkeypatch.setattr(web_cache, "PROVIDER_TTL_S", 0)  # Keep the rendered page stale
+    url = server.url("/js")
+
+    first = await fetch(url)
+    second = await fetch(url)
+
+    assert first.provider == second.provider == "firecrawl"
+    assert web_cache.skipped_providers(url) == {"httpx_fallback": "needs_js"}
+    assert server.hits("/js") == 1
+    assert paid == [url, url]
+
+
+async def test_blocked_status_is_remembered(server, paid):
+    url = server.url("/blocked")
+    await fetch(url)
+    assert web_cache.skipped_providers(url) == {"httpx_fallback": "blocked"}
+
+
+async def test_paid_failure_is_remembered_only_with_a_key(monkeypatch, paid):
+    url = "https://example.invalid/page"
+    await fetch_module._remember(url, "tavily", None)
+    assert web_cache.skipped_providers(url) == {}
+
+    monkeypatch.setenv("TAVILY_API_KEY", "key")
+    await fetch_module._remember(url, "tavily", None)
+    assert web_cache.skipped_providers(url) == {"tavily": "empty"}
+
+
+async def test_disabled_cache_always_fetches(server, paid, monkeypatch):
+    monkeypatch.setenv("WEB_CACHE_DISABLED", "1")
+    url = server.url("/fresh")
+    await fetch(url)
+    await fetch(url)
+    assert server.hits("/fresh") == 2
+
+
+async def test_search_results_are_cached_per_query_and_options(monkeypatch, metrics):
+    calls = []
+
+    async def search(query, **kwargs):
+        calls.append((query, kwargs))
+        return SearchResult(
+            answer=f"answer to {query}",
+            sources=[Source(url="https://example.com", title="Example", snippet=None)],
+            citations=["https://example.com"],
+            query=query,
+            provider="perplexity",
+        )
+
+    monkeypatch.setattr(perplexity, "search", search)
+
+    first = await web_search("python  release", max_results=3)
+    again = await web_search(" python release\n", max_results=3)
+    other = await web_search("python release", max_results=5)
+
+    assert again == first
+    assert isinstance(again.sources[0], Source)
+    assert other is not None
+    assert len(calls) == 2
+    assert metrics()[("valor_web_cache_hits_total", "search", "fresh")] == 1
+
+
+def test_normalize_url():
+    assert (
+        web_cache.normalize_url("HTTPS://Example.COM:443/a?b=2&utm_source=x&a=1#frag")
+        == "https://example.com/a?a=1&b=2"
+    )
+    assert web_cache.normalize_url("http://example.com:8080") == "http://example.com:8080/"
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"cache-control": "public, max-age=120"}, 120.0),
+        ({"cache-control": "max-age=999999999"}, float(web_cache.MAX_TTL_S)),
+        ({"cache-control": "no-cache"}, 0.0),
+        ({"cache-control": "no-store, max-age=60"}, None),
+        ({"expires": "garbage"}, 0.0),
+        ({}, float(web_cache.DEFAULT_TTL_S)),
+    ],
+)
+def test_freshness(headers, expected):
+    assert web_cache.freshness(headers) == expected
+
+
+def test_expires_header_sets_lifetime():
+    now = time.time()
+    expires = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(now + 300))
+    assert 290 < web_cache.freshness({"expires": expires}, now=now) <= 300
+
+
+def test_bodies_are_shared_and_pruned():
+    page = FetchResult(content="same body", title=None, url="https://a.example", provider="x")
+    web_cache.store("https://a.example", page, 60)
+    web_cache.store("https://b.example", page, 60)
+    bodies = list((web_cache._cache_dir() / "bodies").glob("*/*"))
+    assert len(bodies) == 1
+
+    web_cache.store("https://a.example", FetchResult("new", None, "https://a.example", "x"), 60)
+    web_cache.store("https://b.example", FetchResult("new", None, "https://b.example", "x"), 60)
+    old = time.time() - 120
+    os.utime(bodies[0], (old, old))
+
+    assert web_cache.prune() == 1
+    assert web_cache.lookup("https://a.example").result.content == "new"
+
+
+def test_store_prunes_at_most_once_per_interval(monkeypatch):
+    runs = []
+    monkeypatch.setattr(web_cache, "prune", lambda: runs.append(1) or 0)
+    page = FetchResult(content="body", title=None, url="https://a.example", provider="x")
+
+    web_cache.store("https://a.example", page, 60)
+    web_cache.store("https://b.example", page, 60)
+    assert len(runs) == 1
+
+    marker = web_cache._cache_dir() / web_cache._PRUNE_MARKER
+    old = time.time() - web_cache.PRUNE_INTERVAL_S - 1
+    os.utime(marker, (old, old))
+    web_cache.store("https://c.example", page, 60)
+    assert len(runs) == 2
@@ -83,7 +83,7 @@ class TestCleanupAfterMerge:
         assert result["already_clean"] is False
 
         # remove_worktree was called with delete_branch=False
-        mock_remove_wt.assert_called_once_with(repo, slug, delete_branch=False)
+        mock_remove_wt.assert_called_once_with(repo, slug, delete_branch=False, recycle=True)
 
     @patch("agent.worktree_manager.subprocess.run")
     @patch("agent.worktree_manager._branch_exists")
@@ -0,0 +1,163 @@
+"""Tests for the pre-warmed worktree pool (agent/worktree_pool.py).
+
+Real git repos under ``tmp_path``; only the ``uv`` steps are faked (``uv venv``
+writes a relocatable ``pyvenv.cfg``, provisioning writes the marker), so the
+worktree moves, checkouts and resets run against real git.
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from agent import worktree_manager, worktree_pool
+from agent.worktree_manager import (
+    PROVISIONED_MARKER,
+    cleanup_after_merge,
+    create_worktree,
+    list_worktrees,
+)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def provisioned():
+    """Worktrees the faked ``provision_worktree_venv`` ran on, in order."""
+    return []
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch, provisioned):
+    """A git repo on ``main`` with a 2-member pool and faked uv steps."""
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "Test")
+    (root / ".gitignore").write_text(".venv/\n.worktrees/\nbuild/\n")
+    (root / "seed.txt").write_text("seed\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "seed")
+
+    monkeypatch.setenv("WORKTREE_POOL_SIZE", "2")
+
+    def fake_provision(worktree_dir):
+        venv = Path(worktree_dir) / ".venv"
+        venv.mkdir(exist_ok=True)
+        (venv / PROVISIONED_MARKER).touch()
+        provisioned.append(Path(worktree_dir))
+        return True
+
+    real_run = subprocess.run
+
+    def fake_run(cmd, **kwargs):
+        if cmd[:2] == ["uv", "venv"]:
+            venv = Path(cmd[cmd.index("--quiet") + 1])
+            venv.mkdir(parents=True)
+            (venv / "pyvenv.cfg").write_text("relocatable = true\n")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+        return real_run(cmd, **kwargs)
+
+    monkeypatch.setattr(worktree_manager, "provision_worktree_venv", fake_provision)
+    monkeypatch.setattr(worktree_manager, "worktree_interpreter_pin", lambda _wt: None)
+    monkeypatch.setattr(worktree_pool.subprocess, "run", fake_run)
+    monkeypatch.setattr(worktree_pool, "refill_in_background", lambda _root: None)
+    return root
+
+
+def test_refill_builds_ready_members_hidden_from_lanes(repo):
+    assert worktree_pool.refill(repo) == 2
+    members = worktree_pool.ready_members(repo)
+    assert len(members) == 2
+    assert all(_git(m, "rev-parse", "HEAD") == _git(repo, "rev-parse", "main") for m in members)
+    assert list_worktrees(repo) == []
+    assert worktree_pool.refill(repo) == 0
+
+
+def test_create_worktree_claims_a_member(repo, provisioned):
+    worktree_pool.refill(repo)
+    provisioned.clear()
+
+    wt = create_worktree(repo, "feat-x")
+
+    assert wt == repo / ".worktrees" / "feat-x"
+    assert _git(wt, "rev-parse", "--abbrev-ref", "HEAD") == "session/feat-x"
+    assert (wt / ".venv" / PROVISIONED_MARKER).exists()
+    assert provisioned == [wt]  # re-synced at the new path
+    assert len(worktree_pool.ready_members(repo)) == 1
+    assert [w["slug"] for w in list_worktrees(repo)] == ["feat-x"]
+
+
+def test_claim_miss_falls_back_to_cold_create(repo):
+    assert worktree_pool.claim(repo, "feat-y") is None
+
+    wt = create_worktree(repo, "feat-y")
+    assert _git(wt, "rev-parse", "--abbrev-ref", "HEAD") == "session/feat-y"
+
+
+def test_failed_venv_resync_falls_back_to_cold_create(repo, provisioned, monkeypatch):
+    worktree_pool.refill(repo)
+    provisioned.clear()
+    real_provision = worktree_manager.provision_worktree_venv
+
+    def provision_fails_once(worktree_dir):
+        real_provision(worktree_dir)
+        return len(provisioned) > 1
+
+    monkeypatch.setattr(worktree_manager, "provision_worktree_venv", provision_fails_once)
+
+    wt = create_worktree(repo, "feat-z")
+
+    assert _git(wt, "rev-parse", "--abbrev-ref", "HEAD") == "session/feat-z"
+    assert provisioned == [wt, wt]  # the claimed member, then the cold create
+    assert len(worktree_pool.ready_members(repo)) == 1
+    assert [w["slug"] for w in list_worktrees(repo)] == ["feat-z"]
+
+
+def test_claim_resumes_existing_branch(repo):
+    _git(repo, "branch", "session/resume")
+    worktree_pool.refill(repo, size=1)
+
+    wt = create_worktree(repo, "resume")
+    assert _git(wt, "rev-parse", "--abbrev-ref", "HEAD") == "session/resume"
+    assert worktree_pool.ready_members(repo) == []
+
+
+def test_cleanup_after_merge_recycles_into_pool(repo):
+    worktree_pool.refill(repo, size=1)
+    wt = create_worktree(repo, "done")
+    (wt / "build").mkdir()
+    (wt / "build" / "out.txt").write_text("ignored build output\n")
+
+    result = cleanup_after_merge(repo, "done")
+
+    assert result["worktree_removed"] is True
+    assert result["branch_deleted"] is True
+    assert not wt.exists()
+    members = worktree_pool.ready_members(repo)
+    assert len(members) == 1
+    assert not (members[0] / "build").exists()
+    assert (members[0] / ".venv" / PROVISIONED_MARKER).exists()
+    assert _git(members[0], "rev-parse", "HEAD") == _git(repo, "rev-parse", "main")
+
+
+def test_full_pool_removes_instead_of_recycling(repo):
+    worktree_pool.refill(repo, size=3)
+    wt = create_worktree(repo, "extra")
+    worktree_pool.refill(repo)  # back to 2 ready: the pool is full
+
+    cleanup_after_merge(repo, "extra")
+
+    assert not wt.exists()
+    assert len(worktree_pool.ready_members(repo)) == 2
+
+
+def test_pool_disabled_by_size_zero(repo, monkeypatch):
+    monkeypatch.setenv("WORKTREE_POOL_SIZE", "0")
+    assert worktree_pool.refill(repo) == 0
+    assert worktree_pool.claim(repo, "feat-z") is None
@@ -4,6 +4,7 @@ Usage:
     python -m tools.analytics export --days 30
     python -m tools.analytics summary
     python -m tools.analytics rollup
+    python -m tools.analytics slowest --limit 10
 """
 
 import argparse
@@ -88,6 +89,29 @@ def cmd_rollup(args: argparse.Namespace) -> None:
             print(f"  Error: {err}")
 
 
+def cmd_slowest(args: argparse.Namespace) -> None:
+    """Print the slowest traced replies of a day, with each trace's longest spans."""
+    from analytics.tracing import load_trace, slowest_replies
+
+    day = args.day or time.strftime("%Y-%m-%d", time.gmtime())
+    replies = slowest_replies(limit=args.limit, day=day)
+    if not replies:
+        print(f"No traced replies recorded for {day}.")
+        return
+
+    print(f"Slowest replies {day} (UTC, intake -> first reply sent)")
+    print("=" * 50)
+    for entry in replies:
+        meta = entry["meta"]
+        who = meta.get("sender") or "?"
+        where = meta.get("chat_title") or meta.get("chat_id") or "?"
+        print(f"\n  {entry['seconds']:8.1f}s  {entry['trace_id']}  {who} in {where}")
+        trace = load_trace(entry["trace_id"]) or {"spans": []}
+        spans = sorted(trace["spans"], key=lambda s: s["end"] - s["start"], reverse=True)
+        for span in spans[: args.spans]:
+            print(f"             {span['end'] - span['start']:8.2f}s  {span['name']}")
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -106,6 +130,14 @@ def main() -> None:
     # rollup
     subparsers.add_parser("rollup", help="Run daily rollup")
 
+    # slowest
+    slowest_parser = subparsers.add_parser("slowest", help="Slowest traced replies of a day")
+    slowest_parser.add_argument("--limit", type=int, default=10, help="Replies (default: 10)")
+    slowest_parser.add_argument("--day", help="UTC day YYYY-MM-DD (default: today)")
+    slowest_parser.add_argument(
+        "--spans", type=int, default=3, help="Longest spans shown per reply (default: 3)"
+    )
+
     args = parser.parse_args()
 
     if args.command == "export":
@@ -114,6 +146,8 @@ def main() -> None:
         cmd_summary(args)
     elif args.command == "rollup":
         cmd_rollup(args)
+    elif args.command == "slowest":
+        cmd_slowest(args)
 
 
 if __name__ == "__main__":
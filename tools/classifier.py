@@ -40,6 +40,7 @@ from pydantic import BaseModel
 from agent.anthropic_client import anthropic_slot
 from config.models import MODEL_FAST
 from utils.api_keys import get_anthropic_api_key
+from utils.llm_cache import llm_cached
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,26 @@ Additional context: {context}
 Respond with JSON only:
 {{"type": "bug"|"feature"|"chore"|"sdlc", "confidence": 0.0-1.0, "reason": "brief explanation"}}"""
 
+# Bump when CLASSIFICATION_PROMPT changes; both entry points share one
+# llm_cache namespace, near-duplicate requests included.
+CLASSIFICATION_PROMPT_VERSION = "v1"
 
+
+def _classified(result: dict) -> bool:
+    return bool(result) and result.get("type") is not None
+
+
+_work_type_cache = llm_cached(
+    "work_type",
+    model=MODEL_FAST,
+    version=CLASSIFICATION_PROMPT_VERSION,
+    ttl=24 * 3600,
+    semantic=True,
+    cache_if=_classified,
+)
+
+
+@_work_type_cache
 def classify_request(message: str, context: str = "") -> dict:
     """Classify a work request using Haiku.
 
@@ -153,6 +173,7 @@ def _parse_json_response(content: str) -> dict:
     return json.loads(content)
 
 
+@_work_type_cache
 async def classify_request_async(message: str, context: str = "") -> dict:
     """Async version of classify_request.
 
@@ -189,7 +210,7 @@ async def classify_request_async(message: str, context: str = "") -> dict:
         )
 
         # Call Haiku via shared semaphore-gated client (#1111)
-        async with anthropic_slot() as client:
+        async with anthropic_slot("interactive") as client:
             response = await client.messages.create(
                 model=MODEL_FAST,
                 max_tokens=200,
@@ -0,0 +1,194 @@
+"""Thin fast-path client for the agent-facing CLIs (``valor-session``, ``sdlc-tool``).
+
+Agents call ``valor-session`` and the ``tools.sdlc_*`` recorders dozens of
+times per SDLC run. A cold ``python -m tools.sdlc_stage_query`` spends seconds
+importing popoto, pydantic settings and the model layer before doing one or two
+Redis reads. When the worker runs the command server (``tools/cli_server.py``,
+opt-in via ``VALOR_CLI_SERVER=1``) those imports are already warm in a
+long-lived process, and this client hands the invocation to it instead.
+
+Contract:
+    - **Stdlib only.** This module must never import the project's heavy
+      layers; ``tests/unit/test_cli_server.py`` pins its import budget. Anything
+      it imports is paid on every fast-path call.
+    - **Same observable behavior.** The server forks a child per call that runs
+      the target module as ``__main__`` with this process's argv, cwd,
+      environment and stdio file descriptors, so output, exit code and env-var
+      session resolution (``VALOR_SESSION_ID`` etc.) are what the cold path
+      would produce.
+    - **Never worse than cold.** No socket, a refused connection, or a protocol
+      error before the command started all fall back to running the module
+      in-process via :func:`runpy.run_module`, exactly like ``python -m``.
+
+Usage:
+    valor-session status --id abc123                  # console script
+    python -m tools.cli_client sdlc_stage_query --issue-number 42
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import runpy
+import signal
+import socket
+import struct
+import sys
+from pathlib import Path
+
+# Modules the server will run. Keep in step with ALLOWED_SUBCOMMANDS in
+# scripts/sdlc-tool (kebab-case there, tools.sdlc_<snake_case> here).
+SERVED_MODULES = frozenset(
+    {
+        "tools.valor_session",
+        "tools.sdlc_verdict",
+        "tools.sdlc_dispatch",
+        "tools.sdlc_stage_marker",
+        "tools.sdlc_stage_query",
+        "tools.sdlc_session_ensure",
+        "tools.sdlc_session_release",
+        "tools.sdlc_next_skill",
+        "tools.sdlc_meta_set",
+        "tools.sdlc_run_health",
+    }
+)
+
+# Socket under the checkout's own data/ dir. A git worktree resolves to its own
+# data/, where no server listens, so worktree code always runs in-process rather
+# than on the main checkout's preloaded modules.
+DEFAULT_SOCKET_PATH = Path(__file__).resolve().parent.parent / "data" / "cli_server.sock"
+
+# Header framing: 4-byte big-endian length, then a JSON object.
+_HEADER = struct.Struct(">I")
+
+# Connecting to a live server is a local accept(); anything slower means it is
+# wedged, and the cold path is the better bet.
+_CONNECT_TIMEOUT_S = 1.0
+
+
+def socket_path() -> Path:
+    """Return the command-server socket path (``VALOR_CLI_SOCKET`` overrides)."""
+    override = os.environ.get("VALOR_CLI_SOCKET")
+    return Path(override) if override else DEFAULT_SOCKET_PATH
+
+
+def _fast_path_disabled() -> bool:
+    return os.environ.get("VALOR_CLI_FAST_PATH", "1").strip().lower() in ("0", "false", "no")
+
+
+def _recv_line(conn: socket.socket) -> bytes | None:
+    """Read one newline-terminated reply; ``None`` if the server hung up first."""
+    buf = b""
+    while not buf.endswith(b"\n"):
+        chunk = conn.recv(64)
+        if not chunk:
+            return None
+        buf += chunk
+    return buf
+
+
+def run_via_server(module: str, argv: list[str]) -> int | None:
+    """Run ``module`` on the command server; ``None`` means fall back to cold.
+
+    Returns the command's exit code once the server has accepted it. After the
+    server reports the child pid the command is running with this process's
+    stdio, so from then on a lost connection is reported as exit 1 rather than
+    falling back (a second, cold run could double a write).
+    """
+    if _fast_path_disabled() or module not in SERVED_MODULES:
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    header = json.dumps(
+        {"module": module, "argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+    ).encode()
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(_CONNECT_TIMEOUT_S)
+        try:
+            conn.connect(str(path))
+            payload = _HEADER.pack(len(header)) + header
+            sent = socket.send_fds(conn, [payload], [0, 1, 2])
+            conn.sendall(payload[sent:])
+            started = _recv_line(conn)
+        except OSError:
+            return None
+        if started is None or not started.startswith(b"pid "):
+            return None
+        pid = int(started.split()[1])
+
+        # Relay Ctrl-C / SIGTERM to the child, which owns the command now.
+        def _relay(signum, _frame):
+            try:
+                os.kill(pid, signum)
+            except OSError:
+                pass
+
+        previous = {sig: signal.signal(sig, _relay) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            conn.settimeout(None)
+            finished = _recv_line(conn)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+        if finished is None or not finished.startswith(b"exit "):
+            print(f"{module}: command server connection lost", file=sys.stderr)
+            return 1
+        return int(finished.split()[1])
+    finally:
+        conn.close()
+
+
+def run_in_process(module: str, argv: list[str]) -> int:
+    """Run ``module`` as ``__main__`` in this process, as ``python -m`` would."""
+    sys.argv = [module, *argv]
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as exc:
+        return _exit_code(exc.code)
+    return 0
+
+
+def _exit_code(code) -> int:
+    """Map a ``SystemExit.code`` to a process exit status, like the interpreter."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run(module: str, argv: list[str] | None = None) -> int:
+    """Run ``module`` with ``argv``: server fast path first, in-process otherwise."""
+    argv = sys.argv[1:] if argv is None else argv
+    rc = run_via_server(module, argv)
+    if rc is None:
+        rc = run_in_process(module, argv)
+    return rc
+
+
+def valor_session() -> None:
+    """Console-script entry point for ``valor-session``."""
+    sys.exit(run("tools.valor_session"))
+
+
+def main() -> None:
+    """``python -m tools.cli_client <tool> [args...]`` — ``<tool>`` may omit ``tools.``."""
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        print(
+            "Usage: python -m tools.cli_client <tool> [args...]\n\nTools:\n  "
+            + "\n  ".join(sorted(m.removeprefix("tools.") for m in SERVED_MODULES)),
+            file=sys.stderr,
+        )
+        sys.exit(2)
+    module = sys.argv[1] if sys.argv[1].startswith("tools.") else f"tools.{sys.argv[1]}"
+    if module not in SERVED_MODULES:
+        print(f"cli_client: unknown tool '{sys.argv[1]}'", file=sys.stderr)
+        sys.exit(2)
+    sys.exit(run(module, sys.argv[2:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Local command server that runs agent-facing CLIs on pre-imported modules.
+
+The client half is ``tools/cli_client.py``; read its docstring for the contract
+callers see. This module is the server half.
+
+Lifecycle:
+    The worker spawns ``python -m tools.cli_server`` as a child process when
+    ``VALOR_CLI_SERVER=1`` (see :func:`spawn_server` / :func:`stop_server`). It
+    is deliberately a separate process, not a thread in the worker: running a
+    command means changing cwd, ``os.environ`` and the stdio descriptors, and
+    none of that may leak into the worker's event loop. The server exits when
+    its parent does, and removes its socket on the way out.
+
+Per request:
+    The server process is single-threaded and only imports; it never runs a
+    command itself. For each connection it receives a JSON header plus the
+    client's stdin/stdout/stderr descriptors (``SCM_RIGHTS``), then forks. The
+    child adopts the descriptors, cwd, environment and argv, runs the module as
+    ``__main__`` through :func:`tools.cli_client.run_in_process`, and reports
+    ``exit <code>`` back. Each command therefore gets a private copy of the warm
+    interpreter, so long-running subcommands (``valor-session
+    wait-for-children``) never block the next caller, and a crash stays in the
+    child.
+
+What is and is not warm:
+    :func:`preload` imports every served module, which pulls in popoto, the
+    pydantic settings and the model layer. The served module itself is
+    re-executed fresh as ``__main__`` on each call, so its own module-level env
+    reads see the caller's environment. Settings read at import time by the
+    shared layers reflect the server's environment, which is the worker's; the
+    fork inherits popoto's Redis pool, and redis-py resets it on the pid change.
+
+    Preloaded code is only as fresh as the server. The update flow restarts the
+    worker, which restarts the server; clients in a git worktree never reach it
+    (see ``DEFAULT_SOCKET_PATH`` in the client).
+
+Usage:
+    python -m tools.cli_server                         # socket at data/cli_server.sock
+    python -m tools.cli_server --socket /tmp/x.sock --no-preload
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from tools.cli_client import _HEADER, SERVED_MODULES, run_in_process, socket_path
+
+logger = logging.getLogger(__name__)
+
+# How often the accept loop wakes to reap children and check the parent.
+_POLL_INTERVAL_S = 1.0
+
+# A header larger than this is not a real client.
+_MAX_HEADER_BYTES = 4 * 1024 * 1024
+
+
+def preload() -> float:
+    """Import every served module; return the seconds it took.
+
+    A module that fails to import is logged and skipped: its callers still work,
+    the child just pays the import (and surfaces the same error) at run time.
+    """
+    start = time.perf_counter()
+    for module in sorted(SERVED_MODULES):
+        try:
+            importlib.import_module(module)
+        except Exception:
+            logger.warning("[cli-server] preload of %s failed", module, exc_info=True)
+    return time.perf_counter() - start
+
+
+def _bind(path: Path) -> socket.socket:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(path))
+    os.chmod(path, 0o600)
+    sock.listen(64)
+    return sock
+
+
+def _read_request(conn: socket.socket) -> tuple[dict, list[int]]:
+    """Read the framed JSON header and the three stdio descriptors."""
+    data, fds, _flags, _addr = socket.recv_fds(conn, 65536, 3)
+    if len(fds) != 3 or len(data) < _HEADER.size:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError("malformed request")
+    (length,) = _HEADER.unpack_from(data)
+    if length > _MAX_HEADER_BYTES:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError(f"header too large ({length} bytes)")
+    body = data[_HEADER.size :]
+    while len(body) < length:
+        chunk = conn.recv(length - len(body))
+        if not chunk:
+            for fd in fds:
+                os.close(fd)
+            raise ValueError("connection closed mid-header")
+        body += chunk
+    request = json.loads(body)
+    if request.get("module") not in SERVED_MODULES:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError(f"module not served: {request.get('module')!r}")
+    return request, fds
+
+
+def _run_child(conn: socket.socket, request: dict, fds: list[int]) -> None:
+    """Body of the forked child. Never returns."""
+    rc = 1
+    try:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        for target, fd in zip((0, 1, 2), fds, strict=True):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, encoding="utf-8", closefd=False)
+        sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", closefd=False)
+        # The command owns logging configuration, as it would in a fresh
+        # interpreter; the server's own handlers must not capture its output.
+        logging.root.handlers.clear()
+        logging.root.setLevel(logging.WARNING)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        # Preload imported the target as a plain module; like ``python -m``,
+        # run it as a fresh ``__main__`` copy on top of its warm dependencies.
+        sys.modules.pop(request["module"], None)
+        conn.sendall(f"pid {os.getpid()}\n".encode())
+        try:
+            rc = run_in_process(request["module"], list(request["argv"]))
+        except KeyboardInterrupt:
+            rc = 130
+        except BaseException:
+            import traceback
+
+            traceback.print_exc()
+            rc = 1
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:  # noqa: S110 -- client may have closed its end
+                pass
+        conn.sendall(f"exit {rc}\n".encode())
+    except BaseException:  # noqa: S110 -- the child must always reach _exit
+        pass
+    finally:
+        os._exit(0)
+
+
+def _reap() -> None:
+    while True:
+        try:
+            pid, _status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def serve(path: Path, *, do_preload: bool = True) -> None:
+    """Accept and fork until the parent process exits or SIGTERM arrives."""
+    if do_preload:
+        logger.info("[cli-server] preloaded %d modules in %.2fs", len(SERVED_MODULES), preload())
+    parent = os.getppid()
+    stop = False
+
+    def _stop(_signum, _frame):
+        nonlocal stop
+        stop = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    sock = _bind(path)
+    sock.settimeout(_POLL_INTERVAL_S)
+    logger.info("[cli-server] listening on %s (pid %d)", path, os.getpid())
+    try:
+        while not stop:
+            _reap()
+            if os.getppid() != parent:
+                logger.info("[cli-server] parent %d exited; shutting down", parent)
+                break
+            try:
+                conn, _ = sock.accept()
+            except TimeoutError:
+                continue
+            except InterruptedError:
+                continue
+            with conn:
+                conn.settimeout(5.0)
+                try:
+                    request, fds = _read_request(conn)
+                except (OSError, ValueError) as exc:
+                    logger.warning("[cli-server] rejected request: %s", exc)
+                    continue
+                pid = os.fork()
+                if pid == 0:
+                    sock.close()
+                    conn.settimeout(None)
+                    _run_child(conn, request, fds)
+                for fd in fds:
+                    os.close(fd)
+                logger.info("[cli-server] %s %s -> pid %d", request["module"], request["argv"], pid)
+    finally:
+        sock.close()
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def spawn_server(log_path: Path | None = None) -> subprocess.Popen:
+    """Start the server as a child of the calling process (the worker)."""
+    repo_root = Path(__file__).resolve().parent.parent
+    log_path = log_path or repo_root / "logs" / "cli_server.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "ab") as log_file:
+        return subprocess.Popen(
+            [sys.executable, "-m", "tools.cli_server"],
+            cwd=repo_root,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+
+
+def stop_server(proc: subprocess.Popen, timeout: float = 3.0) -> None:
+    """SIGTERM the server and wait briefly; in-flight command children finish on their own."""
+    if proc.poll() is not None:
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="cli_server",
+        description="Serve valor-session / sdlc-tool commands from a warm interpreter",
+    )
+    parser.add_argument(
+        "--socket", default=None, help="Socket path (default: data/cli_server.sock)"
+    )
+    parser.add_argument(
+        "--no-preload", action="store_true", help="Skip module preloading (tests only)"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    serve(Path(args.socket) if args.socket else socket_path(), do_preload=not args.no_preload)
+
+
+if __name__ == "__main__":
+    main()
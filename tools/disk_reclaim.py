@@ -350,6 +350,7 @@ def sweep_worktrees(
         merged_via_tree,
         worktree_busy_probe,
     )
+    from agent.worktree_pool import POOL_DIR
 
     sweep = Sweep(category="worktrees")
     worktrees_root = repo_root / WORKTREES_DIR
@@ -361,14 +362,14 @@ def sweep_worktrees(
         # Fail closed across the whole category: without PR state we cannot
         # distinguish an abandoned lane from one under active review.
         for child in sorted(worktrees_root.iterdir()):
-            if child.is_dir():
+            if child.is_dir() and child.name != POOL_DIR:
                 sweep.skip(child.name, "pr_state_unavailable")
         return sweep
 
     cutoff = time.time() - (min_age_days * 86400)
 
     for child in sorted(worktrees_root.iterdir()):
-        if not child.is_dir():
+        if not child.is_dir() or child.name == POOL_DIR:
             continue
         slug = child.name
 
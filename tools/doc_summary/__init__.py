@@ -11,6 +11,7 @@ from typing import Literal
 import requests
 
 from config.models import MODEL_FAST, OPENROUTER_HAIKU, OPENROUTER_URL
+from utils.llm_cache import llm_cached
 
 ANTHROPIC_URL = "https://api.anthropic.com/v1/messages"
 # Summarization is a fast/cheap task - use Haiku
@@ -63,6 +64,18 @@ def summarize(
     if not content or not content.strip():
         return {"error": "Content cannot be empty"}
 
+    return _summarize_content(content, summary_type, max_length, focus_areas, preserve_quotes)
+
+
+@llm_cached("doc_summary", model=DEFAULT_MODEL, version="v1")
+def _summarize_content(
+    content: str,
+    summary_type: str,
+    max_length: int | None,
+    focus_areas: list[str] | None,
+    preserve_quotes: bool,
+) -> dict:
+    """LLM half of :func:`summarize`, cached on the document text (not its path)."""
     # Try Anthropic first, fall back to OpenRouter
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     use_anthropic = bool(api_key)
@@ -9,6 +9,19 @@ still supported by the transport — ``EmojiResult.document_id`` and
 pinned statically by the caller rather than searched semantically (#2716).
 
 Standard emoji cache: data/emoji_embeddings.json
+Query embedding cache: data/emoji_query_embeddings.json
+
+Selection cost:
+    The emoji table is held as one row-normalized NumPy matrix, so scoring a
+    query is a single matrix-vector product. Query embeddings are kept in a
+    bounded LRU persisted to disk, so a feeling that has been embedded once
+    (the terminal reaction phrases in ``agent/constants.py`` are resolved on
+    every process start) never reaches the network again. Misses are written
+    at most once per ``QUERY_CACHE_FLUSH_INTERVAL_S`` and at exit. On load, every
+    cached feeling is scored in one matmul into a nearest-emoji table, so a
+    repeat feeling costs a dict lookup plus the softmax draw.
+    ``find_best_emoji_for_message`` needs no embedding at all: its vocabulary
+    is the fixed ``WORKTYPE_TO_ACTION`` -> ``ACTION_EMOJI_MAP`` table.
 
 Usage:
     from tools.emoji_embedding import find_best_emoji, find_best_emoji_for_message, EmojiResult
@@ -18,24 +31,43 @@ Usage:
     result.is_custom                            # -> False for standard emoji
 
     result = find_best_emoji_for_message(text)  # -> EmojiResult
+
+    result = await find_best_emoji_async("excited")  # pooled httpx client on a miss
+    result = find_best_emoji_offloop("excited")      # sync caller, no running loop
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import base64
 import json
 import logging
 import math
 import os
 import random
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
 OPENROUTER_EMBEDDINGS_URL = "https://openrouter.ai/api/v1/embeddings"
 EMBEDDING_MODEL = "openai/text-embedding-3-small"
 
+# The async path sits on the message-acknowledgement path; a reaction that
+# cannot be chosen in this window falls back to the default emoji.
+ASYNC_EMBEDDING_TIMEOUT_S = 10.0
+
 
 def _compute_embedding(text: str, api_key: str) -> list[float] | None:
     """Compute embedding for text using OpenRouter."""
@@ -61,24 +93,15 @@ def _compute_embedding(text: str, api_key: str) -> list[float] | None:
         return None
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    if not a or not b or len(a) != len(b):
-        return 0.0
-
-    dot_product = sum(x * y for x, y in zip(a, b, strict=False))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(x * x for x in b) ** 0.5
-
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-
-    return dot_product / (norm_a * norm_b)
-
-
 # Cache location for pre-computed emoji embeddings
 CACHE_PATH = Path(__file__).parent.parent / "data" / "emoji_embeddings.json"
 
+# Persistent LRU of feeling text -> query embedding (base64 float32 per entry).
+QUERY_CACHE_PATH = Path(__file__).parent.parent / "data" / "emoji_query_embeddings.json"
+QUERY_CACHE_MAX_ENTRIES = 256
+# Misses within this window of the last write are flushed together (or at exit).
+QUERY_CACHE_FLUSH_INTERVAL_S = 30.0
+
 # Default fallback emoji (thinking face)
 DEFAULT_EMOJI = "\U0001f914"  # 🤔
 
@@ -296,6 +319,225 @@ def _load_or_compute_embeddings() -> dict[str, list[float]]:
     return _embedding_cache
 
 
+@dataclass
+class _EmojiIndex:
+    """Row-normalized emoji matrix plus the nearest-emoji table built on it.
+
+    ``source`` is the embeddings dict the matrix was built from; the index is
+    rebuilt whenever ``_load_or_compute_embeddings`` returns a different one.
+    """
+
+    source: dict[str, list[float]]
+    emojis: tuple[str, ...]
+    matrix: np.ndarray
+    nearest: dict[str, list[tuple[str, float]]] = field(default_factory=dict)
+
+    @property
+    def dim(self) -> int:
+        return self.matrix.shape[1]
+
+    @classmethod
+    def build(cls, embeddings: dict[str, list[float]]) -> _EmojiIndex | None:
+        rows = [(e, v) for e, v in embeddings.items() if e not in BLOCKED_REACTION_EMOJIS and v]
+        if not rows:
+            return None
+        dim = len(rows[0][1])
+        rows = [(e, v) for e, v in rows if len(v) == dim]
+        matrix = np.asarray([v for _, v in rows], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1)
+        keep = norms > 0
+        matrix = matrix[keep] / norms[keep, None]
+        emojis = tuple(e for (e, _), k in zip(rows, keep, strict=True) if k)
+        if not emojis:
+            return None
+        return cls(source=embeddings, emojis=emojis, matrix=matrix)
+
+    def _top_k(self, scores: np.ndarray) -> list[tuple[str, float]]:
+        k = min(max(1, REACTION_TOP_K), len(self.emojis))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.emojis[i], float(scores[i])) for i in top]
+
+    def candidates(self, query: list[float]) -> list[tuple[str, float]]:
+        """Top-K ``(emoji, cosine)`` for one query vector (one matmul)."""
+        q = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return []
+        return self._top_k(self.matrix @ (q / norm))
+
+    def precompute(self, queries: dict[str, list[float]]) -> None:
+        """Fill the nearest-emoji table for many cached feelings in one matmul."""
+        usable = [(k, v) for k, v in queries.items() if len(v) == self.dim]
+        if not usable:
+            return
+        q = np.asarray([v for _, v in usable], dtype=np.float32)
+        norms = np.linalg.norm(q, axis=1)
+        scores = (q / np.where(norms > 0, norms, 1)[:, None]) @ self.matrix.T
+        for (key, _), row, norm in zip(usable, scores, norms, strict=True):
+            if norm > 0:
+                self.nearest[key] = self._top_k(row)
+
+
+_index: _EmojiIndex | None = None
+
+# Query-embedding LRU (most recent last); loaded from QUERY_CACHE_PATH lazily.
+_query_cache: OrderedDict[str, list[float]] | None = None
+# Unwritten entries, and the monotonic time of the last write (debounce).
+_query_cache_dirty = False
+_query_cache_saved_at: float | None = None
+# Guards _query_cache and the published index's ``nearest`` table. Lookups run
+# on the event loop while stores and flushes run in worker threads
+# (``asyncio.to_thread``), and iterating an OrderedDict while another thread
+# reorders it raises RuntimeError. Disk writes happen outside the lock, on a
+# snapshot.
+_query_cache_lock = threading.RLock()
+
+
+def _feeling_key(feeling: str) -> str:
+    return " ".join(feeling.split()).lower()
+
+
+def _load_query_cache() -> OrderedDict[str, list[float]]:
+    """The query LRU, read from disk on first use. Mutate it only under the lock."""
+    global _query_cache
+    if _query_cache is not None:
+        return _query_cache
+    loaded: OrderedDict[str, list[float]] = OrderedDict()
+    try:
+        data = json.loads(QUERY_CACHE_PATH.read_text())
+        if data.get("model") == EMBEDDING_MODEL:
+            for key, packed in data.get("entries", {}).items():
+                vec = np.frombuffer(base64.b64decode(packed), dtype="<f4")
+                loaded[key] = vec.tolist()
+    except FileNotFoundError:
+        pass
+    except (ValueError, OSError, AttributeError) as e:
+        logger.warning(f"Emoji query cache unreadable, starting empty: {e}")
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = loaded
+        return _query_cache
+
+
+def _save_query_cache(cache: dict[str, list[float]]) -> None:
+    """Atomically replace ``QUERY_CACHE_PATH`` with a snapshot of the LRU.
+
+    The temp file is unique per write, so the bridge and the worker can flush
+    concurrently; the last ``os.replace`` wins, which is fine for a cache.
+    """
+    entries = {
+        key: base64.b64encode(np.asarray(vec, dtype="<f4").tobytes()).decode("ascii")
+        for key, vec in cache.items()
+    }
+    tmp_name = None
+    try:
+        QUERY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=QUERY_CACHE_PATH.parent,
+            prefix=f".{QUERY_CACHE_PATH.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(json.dumps({"model": EMBEDDING_MODEL, "entries": entries}))
+        os.replace(tmp_name, QUERY_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Failed to save emoji query cache: {e}")
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def flush_query_cache() -> None:
+    """Write unsaved query embeddings to ``QUERY_CACHE_PATH`` (registered atexit)."""
+    global _query_cache_dirty, _query_cache_saved_at
+    with _query_cache_lock:
+        if not _query_cache_dirty or _query_cache is None:
+            return
+        _query_cache_dirty = False
+        _query_cache_saved_at = time.monotonic()
+        snapshot = dict(_query_cache)
+    _save_query_cache(snapshot)
+
+
+atexit.register(flush_query_cache)
+
+
+def _remember_query(key: str, embedding: list[float]) -> None:
+    """Add ``key`` to the LRU; persisted at most once per ``QUERY_CACHE_FLUSH_INTERVAL_S``."""
+    global _query_cache_dirty
+    cache = _load_query_cache()
+    with _query_cache_lock:
+        cache[key] = embedding
+        cache.move_to_end(key)
+        while len(cache) > QUERY_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        _query_cache_dirty = True
+        due = (
+            _query_cache_saved_at is None
+            or time.monotonic() - _query_cache_saved_at >= QUERY_CACHE_FLUSH_INTERVAL_S
+        )
+    if due:
+        flush_query_cache()
+
+
+def _get_index() -> _EmojiIndex | None:
+    """Return the emoji index for the current embeddings, building it if needed."""
+    global _index
+    embeddings = _load_or_compute_embeddings()
+    if not embeddings:
+        return None
+    if _index is None or _index.source is not embeddings:
+        index = _EmojiIndex.build(embeddings)
+        if index is not None:
+            # Not published yet, so its table is private until the assignment.
+            cache = _load_query_cache()
+            with _query_cache_lock:
+                snapshot = dict(cache)
+            index.precompute(snapshot)
+        _index = index
+    return _index
+
+
+def _cached_candidates(index: _EmojiIndex, key: str) -> list[tuple[str, float]] | None:
+    """Candidates for ``key`` without any network call, or ``None`` on a miss."""
+    cache = _load_query_cache()
+    with _query_cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+        hit = index.nearest.get(key)
+        embedding = cache.get(key)
+    if hit is not None:
+        return hit
+    if embedding is None or len(embedding) != index.dim:
+        return None
+    candidates = index.candidates(embedding)
+    with _query_cache_lock:
+        index.nearest[key] = candidates
+    return candidates
+
+
+def _store_candidates(
+    index: _EmojiIndex, key: str, embedding: list[float]
+) -> list[tuple[str, float]] | None:
+    """Cache a freshly computed query embedding and score it."""
+    if len(embedding) != index.dim:
+        return None
+    _remember_query(key, embedding)
+    candidates = index.candidates(embedding)
+    with _query_cache_lock:
+        index.nearest[key] = candidates
+    return candidates
+
+
+def _pick(feeling: str, candidates: list[tuple[str, float]], start: float) -> EmojiResult:
+    emoji, score = _softmax_sample(candidates, REACTION_TEMPERATURE)
+    elapsed_ms = (time.time() - start) * 1000
+    logger.debug(f"find_best_emoji({feeling!r}) -> {emoji} (score={score:.3f}, {elapsed_ms:.1f}ms)")
+    return EmojiResult(emoji=emoji, is_custom=False, score=score)
+
+
 def _softmax_sample(candidates: list[tuple[str, float]], temperature: float) -> tuple[str, float]:
     """Sample an emoji from candidates using softmax-weighted probability.
 
@@ -326,7 +568,9 @@ def find_best_emoji(feeling: str) -> EmojiResult:
     """Find the best reaction emoji for a given feeling word.
 
     Embeds the feeling text and finds the nearest emoji by cosine similarity
-    over the standard, Telegram-validated reaction set.
+    over the standard, Telegram-validated reaction set. A feeling seen before
+    (this process or a previous one, via ``QUERY_CACHE_PATH``) is answered
+    from the nearest-emoji table without a network call.
 
     This function never returns a custom emoji. The embedding index that once
     fed that branch was deleted in #2716: it had no production caller, could
@@ -349,43 +593,135 @@ def find_best_emoji(feeling: str) -> EmojiResult:
     if not feeling or not isinstance(feeling, str) or not feeling.strip():
         return default_result
 
-    embeddings = _load_or_compute_embeddings()
-    if not embeddings:
+    index = _get_index()
+    if index is None:
         return default_result
 
-    api_key = os.environ.get("OPENROUTER_API_KEY")
-    if not api_key:
+    start = time.time()
+    key = _feeling_key(feeling)
+    candidates = _cached_candidates(index, key)
+    if candidates is None:
+        api_key = os.environ.get("OPENROUTER_API_KEY")
+        if not api_key:
+            return default_result
+        query_embedding = _compute_embedding(feeling.strip(), api_key)
+        if not query_embedding:
+            return default_result
+        candidates = _store_candidates(index, key, query_embedding)
+    if not candidates:
+        return default_result
+    return _pick(feeling, candidates, start)
+
+
+# Pooled client for the async path, bound to the event loop that created it.
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        import httpx
+
+        _async_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(ASYNC_EMBEDDING_TIMEOUT_S, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the pooled async client (call on shutdown; safe if never opened)."""
+    global _async_client, _async_client_loop
+    client, _async_client, _async_client_loop = _async_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def _compute_embedding_async(text: str, api_key: str) -> list[float] | None:
+    """Async twin of ``_compute_embedding`` over the pooled keep-alive client."""
+    try:
+        response = await _get_async_client().post(
+            OPENROUTER_EMBEDDINGS_URL,
+            headers={"Authorization": f"Bearer {api_key}"},
+            json={"model": EMBEDDING_MODEL, "input": text[:8000]},
+        )
+        response.raise_for_status()
+        return response.json().get("data", [{}])[0].get("embedding")
+    except Exception:
+        return None
+
+
+async def find_best_emoji_async(feeling: str) -> EmojiResult:
+    """Async variant of :func:`find_best_emoji` for event-loop callers.
+
+    Cache and table hits never leave the loop. A miss embeds the feeling over
+    a pooled ``httpx.AsyncClient`` (keep-alive, ``ASYNC_EMBEDDING_TIMEOUT_S``)
+    instead of a blocking ``requests.post``. The one-time emoji index load runs
+    in a worker thread because it may have to build the index over the network.
+    """
+    default_result = EmojiResult(emoji=DEFAULT_EMOJI)
+
+    if not feeling or not isinstance(feeling, str) or not feeling.strip():
+        return default_result
+
+    index = _index if _embedding_cache is not None else None
+    if index is None or index.source is not _embedding_cache:
+        index = await asyncio.to_thread(_get_index)
+    if index is None:
         return default_result
 
     start = time.time()
-    query_embedding = _compute_embedding(feeling.strip(), api_key)
-    if not query_embedding:
+    key = _feeling_key(feeling)
+    candidates = _cached_candidates(index, key)
+    if candidates is None:
+        api_key = os.environ.get("OPENROUTER_API_KEY")
+        if not api_key:
+            return default_result
+        query_embedding = await _compute_embedding_async(feeling.strip(), api_key)
+        if not query_embedding:
+            return default_result
+        candidates = await asyncio.to_thread(_store_candidates, index, key, query_embedding)
+    if not candidates:
         return default_result
+    return _pick(feeling, candidates, start)
 
-    # Score all standard emoji and collect top-K candidates for sampling
-    scored: list[tuple[str, float]] = []
-    for emoji, emb in embeddings.items():
-        if emoji in BLOCKED_REACTION_EMOJIS:
-            continue
-        score = _cosine_similarity(query_embedding, emb)
-        scored.append((emoji, score))
 
-    scored.sort(key=lambda x: x[1], reverse=True)
-    top_standard = scored[: max(1, REACTION_TOP_K)]
-    best_standard_emoji, best_standard_score = _softmax_sample(top_standard, REACTION_TEMPERATURE)
+def find_best_emoji_offloop(feeling: str) -> EmojiResult:
+    """Run :func:`find_best_emoji_async` from synchronous code with no running loop.
 
-    elapsed_ms = (time.time() - start) * 1000
-    result = EmojiResult(
-        emoji=best_standard_emoji,
-        is_custom=False,
-        score=best_standard_score,
-    )
-    logger.debug(
-        f"find_best_emoji({feeling!r}) -> {best_standard_emoji} "
-        f"(score={best_standard_score:.3f}, {elapsed_ms:.1f}ms)"
-    )
+    For one-shot callers (CLIs, import-time constants): the embed goes over
+    the async client on a private loop, which is closed before returning.
+    """
+
+    async def _run() -> EmojiResult:
+        try:
+            return await find_best_emoji_async(feeling)
+        finally:
+            await close_async_client()
+
+    return asyncio.run(_run())
 
-    return result
+
+def find_best_emoji_cached(feeling: str) -> EmojiResult | None:
+    """Answer from the loaded index and query cache only, or ``None``.
+
+    Never touches the network or disk, so it is safe on a running event loop;
+    ``None`` means the feeling (or the index itself) is not loaded yet.
+    """
+    if not feeling or not isinstance(feeling, str) or not feeling.strip():
+        return None
+    index = _index
+    if index is None or _embedding_cache is None or index.source is not _embedding_cache:
+        return None
+    if _query_cache is None:
+        return None
+    candidates = _cached_candidates(index, _feeling_key(feeling))
+    if not candidates:
+        return None
+    return _pick(feeling, candidates, time.time())
 
 
 # Maps work type labels (from issue/task classification) to action intent categories.
@@ -440,6 +776,10 @@ def find_best_emoji_for_message(text: str, work_type: str | None = None) -> Emoj
 
 
 def clear_cache() -> None:
-    """Clear the in-memory embedding cache (for testing)."""
-    global _embedding_cache
+    """Clear the in-memory embedding, index and query caches (for testing)."""
+    global _embedding_cache, _index, _query_cache, _query_cache_dirty, _query_cache_saved_at
     _embedding_cache = None
+    _index = None
+    _query_cache = None
+    _query_cache_dirty = False
+    _query_cache_saved_at = None
@@ -6,18 +6,32 @@ Includes YouTube video processing with audio extraction and transcription.
 """
 
 import asyncio
+import html
 import logging
 import os
 import re
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 import requests
 
+from tools.transcribe.engine import (
+    TranscriptChunk,
+    content_key,
+    get_cached_transcript,
+    store_transcript,
+    transcribe_audio,
+    video_key,
+)
+from utils.llm_cache import llm_cached
+
 PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
 DEFAULT_MODEL = "sonar"  # Current Perplexity model
+TRANSCRIPT_SUMMARY_MODEL = "gpt-4o-mini"
 
 OPENROUTER_TRANSCRIBE_URL = (
     "https://openrouter.ai/api/v1/audio/transcriptions"  # OpenAI-compatible, provisional
@@ -312,13 +326,24 @@ async def _post_transcription(
         return None
 
 
-async def transcribe_audio_file(filepath: Path) -> str | None:
+async def transcribe_audio_file(
+    filepath: Path,
+    *,
+    cache_key: str | None = None,
+    on_partial: Callable[[TranscriptChunk], Any] | None = None,
+) -> str | None:
     """
     Transcribes audio using OpenRouter whisper-large-v3 (preferred) with automatic
     fallback to OpenAI whisper-1.
 
+    Served from the shared transcript cache when these bytes (or ``cache_key``)
+    were transcribed before. Long audio is split at silences and its chunks are
+    transcribed concurrently (``tools.transcribe.engine``).
+
     Args:
         filepath: Path to audio file
+        cache_key: Transcript cache key; defaults to the file's content hash
+        on_partial: Called with each ordered chunk as it becomes available
 
     Returns:
         Transcription text or None on error
@@ -327,66 +352,75 @@ async def transcribe_audio_file(filepath: Path) -> str | None:
     openai_key = os.getenv("OPENAI_API_KEY", "")
 
     if not openrouter_key and not openai_key:
+        key = cache_key or await asyncio.to_thread(content_key, filepath)
+        cached = await asyncio.to_thread(get_cached_transcript, key)
+        if cached:
+            return cached["text"]
         logger.warning("No OPENROUTER_API_KEY or OPENAI_API_KEY for audio transcription")
         return None
 
     try:
-        # Determine MIME type based on extension
-        ext = filepath.suffix.lower()
-        mime_types = {
-            ".mp3": "audio/mpeg",
-            ".m4a": "audio/mp4",
-            ".wav": "audio/wav",
-            ".webm": "audio/webm",
-            ".ogg": "audio/ogg",
-            ".opus": "audio/opus",
-        }
-        mime_type = mime_types.get(ext, "audio/mpeg")
-
         async with httpx.AsyncClient(timeout=120.0) as client:
-            if openrouter_key:
-                result = await _post_transcription(
-                    client,
-                    filepath,
-                    mime_type,
-                    url=OPENROUTER_TRANSCRIBE_URL,
-                    api_key=openrouter_key,
-                    model=OPENROUTER_WHISPER_MODEL,
-                    backend="OpenRouter",
-                )
-                if result is not None:
-                    return result
-
-                logger.warning("OpenRouter transcription failed, attempting fallback")
-                if not openai_key:
-                    logger.warning("No OPENAI_API_KEY for fallback transcription")
-                    return None
-
-                return await _post_transcription(
-                    client,
-                    filepath,
-                    mime_type,
-                    url=OPENAI_TRANSCRIBE_URL,
-                    api_key=openai_key,
-                    model=OPENAI_WHISPER_MODEL,
-                    backend="OpenAI",
-                )
 
-            return await _post_transcription(
-                client,
-                filepath,
-                mime_type,
-                url=OPENAI_TRANSCRIBE_URL,
-                api_key=openai_key,
-                model=OPENAI_WHISPER_MODEL,
-                backend="OpenAI",
+            async def transcribe_chunk(chunk_path: Path) -> dict | None:
+                text = await _transcribe_one(client, chunk_path, openrouter_key, openai_key)
+                return None if text is None else {"text": text}
+
+            result = await transcribe_audio(
+                filepath, transcribe_chunk, cache_key=cache_key, on_partial=on_partial
             )
+            return result["text"] if result else None
 
     except Exception as e:
         logger.error(f"Audio transcription failed: {e}")
         return None
 
 
+async def _transcribe_one(
+    client: httpx.AsyncClient, filepath: Path, openrouter_key: str, openai_key: str
+) -> str | None:
+    """Transcribe one file (or chunk): OpenRouter first, then OpenAI."""
+    # Determine MIME type based on extension
+    ext = filepath.suffix.lower()
+    mime_types = {
+        ".mp3": "audio/mpeg",
+        ".m4a": "audio/mp4",
+        ".wav": "audio/wav",
+        ".webm": "audio/webm",
+        ".ogg": "audio/ogg",
+        ".opus": "audio/opus",
+    }
+    mime_type = mime_types.get(ext, "audio/mpeg")
+
+    if openrouter_key:
+        result = await _post_transcription(
+            client,
+            filepath,
+            mime_type,
+            url=OPENROUTER_TRANSCRIBE_URL,
+            api_key=openrouter_key,
+            model=OPENROUTER_WHISPER_MODEL,
+            backend="OpenRouter",
+        )
+        if result is not None:
+            return result
+
+        logger.warning("OpenRouter transcription failed, attempting fallback")
+        if not openai_key:
+            logger.warning("No OPENAI_API_KEY for fallback transcription")
+            return None
+
+    return await _post_transcription(
+        client,
+        filepath,
+        mime_type,
+        url=OPENAI_TRANSCRIBE_URL,
+        api_key=openai_key,
+        model=OPENAI_WHISPER_MODEL,
+        backend="OpenAI",
+    )
+
+
 async def summarize_transcript(text: str, max_length: int = 500) -> str:
     """
     Summarize long transcript using OpenAI API.
@@ -398,13 +432,22 @@ async def summarize_transcript(text: str, max_length: int = 500) -> str:
     Returns:
         Summary text or original text if summarization fails
     """
+    summary = await _summarize_transcript_llm(text, max_length)
+    if summary:
+        return summary
+    # Fallback to truncation
+    if len(text) > max_length:
+        return text[:max_length] + "..."
+    return text
+
+
+@llm_cached("transcript_summary", model=TRANSCRIPT_SUMMARY_MODEL, version="v1")
+async def _summarize_transcript_llm(text: str, max_length: int) -> str | None:
+    """The OpenAI half of :func:`summarize_transcript`; ``None`` on failure (not cached)."""
     api_key = os.getenv("OPENAI_API_KEY", "")
     if not api_key:
         logger.warning("No OPENAI_API_KEY for summarization")
-        # Return truncated text as fallback
-        if len(text) > max_length:
-            return text[:max_length] + "..."
-        return text
+        return None
 
     try:
         async with httpx.AsyncClient(timeout=60.0) as client:
@@ -415,7 +458,7 @@ async def summarize_transcript(text: str, max_length: int = 500) -> str:
                     "Content-Type": "application/json",
                 },
                 json={
-                    "model": "gpt-4o-mini",
+                    "model": TRANSCRIPT_SUMMARY_MODEL,
                     "messages": [
                         {
                             "role": "system",
@@ -441,16 +484,11 @@ async def summarize_transcript(text: str, max_length: int = 500) -> str:
                 return summary.strip()
             else:
                 logger.error(f"OpenAI summarization error: {response.status_code}")
-                # Fallback to truncation
-                if len(text) > max_length:
-                    return text[:max_length] + "..."
-                return text
+                return None
 
     except Exception as e:
         logger.error(f"Summarization failed: {e}")
-        if len(text) > max_length:
-            return text[:max_length] + "..."
-        return text
+        return None
 
 
 async def process_youtube_url(url: str) -> dict:
@@ -488,6 +526,13 @@ async def process_youtube_url(url: str) -> dict:
         "context": "",
     }
 
+    # A video transcribed before (by captions or Whisper) skips yt-dlp entirely.
+    transcript_key = video_key("youtube", video_id)
+    cached = get_cached_transcript(transcript_key)
+    if cached:
+        result["title"] = cached.get("title")
+        return await _finish_youtube_result(result, cached["text"])
+
     # Get video info first
     video_info = get_youtube_video_info(video_id)
     if video_info:
@@ -536,7 +581,9 @@ async def process_youtube_url(url: str) -> dict:
         logger.warning(f"Caption fetch failed for {video_id}: {e}; falling through to Whisper path")
 
     # --- Whisper fallback (requires OPENAI_API_KEY) ---
+    source = "captions"
     if not transcript:
+        source = "whisper"
         audio_path = await download_youtube_audio_async(video_id)
         if audio_path:
             transcript = await transcribe_audio_file(audio_path)
@@ -556,6 +603,14 @@ async def process_youtube_url(url: str) -> dict:
         )
         return result
 
+    store_transcript(
+        transcript_key, {"text": transcript, "title": result["title"], "source": source}
+    )
+    return await _finish_youtube_result(result, transcript)
+
+
+async def _finish_youtube_result(result: dict, transcript: str) -> dict:
+    """Fill a successful ``process_youtube_url`` result, summarizing long transcripts."""
     result["transcript"] = transcript
     result["success"] = True
 
@@ -733,62 +788,203 @@ def get_metadata(url: str, timeout: int = 10) -> dict:
         return {"url": url, "error": str(e)}
 
 
-async def summarize_url_content(url: str, timeout: float = 30.0) -> str | None:
+# Page text sent to the summarizer; a few thousand words is plenty for 2-3 sentences.
+PAGE_SUMMARY_MAX_CHARS = 12000
+# Bytes of a page body read for enrichment; the rest is never downloaded.
+PAGE_MAX_BYTES = 2_000_000
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_META_RE = re.compile(r"<meta\s[^>]*>", re.IGNORECASE)
+_META_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_DESCRIPTION_KEYS = ("description", "og:description", "twitter:description")
+
+
+def _html_metadata(page: str) -> tuple[str | None, str | None]:
+    """Return (title, description) from an HTML document's head."""
+    match = _TITLE_RE.search(page)
+    title = html.unescape(" ".join(match.group(1).split())) if match else None
+    description = None
+    for tag in _META_RE.findall(page):
+        attrs = {k.lower(): a or b for k, a, b in _META_ATTR_RE.findall(tag)}
+        if (attrs.get("name") or attrs.get("property", "")).lower() in _DESCRIPTION_KEYS:
+            description = html.unescape(attrs.get("content", "")).strip() or None
+            if description:
+                break
+    return title or None, description
+
+
+async def fetch_page(url: str, client: httpx.AsyncClient, timeout: float = 10.0) -> dict:
     """
-    Use Perplexity API to summarize URL content.
+    Fetch a page once and derive everything link enrichment needs from it.
+
+    Replaces the ``get_metadata`` + summarize-by-URL pair, which fetched the
+    page twice (once here, once by the summarizer) and ran ``get_metadata``
+    through ``fetch_sync``'s ``asyncio.run``, which fails inside a running loop.
+
+    The body is streamed: a content type that is not HTML, text or JSON is
+    rejected from the headers before any of it is read, and at most
+    ``PAGE_MAX_BYTES`` are read (the head, with the metadata, comes first).
 
     Args:
-        url: URL to summarize
+        url: URL to fetch
+        client: Shared client (connection pooling is the caller's)
         timeout: Request timeout in seconds
 
     Returns:
-        Summary string, or None if summarization failed
+        dict with url, final_url, title, description and content (markdown
+        text), or url and error when the page could not be read
     """
+    from html2text import HTML2Text
+
+    try:
+        async with client.stream("GET", url, timeout=timeout, follow_redirects=True) as response:
+            response.raise_for_status()
+            final_url = str(response.url)
+            content_type = response.headers.get("content-type", "")
+            is_text = content_type.startswith("text/") or "json" in content_type
+            if "html" not in content_type and not is_text:
+                return {"url": url, "final_url": final_url, "error": f"Unsupported {content_type}"}
+            body = bytearray()
+            async for block in response.aiter_bytes():
+                body += block
+                if len(body) >= PAGE_MAX_BYTES:
+                    del body[PAGE_MAX_BYTES:]
+                    break
+            page = body.decode(response.encoding or "utf-8", errors="replace")
+    except httpx.TimeoutException:
+        return {"url": url, "error": "Request timed out"}
+    except Exception as e:
+        return {"url": url, "error": str(e)}
+
+    if "html" in content_type:
+        title, description = _html_metadata(page)
+        converter = HTML2Text()
+        converter.body_width = 0
+        converter.ignore_images = True
+        converter.unicode_snob = True
+        content = converter.handle(page)
+    else:
+        title, description, content = None, None, page
+
+    return {
+        "url": url,
+        "final_url": final_url,
+        "title": title,
+        "description": description,
+        "content": content.strip(),
+    }
+
+
+async def _perplexity_summary(
+    prompt: str, label: str, client: httpx.AsyncClient | None, timeout: float
+) -> str | None:
+    """POST one summarization prompt to Perplexity; None on any failure."""
     api_key = os.environ.get("PERPLEXITY_API_KEY")
     if not api_key:
         logger.warning("PERPLEXITY_API_KEY not set, skipping URL summarization")
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                PERPLEXITY_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": DEFAULT_MODEL,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": (
-                                "Summarize the main points of this URL in 2-3 sentences. "
-                                f"Be concise and informative: {url}"
-                            ),
-                        }
-                    ],
-                    "max_tokens": 256,
-                },
-            )
+        if client is None:
+            async with httpx.AsyncClient(timeout=timeout) as own_client:
+                response = await _post_perplexity(own_client, api_key, prompt, timeout)
+        else:
+            response = await _post_perplexity(client, api_key, prompt, timeout)
 
-            if response.status_code == 200:
-                data = response.json()
-                summary = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                if summary:
-                    logger.info(f"Successfully summarized URL: {url[:50]}...")
-                    return summary.strip()
-            else:
-                logger.error(f"Perplexity API error {response.status_code}: {response.text[:200]}")
+        if response.status_code == 200:
+            data = response.json()
+            summary = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+            if summary:
+                logger.info(f"Successfully summarized URL: {label[:50]}...")
+                return summary.strip()
+        else:
+            logger.error(f"Perplexity API error {response.status_code}: {response.text[:200]}")
 
     except httpx.TimeoutException:
-        logger.warning(f"Timeout summarizing URL: {url[:50]}...")
+        logger.warning(f"Timeout summarizing URL: {label[:50]}...")
     except Exception as e:
         logger.error(f"Error summarizing URL: {e}")
 
     return None
 
 
+async def _post_perplexity(
+    client: httpx.AsyncClient, api_key: str, prompt: str, timeout: float
+) -> httpx.Response:
+    return await client.post(
+        PERPLEXITY_URL,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        json={
+            "model": DEFAULT_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 256,
+        },
+        timeout=timeout,
+    )
+
+
+@llm_cached(
+    "url_summary", model=DEFAULT_MODEL, version="v1", ttl=24 * 3600, ignore=("timeout", "client")
+)
+async def summarize_url_content(
+    url: str, timeout: float = 30.0, client: httpx.AsyncClient | None = None
+) -> str | None:
+    """
+    Use Perplexity API to summarize URL content.
+
+    Perplexity fetches the page itself. Prefer ``summarize_page_content`` when
+    the page was already fetched.
+
+    Args:
+        url: URL to summarize
+        timeout: Request timeout in seconds
+        client: Optional shared client to reuse pooled connections
+
+    Returns:
+        Summary string, or None if summarization failed
+    """
+    prompt = (
+        f"Summarize the main points of this URL in 2-3 sentences. Be concise and informative: {url}"
+    )
+    return await _perplexity_summary(prompt, url, client, timeout)
+
+
+@llm_cached(
+    "page_summary", model=DEFAULT_MODEL, version="v1", ttl=24 * 3600, ignore=("timeout", "client")
+)
+async def summarize_page_content(
+    url: str,
+    content: str,
+    title: str | None = None,
+    timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
+) -> str | None:
+    """
+    Use Perplexity API to summarize a page from its already-fetched text.
+
+    Args:
+        url: URL the content came from (context for the model)
+        content: Page text, e.g. ``fetch_page(...)["content"]``; truncated to
+            ``PAGE_SUMMARY_MAX_CHARS``
+        title: Page title, if known
+        timeout: Request timeout in seconds
+        client: Optional shared client to reuse pooled connections
+
+    Returns:
+        Summary string, or None if summarization failed
+    """
+    header = f"URL: {url}\n" + (f"Title: {title}\n" if title else "")
+    prompt = (
+        "Summarize the main points of this page in 2-3 sentences. "
+        "Be concise and informative. Use only the page text below.\n\n"
+        f"{header}\n{content[:PAGE_SUMMARY_MAX_CHARS]}"
+    )
+    return await _perplexity_summary(prompt, url, client, timeout)
+
+
 def analyze_url(
     url: str,
     analyze_content: bool = True,
@@ -114,7 +114,7 @@ async def _generate_one(content: str) -> str | None:
 
     prompt = _GENERATION_PROMPT.format(content=content[:MAX_CONTENT_CHARS])
     try:
-        result = await run_typed(prompt, GeneratedQuery)
+        result = await run_typed(prompt, GeneratedQuery, lane="background")
     except (LLMCallError, ValueError) as e:
         logger.warning("[memory_eval] known-item generation failed: %s", e)
         return None
@@ -187,7 +187,7 @@ def build_pooled_judgments(
         for memory_id, content in pooled_records.items():
             prompt = _GRADING_PROMPT.format(query=query, content=content[:MAX_CONTENT_CHARS])
             try:
-                result = await run_typed(prompt, RelevanceGrade)
+                result = await run_typed(prompt, RelevanceGrade, lane="background")
             except (LLMCallError, ValueError) as e:
                 logger.warning(
                     "[memory_eval] pooled grading failed for memory_id=%s: %s", memory_id, e
@@ -175,12 +175,22 @@ def _gh_pr_view(pr_number: int, repo_root: Path) -> dict:
 
 
 def _gh_repo_name_with_owner(repo_root: Path) -> str:
-    """Resolve the target repo's ``owner/name`` slug via ``gh repo view``.
+    """Resolve the target repo's ``owner/name`` slug.
+
+    With the shared GitHub broker configured this is ``GH_REPO`` or the
+    ``origin`` remote, read without a subprocess to GitHub; otherwise
+    ``gh repo view``.
 
     Raises on any failure. Shared by the latest-commit lookup and the
     PipelineLedger tracked-issue resolution (#2034), both of which need the
     same repo-scoping value.
     """
+    from utils import github_api
+
+    if github_api.enabled():
+        repo = github_api.resolve_repo(repo_root)
+        if repo:
+            return repo
     repo_proc = subprocess.run(
         ["gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
         capture_output=True,
@@ -106,8 +106,22 @@ def _gh_pr_head(pr: int, repo: str | None) -> str | None:
 
     Used when the authoritative git read yields nothing (no ``origin`` remote,
     or a cross-repo ``GH_REPO`` checkout where ``origin`` is a different repo).
-    ``gh pr view --json`` does not touch gh's disk cache on gh 2.89.0.
+    ``gh pr view --json`` does not touch gh's disk cache on gh 2.89.0. With
+    the shared GitHub broker configured the read goes through it instead; it
+    revalidates its cached copy with the API on every call.
     """
+    from utils import github_api
+
+    broker_repo = (repo or github_api.resolve_repo()) if github_api.enabled() else None
+    if broker_repo:
+        try:
+            sha = github_api.pull_head_sha(pr, broker_repo)
+        except github_api.GitHubAPIError as e:
+            logger.debug("broker headRefOid for PR #%s failed: %s", pr, e)
+            return None
+        match = _SHA_RE.search(sha or "")
+        return match.group(1) if match else None
+
     cmd = ["gh", "pr", "view", str(pr), "--json", "headRefOid", "-q", ".headRefOid"]
     if repo:
         cmd = [
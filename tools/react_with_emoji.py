@@ -91,9 +91,9 @@ def react(feeling: str) -> None:
         print("Error: feeling is empty.", file=sys.stderr)
         sys.exit(1)
 
-    from tools.emoji_embedding import find_best_emoji
+    from tools.emoji_embedding import find_best_emoji_offloop
 
-    result = find_best_emoji(feeling.strip())
+    result = find_best_emoji_offloop(feeling.strip())
 
     from agent.reaction_priority import is_ranked_glyph, priority_for_glyph
 
@@ -168,9 +168,9 @@ def standalone(feeling: str) -> None:
         print("Error: feeling is empty.", file=sys.stderr)
         sys.exit(1)
 
-    from tools.emoji_embedding import find_best_emoji
+    from tools.emoji_embedding import find_best_emoji_offloop
 
-    result = find_best_emoji(feeling.strip())
+    result = find_best_emoji_offloop(feeling.strip())
 
     payload = {
         "type": "custom_emoji_message",
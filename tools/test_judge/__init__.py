@@ -12,6 +12,7 @@ import anthropic
 import requests
 
 from config.models import MODEL_REASONING, OPENROUTER_SONNET, OPENROUTER_URL
+from utils.llm_cache import llm_cached
 
 DEFAULT_MODEL = MODEL_REASONING
 DEFAULT_MODEL_OPENROUTER = OPENROUTER_SONNET
@@ -37,6 +38,7 @@ class TestJudgeError(Exception):
         super().__init__(message)
 
 
+@llm_cached("test_judge", model=DEFAULT_MODEL, version="v1")
 def judge_test_result(
     test_output: str,
     expected_criteria: list[str],
@@ -2,9 +2,16 @@
 Test Scheduler Tool
 
 Schedule test runs through background queue with resource management.
+
+Sessions, the coverage map and per-test history persist in a SQLite store
+(``tools.test_scheduler.store``), so status, results, durations and flaky
+history survive a restart. ``schedule_impacted_tests`` runs only the tests a
+diff can affect, sharded across cores (``tools.test_scheduler.impact``).
 """
 
 import json
+import logging
+import os
 import subprocess
 import threading
 import time
@@ -14,7 +21,9 @@ from typing import Literal
 
 from bridge.utc import utc_iso
 
-# In-memory session storage (for simplicity)
+logger = logging.getLogger(__name__)
+
+# Live sessions of this process; every state change is also written to the store.
 _sessions: dict[str, dict] = {}
 _lock = threading.Lock()
 
@@ -30,6 +39,40 @@ class TestSchedulerError(Exception):
         super().__init__(message)
 
 
+def _persist(session: dict) -> None:
+    """Write a session to the store. Storage trouble never fails a test run."""
+    from tools.test_scheduler import store
+
+    try:
+        store.save_session(session)
+    except Exception as e:
+        logger.warning("test_scheduler: could not persist session: %s", e)
+
+
+def _load_persisted(agent_session_id: str | None = None, limit: int = 100) -> list[dict]:
+    """Return stored sessions not live in this process.
+
+    A stored session still ``scheduled`` or ``running`` belonged to a process
+    that has since exited, so it is reported as ``interrupted``.
+    """
+    from tools.test_scheduler import store
+
+    try:
+        if agent_session_id is not None:
+            found = store.load_session(agent_session_id)
+            sessions = [found] if found else []
+        else:
+            sessions = store.list_sessions(limit=limit)
+    except Exception:
+        return []
+    with _lock:
+        sessions = [s for s in sessions if s["agent_session_id"] not in _sessions]
+    for session in sessions:
+        if session.get("status") in ("scheduled", "running"):
+            session["status"] = "interrupted"
+    return sessions
+
+
 def _parse_test_specification(spec: str) -> list[dict]:
     """
     Parse test specification into individual tests.
@@ -92,6 +135,7 @@ def _run_test_job(agent_session_id: str, tests: list[dict], timeout_minutes: int
     with _lock:
         _sessions[agent_session_id]["status"] = "running"
         _sessions[agent_session_id]["started_at"] = utc_iso()
+    _persist(_sessions[agent_session_id])
 
     results = []
     timeout_seconds = timeout_minutes * 60
@@ -141,16 +185,25 @@ def _run_test_job(agent_session_id: str, tests: list[dict], timeout_minutes: int
                 }
             )
 
-    # Update session status
+    _complete_session(
+        agent_session_id,
+        results,
+        {
+            "total": len(results),
+            "passed": sum(1 for r in results if r["passed"]),
+            "failed": sum(1 for r in results if not r["passed"]),
+        },
+    )
+
+
+def _complete_session(agent_session_id: str, results: list[dict], summary: dict) -> None:
+    """Mark a session completed and save it to the store and the results dir."""
     with _lock:
         _sessions[agent_session_id]["status"] = "completed"
         _sessions[agent_session_id]["completed_at"] = utc_iso()
         _sessions[agent_session_id]["results"] = results
-        _sessions[agent_session_id]["summary"] = {
-            "total": len(results),
-            "passed": sum(1 for r in results if r["passed"]),
-            "failed": sum(1 for r in results if not r["passed"]),
-        }
+        _sessions[agent_session_id]["summary"] = summary
+    _persist(_sessions[agent_session_id])
 
     # Save results to file
     results_dir = DEFAULT_RESULTS_DIR
@@ -209,6 +262,7 @@ def schedule_tests(
 
     with _lock:
         _sessions[agent_session_id] = session
+    _persist(session)
 
     # Start background execution
     thread = threading.Thread(
@@ -232,6 +286,188 @@ def schedule_tests(
     }
 
 
+def _run_impact_job(
+    agent_session_id: str, repo_root: Path, shards: list[list[str]], timeout_minutes: int
+):
+    """Run impact-selected shards in parallel and summarize per test."""
+    from tools.test_scheduler import impact, store
+
+    with _lock:
+        _sessions[agent_session_id]["status"] = "running"
+        _sessions[agent_session_id]["started_at"] = utc_iso()
+    _persist(_sessions[agent_session_id])
+
+    try:
+        results, outcomes = impact.run_shards(
+            repo_root, shards, timeout_minutes * 60, agent_session_id=agent_session_id
+        )
+        flaky = store.flaky_tests(impact.repo_key(repo_root))
+    except Exception as e:
+        results = [{"type": "pytest-shard", "exit_code": -1, "error": str(e), "passed": False}]
+        outcomes, flaky = [], {}
+
+    failed = sorted(o["nodeid"] for o in outcomes if o["outcome"] == "failed")
+    _complete_session(
+        agent_session_id,
+        results,
+        {
+            "total": len(outcomes),
+            "passed": sum(1 for o in outcomes if o["outcome"] == "passed"),
+            "failed": len(failed),
+            "skipped": sum(1 for o in outcomes if o["outcome"] == "skipped"),
+            "shards_failed": sum(1 for r in results if not r["passed"]),
+            "failed_tests": failed,
+            "known_flaky": [t for t in failed if t in flaky],
+        },
+    )
+
+
+def schedule_impacted_tests(
+    repo_root: str | Path | None = None,
+    base: str = "main",
+    notification_chat_id: str | None = None,
+    max_workers: int | None = None,
+    timeout_minutes: int = 10,
+    priority: Literal["low", "normal", "high"] = "normal",
+) -> dict:
+    """
+    Schedule only the tests affected by the diff against ``base``, sharded.
+
+    Args:
+        repo_root: Repo or worktree to test (default: current directory)
+        base: Branch the diff is taken against (via its merge base)
+        notification_chat_id: Where to send results (optional)
+        max_workers: Shard count limit (default: CPU count)
+        timeout_minutes: Maximum runtime per shard (default: 10)
+        priority: Session priority
+
+    Returns:
+        dict with:
+            - agent_session_id: Scheduled session identifier (absent when
+              nothing needs to run)
+            - status: "scheduled" or "nothing_to_run"
+            - selection: How the tests were chosen (see impact.Selection)
+            - test_count: Selected test units
+            - shards: Number of parallel pytest processes
+            - estimated_duration: Longest shard, from historical durations
+    """
+    from tools.test_scheduler import impact, store
+
+    root = Path(repo_root or Path.cwd()).resolve()
+    try:
+        changed, base_rev = impact.changed_files(root, base)
+        selection = impact.select_tests(changed, root, base_rev=base_rev)
+    except TestSchedulerError as e:
+        # An unreadable diff is never an answer of "nothing": run everything.
+        selection = impact.Selection(
+            full_run=True, reason=f"selection failed, running everything: {e.message}"
+        )
+    try:
+        units = impact.discover_test_files(root) if selection.full_run else selection.tests
+        history = store.durations(impact.repo_key(root))
+    except TestSchedulerError as e:
+        return {"error": e.message, "category": e.category}
+
+    if not units:
+        return {
+            "status": "nothing_to_run",
+            "selection": selection.as_dict(),
+            "test_count": 0,
+        }
+
+    shards = impact.shard(units, max_workers or os.cpu_count() or 1, history)
+    agent_session_id = str(uuid.uuid4())[:8]
+    session = {
+        "agent_session_id": agent_session_id,
+        "status": "scheduled",
+        "created_at": utc_iso(),
+        "specification": f"impacted tests vs {base}",
+        "repo_root": str(root),
+        "selection": selection.as_dict(),
+        "tests": [
+            {
+                "command": impact.shard_command(root, shard_units),
+                "type": "pytest-shard",
+                "framework": "pytest",
+                "units": shard_units,
+                "expected_seconds": round(expected, 1),
+            }
+            for expected, shard_units in shards
+        ],
+        "notification_chat_id": notification_chat_id,
+        "max_workers": len(shards),
+        "timeout_minutes": timeout_minutes,
+        "priority": priority,
+    }
+
+    with _lock:
+        _sessions[agent_session_id] = session
+    _persist(session)
+
+    thread = threading.Thread(
+        target=_run_impact_job,
+        args=(agent_session_id, root, [s for _, s in shards], timeout_minutes),
+        daemon=True,
+    )
+    thread.start()
+
+    estimated_seconds = int(shards[0][0]) if shards else 0
+    return {
+        "agent_session_id": agent_session_id,
+        "status": "scheduled",
+        "selection": selection.as_dict(),
+        "tests_to_run": units,
+        "test_count": len(units),
+        "shards": len(shards),
+        "estimated_duration": f"{estimated_seconds // 60}m {estimated_seconds % 60}s",
+        "timeout_minutes": timeout_minutes,
+    }
+
+
+def run_impacted_tests(
+    repo_root: str | Path | None = None,
+    base: str = "main",
+    max_workers: int | None = None,
+    timeout_minutes: int = 10,
+    poll_interval_s: float = 1.0,
+) -> dict:
+    """
+    Run the tests affected by the diff against ``base`` and wait for them.
+
+    The blocking form of :func:`schedule_impacted_tests`, used by the do-test
+    flow (``python -m tools.test_scheduler --impacted``). Selection falls back
+    to a full run whenever it cannot answer (no coverage map, a project config
+    change, an unreadable diff), so an empty selection always means "nothing
+    changed", never "could not tell".
+
+    Args:
+        repo_root: Repo or worktree to test (default: current directory)
+        base: Branch the diff is taken against (via its merge base)
+        max_workers: Shard count limit (default: CPU count)
+        timeout_minutes: Maximum runtime per shard (default: 10)
+        poll_interval_s: How often to check for completion
+
+    Returns:
+        The :func:`schedule_impacted_tests` result. Once the run finishes it has
+        ``status="completed"`` and the session ``summary``. It has ``error`` if
+        scheduling failed or the run outlived its shards' timeout.
+    """
+    result = schedule_impacted_tests(
+        repo_root, base=base, max_workers=max_workers, timeout_minutes=timeout_minutes
+    )
+    if "error" in result or result["status"] == "nothing_to_run":
+        return result
+
+    # Shards run in parallel, each bounded by timeout_minutes; allow for startup.
+    deadline = time.monotonic() + timeout_minutes * 60 + 60
+    while time.monotonic() < deadline:
+        status = get_session_status(result["agent_session_id"])
+        if status.get("status") == "completed":
+            return {**result, "status": "completed", "summary": status.get("summary", {})}
+        time.sleep(poll_interval_s)
+    return {**result, "error": f"Impacted run did not finish within {timeout_minutes} minutes"}
+
+
 def get_session_status(agent_session_id: str) -> dict:
     """
     Get status of a scheduled session.
@@ -246,7 +482,10 @@ def get_session_status(agent_session_id: str) -> dict:
         session = _sessions.get(agent_session_id)
 
     if not session:
-        # Try loading from file
+        persisted = _load_persisted(agent_session_id)
+        if persisted:
+            return persisted[0]
+        # Sessions from before the store existed
         results_file = DEFAULT_RESULTS_DIR / f"{agent_session_id}.json"
         if results_file.exists():
             return json.loads(results_file.read_text())
@@ -271,6 +510,7 @@ def list_sessions(
     """
     with _lock:
         sessions = list(_sessions.values())
+    sessions.extend(_load_persisted())
 
     if status_filter:
         sessions = [s for s in sessions if s["status"] == status_filter]
@@ -305,6 +545,7 @@ def cancel_session(agent_session_id: str) -> dict:
 
         session["status"] = "cancelled"
         session["cancelled_at"] = utc_iso()
+    _persist(session)
 
     return {
         "agent_session_id": agent_session_id,
@@ -347,11 +588,34 @@ if __name__ == "__main__":
 
     if len(sys.argv) < 2:
         print("Usage: python -m tools.test_scheduler 'pytest tests/'")
+        print("       python -m tools.test_scheduler --impacted [base]")
+        print("       python -m tools.test_scheduler --build-coverage-map")
         sys.exit(1)
 
     spec = sys.argv[1]
-    print(f"Scheduling: {spec}")
+    if spec == "--build-coverage-map":
+        from tools.test_scheduler import impact
+
+        print(json.dumps(impact.build_coverage_map(Path.cwd()), indent=2))
+        sys.exit(0)
+
+    if spec == "--impacted":
+        # Exit 0: passed or nothing to run; 1: test failures; 2: could not run
+        # (the caller falls back to the full suite).
+        base = sys.argv[2] if len(sys.argv) > 2 else "main"
+        print(f"Running tests impacted by the diff against {base}")
+        result = run_impacted_tests(base=base)
+        if "error" in result:
+            print(f"Error: {result['error']}")
+            sys.exit(2)
+        print(f"Selection: {result['selection']['reason']}")
+        if result["status"] == "nothing_to_run":
+            sys.exit(0)
+        summary = result["summary"]
+        print(f"Results: {json.dumps(summary, indent=2)}")
+        sys.exit(1 if summary.get("failed") or summary.get("shards_failed") else 0)
 
+    print(f"Scheduling: {spec}")
     result = schedule_tests(spec)
 
     if "error" in result:
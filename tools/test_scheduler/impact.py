@@ -0,0 +1,471 @@
+"""
+Test impact selection and sharding.
+
+- ``build_coverage_map`` runs the suite once under ``coverage`` with one
+  context per test and stores source file -> tests in the scheduler store.
+- ``select_tests`` turns a diff into the tests it can affect: changed test
+  files run as-is, Python sources run the tests that executed them, and
+  everything the map cannot answer (config, shell, docs, never-executed
+  modules) goes to ``tools.code_impact_finder`` in one call.
+- ``shard`` splits the selection into per-core groups balanced by historical
+  durations, keeping each test file on one shard (the repo's ``loadfile``
+  rule), and ``run_shards`` runs the groups as parallel pytest processes and
+  records every outcome for the next balance and for flaky detection.
+"""
+
+import bisect
+import heapq
+import importlib.util
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path, PurePosixPath
+
+from config.settings import settings
+from tools.test_scheduler import TestSchedulerError, store
+from tools.test_scheduler.pytest_plugin import COVERAGE_ENV, REPORT_ENV
+
+logger = logging.getLogger(__name__)
+
+PLUGIN = "tools.test_scheduler.pytest_plugin"
+
+# Test trees covered by the map and run on a full fallback.
+DEFAULT_TEST_PATHS = ("tests/unit",)
+
+# Files whose change can alter any test's behaviour.
+FULL_RUN_FILES = frozenset({"pyproject.toml", "uv.lock", "pytest.ini", "setup.cfg"})
+
+# Assumed duration for a test with no history when nothing is known at all.
+DEFAULT_TEST_DURATION_S = 1.0
+
+# Cap on the diff text handed to the semantic impact finder.
+_FALLBACK_DIFF_CHARS = 6000
+
+# Never map coverage of these trees to tests.
+_COVERAGE_OMIT = ("tests/*", ".venv/*", ".worktrees/*")
+
+_PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class Selection:
+    """The tests a diff can affect, and how they were found."""
+
+    tests: list[str] = field(default_factory=list)
+    full_run: bool = False
+    reason: str = ""
+    changed: list[str] = field(default_factory=list)
+    fallback: list[str] = field(default_factory=list)
+    uncovered: list[str] = field(default_factory=list)
+    map_commit: str | None = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _git(root: Path, *args: str) -> str:
+    proc = subprocess.run(
+        ["git", *args],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        timeout=settings.timeouts.git_subprocess_s,
+    )
+    if proc.returncode != 0:
+        raise TestSchedulerError(
+            f"git {' '.join(args)} failed: {proc.stderr.strip()}", category="git"
+        )
+    return proc.stdout
+
+
+def repo_key(repo_root: Path) -> str:
+    """Return the store key for a repo: its git common dir, shared by worktrees."""
+    common = _git(repo_root, "rev-parse", "--git-common-dir").strip()
+    return str((repo_root / common).resolve())
+
+
+def _python(repo_root: Path) -> str:
+    """Prefer the repo's (or lane worktree's) own venv interpreter."""
+    venv_python = repo_root / ".venv" / "bin" / "python"
+    return str(venv_python) if venv_python.exists() else sys.executable
+
+
+def _plugin_env(**extra: str) -> dict[str, str]:
+    env = dict(os.environ, **extra)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (env.get("PYTHONPATH"), str(_PACKAGE_ROOT)) if p)
+    return env
+
+
+def _pytest_cmd(repo_root: Path, targets: list[str]) -> list[str]:
+    return [
+        _python(repo_root),
+        "-m",
+        "pytest",
+        "-q",
+        "-n0",
+        "-p",
+        "no:cacheprovider",
+        "-p",
+        PLUGIN,
+        *targets,
+    ]
+
+
+def _read_report(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def _is_test_file(path: PurePosixPath) -> bool:
+    return path.suffix == ".py" and path.name.startswith("test_")
+
+
+def _unit_file(unit: str) -> str:
+    return unit.split("::", 1)[0]
+
+
+def discover_test_files(repo_root: Path, test_paths=DEFAULT_TEST_PATHS) -> list[str]:
+    """Return every test file under ``test_paths``, relative to ``repo_root``."""
+    files = []
+    for test_path in test_paths:
+        base = repo_root / test_path
+        if base.is_dir():
+            files.extend(str(p.relative_to(repo_root)) for p in base.rglob("test_*.py"))
+    return sorted(files)
+
+
+# ---------------------------------------------------------------------------
+# Coverage map
+# ---------------------------------------------------------------------------
+
+
+def build_coverage_map(
+    repo_root: Path,
+    test_paths: tuple[str, ...] = DEFAULT_TEST_PATHS,
+    timeout_s: float = 3600.0,
+) -> dict:
+    """Run ``test_paths`` under coverage and store the source -> tests map.
+
+    Runs serially (``-n0``): coverage contexts are per process. Test failures
+    do not abort the build; their coverage is as valid as a pass's. Module
+    level lines execute at import, before any test context is active, so a
+    test that only depends on a module-level constant is not mapped to it.
+
+    Returns:
+        dict with sources, tests, commit and duration_s
+    """
+    if importlib.util.find_spec("coverage") is None:
+        raise TestSchedulerError(
+            "coverage is not installed; install it to build the coverage map",
+            category="dependency",
+        )
+    from coverage import CoverageData
+
+    repo_root = Path(repo_root).resolve()
+    started = time.monotonic()
+    with tempfile.TemporaryDirectory(prefix="test-scheduler-cov-") as tmp:
+        data_file = Path(tmp) / ".coverage"
+        report = Path(tmp) / "report.jsonl"
+        rcfile = Path(tmp) / "coveragerc"
+        rcfile.write_text(
+            "[run]\n"
+            f"data_file = {data_file}\n"
+            f"source = {repo_root}\n"
+            "omit =\n" + "".join(f"    {repo_root}/{pattern}\n" for pattern in _COVERAGE_OMIT)
+        )
+        cmd = _pytest_cmd(repo_root, list(test_paths))
+        cmd[1:3] = ["-m", "coverage", "run", f"--rcfile={rcfile}", "-m", "pytest"]
+        try:
+            subprocess.run(
+                cmd,
+                cwd=repo_root,
+                capture_output=True,
+                text=True,
+                timeout=timeout_s,
+                env=_plugin_env(**{COVERAGE_ENV: "1", REPORT_ENV: str(report)}),
+            )
+        except subprocess.TimeoutExpired as e:
+            raise TestSchedulerError(f"coverage run timed out after {timeout_s}s") from e
+        if not data_file.exists():
+            raise TestSchedulerError("coverage run produced no data")
+
+        data = CoverageData(basename=str(data_file))
+        data.read()
+        mapping: dict[str, set[str]] = {}
+        for measured in data.measured_files():
+            try:
+                source = str(Path(measured).resolve().relative_to(repo_root))
+            except ValueError:
+                continue
+            tests: set[str] = set()
+            for contexts in (data.contexts_by_lineno(measured) or {}).values():
+                tests.update(c for c in contexts if c)
+            if tests:
+                mapping[source] = tests
+        outcomes = _read_report(report)
+
+    repo = repo_key(repo_root)
+    commit = _git(repo_root, "rev-parse", "HEAD").strip()
+    store.replace_coverage_map(repo, mapping, commit)
+    store.record_results(repo, outcomes, agent_session_id="coverage-map")
+    return {
+        "sources": len(mapping),
+        "tests": len({t for tests in mapping.values() for t in tests}),
+        "commit": commit,
+        "duration_s": round(time.monotonic() - started, 1),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+
+def changed_files(repo_root: Path, base: str = "main") -> tuple[list[str], str]:
+    """Return files changed since the merge base with ``base``, and that base.
+
+    Covers committed, staged, unstaged and untracked changes, so a lane's
+    uncommitted edits are selected too.
+    """
+    try:
+        base_rev = _git(repo_root, "merge-base", base, "HEAD").strip()
+    except TestSchedulerError:
+        base_rev = base
+    changed = set(_git(repo_root, "diff", "--name-only", base_rev).split())
+    changed.update(_git(repo_root, "ls-files", "--others", "--exclude-standard").split())
+    return sorted(changed), base_rev
+
+
+def _fallback_tests(
+    repo_root: Path, repo: str, files: list[str], base_rev: str | None
+) -> set[str] | None:
+    """Ask the semantic impact finder which tests ``files`` can affect.
+
+    Returns None when the finder could not run cleanly (the caller then runs
+    everything), otherwise the tests it points at directly plus the mapped
+    tests of the Python sources it points at.
+    """
+    from tools.code_impact_finder import find_affected_code
+
+    summary = "Changed files:\n" + "\n".join(files)
+    if base_rev:
+        try:
+            diff = _git(repo_root, "diff", base_rev, "--", *files)
+            summary += "\n\n" + diff[:_FALLBACK_DIFF_CHARS]
+        except TestSchedulerError:
+            pass
+    try:
+        affected, meta = find_affected_code(summary, repo_root=repo_root)
+    except Exception as e:
+        logger.warning("code_impact_finder failed, falling back to a full run: %s", e)
+        return None
+    if meta.degraded:
+        logger.warning("code_impact_finder degraded (%s), falling back to a full run", meta.reason)
+        return None
+
+    tests = {a.path for a in affected if _is_test_file(PurePosixPath(a.path))}
+    sources = [a.path for a in affected if a.path.endswith(".py") and a.path not in tests]
+    for mapped in store.tests_for_sources(repo, sources).values():
+        tests.update(mapped)
+    return tests
+
+
+def select_tests(changed: list[str], repo_root: Path, base_rev: str | None = None) -> Selection:
+    """Map changed files to the tests that can observe the change.
+
+    Args:
+        changed: Repo-relative paths, e.g. from ``changed_files``
+        repo_root: Repo or worktree root
+        base_rev: Diff base, used to give the impact finder the diff text
+
+    Returns:
+        Selection; ``full_run`` is set when the answer is "everything"
+    """
+    repo_root = Path(repo_root)
+    selection = Selection(changed=list(changed))
+    if not changed:
+        selection.reason = "no changes"
+        return selection
+
+    repo = repo_key(repo_root)
+    meta = store.coverage_meta(repo)
+    if meta is None:
+        selection.full_run = True
+        selection.reason = "no coverage map; run build_coverage_map()"
+        return selection
+    selection.map_commit = meta["commit_sha"]
+
+    units: set[str] = set()
+    sources = []
+    for path in changed:
+        posix = PurePosixPath(path)
+        if path in FULL_RUN_FILES:
+            selection.full_run = True
+            selection.reason = f"{path} affects every test"
+            return selection
+        if posix.name == "conftest.py":
+            units.add(str(posix.parent))
+        elif _is_test_file(posix):
+            units.add(path)
+        elif posix.suffix == ".py":
+            sources.append(path)
+        else:
+            selection.fallback.append(path)
+
+    mapped = store.tests_for_sources(repo, sources)
+    for source in sources:
+        if source in mapped:
+            units.update(mapped[source])
+        else:
+            selection.fallback.append(source)
+
+    if selection.fallback:
+        found = _fallback_tests(repo_root, repo, selection.fallback, base_rev)
+        if found is None:
+            selection.full_run = True
+            selection.reason = "impact finder unavailable for unmapped changes"
+            return selection
+        units.update(found)
+        if not found:
+            selection.uncovered = [p for p in selection.fallback if p.endswith(".py")]
+
+    # A mapped test whose file was since deleted or renamed would fail collection.
+    selection.tests = sorted(u for u in units if (repo_root / _unit_file(u)).exists())
+    selection.reason = f"{len(selection.tests)} tests for {len(changed)} changed files"
+    return selection
+
+
+# ---------------------------------------------------------------------------
+# Sharding
+# ---------------------------------------------------------------------------
+
+
+def _unit_duration(unit: str, keys: list[str], history: dict[str, float]) -> float | None:
+    """Sum the history of every node under ``unit`` (a node, file or directory)."""
+    total = history.get(unit, 0.0)
+    found = unit in history
+    for sep in ("::", "/", "["):
+        prefix = unit + sep
+        lo = bisect.bisect_left(keys, prefix)
+        hi = bisect.bisect_left(keys, prefix + "\uffff")
+        for key in keys[lo:hi]:
+            total += history[key]
+            found = True
+    return total if found else None
+
+
+def shard(
+    units: list[str], workers: int, history: dict[str, float]
+) -> list[tuple[float, list[str]]]:
+    """Split ``units`` into at most ``workers`` groups of similar expected duration.
+
+    Units of one test file always land in the same group, like xdist's
+    ``--dist=loadfile``: some files here share global resources between their
+    tests. Groups are filled longest-first onto the least-loaded shard (LPT).
+    A file with no history is assumed to take the median known file time.
+
+    Returns:
+        ``[(expected_seconds, units), ...]``, longest first
+    """
+    by_file: dict[str, list[str]] = {}
+    for unit in units:
+        by_file.setdefault(_unit_file(unit), []).append(unit)
+
+    keys = sorted(history)
+    known: dict[str, float] = {}
+    for path, file_units in by_file.items():
+        times = [_unit_duration(u, keys, history) for u in file_units]
+        if any(t is not None for t in times):
+            known[path] = sum(t for t in times if t is not None)
+    default = statistics.median(known.values()) if known else DEFAULT_TEST_DURATION_S
+
+    groups = sorted(
+        ((known.get(path, default), path) for path in by_file), key=lambda g: (-g[0], g[1])
+    )
+    count = max(1, min(workers, len(groups)))
+    heap = [(0.0, i) for i in range(count)]
+    shards: list[tuple[float, list[str]]] = [(0.0, []) for _ in range(count)]
+    for cost, path in groups:
+        load, i = heapq.heappop(heap)
+        shards[i] = (load + cost, shards[i][1] + by_file[path])
+        heapq.heappush(heap, (load + cost, i))
+    return sorted((s for s in shards if s[1]), key=lambda s: -s[0])
+
+
+def shard_command(repo_root: Path, units: list[str]) -> str:
+    """Return the shell-readable command for one shard (for display)."""
+    return " ".join(_pytest_cmd(repo_root, units))
+
+
+def run_shards(
+    repo_root: Path,
+    shards: list[list[str]],
+    timeout_s: float,
+    agent_session_id: str | None = None,
+) -> tuple[list[dict], list[dict]]:
+    """Run each shard as its own pytest process, all in parallel.
+
+    Every per-test outcome is recorded in the store, including those of a
+    shard that timed out part-way.
+
+    Returns:
+        ``(shard_results, outcomes)``: one result dict per shard in the
+        scheduler's result format, and every per-test outcome
+    """
+    repo_root = Path(repo_root)
+    repo = repo_key(repo_root)
+
+    with tempfile.TemporaryDirectory(prefix="test-scheduler-run-") as tmp:
+
+        def run_one(index: int, units: list[str]) -> tuple[dict, list[dict]]:
+            report = Path(tmp) / f"shard-{index}.jsonl"
+            cmd = _pytest_cmd(repo_root, units)
+            started = time.time()
+            result = {
+                "command": " ".join(cmd),
+                "type": "pytest-shard",
+                "shard": index,
+                "tests": len(units),
+            }
+            try:
+                proc = subprocess.run(
+                    cmd,
+                    cwd=repo_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout_s,
+                    env=_plugin_env(**{REPORT_ENV: str(report)}),
+                )
+                result.update(
+                    exit_code=proc.returncode,
+                    stdout=proc.stdout,
+                    stderr=proc.stderr,
+                    passed=proc.returncode == 0,
+                )
+            except subprocess.TimeoutExpired:
+                result.update(exit_code=-1, error="Test timed out", passed=False)
+            except Exception as e:
+                result.update(exit_code=-1, error=str(e), passed=False)
+            result["duration_seconds"] = time.time() - started
+            return result, _read_report(report)
+
+        with ThreadPoolExecutor(max_workers=max(1, len(shards))) as pool:
+            done = list(pool.map(run_one, range(len(shards)), shards))
+
+    results = [r for r, _ in done]
+    outcomes = [o for _, shard_outcomes in done for o in shard_outcomes]
+    store.record_results(repo, outcomes, agent_session_id=agent_session_id)
+    return results, outcomes
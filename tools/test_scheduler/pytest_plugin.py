@@ -0,0 +1,60 @@
+"""
+pytest plugin loaded by the test scheduler with ``-p tools.test_scheduler.pytest_plugin``.
+
+Two opt-in behaviours, each switched on by an environment variable:
+
+- ``TEST_SCHEDULER_COVERAGE=1``: switch the running ``coverage`` context to
+  the test's node id (parameters stripped) around each test, so the coverage
+  data says which test executed which line.
+- ``TEST_SCHEDULER_REPORT=<path>``: append one JSON line per finished test
+  with its node id, outcome and duration. Lines are written as each test
+  finishes, so a shard killed by a timeout still reports what it ran.
+"""
+
+import json
+import os
+
+import pytest
+
+COVERAGE_ENV = "TEST_SCHEDULER_COVERAGE"
+REPORT_ENV = "TEST_SCHEDULER_REPORT"
+
+_pending: dict[str, dict] = {}
+
+
+def coverage_context(nodeid: str) -> str:
+    """Return the coverage context for a node id: parametrize ids stripped."""
+    return nodeid.split("[", 1)[0]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    cov = None
+    if os.environ.get(COVERAGE_ENV):
+        import coverage
+
+        cov = coverage.Coverage.current()
+    if cov is not None:
+        cov.switch_context(coverage_context(item.nodeid))
+    try:
+        yield
+    finally:
+        if cov is not None:
+            cov.switch_context("")
+
+
+def pytest_runtest_logreport(report):
+    path = os.environ.get(REPORT_ENV)
+    if not path:
+        return
+    entry = _pending.setdefault(
+        report.nodeid, {"nodeid": report.nodeid, "outcome": "passed", "duration": 0.0}
+    )
+    entry["duration"] += report.duration
+    if report.failed:
+        entry["outcome"] = "failed"
+    elif report.skipped and entry["outcome"] == "passed":
+        entry["outcome"] = "skipped"
+    if report.when == "teardown":
+        with open(path, "a") as fh:
+            fh.write(json.dumps(_pending.pop(report.nodeid)) + "\n")
@@ -0,0 +1,274 @@
+"""
+Persistent state for the test scheduler.
+
+One SQLite file holds everything that must survive a restart:
+
+- ``sessions``: every scheduled session, as its JSON payload
+- ``coverage_map``: source file -> tests that executed it, per repo
+- ``test_runs``: the last ``HISTORY_WINDOW`` outcomes and durations per test,
+  used for shard balancing and flaky detection
+
+Repos are keyed by their git common dir, so every worktree of a repo shares one
+coverage map and one history.
+"""
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from bridge.utc import utc_iso
+
+DEFAULT_DB_PATH = Path.home() / ".valor" / "test_scheduler.db"
+
+# Runs kept per test. Durations average over this window; flakiness counts
+# pass/fail flips inside it.
+HISTORY_WINDOW = 20
+
+_BUSY_TIMEOUT_S = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    agent_session_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_created ON sessions (created_at);
+CREATE TABLE IF NOT EXISTS coverage_map (
+    repo TEXT NOT NULL,
+    source TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    PRIMARY KEY (repo, source, test_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage_meta (
+    repo TEXT PRIMARY KEY,
+    commit_sha TEXT,
+    built_at TEXT NOT NULL,
+    sources INTEGER NOT NULL,
+    tests INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    repo TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    agent_session_id TEXT,
+    outcome TEXT NOT NULL,
+    duration_s REAL NOT NULL,
+    ts TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS test_runs_test ON test_runs (repo, test_id, id);
+"""
+
+
+def _db_path(db_path: Path | None) -> Path:
+    if db_path is not None:
+        return Path(db_path)
+    return Path(os.environ.get("TEST_SCHEDULER_DB_PATH", DEFAULT_DB_PATH))
+
+
+def _connect(db_path: Path | None = None) -> sqlite3.Connection:
+    path = _db_path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=_BUSY_TIMEOUT_S, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------------------------
+
+
+def save_session(session: dict, db_path: Path | None = None) -> None:
+    """Insert or replace a session's payload."""
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO sessions (agent_session_id, created_at, status, payload)"
+            " VALUES (?, ?, ?, ?)",
+            (
+                session["agent_session_id"],
+                session.get("created_at", ""),
+                session.get("status", ""),
+                json.dumps(session),
+            ),
+        )
+    finally:
+        conn.close()
+
+
+def load_session(agent_session_id: str, db_path: Path | None = None) -> dict | None:
+    """Return a stored session payload, or None."""
+    conn = _connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT payload FROM sessions WHERE agent_session_id = ?", (agent_session_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return json.loads(row["payload"]) if row else None
+
+
+def list_sessions(limit: int = 100, db_path: Path | None = None) -> list[dict]:
+    """Return stored session payloads, newest first."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT payload FROM sessions ORDER BY created_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [json.loads(r["payload"]) for r in rows]
+
+
+# ---------------------------------------------------------------------------
+# Coverage map
+# ---------------------------------------------------------------------------
+
+
+def replace_coverage_map(
+    repo: str,
+    mapping: dict[str, set[str]],
+    commit_sha: str | None,
+    db_path: Path | None = None,
+) -> None:
+    """Replace the repo's coverage map with ``mapping`` (source -> test ids)."""
+    rows = [(repo, source, test) for source, tests in mapping.items() for test in tests]
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM coverage_map WHERE repo = ?", (repo,))
+        conn.executemany("INSERT INTO coverage_map (repo, source, test_id) VALUES (?, ?, ?)", rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO coverage_meta (repo, commit_sha, built_at, sources, tests)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (repo, commit_sha, utc_iso(), len(mapping), len({r[2] for r in rows})),
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def coverage_meta(repo: str, db_path: Path | None = None) -> dict | None:
+    """Return when and at which commit the repo's map was built, or None."""
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT * FROM coverage_meta WHERE repo = ?", (repo,)).fetchone()
+    finally:
+        conn.close()
+    return dict(row) if row else None
+
+
+def tests_for_sources(
+    repo: str, sources: Iterable[str], db_path: Path | None = None
+) -> dict[str, set[str]]:
+    """Return ``{source: test ids}`` for the sources present in the map."""
+    sources = list(sources)
+    found: dict[str, set[str]] = {}
+    if not sources:
+        return found
+    conn = _connect(db_path)
+    try:
+        for start in range(0, len(sources), 500):
+            chunk = sources[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                "SELECT source, test_id FROM coverage_map"
+                f" WHERE repo = ? AND source IN ({placeholders})",
+                (repo, *chunk),
+            ):
+                found.setdefault(row["source"], set()).add(row["test_id"])
+    finally:
+        conn.close()
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Test history
+# ---------------------------------------------------------------------------
+
+
+def record_results(
+    repo: str,
+    outcomes: Iterable[dict],
+    agent_session_id: str | None = None,
+    db_path: Path | None = None,
+) -> int:
+    """Append per-test outcomes and trim each test to ``HISTORY_WINDOW`` runs.
+
+    Each outcome is ``{"nodeid", "outcome", "duration"}`` as written by
+    ``tools.test_scheduler.pytest_plugin``. Returns the number recorded.
+    """
+    ts = utc_iso()
+    rows = [
+        (repo, o["nodeid"], agent_session_id, o["outcome"], float(o["duration"]), ts)
+        for o in outcomes
+    ]
+    if not rows:
+        return 0
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT INTO test_runs (repo, test_id, agent_session_id, outcome, duration_s, ts)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.execute(
+            "DELETE FROM test_runs WHERE id IN ("
+            " SELECT id FROM ("
+            "  SELECT id, ROW_NUMBER() OVER (PARTITION BY test_id ORDER BY id DESC) AS rn"
+            "  FROM test_runs WHERE repo = ?"
+            " ) WHERE rn > ?)",
+            (repo, HISTORY_WINDOW),
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    return len(rows)
+
+
+def durations(repo: str, db_path: Path | None = None) -> dict[str, float]:
+    """Return the mean duration in seconds of each test's recent non-skipped runs."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT test_id, AVG(duration_s) AS d FROM test_runs"
+            " WHERE repo = ? AND outcome != 'skipped' GROUP BY test_id",
+            (repo,),
+        ).fetchall()
+    finally:
+        conn.close()
+    return {r["test_id"]: r["d"] for r in rows}
+
+
+def flaky_tests(repo: str, min_flips: int = 2, db_path: Path | None = None) -> dict[str, int]:
+    """Return ``{test_id: flips}`` for tests whose recent outcomes flipped often.
+
+    A flip is a passed -> failed or failed -> passed change between consecutive
+    runs. One flip is a break or a fix; two or more inside the window is a
+    test that fails without the code changing.
+    """
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT test_id, SUM(outcome != prev) AS flips FROM ("
+            " SELECT test_id, outcome,"
+            "  LAG(outcome) OVER (PARTITION BY test_id ORDER BY id) AS prev"
+            " FROM test_runs WHERE repo = ? AND outcome IN ('passed', 'failed')"
+            ") WHERE prev IS NOT NULL GROUP BY test_id HAVING flips >= ?",
+            (repo, min_flips),
+        ).fetchall()
+    finally:
+        conn.close()
+    return {r["test_id"]: r["flips"] for r in rows}
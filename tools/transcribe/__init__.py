@@ -4,17 +4,30 @@ Voice Transcription Tool
 Dual-backend audio transcription:
 1. SuperWhisper (primary) - local macOS app, free, fast
 2. OpenAI Whisper API (fallback) - cloud API, paid per minute
+
+Results are cached by audio content hash, and long audio is split at silences
+and sent to Whisper in parallel chunks (``tools.transcribe.engine``).
 """
 
+import asyncio
 import json
 import logging
 import os
+import shutil
 import subprocess
 import time
 from pathlib import Path
 
 import requests
 
+from tools.transcribe.engine import (
+    content_key,
+    get_cached_transcript,
+    run_blocking,
+    store_transcript,
+    transcribe_audio,
+)
+
 logger = logging.getLogger(__name__)
 
 WHISPER_URL = "https://api.openai.com/v1/audio/transcriptions"
@@ -175,6 +188,11 @@ def transcribe(
     Tries SuperWhisper first if the app is running. Falls back to OpenAI Whisper
     API if SuperWhisper is unavailable, times out, or returns an empty result.
 
+    A transcript of the same bytes with the same options is served from the
+    shared transcript cache. For ``json``/``verbose_json``, audio long enough to
+    chunk (or over the 25MB request limit, when ffmpeg is installed) is sent to
+    Whisper as parallel chunks and stitched with absolute timestamps.
+
     Args:
         audio_source: File path to audio file
         language: ISO-639-1 language code (optional, auto-detected if not provided)
@@ -205,24 +223,92 @@ def transcribe(
     file_size = audio_path.stat().st_size
     if file_size == 0:
         return {"error": "Audio file is empty (0 bytes)"}
-    if file_size > MAX_FILE_SIZE:
+    chunkable = response_format in ("json", "verbose_json")
+    if file_size > MAX_FILE_SIZE and not (chunkable and shutil.which("ffmpeg")):
         return {"error": f"File too large: {file_size / 1024 / 1024:.1f}MB. Max: 25MB"}
 
+    # Only non-default options enter the key, so a plain transcript of these
+    # bytes is shared with tools.link_analysis.transcribe_audio_file.
+    options = {
+        "response_format": response_format if response_format != "json" else None,
+        "language": language,
+        "timestamps": timestamps,
+        "prompt": prompt,
+    }
+    cache_key = content_key(audio_path, *sorted((k, v) for k, v in options.items() if v))
+    cached = get_cached_transcript(cache_key)
+    if cached is not None:
+        logger.info(f"Transcript cache hit for {audio_path.name}")
+        return cached
+
     # Try SuperWhisper first (only for basic json format without special options)
-    if _is_superwhisper_available() and response_format == "json" and not timestamps:
+    result = None
+    if (
+        _is_superwhisper_available()
+        and response_format == "json"
+        and not timestamps
+        and file_size <= MAX_FILE_SIZE
+    ):
         result = _transcribe_superwhisper(audio_source)
-        if result is not None:
-            return result
-        logger.info("SuperWhisper failed or timed out, falling back to OpenAI Whisper API")
+        if result is None:
+            logger.info("SuperWhisper failed or timed out, falling back to OpenAI Whisper API")
 
     # Fall back to OpenAI Whisper API
-    return _transcribe_openai(
-        audio_source=audio_source,
-        language=language,
-        response_format=response_format,
-        timestamps=timestamps,
-        prompt=prompt,
-    )
+    if result is None:
+        transcribe_openai = _transcribe_openai_chunked if chunkable else _transcribe_openai
+        result = transcribe_openai(
+            audio_source=audio_source,
+            language=language,
+            response_format=response_format,
+            timestamps=timestamps,
+            prompt=prompt,
+        )
+
+    store_transcript(cache_key, result)
+    return result
+
+
+def _transcribe_openai_chunked(
+    audio_source: str,
+    language: str | None = None,
+    response_format: str = "json",
+    timestamps: bool = False,
+    prompt: str | None = None,
+) -> dict:
+    """Transcribe with OpenAI Whisper, in parallel chunks when the audio is long.
+
+    Short audio (or a host without ffprobe) is one ``_transcribe_openai`` call.
+    The output keeps the shape ``_transcribe_openai`` returns for
+    ``response_format``.
+    """
+    errors: list[str] = []
+
+    async def transcribe_chunk(chunk_path: Path) -> dict | None:
+        chunk = await asyncio.to_thread(
+            _transcribe_openai,
+            audio_source=str(chunk_path),
+            language=language,
+            response_format=response_format,
+            timestamps=timestamps,
+            prompt=prompt,
+        )
+        if "error" in chunk:
+            errors.append(chunk["error"])
+            return None
+        return chunk
+
+    stitched = run_blocking(transcribe_audio(Path(audio_source), transcribe_chunk, use_cache=False))
+    if stitched is None:
+        # No error means Whisper heard nothing (silence); keep the old empty result.
+        return {"error": errors[0]} if errors else {"text": "", "language": None}
+
+    output = {"text": stitched["text"], "language": stitched["language"]}
+    if response_format == "verbose_json" or timestamps:
+        output["duration"] = stitched["duration"]
+        output["segments"] = stitched["segments"]
+        if "words" in stitched:
+            output["words"] = stitched["words"]
+    return output
 
 
 def _transcribe_openai(
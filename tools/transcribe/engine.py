@@ -0,0 +1,433 @@
+"""Content-addressed, chunked transcription engine.
+
+Shared by both Whisper paths, ``tools.transcribe.transcribe`` (sync; bridge
+voice notes and the CLI) and ``tools.link_analysis.transcribe_audio_file``
+(async; YouTube enrichment and ``video_watch``). Each path supplies one
+backend coroutine that transcribes a single audio file; this module adds
+three things around it:
+
+Cache:
+    A finished transcript is stored in Redis at ``transcript:{key}`` for
+    ``TRANSCRIPT_CACHE_TTL_S`` (default 30 days). The key is a content hash
+    (``content_key``: sha256 of the file bytes, plus any non-default request
+    options) or a source id (``video_key("youtube", video_id)``), so the same
+    voice note or video is never uploaded twice, by any process. Failed or
+    empty transcripts are never stored. ``TRANSCRIPT_CACHE_DISABLED=1``
+    bypasses the cache. Hits and misses are counted in process
+    (``valor_transcript_cache_hits_total`` / ``_misses_total``), and the async
+    path reads and writes the cache from a worker thread.
+
+Chunking:
+    Audio longer than 1.5x ``CHUNK_TARGET_S`` is cut near every ``CHUNK_TARGET_S``
+    seconds, at the middle of a silence found by ffmpeg ``silencedetect``
+    (a hard cut when a window has none). Chunks are re-encoded to mono
+    16 kHz MP3 and transcribed concurrently, at most ``CHUNK_CONCURRENCY`` at
+    a time, then stitched: texts joined in order, segment and word timestamps
+    shifted by the chunk's start offset. Shorter audio, or any host without
+    ffprobe, goes up as one request exactly as before.
+
+Streaming:
+    ``iter_transcript`` yields chunks in order as soon as each one and all
+    before it are done; ``transcribe_audio(on_partial=...)`` forwards them to
+    a callback.
+
+See docs/features/transcription-engine.md.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import subprocess
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from analytics.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+KEY_PREFIX = "transcript"
+TRANSCRIPT_CACHE_TTL_S = int(os.environ.get("TRANSCRIPT_CACHE_TTL_S", str(30 * 24 * 3600)))
+CHUNK_TARGET_S = float(os.environ.get("TRANSCRIBE_CHUNK_TARGET_S", "300"))
+CHUNK_CONCURRENCY = int(os.environ.get("TRANSCRIBE_CHUNK_CONCURRENCY", "4"))
+# silencedetect thresholds: quieter than -35 dB for at least 0.4 s.
+SILENCE_NOISE_DB = -35
+SILENCE_MIN_S = 0.4
+FFMPEG_TIMEOUT_S = 300
+
+ChunkTranscriber = Callable[[Path], Awaitable[dict | None]]
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
+
+class ChunkTranscriptionError(Exception):
+    """A chunk of a segmented transcription failed; the transcript is incomplete."""
+
+
+@dataclass
+class TranscriptChunk:
+    """One transcribed span of the source audio, timestamps already absolute."""
+
+    index: int
+    start: float
+    end: float
+    text: str
+    segments: list[dict] = field(default_factory=list)
+    words: list[dict] = field(default_factory=list)
+    language: str | None = None
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+def _cache_disabled() -> bool:
+    return os.environ.get("TRANSCRIPT_CACHE_DISABLED", "").lower() in ("1", "true", "yes")
+
+
+def content_key(path: Path | str, *variant: Any) -> str:
+    """Cache key for an audio file's bytes, plus request options that change the output.
+
+    Callers pass only non-default options as ``variant`` so that every path
+    asking for a plain transcript of the same bytes shares one entry.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    key = f"sha256:{digest.hexdigest()}"
+    if variant:
+        options = json.dumps(variant, default=str, separators=(",", ":"))
+        key += ":" + hashlib.sha256(options.encode()).hexdigest()[:16]
+    return key
+
+
+def video_key(source: str, video_id: str) -> str:
+    """Cache key for a transcript identified by its source, e.g. ``youtube:<id>``."""
+    return f"{source}:{video_id}"
+
+
+_HITS = counter("valor_transcript_cache_hits_total", "Transcript cache hits")
+_MISSES = counter("valor_transcript_cache_misses_total", "Transcript cache misses")
+
+
+def get_cached_transcript(key: str) -> dict | None:
+    """Return the stored transcript for ``key``, or None. Never raises."""
+    if _cache_disabled():
+        return None
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        raw = POPOTO_REDIS_DB.get(f"{KEY_PREFIX}:{key}")
+        cached = json.loads(raw) if raw else None
+    except Exception as e:
+        logger.debug("[transcribe] cache read failed for %s: %s", key, e)
+        return None
+    (_HITS if cached else _MISSES).inc()
+    return cached
+
+
+def store_transcript(key: str, result: dict) -> None:
+    """Store a transcript under ``key``. Results without text are skipped. Never raises."""
+    if _cache_disabled() or not result or "error" in result or not result.get("text"):
+        return
+    try:
+        from popoto.redis_db import POPOTO_REDIS_DB
+
+        POPOTO_REDIS_DB.set(f"{KEY_PREFIX}:{key}", json.dumps(result), ex=TRANSCRIPT_CACHE_TTL_S)
+    except Exception as e:
+        logger.debug("[transcribe] cache write failed for %s: %s", key, e)
+
+
+# =============================================================================
+# Segmentation (ffmpeg)
+# =============================================================================
+
+
+def probe_duration(path: Path) -> float | None:
+    """Audio duration in seconds via ffprobe, or None when unknown or ffprobe is missing."""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        str(path),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        return float(result.stdout.strip()) if result.returncode == 0 else None
+    except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
+        return None
+
+
+def detect_silences(path: Path) -> list[tuple[float, float]]:
+    """Silent intervals ``[(start, end), ...]`` found by ffmpeg silencedetect.
+
+    Returns an empty list on any ffmpeg failure; the planner then hard-cuts.
+    """
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-i",
+        str(path),
+        "-af",
+        f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_S}",
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=FFMPEG_TIMEOUT_S)
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        logger.warning("[transcribe] silencedetect failed for %s: %s", path.name, e)
+        return []
+    silences = []
+    start = None
+    for line in result.stderr.splitlines():
+        if (m := _SILENCE_START_RE.search(line)) is not None:
+            start = max(0.0, float(m.group(1)))
+        elif (m := _SILENCE_END_RE.search(line)) is not None and start is not None:
+            silences.append((start, float(m.group(1))))
+            start = None
+    return silences
+
+
+def plan_chunks(
+    duration: float,
+    silences: list[tuple[float, float]],
+    *,
+    target_s: float = CHUNK_TARGET_S,
+    max_s: float | None = None,
+) -> list[tuple[float, float]]:
+    """Split ``[0, duration]`` into spans of about ``target_s``, cutting inside silences.
+
+    Each cut is the silence midpoint closest to ``target_s`` past the previous
+    cut, searched between half the target and ``max_s`` (default 1.5x target).
+    A window without silence is cut hard at the target. Audio no longer than
+    ``max_s`` is one span.
+    """
+    max_s = max_s if max_s is not None else target_s * 1.5
+    midpoints = sorted((a + b) / 2 for a, b in silences)
+    spans = []
+    cursor = 0.0
+    while duration - cursor > max_s:
+        ideal = cursor + target_s
+        candidates = [m for m in midpoints if cursor + target_s / 2 <= m <= cursor + max_s]
+        cut = min(candidates, key=lambda m: abs(m - ideal)) if candidates else ideal
+        spans.append((cursor, cut))
+        cursor = cut
+    spans.append((cursor, duration))
+    return spans
+
+
+def extract_chunk(source: Path, start: float, end: float, dest: Path) -> Path:
+    """Re-encode ``[start, end)`` of ``source`` to a mono 16 kHz 64 kbps MP3 at ``dest``."""
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-y",
+        "-ss",
+        f"{start:.3f}",
+        "-t",
+        f"{end - start:.3f}",
+        "-i",
+        str(source),
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        "16000",
+        "-b:a",
+        "64k",
+        str(dest),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=FFMPEG_TIMEOUT_S)
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        raise ChunkTranscriptionError(f"ffmpeg chunk extraction failed: {e}") from e
+    if result.returncode != 0 or not dest.exists():
+        raise ChunkTranscriptionError(
+            f"ffmpeg chunk extraction failed: {result.stderr.strip()[:400]}"
+        )
+    return dest
+
+
+# =============================================================================
+# Transcription
+# =============================================================================
+
+
+def _to_chunk(index: int, start: float, end: float, raw: dict) -> TranscriptChunk:
+    def shifted(items: list[dict]) -> list[dict]:
+        out = []
+        for item in items:
+            item = dict(item)
+            for k in ("start", "end"):
+                if isinstance(item.get(k), (int, float)):
+                    item[k] = round(item[k] + start, 3)
+            out.append(item)
+        return out
+
+    text = (raw.get("text") or "").strip()
+    segments = shifted(raw.get("segments") or [])
+    if not segments and text:
+        segments = [{"start": round(start, 3), "end": round(end, 3), "text": text}]
+    words = shifted(raw.get("words") or [])
+    return TranscriptChunk(index, start, end, text, segments, words, raw.get("language"))
+
+
+def stitch(chunks: list[TranscriptChunk]) -> dict:
+    """Join ordered chunks into one transcript dict (``text``, ``segments``, ``duration``...)."""
+    segments = [dict(s) for c in chunks for s in c.segments]
+    for i, segment in enumerate(segments):
+        segment["id"] = i
+    result: dict[str, Any] = {
+        "text": " ".join(c.text for c in chunks if c.text),
+        "language": next((c.language for c in chunks if c.language), None),
+        "segments": segments,
+        "duration": chunks[-1].end if chunks else 0.0,
+        "chunks": len(chunks),
+    }
+    words = [w for c in chunks for w in c.words]
+    if words:
+        result["words"] = words
+    return result
+
+
+async def iter_transcript(
+    path: Path,
+    transcribe_chunk: ChunkTranscriber,
+    *,
+    target_s: float | None = None,
+    concurrency: int | None = None,
+) -> AsyncIterator[TranscriptChunk]:
+    """Transcribe ``path``, yielding chunks in order as they become available.
+
+    Raises:
+        ChunkTranscriptionError: a chunk could not be extracted or transcribed.
+            Outstanding chunks are cancelled.
+    """
+    path = Path(path)
+    target_s = target_s or CHUNK_TARGET_S
+    concurrency = concurrency or CHUNK_CONCURRENCY
+    max_s = target_s * 1.5
+    duration = await asyncio.to_thread(probe_duration, path)
+    if duration is None or duration <= max_s:
+        raw = await transcribe_chunk(path)
+        if raw is None:
+            raise ChunkTranscriptionError(f"transcription failed for {path.name}")
+        yield _to_chunk(0, 0.0, duration or raw.get("duration") or 0.0, raw)
+        return
+
+    silences = await asyncio.to_thread(detect_silences, path)
+    spans = plan_chunks(duration, silences, target_s=target_s, max_s=max_s)
+    logger.info(
+        "[transcribe] %s: %.0fs in %d chunks (%d silences, concurrency %d)",
+        path.name,
+        duration,
+        len(spans),
+        len(silences),
+        concurrency,
+    )
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    with tempfile.TemporaryDirectory(prefix="transcribe_chunks_") as work:
+
+        async def run(index: int, start: float, end: float) -> TranscriptChunk:
+            async with semaphore:
+                dest = Path(work) / f"chunk_{index:03d}.mp3"
+                chunk_path = await asyncio.to_thread(extract_chunk, path, start, end, dest)
+                raw = await transcribe_chunk(chunk_path)
+            if raw is None:
+                raise ChunkTranscriptionError(
+                    f"chunk {index} ({start:.0f}s-{end:.0f}s) of {path.name} failed"
+                )
+            return _to_chunk(index, start, end, raw)
+
+        tasks = [asyncio.create_task(run(i, a, b)) for i, (a, b) in enumerate(spans)]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def transcribe_audio(
+    path: Path,
+    transcribe_chunk: ChunkTranscriber,
+    *,
+    cache_key: str | None = None,
+    use_cache: bool = True,
+    on_partial: Callable[[TranscriptChunk], Any] | None = None,
+    target_s: float | None = None,
+    concurrency: int | None = None,
+) -> dict | None:
+    """Cached, chunked transcription of ``path``; None when any part fails.
+
+    Args:
+        path: Audio file.
+        transcribe_chunk: Backend coroutine for one file; returns a Whisper-style
+            dict (``text``, optional ``segments``/``words``) or None on failure.
+        cache_key: Defaults to ``content_key(path)``.
+        use_cache: False when the caller does its own cache lookup and store.
+        on_partial: Called (or awaited) with each ordered ``TranscriptChunk``.
+        target_s: Target chunk length in seconds (default ``CHUNK_TARGET_S``).
+        concurrency: Maximum chunks in flight (default ``CHUNK_CONCURRENCY``).
+    """
+    key = None
+    if use_cache:
+        key = cache_key or await asyncio.to_thread(content_key, path)
+        cached = await asyncio.to_thread(get_cached_transcript, key)
+        if cached is not None:
+            logger.info("[transcribe] cache hit for %s (%s)", Path(path).name, key[:24])
+            return cached
+
+    chunks = []
+    try:
+        async for chunk in iter_transcript(
+            path, transcribe_chunk, target_s=target_s, concurrency=concurrency
+        ):
+            chunks.append(chunk)
+            if on_partial is not None:
+                maybe = on_partial(chunk)
+                if inspect.isawaitable(maybe):
+                    await maybe
+    except ChunkTranscriptionError as e:
+        logger.warning("[transcribe] %s", e)
+        return None
+
+    result = stitch(chunks)
+    if not result["text"]:
+        return None
+    if key is not None:
+        await asyncio.to_thread(store_transcript, key, result)
+    return result
+
+
+def run_blocking(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion from sync code, even on a thread with a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
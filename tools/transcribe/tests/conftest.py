@@ -0,0 +1,12 @@
+"""Keep the shared transcript cache out of these tests.
+
+Several tests transcribe identical fake bytes with different mocked backends;
+a cache hit from an earlier test would mask the backend under test.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_transcript_cache(monkeypatch):
+    monkeypatch.setenv("TRANSCRIPT_CACHE_DISABLED", "1")
@@ -26,11 +26,13 @@ from __future__ import annotations
 
 from tools.video_watch.constants import (
     VIDEO_WATCH_DEDUP_THRESHOLD,
+    VIDEO_WATCH_DEDUP_WORKERS,
     VIDEO_WATCH_FRAME_DIR_MAX_AGE,
     VIDEO_WATCH_FRAME_WIDTH,
     VIDEO_WATCH_GROK_TIMEOUT,
     VIDEO_WATCH_MAX_DURATION,
     VIDEO_WATCH_MAX_FRAMES,
+    VIDEO_WATCH_PHASH_THRESHOLD,
     VIDEO_WATCH_PROBE_TIMEOUT,
     VIDEO_WATCH_SCENE_THRESHOLD,
     VIDEO_WATCH_SUBPROCESS_TIMEOUT,
@@ -46,6 +48,8 @@ __all__ = [
     "VIDEO_WATCH_MAX_DURATION",
     "VIDEO_WATCH_SCENE_THRESHOLD",
     "VIDEO_WATCH_DEDUP_THRESHOLD",
+    "VIDEO_WATCH_PHASH_THRESHOLD",
+    "VIDEO_WATCH_DEDUP_WORKERS",
     "VIDEO_WATCH_SUBPROCESS_TIMEOUT",
     "VIDEO_WATCH_PROBE_TIMEOUT",
     "VIDEO_WATCH_GROK_TIMEOUT",
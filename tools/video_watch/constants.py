@@ -32,8 +32,16 @@ VIDEO_WATCH_MAX_DURATION = int(os.getenv("VIDEO_WATCH_MAX_DURATION", "1800"))
 # ffmpeg scene-change score threshold (0..1); higher = fewer, more distinct frames.
 VIDEO_WATCH_SCENE_THRESHOLD = float(os.getenv("VIDEO_WATCH_SCENE_THRESHOLD", "0.3"))
 # Near-duplicate dedup: mean-abs-diff over a 16x16 grayscale thumbnail, 0..255.
-# Frames closer than this to the previous kept frame are dropped.
+# Frames closer than this to any kept frame are dropped.
 VIDEO_WATCH_DEDUP_THRESHOLD = float(os.getenv("VIDEO_WATCH_DEDUP_THRESHOLD", "6.0"))
+# Perceptual-hash dedup: textured frames whose 64-bit DCT pHashes differ in at
+# most this many bits from ANY kept frame are dropped (catches a slide revisited
+# after a fade or re-encode). Negative disables the pHash check. Grain of salt.
+VIDEO_WATCH_PHASH_THRESHOLD = int(os.getenv("VIDEO_WATCH_PHASH_THRESHOLD", "4"))
+# Thread-pool size for decoding frame thumbnails during dedup.
+VIDEO_WATCH_DEDUP_WORKERS = int(
+    os.getenv("VIDEO_WATCH_DEDUP_WORKERS", str(min(8, os.cpu_count() or 1)))
+)
 
 # Shared subprocess timeout (seconds) for yt-dlp downloads and ffmpeg frame/audio
 # extraction — the plan's documented name for all three. Grain of salt.
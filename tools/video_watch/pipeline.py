@@ -19,18 +19,22 @@ fallback), never for frame vision.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from tools.link_analysis import transcribe_audio_file
 from tools.video_watch.constants import (
     VIDEO_WATCH_DEDUP_THRESHOLD,
+    VIDEO_WATCH_DEDUP_WORKERS,
     VIDEO_WATCH_FRAME_WIDTH,
     VIDEO_WATCH_MAX_DURATION,
     VIDEO_WATCH_MAX_FRAMES,
+    VIDEO_WATCH_PHASH_THRESHOLD,
     VIDEO_WATCH_PROBE_TIMEOUT,
     VIDEO_WATCH_SCENE_THRESHOLD,
     VIDEO_WATCH_SUBPROCESS_TIMEOUT,
@@ -262,40 +266,112 @@ def _subsample(frames: list[tuple[Path, float]], cap: int) -> list[tuple[Path, f
     return [frames[int(i * step)] for i in range(cap)]
 
 
-def _dedup_frames(frames: list[tuple[Path, float]]) -> list[tuple[Path, float]]:
-    """Drop near-duplicate consecutive frames via 16x16 grayscale mean-abs-diff.
+# pHash geometry: an 8x8 low-frequency block of the DCT of a 32x32 grayscale
+# thumbnail. A frame whose 32x32 thumbnail has less grayscale spread than
+# _FLAT_FRAME_STD (a black or solid-colour card) hashes to near-constant bits,
+# so it never matches by hash, only by mean-abs-diff.
+_PHASH_SIZE = 32
+_PHASH_BITS_SIDE = 8
+_FLAT_FRAME_STD = 4.0
+
+
+@functools.cache
+def _dct_matrix(n: int):
+    """Orthonormal DCT-II matrix; ``M @ X @ M.T`` is the 2-D DCT of ``X``."""
+    import numpy as np
+
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m.astype(np.float32)
+
+
+def _frame_signature(path: Path):
+    """Return ``(thumb16, phash, flat)`` for one frame, or None if it can't be read.
+
+    ``thumb16`` is the flattened 16x16 grayscale thumbnail (int16), ``phash`` a
+    64-bit DCT perceptual hash (uint64) and ``flat`` whether the frame is too
+    uniform for its hash to mean anything. JPEGs decode at reduced scale
+    (``Image.draft``), which skips most of the IDCT work.
+    """
+    import numpy as np
+    from PIL import Image
+
+    try:
+        with Image.open(path) as im:
+            im.draft("L", (_PHASH_SIZE * 2, _PHASH_SIZE * 2))
+            gray = im.convert("L")
+            thumb = np.asarray(gray.resize((16, 16)), dtype=np.int16).ravel()
+            pixels = np.asarray(gray.resize((_PHASH_SIZE, _PHASH_SIZE)), dtype=np.float32)
+    except Exception as e:  # noqa: BLE001 -- a bad frame shouldn't kill dedup
+        logger.warning("Could not read frame for dedup %s: %s", path, e)
+        return None
+
+    dct = _dct_matrix(_PHASH_SIZE)
+    low = (dct @ pixels @ dct.T)[:_PHASH_BITS_SIDE, :_PHASH_BITS_SIDE].ravel()
+    phash = np.packbits(low > np.median(low)).view(">u8")[0].astype(np.uint64)
+    return thumb, phash, float(pixels.std()) < _FLAT_FRAME_STD
+
+
+def _hamming(hashes, h):
+    """Bit distance from each uint64 in ``hashes`` to ``h``."""
+    import numpy as np
+
+    x = hashes ^ h
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(x)
+    return np.unpackbits(x.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
 
-    Best-effort: if Pillow is unavailable, returns the frames unchanged.
+
+def _dedup_frames(frames: list[tuple[Path, float]]) -> list[tuple[Path, float]]:
+    """Drop frames that near-duplicate ANY earlier kept frame, not just the last one.
+
+    Thumbnails and hashes are decoded in a thread pool (Pillow releases the
+    GIL while decoding and resizing). A frame is dropped when, against some
+    kept frame, either the 16x16 grayscale mean-abs-diff is under
+    ``VIDEO_WATCH_DEDUP_THRESHOLD`` or, for textured frames, the pHashes
+    differ in at most ``VIDEO_WATCH_PHASH_THRESHOLD`` bits. Both checks are
+    one vectorized comparison against all kept frames, so a slide revisited
+    minutes later is caught too.
+
+    Best-effort: if Pillow is unavailable, returns the frames unchanged; an
+    unreadable frame is kept.
     """
     try:
-        from PIL import Image
+        import numpy as np
+        from PIL import Image  # noqa: F401 -- availability check
     except ImportError:
         logger.warning("Pillow unavailable — skipping frame dedup")
         return frames
+    if len(frames) < 2:
+        return frames
 
-    def thumb(path: Path) -> list[int] | None:
-        try:
-            with Image.open(path) as im:
-                small = im.convert("L").resize((16, 16))
-                # "L" mode => one byte per pixel; tobytes() avoids the deprecated getdata().
-                return list(small.tobytes())
-        except Exception as e:  # noqa: BLE001 -- a bad frame shouldn't kill dedup
-            logger.warning("Could not read frame for dedup %s: %s", path, e)
-            return None
+    workers = max(1, min(VIDEO_WATCH_DEDUP_WORKERS, len(frames)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        signatures = list(pool.map(_frame_signature, [path for path, _ in frames]))
 
+    thumbs = np.zeros((len(frames), 256), dtype=np.int16)
+    hashes = np.zeros(len(frames), dtype=np.uint64)
+    textured = np.zeros(len(frames), dtype=bool)
+    n_kept = 0
     kept: list[tuple[Path, float]] = []
-    prev_sig: list[int] | None = None
-    for path, ts in frames:
-        sig = thumb(path)
+    for frame, sig in zip(frames, signatures, strict=True):
         if sig is None:
-            kept.append((path, ts))
+            kept.append(frame)
             continue
-        if prev_sig is not None:
-            mad = sum(abs(a - b) for a, b in zip(prev_sig, sig, strict=False)) / len(sig)
-            if mad < VIDEO_WATCH_DEDUP_THRESHOLD:
-                continue  # near-duplicate of the last kept frame
-        kept.append((path, ts))
-        prev_sig = sig
+        thumb, phash, flat = sig
+        if n_kept:
+            mad = np.abs(thumbs[:n_kept] - thumb).mean(axis=1)
+            if mad.min() < VIDEO_WATCH_DEDUP_THRESHOLD:
+                continue
+            if not flat and VIDEO_WATCH_PHASH_THRESHOLD >= 0:
+                near = _hamming(hashes[:n_kept], phash) <= VIDEO_WATCH_PHASH_THRESHOLD
+                if (near & textured[:n_kept]).any():
+                    continue
+        thumbs[n_kept], hashes[n_kept], textured[n_kept] = thumb, phash, not flat
+        n_kept += 1
+        kept.append(frame)
     return kept
 
 
@@ -73,6 +73,68 @@ def test_dedup_drops_identical_frames(tmp_path):
     assert kept[1][1] == 3.0
 
 
+def _slide(seed: int, brightness: int = 0):
+    """A textured 'slide': random dark blocks on a light card, optionally brightened."""
+    import random
+
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    img = Image.new("RGB", (256, 144), (230, 230, 230))
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x, y = rng.randrange(0, 220), rng.randrange(0, 120)
+        draw.rectangle(
+            [x, y, x + rng.randrange(10, 40), y + rng.randrange(4, 20)], fill=(20, 40, 90)
+        )
+    if brightness:
+        img = img.point(lambda v: max(0, min(255, v + brightness)))
+    return img
+
+
+def test_dedup_drops_non_adjacent_and_brightness_shifted_repeats(tmp_path):
+    # Slides A, B, A again, B brightened by a fade, then a new slide C.
+    images = [_slide(1), _slide(2), _slide(1), _slide(2, brightness=-40), _slide(3)]
+    paths = []
+    for i, img in enumerate(images):
+        p = tmp_path / f"frame_{i}.jpg"
+        img.save(p, quality=85)
+        paths.append((p, float(i * 10)))
+
+    kept = vw._dedup_frames(paths)
+
+    assert [ts for _, ts in kept] == [0.0, 10.0, 40.0]
+
+
+def test_dedup_phash_check_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(vw, "VIDEO_WATCH_PHASH_THRESHOLD", -1)
+    paths = []
+    for i, img in enumerate([_slide(2), _slide(2, brightness=-40)]):
+        p = tmp_path / f"frame_{i}.jpg"
+        img.save(p)
+        paths.append((p, float(i)))
+
+    assert len(vw._dedup_frames(paths)) == 2
+
+
+def test_dedup_keeps_unreadable_frames(tmp_path):
+    good = tmp_path / "good.jpg"
+    _slide(1).save(good)
+    bad = tmp_path / "bad.jpg"
+    bad.write_bytes(b"not a jpeg")
+
+    kept = vw._dedup_frames([(good, 0.0), (bad, 1.0), (good, 2.0)])
+
+    assert [ts for _, ts in kept] == [0.0, 1.0]
+
+
+def test_hamming_distance():
+    import numpy as np
+
+    hashes = np.array([0, 0b1011, 2**64 - 1], dtype=np.uint64)
+    assert vw._hamming(hashes, np.uint64(0)).tolist() == [0, 3, 64]
+
+
 # --- watch_video orchestration ----------------------------------------------
 
 
@@ -0,0 +1,462 @@
+"""On-disk response cache for ``tools.web`` fetch and search.
+
+Layout (``WEB_CACHE_DIR``, default ``data/web_cache/``)::
+
+    index.db            SQLite: responses, negatives, searches
+    bodies/ab/abcd...   fetched content, named by its sha256
+
+Responses:
+    One row per normalized URL (``normalize_url``) pointing at a content-
+    addressed body, so the same page reached through different URLs is stored
+    once. Pages fetched directly (``httpx_fallback``) follow HTTP caching:
+    ``Cache-Control: no-store`` is never stored, ``max-age`` / ``Expires``
+    set the freshness lifetime (``no-cache`` makes it zero), and without
+    either a page is fresh for ``DEFAULT_TTL_S``. A stale entry carrying an
+    ``ETag`` or ``Last-Modified`` is revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``; a ``304`` refreshes it without a body transfer.
+    Pages from a paid provider (Firecrawl, Tavily) carry no origin headers
+    and are fresh for ``PROVIDER_TTL_S``.
+
+Negatives:
+    ``(url, provider)`` pairs known to fail, so the fetch chain skips them:
+    a page that needs JavaScript (``needs_js``) goes straight to Firecrawl,
+    a page that refuses plain clients (``blocked``) likewise. Transient
+    failures (timeouts, 5xx) are never recorded.
+
+Searches:
+    ``web_search`` results keyed by the whitespace-normalized query and its
+    options, fresh for ``SEARCH_TTL_S``.
+
+Metrics (in-process ``analytics.metrics`` counters, label ``kind``):
+    ``valor_web_cache_hits_total`` (with ``state=fresh|revalidated``),
+    ``valor_web_cache_misses_total`` and ``valor_web_cache_bytes_saved_total``
+    -- the response bytes not transferred. Counting never leaves the process,
+    so a hit on the event loop costs no I/O.
+
+Maintenance:
+    ``store`` runs ``prune`` at most once per ``PRUNE_INTERVAL_S`` across
+    processes (a marker file's mtime), so the directory stays bounded without
+    a scheduled job.
+
+Cache failures are silent: a broken index or missing body is a miss.
+``WEB_CACHE_DISABLED=1`` bypasses the cache entirely.
+
+See docs/features/web-response-cache.md.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from analytics.metrics import counter
+from tools.web.types import FetchResult, SearchResult, Source
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DIR = Path(__file__).parent.parent.parent / "data" / "web_cache"
+
+DEFAULT_TTL_S = 3600  # Direct fetch without Cache-Control or Expires
+PROVIDER_TTL_S = 24 * 3600  # Paid-provider results; no origin headers to honour
+MAX_TTL_S = 7 * 24 * 3600  # Cap on any server-provided lifetime
+SEARCH_TTL_S = int(os.environ.get("WEB_SEARCH_CACHE_TTL_S", "900"))
+RETENTION_DAYS = 30  # Rows unused this long are pruned with their bodies
+PRUNE_INTERVAL_S = 24 * 3600  # How often store() triggers prune()
+_PRUNE_MARKER = ".last_prune"
+
+# How long each kind of provider failure is remembered.
+NEGATIVE_TTL_S = {
+    "needs_js": 7 * 24 * 3600,
+    "blocked": 24 * 3600,
+    "empty": 3600,
+}
+
+# Query parameters that only track the click and never change the page.
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref_src"}
+
+_BUSY_TIMEOUT_S = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url_key TEXT PRIMARY KEY,
+    final_url TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    title TEXT,
+    body_sha TEXT NOT NULL,
+    raw_bytes INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS negatives (
+    url_key TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (url_key, provider)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS searches (
+    query_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored page; ``fresh`` is False once its lifetime has passed."""
+
+    url_key: str
+    result: FetchResult
+    raw_bytes: int
+    etag: str | None
+    last_modified: str | None
+    fresh: bool
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def disabled() -> bool:
+    return os.environ.get("WEB_CACHE_DISABLED", "").lower() in ("1", "true", "yes")
+
+
+def _cache_dir() -> Path:
+    return Path(os.environ.get("WEB_CACHE_DIR", _DEFAULT_DIR))
+
+
+def _connect() -> sqlite3.Connection:
+    root = _cache_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(root / "index.db"), timeout=_BUSY_TIMEOUT_S, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _body_path(sha: str) -> Path:
+    return _cache_dir() / "bodies" / sha[:2] / sha
+
+
+_HITS = counter("valor_web_cache_hits_total", "Web response cache hits", ("kind", "state"))
+_MISSES = counter("valor_web_cache_misses_total", "Web response cache misses", ("kind",))
+_BYTES_SAVED = counter(
+    "valor_web_cache_bytes_saved_total",
+    "Response bytes not transferred thanks to a web cache hit",
+    ("kind",),
+)
+
+
+def count_hit(kind: str, state: str, bytes_saved: int = 0) -> None:
+    _HITS.labels(kind, state).inc()
+    if bytes_saved:
+        _BYTES_SAVED.labels(kind).inc(bytes_saved)
+
+
+def count_miss(kind: str) -> None:
+    _MISSES.labels(kind).inc()
+
+
+# ---------------------------------------------------------------------------
+# Keys and HTTP freshness
+# ---------------------------------------------------------------------------
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a URL.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters (``utm_*``, ``fbclid``...), and sorts the remaining query.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in _TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def freshness(headers, now: float | None = None) -> float | None:
+    """Seconds a direct response stays fresh, or None if it must not be stored.
+
+    ``headers`` is any case-insensitive mapping (``httpx.Headers``).
+    """
+    now = time.time() if now is None else now
+    directives = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    if "max-age" in directives:
+        try:
+            return float(min(max(int(directives["max-age"]), 0), MAX_TTL_S))
+        except ValueError:
+            return 0.0
+    expires = headers.get("expires")
+    if expires:
+        try:
+            stamp = email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return 0.0  # An invalid Expires means already expired
+        return min(max(stamp - now, 0.0), MAX_TTL_S)
+    return float(DEFAULT_TTL_S)
+
+
+# ---------------------------------------------------------------------------
+# Responses
+# ---------------------------------------------------------------------------
+
+
+def lookup(url: str) -> CachedResponse | None:
+    """Return the stored response for ``url``, fresh or stale, or None."""
+    key = normalize_url(url)
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute("SELECT * FROM responses WHERE url_key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            content = _body_path(row["body_sha"]).read_text(encoding="utf-8")
+            now = time.time()
+            conn.execute("UPDATE responses SET used_at = ? WHERE url_key = ?", (now, key))
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("web cache lookup failed for %s: %s", url, e)
+        return None
+    return CachedResponse(
+        url_key=key,
+        result=FetchResult(
+            content=content, title=row["title"], url=row["final_url"], provider=row["provider"]
+        ),
+        raw_bytes=row["raw_bytes"],
+        etag=row["etag"],
+        last_modified=row["last_modified"],
+        fresh=row["expires_at"] > now,
+    )
+
+
+def store(
+    url: str,
+    result: FetchResult,
+    ttl_s: float,
+    raw_bytes: int | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> None:
+    """Store ``result`` for ``url``, fresh for ``ttl_s`` seconds; may run the daily prune."""
+    body = result.content.encode("utf-8")
+    sha = hashlib.sha256(body).hexdigest()
+    now = time.time()
+    try:
+        path = _body_path(sha)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{sha}.{os.getpid()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        conn = _connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (url_key, final_url, provider, title,"
+                " body_sha, raw_bytes, etag, last_modified, stored_at, expires_at, used_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    normalize_url(url),
+                    result.url,
+                    result.provider,
+                    result.title,
+                    sha,
+                    len(body) if raw_bytes is None else raw_bytes,
+                    etag,
+                    last_modified,
+                    now,
+                    now + ttl_s,
+                    now,
+                ),
+            )
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("web cache store failed for %s: %s", url, e)
+    maybe_prune()
+
+
+def refresh(entry: CachedResponse, ttl_s: float, etag: str | None = None) -> None:
+    """Extend a revalidated entry's lifetime (after a ``304 Not Modified``)."""
+    now = time.time()
+    try:
+        conn = _connect()
+        try:
+            conn.execute(
+                "UPDATE responses SET expires_at = ?, used_at = ?, etag = COALESCE(?, etag)"
+                " WHERE url_key = ?",
+                (now + ttl_s, now, etag, entry.url_key),
+            )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug("web cache refresh failed for %s: %s", entry.url_key, e)
+
+
+# ---------------------------------------------------------------------------
+# Negatives
+# ---------------------------------------------------------------------------
+
+
+def skipped_providers(url: str) -> dict[str, str]:
+    """Return ``{provider: reason}`` for providers known to fail on ``url``."""
+    try:
+        conn = _connect()
+        try:
+            rows = conn.execute(
+                "SELECT provider, reason FROM negatives WHERE url_key = ? AND expires_at > ?",
+                (normalize_url(url), time.time()),
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug("web cache negative lookup failed for %s: %s", url, e)
+        return {}
+    return {r["provider"]: r["reason"] for r in rows}
+
+
+def store_negative(url: str, provider: str, reason: str) -> None:
+    """Remember that ``provider`` cannot fetch ``url`` (see ``NEGATIVE_TTL_S``)."""
+    try:
+        conn = _connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO negatives (url_key, provider, reason, expires_at)"
+                " VALUES (?, ?, ?, ?)",
+                (normalize_url(url), provider, reason, time.time() + NEGATIVE_TTL_S[reason]),
+            )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug("web cache negative store failed for %s: %s", url, e)
+
+
+# ---------------------------------------------------------------------------
+# Searches
+# ---------------------------------------------------------------------------
+
+
+def search_key(query: str, options: dict) -> str:
+    """Cache key for a search: the whitespace-normalized query plus its options."""
+    payload = json.dumps([" ".join(query.split()), options], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def lookup_search(key: str) -> SearchResult | None:
+    """Return a fresh cached search result, or None."""
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT payload FROM searches WHERE query_key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        data = json.loads(row["payload"])
+    except (sqlite3.Error, ValueError) as e:
+        logger.debug("web cache search lookup failed: %s", e)
+        return None
+    data["sources"] = [Source(**s) for s in data["sources"]]
+    return SearchResult(**data)
+
+
+def store_search(key: str, result: SearchResult) -> None:
+    """Store a search result for ``SEARCH_TTL_S`` seconds."""
+    try:
+        conn = _connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO searches (query_key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(asdict(result)), time.time() + SEARCH_TTL_S),
+            )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug("web cache search store failed: %s", e)
+
+
+# ---------------------------------------------------------------------------
+# Maintenance
+# ---------------------------------------------------------------------------
+
+
+def prune(retention_days: int = RETENTION_DAYS) -> int:
+    """Drop expired negatives and searches, responses unused for ``retention_days``,
+    and bodies no response points at. Returns the number of bodies removed."""
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute("DELETE FROM negatives WHERE expires_at <= ?", (now,))
+        conn.execute("DELETE FROM searches WHERE expires_at <= ?", (now,))
+        conn.execute("DELETE FROM responses WHERE used_at < ?", (now - retention_days * 86400,))
+        live = {r["body_sha"] for r in conn.execute("SELECT body_sha FROM responses")}
+    finally:
+        conn.close()
+    removed = 0
+    for path in (_cache_dir() / "bodies").glob("*/*"):
+        # Skip bodies written in the last minute: their row may not be committed yet.
+        if path.name not in live and path.stat().st_mtime < now - 60:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def maybe_prune() -> None:
+    """Run :func:`prune` if no process has in the last ``PRUNE_INTERVAL_S``. Never raises."""
+    marker = _cache_dir() / _PRUNE_MARKER
+    try:
+        if time.time() - marker.stat().st_mtime < PRUNE_INTERVAL_S:
+            return
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+    try:
+        # Claim the interval first, so the other processes skip it.
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        removed = prune()
+        logger.debug("web cache pruned %d bodies", removed)
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("web cache prune failed: %s", e)
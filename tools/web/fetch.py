@@ -1,13 +1,25 @@
-"""URL fetching with provider fallback chain."""
+"""URL fetching with provider fallback chain.
+
+Every fetch goes through the on-disk response cache (``tools/web/cache.py``):
+a fresh entry is returned without touching the network, a stale one is
+revalidated with a conditional request, and providers known to fail on a URL
+are skipped.
+"""
 
 import asyncio
 import logging
+import os
 
+from tools.web import cache as web_cache
 from tools.web.providers import firecrawl, httpx_fallback, tavily
 from tools.web.types import FetchResult
 
 logger = logging.getLogger(__name__)
 
+# A paid provider without its key returns None at once; only a failure with the
+# key set says something about the URL, so only that is remembered.
+_PROVIDER_KEYS = {firecrawl.name: "FIRECRAWL_API_KEY", tavily.name: "TAVILY_API_KEY"}
+
 
 async def fetch(url: str, **kwargs) -> FetchResult | None:
     """Fetch and read content from a URL using provider fallback chain.
@@ -17,6 +29,8 @@ async def fetch(url: str, **kwargs) -> FetchResult | None:
     2. Firecrawl (handles JS-rendered pages, requires API key)
     3. Tavily extract (last resort, requires API key)
 
+    A fresh cached response short-circuits the chain; see ``tools.web.cache``.
+
     Args:
         url: URL to fetch
         **kwargs: Additional parameters passed to providers (timeout, formats, etc.)
@@ -41,9 +55,28 @@ async def fetch(url: str, **kwargs) -> FetchResult | None:
         tavily,
     ]
 
+    use_cache = not web_cache.disabled()
+    entry = None
+    skipped: dict[str, str] = {}
+    if use_cache:
+        entry = await asyncio.to_thread(web_cache.lookup, url)
+        if entry and entry.fresh:
+            _record_hit(entry, "fresh")
+            return entry.result
+        skipped = await asyncio.to_thread(web_cache.skipped_providers, url)
+        web_cache.count_miss("fetch")
+
     for provider in providers:
+        if provider.name in skipped:
+            logger.debug("skipping %s for %s: %s", provider.name, url, skipped[provider.name])
+            continue
         try:
-            result = await provider.fetch(url, **kwargs)
+            if provider is httpx_fallback and use_cache:
+                result = await _fetch_direct(url, entry, kwargs)
+            else:
+                result = await provider.fetch(url, **kwargs)
+                if use_cache:
+                    await _remember(url, provider.name, result)
             if result:
                 return result
         except Exception as e:
@@ -55,6 +88,50 @@ async def fetch(url: str, **kwargs) -> FetchResult | None:
     return None
 
 
+async def _fetch_direct(
+    url: str, entry: web_cache.CachedResponse | None, kwargs: dict
+) -> FetchResult | None:
+    """Direct fetch, conditional when ``entry`` has validators; caches the outcome."""
+    validators = entry.validators() if entry and entry.revalidatable else None
+    direct = await httpx_fallback.fetch_direct(
+        url, timeout=kwargs.get("timeout", 30.0), headers=validators
+    )
+    if direct is None:
+        return None
+
+    if direct.status == 304 and validators:
+        ttl = web_cache.freshness(direct.headers) or 0.0
+        await asyncio.to_thread(web_cache.refresh, entry, ttl, direct.headers.get("etag"))
+        _record_hit(entry, "revalidated")
+        return entry.result
+
+    if direct.failure:
+        await asyncio.to_thread(web_cache.store_negative, url, httpx_fallback.name, direct.failure)
+    if direct.result is None:
+        return None
+
+    etag = direct.headers.get("etag")
+    last_modified = direct.headers.get("last-modified")
+    ttl = web_cache.freshness(direct.headers)
+    if ttl is not None and (ttl > 0 or etag or last_modified):
+        await asyncio.to_thread(
+            web_cache.store, url, direct.result, ttl, direct.raw_bytes, etag, last_modified
+        )
+    return direct.result
+
+
+async def _remember(url: str, provider: str, result: FetchResult | None) -> None:
+    """Cache a paid provider's result, or its failure when its key is configured."""
+    if result:
+        await asyncio.to_thread(web_cache.store, url, result, web_cache.PROVIDER_TTL_S)
+    elif os.environ.get(_PROVIDER_KEYS.get(provider, "")):
+        await asyncio.to_thread(web_cache.store_negative, url, provider, "empty")
+
+
+def _record_hit(entry: web_cache.CachedResponse, state: str) -> None:
+    web_cache.count_hit("fetch", state, entry.raw_bytes)
+
+
 def fetch_sync(url: str, **kwargs) -> FetchResult | None:
     """Synchronous wrapper for fetch().
 
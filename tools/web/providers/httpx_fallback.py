@@ -1,5 +1,7 @@
 """Free fallback provider using httpx + html2text."""
 
+from dataclasses import dataclass
+
 import httpx
 from html2text import HTML2Text
 
@@ -7,6 +9,81 @@ from tools.web.types import FetchResult
 
 name = "httpx_fallback"
 
+# Statuses that mean the site refuses plain clients rather than a passing fault.
+BLOCKED_STATUSES = {401, 403, 451}
+
+
+@dataclass
+class DirectResponse:
+    """Outcome of one direct fetch, with what the cache layer needs to store it."""
+
+    status: int
+    headers: httpx.Headers
+    result: FetchResult | None = None  # Set for a usable 2xx page
+    raw_bytes: int = 0  # Response body size as transferred
+    failure: str | None = None  # "needs_js" | "blocked" when worth remembering
+
+
+async def fetch_direct(
+    url: str, timeout: float = 30.0, headers: dict[str, str] | None = None
+) -> DirectResponse | None:
+    """GET ``url`` and convert it, reporting status and response headers.
+
+    ``headers`` carries extra request headers, e.g. ``If-None-Match`` for a
+    conditional request; a ``304`` comes back with no result. Returns None on
+    network errors, which are not worth remembering.
+    """
+    try:
+        async with httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+            },
+        ) as client:
+            response = await client.get(url, headers=headers)
+    except Exception:
+        return None
+
+    direct = DirectResponse(
+        status=response.status_code, headers=response.headers, raw_bytes=len(response.content)
+    )
+    if response.status_code in BLOCKED_STATUSES:
+        direct.failure = "blocked"
+    if not response.is_success:
+        return direct
+
+    # Get final URL after redirects
+    final_url = str(response.url)
+
+    # Extract title from HTML
+    title = None
+    html_content = response.text
+    if "<title>" in html_content:
+        title_start = html_content.find("<title>") + 7
+        title_end = html_content.find("</title>", title_start)
+        if title_end > title_start:
+            title = html_content[title_start:title_end].strip()
+
+    # Convert HTML to markdown
+    h = HTML2Text()
+    h.ignore_links = False
+    h.ignore_images = False
+    h.ignore_emphasis = False
+    h.body_width = 0  # Don't wrap lines
+    h.unicode_snob = True  # Use unicode
+    h.skip_internal_links = True
+
+    content = h.handle(html_content)
+
+    if not content or len(content.strip()) < 50:
+        # Content too short: an error page or a shell that renders with JavaScript
+        direct.failure = "needs_js"
+        return direct
+
+    direct.result = FetchResult(content=content, title=title, url=final_url, provider=name)
+    return direct
+
 
 async def fetch(url: str, **kwargs) -> FetchResult | None:
     """Fetch content from URL using httpx + html2text.
@@ -28,45 +105,8 @@ async def fetch(url: str, **kwargs) -> FetchResult | None:
     timeout = kwargs.get("timeout", 30.0)
 
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            },
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # Get final URL after redirects
-            final_url = str(response.url)
-
-            # Extract title from HTML
-            title = None
-            html_content = response.text
-            if "<title>" in html_content:
-                title_start = html_content.find("<title>") + 7
-                title_end = html_content.find("</title>", title_start)
-                if title_end > title_start:
-                    title = html_content[title_start:title_end].strip()
-
-            # Convert HTML to markdown
-            h = HTML2Text()
-            h.ignore_links = False
-            h.ignore_images = False
-            h.ignore_emphasis = False
-            h.body_width = 0  # Don't wrap lines
-            h.unicode_snob = True  # Use unicode
-            h.skip_internal_links = True
-
-            content = h.handle(html_content)
-
-            if not content or len(content.strip()) < 50:
-                # Content too short, likely error page
-                return None
-
-            return FetchResult(content=content, title=title, url=final_url, provider=name)
-
+        direct = await fetch_direct(url, timeout=timeout)
     except Exception:
         # Any error returns None to trigger fallback
         return None
+    return direct.result if direct else None
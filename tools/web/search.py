@@ -1,8 +1,13 @@
-"""Unified web search with provider fallback chain."""
+"""Unified web search with provider fallback chain.
+
+Results are cached for ``tools.web.cache.SEARCH_TTL_S`` seconds per query and
+options, so an agent repeating a search inside one task pays for it once.
+"""
 
 import asyncio
 import logging
 
+from tools.web import cache as web_cache
 from tools.web.providers import perplexity, tavily
 from tools.web.types import SearchResult
 
@@ -13,7 +18,8 @@ async def web_search(query: str, **kwargs) -> SearchResult | None:
     """Search the web using provider fallback chain.
 
     Tries providers in order: Perplexity → Tavily
-    Returns the first successful result or None if all fail.
+    Returns the first successful result or None if all fail. A recent
+    identical search is answered from the cache.
 
     Args:
         query: Search query
@@ -29,6 +35,15 @@ async def web_search(query: str, **kwargs) -> SearchResult | None:
     Returns:
         SearchResult on success, None if all providers fail
     """
+    key = None
+    if query and query.strip() and not web_cache.disabled():
+        key = web_cache.search_key(query, kwargs)
+        cached = await asyncio.to_thread(web_cache.lookup_search, key)
+        if cached is not None:
+            web_cache.count_hit("search", "fresh")
+            return cached
+        web_cache.count_miss("search")
+
     # Provider chain: Perplexity → Tavily
     providers = [perplexity, tavily]
 
@@ -36,6 +51,8 @@ async def web_search(query: str, **kwargs) -> SearchResult | None:
         try:
             result = await provider.search(query, **kwargs)
             if result is not None:
+                if key:
+                    await asyncio.to_thread(web_cache.store_search, key, result)
                 return result
         except Exception as e:
             # Continue to next provider on any error.
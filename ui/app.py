@@ -295,6 +295,24 @@ def create_app() -> FastAPI:
             },
         )
 
+    # `/traces` ranks today's slowest replies; `?trace_id=` adds the span
+    # waterfall for one of them (analytics/tracing.py).
+    @app.get("/traces", response_class=HTMLResponse)
+    def traces_page(request: Request, trace_id: str | None = None, day: str | None = None):
+        """Slowest replies of the day and one trace's waterfall (read-only)."""
+        from ui.data.traces import get_slowest, get_waterfall
+
+        return templates.TemplateResponse(
+            request,
+            "traces.html",
+            {
+                "slowest": get_slowest(day=day),
+                "waterfall": get_waterfall(trace_id) if trace_id else None,
+                "trace_id": trace_id,
+                "day": day,
+            },
+        )
+
     @app.get("/_partials/memories/", response_class=HTMLResponse)
     def partial_memories_list(
         request: Request,
@@ -1006,6 +1024,18 @@ def create_app() -> FastAPI:
             }
         )
 
+    @app.get("/metrics")
+    def metrics():
+        """Prometheus text: hot-path histograms from every live process."""
+        from fastapi.responses import PlainTextResponse
+
+        from analytics.metrics import collect, render_prometheus
+
+        return PlainTextResponse(
+            render_prometheus(collect("ui")),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
     @app.get("/health")
     def health_status():
         """Health JSON endpoint for programmatic access."""
@@ -1161,6 +1191,14 @@ def create_app() -> FastAPI:
             request, "error.html", {"error": str(exc)}, status_code=500
         )
 
+    @app.on_event("startup")
+    def _start_metrics_export():
+        from analytics.metrics import start_exporter
+        from config.redis_bootstrap import instrument_redis_client
+
+        instrument_redis_client()
+        start_exporter("ui")
+
     # Startup probe: log session count for index staleness detection
     @app.on_event("startup")
     def _log_session_count():
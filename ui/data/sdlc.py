@@ -113,6 +113,11 @@ def _fetch_github_title(url: str) -> str | None:
     """Return the title of a GitHub issue or PR URL, using a process-level cache."""
     if url in _github_title_cache:
         return _github_title_cache[url]
+    from utils import github_api
+
+    if github_api.enabled():
+        _prefetch_github_titles([url])
+        return _github_title_cache.get(url)
     try:
         if "/issues/" in url:
             result = subprocess.run(
@@ -144,6 +149,23 @@ _SYSTEM_PROMPT_PREFIXES = ("PROJECT:", "[Prior session context")
 _INTERNAL_SENDERS = {"valor-session (eng)", "None", ""}
 
 
+def _prefetch_github_titles(urls) -> None:
+    """Fill ``_github_title_cache`` for ``urls`` in one batched read per repo.
+
+    Only with the shared GitHub broker configured; without it titles are read
+    one ``gh`` call at a time by ``_fetch_github_title``.
+    """
+    from utils import github_api
+
+    wanted = [u for u in urls if u and u not in _github_title_cache]
+    if not wanted or not github_api.enabled():
+        return
+    try:
+        _github_title_cache.update(github_api.titles_for_urls(wanted))
+    except github_api.GitHubAPIError as e:
+        logger.debug(f"GitHub title prefetch failed: {e}")
+
+
 def _extract_from_system_prompt(message_text: str) -> str | None:
     """Extract a human-readable label from a session system-prompt message_text.
 
@@ -1236,6 +1258,12 @@ def _session_to_pipeline(session) -> PipelineProgress:
     )
 
 
+# Cold payload fields _session_to_pipeline reads on every row: stage_states and
+# history are views over session_events, and message_text / sender_name over
+# initial_telegram_message. Scans prefetch them in one round trip.
+_PIPELINE_COLD_FIELDS = ("session_events", "extra_context", "initial_telegram_message")
+
+
 # === Public query functions ===
 
 
@@ -1263,7 +1291,7 @@ def load_pipelines() -> list[PipelineProgress]:
     """
     from models.session_enumeration import enumerate_sessions
 
-    all_sessions = enumerate_sessions()
+    all_sessions = enumerate_sessions(cold_fields=_PIPELINE_COLD_FIELDS)
     cutoff = time.time() - DASHBOARD_RETENTION_HOURS * 3600
     hard_cutoff = time.time() - DASHBOARD_MAX_AGE_HOURS * 3600
 
@@ -1295,6 +1323,11 @@ def load_pipelines() -> list[PipelineProgress]:
             if best_timestamp(pipeline) >= cutoff or retained_as_active:
                 all_pipelines.append(pipeline)
 
+    # Titles for every unslugged row in one batched read instead of one
+    # subprocess per row when display_name is rendered.
+    _prefetch_github_titles(
+        url for p in all_pipelines if not p.slug for url in (p.issue_url, p.pr_url)
+    )
     return all_pipelines
 
 
@@ -1385,9 +1418,45 @@ def get_pipeline_detail(agent_session_id: str) -> PipelineProgress | None:
         return None
 
 
+def _completed_pipelines(sessions) -> list[PipelineProgress]:
+    """PipelineProgress for the finished SDLC sessions in ``sessions``."""
+    pipelines = []
+    for session in sessions:
+        if getattr(session, "status", None) not in ("completed", "failed"):
+            continue
+        if not _session_has_stage_data(session):
+            continue
+        try:
+            pipeline = _session_to_pipeline(session)
+        except Exception:
+            logger.debug(f"Skipping corrupt session: {getattr(session, 'agent_session_id', '?')}")
+            continue
+        pipelines.append(pipeline)
+    return pipelines
+
+
+def _index_covers_all_completions() -> bool:
+    """``covers_all("completed")``; False (scan) if the index cannot answer."""
+    from models.session_time_index import covers_all
+
+    try:
+        return covers_all("completed")
+    except Exception as e:
+        logger.warning(f"Recent completions index check failed: {e}")
+        return False
+
+
 def get_recent_completions(limit: int = 25, page: int = 1) -> list[PipelineProgress]:
     """Get recently completed SDLC pipelines.
 
+    Pages are served from the ``completed`` time index
+    (``models/session_time_index.py``). The index only reaches back
+    ``SESSION_TIME_INDEX_RETENTION_DAYS``; a page that runs past it is filled
+    from the full session scan, as before the index existed, but only when
+    the index is missing some completion (``covers_all``): one older than the
+    window, or a finished session with no ``completed_at``. Otherwise the
+    index holds every completion and a short page is final.
+
     Args:
         limit: Maximum number of results per page.
         page: Page number (1-indexed).
@@ -1395,23 +1464,44 @@ def get_recent_completions(limit: int = 25, page: int = 1) -> list[PipelineProgr
     Returns:
         List of PipelineProgress for completed pipelines, newest first.
     """
+    from models.agent_session import AgentSession
+    from models.cold_payload import prefetch_cold_payloads
     from models.session_enumeration import enumerate_sessions
-
-    completed = []
-    for session in enumerate_sessions(("completed", "failed")):
-        if not _session_has_stage_data(session):
-            continue
+    from models.session_time_index import session_keys_between
+
+    # Walk the completed_at time index newest first, a batch at a time, until
+    # the requested page is filled -- O(page) reads instead of a full scan.
+    # Non-SDLC completions are skipped, so the batch doubles as the walk goes.
+    wanted = page * limit
+    completed: list[PipelineProgress] = []
+    seen: set[str] = set()
+    offset = 0
+    batch = max(wanted, 50)
+    while len(completed) < wanted:
         try:
-            pipeline = _session_to_pipeline(session)
-        except Exception:
-            logger.debug(f"Skipping corrupt session: {getattr(session, 'agent_session_id', '?')}")
-            continue
-        completed.append(pipeline)
-
-    # Sort by completed_at descending
-    completed.sort(key=lambda p: p.completed_at or p.created_at or 0, reverse=True)
+            keys = session_keys_between("completed", newest_first=True, offset=offset, limit=batch)
+            if not keys:
+                break
+            sessions = AgentSession.query.get_many(keys, skip_none=True)
+            prefetch_cold_payloads(sessions, _PIPELINE_COLD_FIELDS)
+        except Exception as e:
+            logger.warning(f"Recent completions lookup failed: {e}")
+            break
+        offset += batch
+        batch = min(batch * 2, 1000)
+        seen.update(keys)
+        completed.extend(_completed_pipelines(sessions))
+
+    if len(completed) < wanted and not _index_covers_all_completions():
+        # Past the index: older than the retention window, or no completed_at.
+        older = _completed_pipelines(
+            s
+            for s in enumerate_sessions(("completed", "failed"), cold_fields=_PIPELINE_COLD_FIELDS)
+            if s.db_key.redis_key not in seen
+        )
+        older.sort(key=lambda p: p.completed_at or p.created_at or 0, reverse=True)
+        completed.extend(older)
 
     # Paginate
     start = (page - 1) * limit
-    end = start + limit
-    return completed[start:end]
+    return completed[start:wanted]
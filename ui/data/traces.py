@@ -0,0 +1,68 @@
+"""Data access layer for the reply-trace view (``/traces``).
+
+Reads the spans ``analytics/tracing.py`` records across the bridge, worker,
+harness and relay. Functions are synchronous; FastAPI runs sync route
+handlers in its threadpool. Read-only, and a Redis failure renders as an
+empty view rather than an error page.
+"""
+
+import logging
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 20
+
+# Narrowest bar drawn, in percent of the trace, so instant spans stay visible.
+MIN_BAR_PCT = 0.5
+
+
+def get_slowest(limit: int = DEFAULT_LIMIT, day: str | None = None) -> list[dict[str, Any]]:
+    """The slowest first replies of ``day`` (UTC ``YYYY-MM-DD``, default today)."""
+    try:
+        from analytics.tracing import slowest_replies
+
+        return slowest_replies(limit=limit, day=day)
+    except Exception as e:
+        logger.warning("[traces-dashboard] slowest_replies failed: %s", e)
+        return []
+
+
+def get_waterfall(trace_id: str) -> dict[str, Any] | None:
+    """A trace with per-span bar geometry, or None when unknown.
+
+    Each span gains ``offset_s`` / ``duration_s`` relative to the trace start
+    and ``left_pct`` / ``width_pct`` for the waterfall bar.
+    """
+    try:
+        from analytics.tracing import load_trace
+
+        trace = load_trace(trace_id)
+    except Exception as e:
+        logger.warning("[traces-dashboard] load_trace(%s) failed: %s", trace_id, e)
+        return None
+    if trace is None:
+        return None
+
+    origin = trace["started_at"]
+    total = trace["duration"] or 1e-9
+    rows = []
+    for span in trace["spans"]:
+        offset = max(0.0, span["start"] - origin)
+        duration = max(0.0, span["end"] - span["start"])
+        left = min(100.0, offset / total * 100)
+        rows.append(
+            {
+                **span,
+                "offset_s": offset,
+                "duration_s": duration,
+                "left_pct": round(left, 2),
+                "width_pct": round(max(MIN_BAR_PCT, min(100.0 - left, duration / total * 100)), 2),
+            }
+        )
+    return {
+        **trace,
+        "rows": rows,
+        "started": datetime.fromtimestamp(origin, tz=UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
+    }
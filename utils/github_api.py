@@ -0,0 +1,463 @@
+"""Shared GitHub read broker: one HTTP client, a cross-process ETag cache.
+
+Call sites used to shell out to ``gh`` for every read. Each call forked a Go
+binary, re-read its auth, and paid the full API latency and rate-limit cost.
+This module serves the same reads in-process:
+
+- One pooled ``httpx.Client`` per process, authenticated with ``GH_TOKEN`` /
+  ``GITHUB_TOKEN`` or, failing those, ``gh auth token`` (asked once).
+- REST responses are cached in Redis (``POPOTO_REDIS_DB``) under
+  ``github_api:rest:{sha256(url)}`` with their ``ETag``, shared by the bridge,
+  the worker and CLI tools. Every read revalidates with ``If-None-Match``; a
+  ``304`` costs no rate limit and returns the cached body. ``max_age_s``
+  skips even that request while the entry is younger than it.
+- Identical concurrent reads in one process are coalesced: the first caller
+  makes the request, the rest wait for its answer.
+- ``items`` reads titles and states for many issues and PRs of one repo in
+  one GraphQL query per ``BATCH_SIZE`` numbers, cached per item.
+
+Every read raises ``GitHubAPIError`` on a transport failure or an error status,
+except 404, which is ``None``. Cache failures are silent: a Redis error is a
+miss.
+
+``enabled()`` is False without a token or with ``GITHUB_BROKER_DISABLED=1``;
+call sites keep their ``gh`` path for that case. ``GITHUB_API_URL`` points the
+broker at another API root (GitHub Enterprise, or a fake server in tests).
+
+Metrics (``analytics.collector.record_metric``): ``github_api.request`` with
+``kind=rest|graphql`` and ``result=fresh|not_modified|fetched|coalesced|error``,
+and ``github_api.rate_remaining`` per rate-limit ``resource``.
+
+See docs/features/github-read-broker.md.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://api.github.com"
+KEY_PREFIX = "github_api"
+CACHE_TTL_S = 24 * 3600  # Unused ETag entries expire after a day
+ITEM_TTL_S = 300  # Default freshness of an issue/PR title and state
+BATCH_SIZE = 50  # Issues/PRs per GraphQL query
+REQUEST_TIMEOUT_S = 10.0
+
+_GITHUB_URL_RE = re.compile(r"github\.com/([\w.-]+/[\w.-]+)/(issues|pull)/(\d+)")
+_REMOTE_RE = re.compile(r"github\.com[:/]([\w.-]+/[\w.-]+?)(?:\.git)?/?$")
+
+_ITEM_FIELDS = """
+    __typename
+    ... on Issue { number title state url }
+    ... on PullRequest { number title state url }
+"""
+
+_CHECKS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      commits(last: 1) {
+        nodes { commit { statusCheckRollup { contexts(first: 100) { nodes {
+          __typename
+          ... on CheckRun { name status conclusion }
+          ... on StatusContext { context state }
+        } } } } }
+      }
+    }
+  }
+}
+"""
+
+
+class GitHubAPIError(Exception):
+    """A GitHub read failed; ``status`` is 0 for transport errors."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"GitHub API {status}: {message}")
+        self.status = status
+
+
+_UNSET = object()
+_token_lock = threading.Lock()
+_gh_token: Any = _UNSET
+
+_client_lock = threading.Lock()
+_client: httpx.Client | None = None
+_client_key: tuple[int, str] | None = None
+
+_inflight_lock = threading.Lock()
+_inflight: dict[str, Future] = {}
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+
+def api_url() -> str:
+    return os.environ.get("GITHUB_API_URL", DEFAULT_API_URL).rstrip("/")
+
+
+def token() -> str | None:
+    """The API token: ``GH_TOKEN``, ``GITHUB_TOKEN``, else ``gh auth token``."""
+    env = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if env:
+        return env
+    global _gh_token
+    with _token_lock:
+        if _gh_token is _UNSET:
+            try:
+                proc = subprocess.run(
+                    ["gh", "auth", "token"], capture_output=True, text=True, timeout=10
+                )
+                _gh_token = proc.stdout.strip() if proc.returncode == 0 else None
+            except (OSError, subprocess.SubprocessError):
+                _gh_token = None
+        return _gh_token or None
+
+
+def enabled() -> bool:
+    """True when reads should go through the broker instead of ``gh``."""
+    if os.environ.get("GITHUB_BROKER_DISABLED", "").lower() in ("1", "true", "yes"):
+        return False
+    return token() is not None
+
+
+def resolve_repo(cwd: str | Path | None = None) -> str | None:
+    """``owner/name`` the way ``gh`` picks it: ``GH_REPO``, else ``origin`` of ``cwd``."""
+    return os.environ.get("GH_REPO") or _origin_repo(str(Path(cwd or ".").resolve()))
+
+
+@lru_cache(maxsize=64)
+def _origin_repo(cwd: str) -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            cwd=cwd,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _REMOTE_RE.search(proc.stdout.strip()) if proc.returncode == 0 else None
+    return match.group(1) if match else None
+
+
+def close() -> None:
+    """Close the pooled client; the next read opens a new one."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# ---------------------------------------------------------------------------
+# Transport, cache, coalescing
+# ---------------------------------------------------------------------------
+
+
+def _http() -> httpx.Client:
+    # Keyed by pid (a forked child must not share the parent's sockets) and by
+    # API root (tests and GHE switch it through the environment).
+    global _client, _client_key
+    key = (os.getpid(), api_url())
+    with _client_lock:
+        if _client is None or _client.is_closed or _client_key != key:
+            _client = httpx.Client(
+                base_url=key[1],
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                    "User-Agent": "valor-github-broker",
+                },
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                timeout=REQUEST_TIMEOUT_S,
+            )
+            _client_key = key
+        return _client
+
+
+def _emit(name: str, value: float, dims: dict[str, str]) -> None:
+    try:
+        from analytics.collector import record_metric
+
+        record_metric(name, value, dims)
+    except Exception:  # noqa: S110 -- optional analytics telemetry
+        pass
+
+
+def _redis():
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    return POPOTO_REDIS_DB
+
+
+def _cache_get(key: str) -> dict | None:
+    try:
+        raw = _redis().get(key)
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.debug("github_api cache read failed: %s", e)
+        return None
+
+
+def _cache_set(key: str, entry: dict, ttl_s: int) -> None:
+    try:
+        _redis().set(key, json.dumps(entry), ex=ttl_s)
+    except Exception as e:
+        logger.debug("github_api cache write failed: %s", e)
+
+
+def _send(method: str, path: str, kind: str, **kwargs) -> httpx.Response:
+    tok = token()
+    if not tok:
+        raise GitHubAPIError(0, "no GitHub token")
+    headers = {"Authorization": f"Bearer {tok}", **kwargs.pop("headers", {})}
+    try:
+        response = _http().request(method, path, headers=headers, **kwargs)
+    except httpx.HTTPError as e:
+        _emit("github_api.request", 1, {"kind": kind, "result": "error"})
+        raise GitHubAPIError(0, str(e)) from e
+    remaining = response.headers.get("x-ratelimit-remaining")
+    if remaining is not None and remaining.isdigit():
+        resource = response.headers.get("x-ratelimit-resource", "core")
+        _emit("github_api.rate_remaining", int(remaining), {"resource": resource})
+    return response
+
+
+def _coalesced(key: str, fn: Callable[[], Any]) -> Any:
+    """Run ``fn`` once for concurrent callers with the same ``key``."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        _emit("github_api.request", 1, {"kind": key.split(" ", 1)[0], "result": "coalesced"})
+        # Each follower gets its own copy; callers may mutate what they get.
+        return copy.deepcopy(future.result())
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+# ---------------------------------------------------------------------------
+# REST
+# ---------------------------------------------------------------------------
+
+
+def get(path: str, params: dict | None = None, *, max_age_s: float = 0) -> Any:
+    """GET a REST path (``repos/o/r/pulls/1``) and return the parsed JSON.
+
+    Revalidates the cached copy with ``If-None-Match``; with ``max_age_s``, a
+    copy validated that recently is returned without a request. Returns None
+    on 404; raises ``GitHubAPIError`` on any other failure.
+    """
+    query = urlencode(sorted((params or {}).items()))
+    url = f"{api_url()}/{path.lstrip('/')}" + (f"?{query}" if query else "")
+    return _coalesced(f"rest {url}", lambda: _get(path, params, url, max_age_s))
+
+
+def _get(path: str, params: dict | None, url: str, max_age_s: float) -> Any:
+    key = f"{KEY_PREFIX}:rest:{hashlib.sha256(url.encode()).hexdigest()}"
+    entry = _cache_get(key)
+    if entry and max_age_s and time.time() - entry["validated_at"] < max_age_s:
+        _emit("github_api.request", 1, {"kind": "rest", "result": "fresh"})
+        return json.loads(entry["body"])
+
+    headers = {"If-None-Match": entry["etag"]} if entry else {}
+    response = _send("GET", path, "rest", params=params, headers=headers)
+    if response.status_code == 304 and entry:
+        entry["validated_at"] = time.time()
+        _cache_set(key, entry, CACHE_TTL_S)
+        _emit("github_api.request", 1, {"kind": "rest", "result": "not_modified"})
+        return json.loads(entry["body"])
+    if response.status_code == 404:
+        _emit("github_api.request", 1, {"kind": "rest", "result": "fetched"})
+        return None
+    if response.is_error:
+        _emit("github_api.request", 1, {"kind": "rest", "result": "error"})
+        raise GitHubAPIError(response.status_code, response.text[:200])
+
+    _emit("github_api.request", 1, {"kind": "rest", "result": "fetched"})
+    etag = response.headers.get("etag")
+    if etag:
+        _cache_set(
+            key, {"etag": etag, "body": response.text, "validated_at": time.time()}, CACHE_TTL_S
+        )
+    return response.json()
+
+
+def pulls_for_branch(branch: str, repo: str, state: str = "open", limit: int = 5) -> list[dict]:
+    """PRs whose head is ``branch``, newest first, shaped like ``gh pr list --json``.
+
+    Each dict has ``number``, ``headRefName`` and ``state`` (``OPEN``,
+    ``CLOSED`` or ``MERGED``). ``state`` is ``open``, ``closed`` or ``all``.
+    """
+    owner = repo.split("/", 1)[0]
+    pulls = get(
+        f"repos/{repo}/pulls",
+        {"head": f"{owner}:{branch}", "state": state, "per_page": limit},
+    )
+    return [
+        {
+            "number": p["number"],
+            "headRefName": p["head"]["ref"],
+            "state": "MERGED" if p.get("merged_at") else p["state"].upper(),
+        }
+        for p in pulls or []
+    ]
+
+
+def pull_head_sha(number: int, repo: str) -> str | None:
+    """Head commit SHA of PR ``number``, revalidated on every call."""
+    pull = get(f"repos/{repo}/pulls/{number}")
+    return pull["head"]["sha"] if pull else None
+
+
+def search_issues(query: str, limit: int = 30) -> list[dict]:
+    """Issue/PR search (``is:open label:x in:title ...``); returns the items."""
+    found = get("search/issues", {"q": query, "per_page": limit})
+    return (found or {}).get("items", [])
+
+
+# ---------------------------------------------------------------------------
+# GraphQL
+# ---------------------------------------------------------------------------
+
+
+def graphql(query: str, variables: dict | None = None) -> dict:
+    """Run a GraphQL query and return its ``data``.
+
+    Partial results (some fields null with errors, e.g. a missing issue
+    number) are returned as is; raises ``GitHubAPIError`` only when there is no
+    data at all.
+    """
+    response = _send("POST", "graphql", "graphql", json={"query": query, "variables": variables})
+    if response.is_error:
+        _emit("github_api.request", 1, {"kind": "graphql", "result": "error"})
+        raise GitHubAPIError(response.status_code, response.text[:200])
+    payload = response.json()
+    if not payload.get("data"):
+        _emit("github_api.request", 1, {"kind": "graphql", "result": "error"})
+        raise GitHubAPIError(response.status_code, json.dumps(payload.get("errors"))[:200])
+    _emit("github_api.request", 1, {"kind": "graphql", "result": "fetched"})
+    return payload["data"]
+
+
+def items(repo: str, numbers: Iterable[int], *, max_age_s: float = ITEM_TTL_S) -> dict[int, dict]:
+    """Titles and states of issues and PRs ``numbers`` in ``repo``.
+
+    Returns ``{number: {"number", "title", "state", "url", "is_pr"}}``;
+    numbers that do not exist are absent. Items fetched within ``max_age_s``
+    come from the cache; the rest are read ``BATCH_SIZE`` per query.
+    """
+    numbers = sorted({int(n) for n in numbers})
+    found: dict[int, dict] = {}
+    missing = []
+    now = time.time()
+    for n in numbers:
+        entry = _cache_get(f"{KEY_PREFIX}:item:{repo}:{n}")
+        if entry and now - entry["fetched_at"] < max_age_s:
+            found[n] = entry["item"]
+        else:
+            missing.append(n)
+    if found:
+        _emit("github_api.request", len(found), {"kind": "graphql", "result": "fresh"})
+
+    for start in range(0, len(missing), BATCH_SIZE):
+        chunk = missing[start : start + BATCH_SIZE]
+        key = f"graphql items {repo} {','.join(map(str, chunk))}"
+        found.update(_coalesced(key, lambda chunk=chunk: _fetch_items(repo, chunk)))
+    return found
+
+
+def _fetch_items(repo: str, numbers: list[int]) -> dict[int, dict]:
+    owner, name = repo.split("/", 1)
+    fields = "\n".join(
+        f"i{n}: issueOrPullRequest(number: {n}) {{ {_ITEM_FIELDS} }}" for n in numbers
+    )
+    data = graphql(
+        "query($owner: String!, $name: String!) {"
+        f" repository(owner: $owner, name: $name) {{ {fields} }} }}",
+        {"owner": owner, "name": name},
+    )
+    repository = data.get("repository") or {}
+    fetched = {}
+    now = time.time()
+    for n in numbers:
+        node = repository.get(f"i{n}")
+        if not node:
+            continue
+        item = {
+            "number": node["number"],
+            "title": node["title"],
+            "state": node["state"],
+            "url": node["url"],
+            "is_pr": node["__typename"] == "PullRequest",
+        }
+        fetched[n] = item
+        _cache_set(f"{KEY_PREFIX}:item:{repo}:{n}", {"item": item, "fetched_at": now}, CACHE_TTL_S)
+    return fetched
+
+
+def titles_for_urls(urls: Iterable[str], *, max_age_s: float = ITEM_TTL_S) -> dict[str, str]:
+    """``{url: title}`` for GitHub issue/PR URLs, one batched query per repo."""
+    by_repo: dict[str, dict[int, list[str]]] = {}
+    for url in urls:
+        match = _GITHUB_URL_RE.search(url or "")
+        if match:
+            by_repo.setdefault(match.group(1), {}).setdefault(int(match.group(3)), []).append(url)
+    titles = {}
+    for repo, wanted in by_repo.items():
+        for number, item in items(repo, wanted, max_age_s=max_age_s).items():
+            for url in wanted[number]:
+                titles[url] = item["title"]
+    return titles
+
+
+def pull_check_rollup(number: int, repo: str) -> list[dict] | None:
+    """Status checks on PR ``number``'s head commit, shaped like ``gh``'s
+    ``statusCheckRollup``: check runs carry ``status``/``conclusion``, commit
+    statuses carry ``state``. None when the PR does not exist.
+
+    Not cached: a verdict read must see the current run.
+    """
+    owner, name = repo.split("/", 1)
+    data = _coalesced(
+        f"graphql checks {repo} {number}",
+        lambda: graphql(_CHECKS_QUERY, {"owner": owner, "name": name, "number": int(number)}),
+    )
+    pull = (data.get("repository") or {}).get("pullRequest")
+    if pull is None:
+        return None
+    nodes = pull["commits"]["nodes"]
+    rollup = nodes[0]["commit"]["statusCheckRollup"] if nodes else None
+    return list(rollup["contexts"]["nodes"]) if rollup else []
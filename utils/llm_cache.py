@@ -0,0 +1,496 @@
+"""Shared, cross-process cache for deterministic LLM call sites.
+
+``utils/json_cache`` is a single-writer JSON file per call site, so it only
+suits sites owned by one process. This module stores results in Redis
+(``POPOTO_REDIS_DB``) so the bridge, the worker and CLI tools share one
+cache, and makes opting in a one-line decorator::
+
+    @llm_cached("work_type", model=MODEL_FAST, version="v1", ttl=3600, semantic=True)
+    async def classify_request_async(message: str, context: str = "") -> dict: ...
+
+Keys:
+    An entry lives at ``llm_cache:{namespace}:{sha256(model|version|args)}``.
+    ``args`` is the call's bound arguments with every string whitespace-
+    normalized, so ``"fix  the bug\\n"`` and ``"fix the bug"`` share an entry.
+    Bumping ``version`` (the prompt template version) orphans old entries;
+    they age out through TTL and eviction.
+
+Bounds:
+    Every entry carries a Redis TTL. A per-namespace sorted set
+    (``llm_cache:{namespace}:lru``, scored by last access) caps the namespace
+    at ``max_entries``; a write past the cap evicts the least recently used.
+
+Near-duplicate hits (``semantic=True``):
+    For classifier prompts, a miss on the exact key embeds the text argument
+    (the first parameter, or ``semantic_arg``) with the process's
+    popoto embedding provider (``agent/embedding_provider.py``) and compares
+    it with the vectors of earlier calls that had the same remaining
+    arguments. A cosine similarity of at least ``semantic_threshold`` is a
+    hit. Vectors are stored as normalized float16 in
+    ``llm_cache:{namespace}:vec:{context}``, capped at ``SEMANTIC_MAX_VECTORS``
+    per context. No provider configured means exact-match only.
+
+    The exact ``GET`` also checks that the context has vectors (same round
+    trip). When it has none, no near-duplicate hit is possible, so the lookup
+    does not embed; the text is embedded by the store, after the real call.
+
+Metrics (in-process ``analytics.metrics`` counters, label ``namespace``):
+    ``valor_llm_cache_hits_total`` (also labelled ``match=exact|semantic``),
+    ``valor_llm_cache_misses_total`` and ``valor_llm_cache_saved_seconds_total``
+    -- the recorded compute time of each hit entry minus the lookup time.
+    Counting is a dict lookup and an add, so it costs nothing on the hot path.
+
+Event loops:
+    The async wrapper runs the lookup (Redis reads, embedding, the
+    near-duplicate scan) and the store in one ``asyncio.to_thread`` call each,
+    so decorated bridge classifiers never block the loop on cache I/O.
+
+Contract, shared with ``utils/json_cache``:
+    - Values must be JSON-serializable; pass ``decode`` to rehydrate (e.g. a
+      ``StrEnum``).
+    - Results rejected by ``cache_if`` are returned but not stored. The
+      default rejects falsy values and dicts carrying an ``"error"`` key, so a
+      transient failure is never cached.
+    - Exceptions from the wrapped function propagate and are not cached.
+    - Cache failures are silent: a Redis or embedding error is a miss.
+    - ``LLM_CACHE_DISABLED=1`` bypasses every decorated site.
+
+See docs/features/llm-result-cache.md.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+from analytics.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm_cache"
+DEFAULT_TTL_S = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_SEMANTIC_THRESHOLD = 0.96
+# Per-context vector cap. A near-duplicate lookup reads the whole set, so it is
+# kept small: 512 float16 x 1536-dim vectors is about 1.5MB per lookup.
+SEMANTIC_MAX_VECTORS = 512
+
+
+def _disabled() -> bool:
+    return os.environ.get("LLM_CACHE_DISABLED", "").lower() in ("1", "true", "yes")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace and strip, the cache's input normalization."""
+    return " ".join(text.split())
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return normalize_text(value)
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items())}
+    return value
+
+
+def _digest(*parts: Any) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def default_cache_if(result: Any) -> bool:
+    """Store truthy results that are not ``{"error": ...}`` dicts."""
+    if not result:
+        return False
+    return not (isinstance(result, dict) and "error" in result)
+
+
+_HITS = counter("valor_llm_cache_hits_total", "LLM result cache hits", ("namespace", "match"))
+_MISSES = counter("valor_llm_cache_misses_total", "LLM result cache misses", ("namespace",))
+_SAVED_S = counter(
+    "valor_llm_cache_saved_seconds_total",
+    "Compute seconds saved by LLM result cache hits, net of lookup time",
+    ("namespace",),
+)
+
+
+def _redis():
+    from popoto.redis_db import POPOTO_REDIS_DB
+
+    return POPOTO_REDIS_DB
+
+
+def _embed(text: str) -> list[float] | None:
+    """Embed with the process's popoto provider; ``None`` if none is configured."""
+    try:
+        from popoto.fields.embedding_field import get_default_provider
+
+        provider = get_default_provider()
+        if provider is None:
+            return None
+        vectors = provider.embed([text], input_type="query")
+        return vectors[0] if vectors and vectors[0] else None
+    except Exception as e:
+        logger.debug("[llm_cache] embedding failed: %s", e)
+        return None
+
+
+class LLMCache:
+    """One namespace of the shared cache. Normally built by :func:`llm_cached`."""
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        model: str = "",
+        version: str = "v1",
+        ttl: int = DEFAULT_TTL_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        semantic_threshold: float | None = None,
+        embed: Callable[[str], list[float] | None] = _embed,
+    ) -> None:
+        self.namespace = namespace
+        self.model = model
+        self.version = version
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.semantic_threshold = semantic_threshold
+        self.embed = embed
+
+    # ---- keys ----
+
+    def _entry_key(self, digest: str) -> str:
+        return f"{KEY_PREFIX}:{self.namespace}:{digest}"
+
+    @property
+    def _lru_key(self) -> str:
+        return f"{KEY_PREFIX}:{self.namespace}:lru"
+
+    def _vec_key(self, context: str) -> str:
+        return f"{KEY_PREFIX}:{self.namespace}:vec:{context}"
+
+    def key_for(self, key_input: Any) -> str:
+        return _digest(self.model, self.version, _normalize(key_input))
+
+    def context_for(self, context_input: Any) -> str:
+        return _digest(self.model, self.version, _normalize(context_input))[:16]
+
+    # ---- exact lookup ----
+
+    def probe(self, digest: str, context: str | None) -> tuple[dict | None, bool]:
+        """Exact lookup, plus whether ``context`` has vectors, in one round trip.
+
+        Returns ``(envelope, comparable)``; ``comparable`` is only set on a miss.
+        """
+        try:
+            db = _redis()
+            pipe = db.pipeline(transaction=False)
+            pipe.get(self._entry_key(digest))
+            if context is not None:
+                pipe.exists(self._vec_key(context))
+            raw, *vectors = pipe.execute()
+            if raw is not None:
+                db.zadd(self._lru_key, {digest: time.time()})
+                return json.loads(raw), False
+            return None, bool(vectors and vectors[0])
+        except Exception as e:
+            logger.debug("[llm_cache] probe failed for %s: %s", self.namespace, e)
+            return None, False
+
+    def get(self, digest: str) -> dict | None:
+        """Return the stored envelope ``{"value", "compute_s", "ts"}`` or ``None``."""
+        try:
+            db = _redis()
+            raw = db.get(self._entry_key(digest))
+            if raw is None:
+                return None
+            db.zadd(self._lru_key, {digest: time.time()})
+            return json.loads(raw)
+        except Exception as e:
+            logger.debug("[llm_cache] get failed for %s: %s", self.namespace, e)
+            return None
+
+    def set(
+        self,
+        digest: str,
+        value: Any,
+        compute_s: float,
+        *,
+        context: str | None = None,
+        vector: list[float] | None = None,
+    ) -> None:
+        try:
+            db = _redis()
+            envelope = {"value": value, "compute_s": round(compute_s, 4), "ts": time.time()}
+            db.set(self._entry_key(digest), json.dumps(envelope), ex=self.ttl)
+            db.zadd(self._lru_key, {digest: time.time()})
+            db.expire(self._lru_key, self.ttl)
+            if context is not None and vector is not None:
+                vec_key = self._vec_key(context)
+                db.hset(vec_key, digest, _pack(vector))
+                db.expire(vec_key, self.ttl)
+                if db.hlen(vec_key) > SEMANTIC_MAX_VECTORS:
+                    self._trim_vectors(db, vec_key)
+            self._evict(db)
+        except Exception as e:
+            logger.warning("[llm_cache] set failed for %s: %s", self.namespace, e)
+
+    def _trim_vectors(self, db, vec_key: str) -> None:
+        """Drop vectors of expired or evicted entries, then the least recently used."""
+        digests = [_as_str(d) for d in db.hkeys(vec_key)]
+        pipe = db.pipeline(transaction=False)
+        for d in digests:
+            pipe.exists(self._entry_key(d))
+            pipe.zscore(self._lru_key, d)
+        replies = pipe.execute()
+        scores = {d: score or 0.0 for d, score in zip(digests, replies[1::2], strict=True)}
+        alive = [d for d, exists in zip(digests, replies[::2], strict=True) if exists]
+        dead = [d for d in digests if d not in set(alive)]
+        if len(alive) > SEMANTIC_MAX_VECTORS // 2:
+            alive.sort(key=scores.__getitem__)
+            dead += alive[: len(alive) - SEMANTIC_MAX_VECTORS // 2]
+        if dead:
+            db.hdel(vec_key, *dead)
+
+    def _evict(self, db) -> None:
+        overflow = db.zcard(self._lru_key) - self.max_entries
+        if overflow <= 0:
+            return
+        victims = [m for m, _score in db.zpopmin(self._lru_key, overflow)]
+        if victims:
+            db.delete(*(self._entry_key(_as_str(v)) for v in victims))
+
+    # ---- near-duplicate lookup ----
+
+    def nearest(self, context: str, vector: list[float]) -> tuple[str, float] | None:
+        """Closest stored digest in ``context`` at or above the threshold, if any."""
+        if self.semantic_threshold is None:
+            return None
+        try:
+            import numpy as np
+
+            stored = _redis().hgetall(self._vec_key(context))
+            if not stored:
+                return None
+            digests = [_as_str(k) for k in stored]
+            matrix = np.stack([_unpack(v) for v in stored.values()]).astype(np.float32)
+            query = _normalized(vector)
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if float(scores[best]) >= self.semantic_threshold:
+                return digests[best], float(scores[best])
+        except Exception as e:
+            logger.debug("[llm_cache] near-duplicate lookup failed for %s: %s", self.namespace, e)
+        return None
+
+    def forget_vector(self, context: str, digest: str) -> None:
+        try:
+            _redis().hdel(self._vec_key(context), digest)
+        except Exception:
+            pass
+
+    def clear(self) -> int:
+        """Delete every key in this namespace. Returns the number removed."""
+        db = _redis()
+        keys = list(db.scan_iter(match=f"{KEY_PREFIX}:{self.namespace}:*", count=500))
+        if keys:
+            db.delete(*keys)
+        return len(keys)
+
+
+def _as_str(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _normalized(vector: list[float]):
+    import numpy as np
+
+    vec = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else vec
+
+
+def _pack(vector: list[float]) -> str:
+    import numpy as np
+
+    return base64.b64encode(_normalized(vector).astype(np.float16).tobytes()).decode()
+
+
+def _unpack(raw: bytes | str):
+    import numpy as np
+
+    return np.frombuffer(base64.b64decode(raw), dtype=np.float16)
+
+
+class _Call:
+    """Key material for one invocation of a decorated function."""
+
+    def __init__(self, cache: LLMCache, signature, semantic_arg, ignore, args, kwargs) -> None:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {k: v for k, v in bound.arguments.items() if k not in ignore}
+        self.cache = cache
+        self.digest = cache.key_for(arguments)
+        self.text: str | None = None
+        self.context: str | None = None
+        if cache.semantic_threshold is not None and semantic_arg in arguments:
+            text = arguments.pop(semantic_arg)
+            if isinstance(text, str) and text.strip():
+                self.text = normalize_text(text)
+                self.context = cache.context_for(arguments)
+        self.vector: list[float] | None = None
+        self.embedded = False
+        self.started = time.perf_counter()
+
+    def lookup(self) -> tuple[dict, str] | None:
+        """Exact hit, else a near-duplicate one; blocking.
+
+        ``text`` is embedded only when its context has vectors to compare
+        with; otherwise :meth:`store` embeds it after the real call.
+        """
+        envelope, comparable = self.cache.probe(self.digest, self.context)
+        if envelope is not None:
+            return envelope, "exact"
+        if comparable and self.text is not None:
+            return self.near(self._embed())
+        return None
+
+    def _embed(self) -> list[float] | None:
+        if not self.embedded:
+            self.vector = self.cache.embed(self.text)
+            self.embedded = True
+        return self.vector
+
+    def near(self, vector: list[float] | None) -> tuple[dict, str] | None:
+        if vector is None:
+            return None
+        match = self.cache.nearest(self.context, vector)
+        if match is None:
+            return None
+        envelope = self.cache.get(match[0])
+        if envelope is None:
+            self.cache.forget_vector(self.context, match[0])
+            return None
+        return envelope, "semantic"
+
+    def hit(self, envelope: dict, match: str) -> None:
+        lookup_s = time.perf_counter() - self.started
+        _HITS.labels(self.cache.namespace, match).inc()
+        saved = float(envelope.get("compute_s") or 0.0) - lookup_s
+        if saved > 0:
+            _SAVED_S.labels(self.cache.namespace).inc(saved)
+
+    def miss(self) -> None:
+        _MISSES.labels(self.cache.namespace).inc()
+        self.started = time.perf_counter()
+
+    def store(self, value: Any) -> None:
+        if self.text is not None:
+            self._embed()
+        self.cache.set(
+            self.digest,
+            value,
+            time.perf_counter() - self.started,
+            context=self.context,
+            vector=self.vector,
+        )
+
+
+def llm_cached(
+    namespace: str,
+    *,
+    model: str = "",
+    version: str = "v1",
+    ttl: int = DEFAULT_TTL_S,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    semantic: bool = False,
+    semantic_threshold: float = DEFAULT_SEMANTIC_THRESHOLD,
+    semantic_arg: str | None = None,
+    ignore: tuple[str, ...] = (),
+    cache_if: Callable[[Any], bool] = default_cache_if,
+    decode: Callable[[Any], Any] | None = None,
+):
+    """Cache a deterministic LLM call site (sync or async) in the shared store.
+
+    Args:
+        namespace: Metric dimension and key prefix; one per call site.
+        model: Model id, part of the key.
+        version: Prompt template version; bump it when the prompt changes.
+        ttl: Entry lifetime in seconds.
+        max_entries: LRU cap for the namespace.
+        semantic: Also serve near-duplicate inputs (classifier prompts only).
+        semantic_threshold: Minimum cosine similarity for a near-duplicate hit.
+        semantic_arg: Parameter to embed; defaults to the first parameter.
+        ignore: Parameters left out of the key (timeouts, clients).
+        cache_if: Predicate deciding whether a fresh result is stored.
+        decode: Applied to values read from the cache (not to fresh results).
+
+    The wrapper exposes the :class:`LLMCache` as ``.cache``.
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        text_arg = semantic_arg or next(iter(signature.parameters), None)
+        cache = LLMCache(
+            namespace,
+            model=model,
+            version=version,
+            ttl=ttl,
+            max_entries=max_entries,
+            semantic_threshold=semantic_threshold if semantic else None,
+        )
+
+        def _decoded(envelope: dict) -> Any:
+            value = envelope.get("value")
+            return decode(value) if decode is not None else value
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _disabled():
+                    return await fn(*args, **kwargs)
+                call = _Call(cache, signature, text_arg, ignore, args, kwargs)
+                found = await asyncio.to_thread(call.lookup)
+                if found is not None:
+                    call.hit(*found)
+                    return _decoded(found[0])
+                call.miss()
+                result = await fn(*args, **kwargs)
+                if cache_if(result):
+                    await asyncio.to_thread(call.store, result)
+                return result
+
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _disabled():
+                return fn(*args, **kwargs)
+            call = _Call(cache, signature, text_arg, ignore, args, kwargs)
+            found = call.lookup()
+            if found is not None:
+                call.hit(*found)
+                return _decoded(found[0])
+            call.miss()
+            result = fn(*args, **kwargs)
+            if cache_if(result):
+                call.store(result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -74,6 +74,14 @@ WORKER_DEADMAN_ENABLED: bool = os.environ.get(
     "WORKER_DEADMAN_ENABLED", "true"
 ).strip().lower() not in ("", "0", "false")
 
+# Opt-in local command server for valor-session / sdlc-tool (tools/cli_server.py).
+# Off by default: the thin clients fall back to in-process execution without it.
+WORKER_CLI_SERVER_ENABLED: bool = os.environ.get("VALOR_CLI_SERVER", "").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 # Stop event for the heartbeat daemon thread — set on worker shutdown.
 _heartbeat_stop_event = threading.Event()
 
@@ -910,6 +918,10 @@ async def _run_worker(projects: dict, dry_run: bool = False) -> None:
         from agent.session_state import bump_loop_tick  # noqa: PLC0415
 
         bump_loop_tick()  # Initialize before first sleep so watchdog has a baseline
+        # Boot budget: process start -> first loop tick (scripts/profile_startup.py).
+        from agent.cold_start_metrics import record_boot  # noqa: PLC0415
+
+        record_boot(process="worker")
         while True:
             await asyncio.sleep(WORKER_DEADMAN_TICK_INTERVAL)
             bump_loop_tick()
@@ -927,6 +939,11 @@ async def _run_worker(projects: dict, dry_run: bool = False) -> None:
 
     loop_tick_task.add_done_callback(_loop_tick_task_done)
 
+    # Import the LLM provider SDKs in a thread now, not on the first LLM call.
+    from agent.llm.wrapper import warm_providers  # noqa: PLC0415
+
+    provider_warmup_task = asyncio.create_task(warm_providers(), name="provider-warmup")  # noqa: F841
+
     # Start dedicated heartbeat daemon thread (issue #1767, inverted #1815).
     # Runs outside the asyncio event loop so thread-pool saturation
     # cannot starve heartbeat writes. daemon=True ensures it cannot outlive
@@ -954,6 +971,20 @@ async def _run_worker(projects: dict, dry_run: bool = False) -> None:
         )
         session_archive_thread.start()
 
+    # Start the CLI command server (tools/cli_server.py) when opted in. It is a
+    # child PROCESS, not a thread: each command it serves forks and rewrites
+    # cwd/env/stdio, none of which may touch this event loop. A failed spawn is
+    # non-fatal — clients fall back to cold in-process runs. Never under pytest.
+    cli_server_proc = None
+    if WORKER_CLI_SERVER_ENABLED and not os.environ.get("PYTEST_CURRENT_TEST"):
+        try:
+            from tools.cli_server import spawn_server
+
+            cli_server_proc = spawn_server()
+            logger.info("CLI command server started (pid=%d)", cli_server_proc.pid)
+        except Exception as e:
+            logger.warning(f"CLI command server failed to start (non-fatal): {e}")
+
     # Start health monitor as a supervised background task (#1816 Fix #4).
     # supervise() respawns on unexpected death with exponential backoff;
     # storm cap exceeds → _self_kill() SIGKILL so launchd can respawn clean.
@@ -1091,6 +1122,13 @@ async def _run_worker(projects: dict, dry_run: bool = False) -> None:
         _session_archive_stop_event.set()
         session_archive_thread.join(timeout=5)
 
+    # Stop the CLI command server. In-flight commands run in their own forked
+    # children and finish on their own.
+    if cli_server_proc is not None:
+        from tools.cli_server import stop_server
+
+        stop_server(cli_server_proc)
+
     # Cancel health monitor
     health_task.cancel()
     try:
@@ -1122,6 +1160,16 @@ async def _run_worker(projects: dict, dry_run: bool = False) -> None:
     # (Reflection scheduler runs out-of-process — issue #1828 — so there is no
     # reflection task to cancel here.)
 
+    # Close the loop's pooled Anthropic client (its keep-alive connections).
+    from agent.anthropic_client import aclose_pooled_clients
+
+    await aclose_pooled_clients()
+
+    # Close the loop's pooled link-enrichment HTTP client.
+    from bridge.link_enrichment import aclose_link_clients
+
+    await aclose_link_clients()
+
     logger.info("Worker shutdown complete")
 
 
@@ -1175,6 +1223,10 @@ def main() -> None:
 
     configure_resilient_redis()
 
+    from analytics.metrics import start_exporter  # noqa: PLC0415
+
+    start_exporter("worker")
+
     # Validate agent definition files are usable on disk. Missing, malformed,
     # or unreadable files are not fatal — the SDK falls back gracefully — but
     # we surface warnings early so operators can fix them before users hit